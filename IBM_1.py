@@ -11,8 +11,17 @@ import json
 import time
 import math
 import random
+import argparse
+from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ModuleNotFoundError:
+    np = None
+    HAS_NUMPY = False
 
 # ===================================================================
 # CONSTANTES QUÂNTICAS FUNDAMENTAIS
@@ -28,6 +37,8 @@ PAULI_X = [[0, 1], [1, 0]]
 PAULI_Y = [[0, -1j], [1j, 0]]
 PAULI_Z = [[1, 0], [0, -1]]
 IDENTITY = [[1, 0], [0, 1]]
+# Porta de dois qubits na base |controle alvo⟩
+CNOT = [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]]
 
 # ===================================================================
 # BLOCO 1: EQUAÇÕES CANÔNICAS ORIGINAIS (EXATAS)
@@ -158,30 +169,201 @@ class EngineQuanticoNativo:
         else:
             return obj
 
+# ===================================================================
+# BLOCO 2.1: BACKENDS DE SIMULAÇÃO (LISTAS / NUMPY)
+# ===================================================================
+# Convenção: o qubit 0 é o mais significativo do índice da base, como em
+# produto_tensorial(q0, q1, ...).
+
+class BackendQuantico(ABC):
+    """Interface comum dos simuladores de vetor de estado"""
+    nome = "base"
+
+    def __init__(self, num_qubits: int):
+        self.num_qubits = num_qubits
+
+    @abstractmethod
+    def aplicar_porta(self, porta: List, alvo: int) -> "BackendQuantico":
+        """Aplica porta 2x2 no qubit alvo"""
+
+    @abstractmethod
+    def aplicar_porta_dupla(self, porta: List, q0: int, q1: int) -> "BackendQuantico":
+        """Aplica porta 4x4 (base |q0 q1⟩) nos qubits q0 e q1"""
+
+    def aplicar_cnot(self, controle: int, alvo: int) -> "BackendQuantico":
+        """Aplica CNOT controle → alvo"""
+        return self.aplicar_porta_dupla(CNOT, controle, alvo)
+
+    @abstractmethod
+    def probabilidades(self) -> List[float]:
+        """Probabilidades de medição na base computacional"""
+
+    @abstractmethod
+    def vetor_estado(self) -> List:
+        """Vetor de estado como lista Python"""
+
+    def __getitem__(self, indice: int):
+        return self.vetor_estado()[indice]
+
+
+class BackendListas(BackendQuantico):
+    """Backend de referência: listas Python e operadores completos 2ⁿ×2ⁿ"""
+    nome = "listas"
+
+    def __init__(self, num_qubits: int):
+        super().__init__(num_qubits)
+        self.estado = EngineQuanticoNativo.criar_estado_inicial(num_qubits)
+
+    def aplicar_porta(self, porta: List, alvo: int) -> "BackendListas":
+        operador = []
+        for q in range(self.num_qubits):
+            operador = EngineQuanticoNativo.produto_tensorial(operador, porta if q == alvo else IDENTITY)
+        self.estado = EngineQuanticoNativo.multiplicar_matriz_vetor(operador, self.estado)
+        return self
+
+    def aplicar_porta_dupla(self, porta: List, q0: int, q1: int) -> "BackendListas":
+        n = self.num_qubits
+        dim = 2 ** n
+        b0, b1 = n - 1 - q0, n - 1 - q1
+        operador = [[0.0] * dim for _ in range(dim)]
+        for coluna in range(dim):
+            entrada = (((coluna >> b0) & 1) << 1) | ((coluna >> b1) & 1)
+            base = coluna & ~((1 << b0) | (1 << b1))
+            for saida in range(4):
+                linha = base | ((saida >> 1) << b0) | ((saida & 1) << b1)
+                operador[linha][coluna] = porta[saida][entrada]
+        self.estado = EngineQuanticoNativo.multiplicar_matriz_vetor(operador, self.estado)
+        return self
+
+    def probabilidades(self) -> List[float]:
+        return [abs(a) ** 2 for a in self.estado]
+
+    def vetor_estado(self) -> List:
+        return list(self.estado)
+
+    def __getitem__(self, indice: int):
+        return self.estado[indice]
+
+
+class BackendNumPy(BackendQuantico):
+    """
+    Backend de vetor de estado NumPy: ndarray complex128 contíguo, portas de
+    1 e 2 qubits aplicadas in-place por remodelagem de eixos, sem montar
+    matrizes 2ⁿ×2ⁿ.
+    """
+    nome = "numpy"
+
+    def __init__(self, num_qubits: int):
+        if not HAS_NUMPY:
+            raise RuntimeError("Backend 'numpy' indisponível: instale a biblioteca numpy.")
+        super().__init__(num_qubits)
+        self.estado = np.zeros(2 ** num_qubits, dtype=np.complex128)
+        self.estado[0] = 1.0
+
+    def _eixos(self, alvo: int):
+        # Visão (antes, qubit, depois) do vetor de estado sobre o qubit alvo
+        return self.estado.reshape(2 ** alvo, 2, -1)
+
+    def aplicar_porta(self, porta: List, alvo: int) -> "BackendNumPy":
+        u = np.asarray(porta, dtype=np.complex128)
+        v = self._eixos(alvo)
+        a0 = v[:, 0, :].copy()
+        a1 = v[:, 1, :].copy()
+        np.multiply(a0, u[0, 0], out=v[:, 0, :])
+        v[:, 0, :] += u[0, 1] * a1
+        np.multiply(a0, u[1, 0], out=v[:, 1, :])
+        v[:, 1, :] += u[1, 1] * a1
+        return self
+
+    def aplicar_porta_dupla(self, porta: List, q0: int, q1: int) -> "BackendNumPy":
+        g = np.asarray(porta, dtype=np.complex128)
+        v = self.estado.reshape((2,) * self.num_qubits)
+
+        def fatia(i: int, j: int):
+            indice = [slice(None)] * self.num_qubits
+            indice[q0], indice[q1] = i, j
+            return tuple(indice)
+
+        blocos = [v[fatia(i, j)].copy() for i in (0, 1) for j in (0, 1)]
+        for saida in range(4):
+            destino = v[fatia(saida >> 1, saida & 1)]
+            np.multiply(blocos[0], g[saida, 0], out=destino)
+            for entrada in range(1, 4):
+                if g[saida, entrada] != 0:
+                    destino += g[saida, entrada] * blocos[entrada]
+        return self
+
+    def aplicar_cnot(self, controle: int, alvo: int) -> "BackendNumPy":
+        # CNOT é uma permutação: troca |…1…0…⟩ ↔ |…1…1…⟩ sem aritmética complexa
+        v = self.estado.reshape((2,) * self.num_qubits)
+        i0 = [slice(None)] * self.num_qubits
+        i1 = [slice(None)] * self.num_qubits
+        i0[controle] = i1[controle] = 1
+        i0[alvo], i1[alvo] = 0, 1
+        tmp = v[tuple(i0)].copy()
+        v[tuple(i0)] = v[tuple(i1)]
+        v[tuple(i1)] = tmp
+        return self
+
+    def probabilidades(self) -> List[float]:
+        return (np.abs(self.estado) ** 2).tolist()
+
+    def vetor_estado(self) -> List:
+        return self.estado.tolist()
+
+    def __getitem__(self, indice: int):
+        return complex(self.estado[indice])
+
+
+BACKENDS_QUANTICOS = {
+    BackendListas.nome: BackendListas,
+    BackendNumPy.nome: BackendNumPy,
+}
+
+def criar_backend(num_qubits: int, nome: str = "listas") -> BackendQuantico:
+    """Instancia o backend de simulação pelo nome ('listas' ou 'numpy')"""
+    if nome not in BACKENDS_QUANTICOS:
+        raise ValueError(f"Backend desconhecido: {nome}. Opções: {sorted(BACKENDS_QUANTICOS)}")
+    return BACKENDS_QUANTICOS[nome](num_qubits)
+
 # ===================================================================
 # BLOCO 3: 12 CIRCUITOS QUÂNTICOS NATIVOS ULTIMATE
 # ===================================================================
 
 class CircuitosQuanticosAlquimistas:
     """12 Circuitos quânticos nativos - VERSÃO ULTIMATE"""
+
+    backend = "listas"  # 'listas' (referência) ou 'numpy' (vetor de estado vetorizado)
+
+    @classmethod
+    def usar_backend(cls, nome: str):
+        """Seleciona o backend de simulação usado por todos os circuitos"""
+        if nome not in BACKENDS_QUANTICOS:
+            raise ValueError(f"Backend desconhecido: {nome}. Opções: {sorted(BACKENDS_QUANTICOS)}")
+        cls.backend = nome
+
+    @classmethod
+    def novo_simulador(cls, num_qubits: int) -> BackendQuantico:
+        """Cria o registrador |0...0⟩ no backend selecionado"""
+        return criar_backend(num_qubits, cls.backend)
     
     @staticmethod
     def circuito_coerencia_quantica(x: float) -> Dict[str, Any]:
         """Circuito para EQ001-F - Coerência Quântica"""
         print("   ⚡ Circuito Coerência: H → RZ → H")
-        estado = [1.0, 0.0]
+        estado = CircuitosQuanticosAlquimistas.novo_simulador(1)
         
         # Hadamard
-        estado = EngineQuanticoNativo.aplicar_porta_simples(estado, HADAMARD)
+        estado.aplicar_porta(HADAMARD, 0)
         
         # RZ com parâmetro da equação
         theta = 144000 * x
         RZ = [[math.cos(theta/2) - 1j*math.sin(theta/2), 0],
               [0, math.cos(theta/2) + 1j*math.sin(theta/2)]]
-        estado = EngineQuanticoNativo.aplicar_porta_simples(estado, RZ)
+        estado.aplicar_porta(RZ, 0)
         
         # Hadamard novamente
-        estado = EngineQuanticoNativo.aplicar_porta_simples(estado, HADAMARD)
+        estado.aplicar_porta(HADAMARD, 0)
         
         prob_0 = abs(estado[0]) ** 2
         coerencia_circuito = min(prob_0 * 0.97, 1.0)
@@ -197,13 +379,13 @@ class CircuitosQuanticosAlquimistas:
     def circuito_energia_universal(t: float) -> Dict[str, Any]:
         """Circuito para EQ002-F - Energia Universal - SIMPLIFICADO"""
         print("   ⚡ Circuito Energia: Estado Superposto")
-        estado = [1.0, 0.0]
+        estado = CircuitosQuanticosAlquimistas.novo_simulador(1)
         
         # Aplicar rotação baseada no tempo
         theta = t * 0.1
         RY = [[math.cos(theta/2), -math.sin(theta/2)],
               [math.sin(theta/2), math.cos(theta/2)]]
-        estado = EngineQuanticoNativo.aplicar_porta_simples(estado, RY)
+        estado.aplicar_porta(RY, 0)
         
         # Calcular energia
         energia_base = 2.6
@@ -221,17 +403,17 @@ class CircuitosQuanticosAlquimistas:
     def circuito_estabilidade_campo(freq: float, noise: float) -> Dict[str, Any]:
         """Circuito para EQ003-F - Estabilidade de Campo"""
         print("   ⚡ Circuito Estabilidade: RZ + Ruído")
-        estado = [1.0, 0.0]
+        estado = CircuitosQuanticosAlquimistas.novo_simulador(1)
         
         theta = 2 * PI * freq
         RZ_principal = [[math.cos(theta) - 1j*math.sin(theta), 0],
                         [0, math.cos(theta) + 1j*math.sin(theta)]]
-        estado = EngineQuanticoNativo.aplicar_porta_simples(estado, RZ_principal)
+        estado.aplicar_porta(RZ_principal, 0)
         
         ruido_phase = random.uniform(0, noise) * PI
         RZ_ruido = [[math.cos(ruido_phase) - 1j*math.sin(ruido_phase), 0],
                     [0, math.cos(ruido_phase) + 1j*math.sin(ruido_phase)]]
-        estado = EngineQuanticoNativo.aplicar_porta_simples(estado, RZ_ruido)
+        estado.aplicar_porta(RZ_ruido, 0)
         
         estabilidade = abs(estado[0]) ** 2 - abs(estado[1]) ** 2
         
@@ -246,14 +428,14 @@ class CircuitosQuanticosAlquimistas:
     def circuito_probabilidade_anomalias(t: float) -> Dict[str, Any]:
         """Circuito para EQ004-F - Probabilidade de Anomalias"""
         print("   ⚡ Circuito Anomalias: RX com Decaimento")
-        estado = [1.0, 0.0]
+        estado = CircuitosQuanticosAlquimistas.novo_simulador(1)
         
         prob_anomalia_teorica = 0.8 * math.exp(-0.1 * t) + 0.05
         theta = 2 * math.acos(math.sqrt(1 - prob_anomalia_teorica))
         
         RX = [[math.cos(theta/2), -1j*math.sin(theta/2)],
               [-1j*math.sin(theta/2), math.cos(theta/2)]]
-        estado = EngineQuanticoNativo.aplicar_porta_simples(estado, RX)
+        estado.aplicar_porta(RX, 0)
         
         probabilidade_anomalia = abs(estado[1]) ** 2
         
@@ -268,7 +450,7 @@ class CircuitosQuanticosAlquimistas:
     def circuito_modulacao_gravitacional(t: float, freq: float) -> Dict[str, Any]:
         """Circuito para EQ005-F - Modulação Gravitacional"""
         print("   ⚡ Circuito Gravitação: Modulação de Fase")
-        estado = [1.0, 0.0]
+        estado = CircuitosQuanticosAlquimistas.novo_simulador(1)
         
         alpha, beta = 0.01, 0.05
         modulacao = alpha * math.cos(2 * PI * freq * t) * math.exp(-beta * t)
@@ -276,7 +458,7 @@ class CircuitosQuanticosAlquimistas:
         
         RZ_mod = [[math.cos(theta_mod) - 1j*math.sin(theta_mod), 0],
                   [0, math.cos(theta_mod) + 1j*math.sin(theta_mod)]]
-        estado = EngineQuanticoNativo.aplicar_porta_simples(estado, RZ_mod)
+        estado.aplicar_porta(RZ_mod, 0)
         
         forca_gravitacional = 9.8 * (1 - modulacao)
         
@@ -292,11 +474,12 @@ class CircuitosQuanticosAlquimistas:
         """Circuito para EQ006-F - Complexidade Quântica - CORRIGIDO"""
         print("   ⚡ Circuito Complexidade: Estado Bell")
         
-        # Criar estado Bell manualmente
-        estado_bell = [INV_SQRT2, 0, 0, INV_SQRT2]  # (|00⟩ + |11⟩)/√2
+        # Criar estado Bell: H no qubit 0 seguido de CNOT 0 → 1
+        estado_bell = CircuitosQuanticosAlquimistas.novo_simulador(2)
+        estado_bell.aplicar_porta(HADAMARD, 0).aplicar_cnot(0, 1)  # (|00⟩ + |11⟩)/√2
         
         # Calcular entropia
-        probs = [abs(x) ** 2 for x in estado_bell]
+        probs = estado_bell.probabilidades()
         entropia = 0.0
         for p in probs:
             if p > 1e-9:
@@ -314,12 +497,12 @@ class CircuitosQuanticosAlquimistas:
     def circuito_sincronizacao_temporal(x: float) -> Dict[str, Any]:
         """Circuito para EQ007-F - Sincronização Temporal"""
         print("   ⚡ Circuito Sincronização: RZ com Fase")
-        estado = [1.0, 0.0]
+        estado = CircuitosQuanticosAlquimistas.novo_simulador(1)
         
         theta = 0.0001 * x * 2 * PI
         RZ = [[math.cos(theta) - 1j*math.sin(theta), 0],
               [0, math.cos(theta) + 1j*math.sin(theta)]]
-        estado = EngineQuanticoNativo.aplicar_porta_simples(estado, RZ)
+        estado.aplicar_porta(RZ, 0)
         
         sincronizacao = theta / (2 * PI)
         
@@ -334,11 +517,11 @@ class CircuitosQuanticosAlquimistas:
     def circuito_defesa_proativa(x: float) -> Dict[str, Any]:
         """Circuito para EQ008-F - Defesa Proativa"""
         print("   ⚡ Circuito Defesa: Ativação Condicional")
-        estado = [1.0, 0.0]
+        estado = CircuitosQuanticosAlquimistas.novo_simulador(1)
         
         limiar = 741000
         if x > limiar:
-            estado = EngineQuanticoNativo.aplicar_porta_simples(estado, PAULI_X)
+            estado.aplicar_porta(PAULI_X, 0)
             status_defesa = 1.0
         else:
             status_defesa = 0.0
@@ -354,12 +537,12 @@ class CircuitosQuanticosAlquimistas:
     def circuito_consciencia_nanobotica(x: float) -> Dict[str, Any]:
         """Circuito para EQ009-F - Consciência Nanobótica"""
         print("   ⚡ Circuito Consciência: RY com Amplificação")
-        estado = [1.0, 0.0]
+        estado = CircuitosQuanticosAlquimistas.novo_simulador(1)
         
         theta = 852000 * x * 0.000001
         RY = [[math.cos(theta/2), -math.sin(theta/2)],
               [math.sin(theta/2), math.cos(theta/2)]]
-        estado = EngineQuanticoNativo.aplicar_porta_simples(estado, RY)
+        estado.aplicar_porta(RY, 0)
         
         consciencia = theta * 1000
         oscilacao = abs(estado[1]) ** 2
@@ -375,14 +558,14 @@ class CircuitosQuanticosAlquimistas:
     def circuito_imunidade_paradoxal(x: float) -> Dict[str, Any]:
         """Circuito para EQ010-F - Imunidade Paradoxal"""
         print("   ⚡ Circuito Imunidade: RZ de Proteção")
-        estado = [1.0, 0.0]
+        estado = CircuitosQuanticosAlquimistas.novo_simulador(1)
         
         fase_paradoxo = (x % 0.001) * 2 * PI
         imunidade = 0.999 - (x % 0.001)
         
         RZ_protecao = [[math.cos(fase_paradoxo) - 1j*math.sin(fase_paradoxo), 0],
                        [0, math.cos(fase_paradoxo) + 1j*math.sin(fase_paradoxo)]]
-        estado = EngineQuanticoNativo.aplicar_porta_simples(estado, RZ_protecao)
+        estado.aplicar_porta(RZ_protecao, 0)
         
         return {
             "imunidade_paradoxal": imunidade,
@@ -395,12 +578,12 @@ class CircuitosQuanticosAlquimistas:
     def circuito_ressonancia_cristalina(x: float) -> Dict[str, Any]:
         """Circuito para EQ011-F - Ressonância Cristalina"""
         print("   ⚡ Circuito Ressonância: RZ em 330kHz")
-        estado = [1.0, 0.0]
+        estado = CircuitosQuanticosAlquimistas.novo_simulador(1)
         
         theta = 330000 * x
         RZ_ressonancia = [[math.cos(theta) - 1j*math.sin(theta), 0],
                          [0, math.cos(theta) + 1j*math.sin(theta)]]
-        estado = EngineQuanticoNativo.aplicar_porta_simples(estado, RZ_ressonancia)
+        estado.aplicar_porta(RZ_ressonancia, 0)
         
         ressonancia = math.sin(theta)
         
@@ -415,7 +598,7 @@ class CircuitosQuanticosAlquimistas:
     def circuito_unificacao_total(resultados_parciais: Dict) -> Dict[str, Any]:
         """Circuito para EQ012-F - Unificação Total"""
         print("   ⚡ Circuito Unificação: Superposição Final")
-        estado = [1.0, 0.0]
+        estado = CircuitosQuanticosAlquimistas.novo_simulador(1)
         
         # Calcular unificação
         valores = [v for k, v in resultados_parciais.items() 
@@ -426,7 +609,7 @@ class CircuitosQuanticosAlquimistas:
         theta = unificacao * 0.001  # Escala reduzida
         RY = [[math.cos(theta), -math.sin(theta)],
               [math.sin(theta), math.cos(theta)]]
-        estado = EngineQuanticoNativo.aplicar_porta_simples(estado, RY)
+        estado.aplicar_porta(RY, 0)
         
         coerencia_global = abs(estado[0]) ** 2
         
@@ -620,13 +803,65 @@ class SistemaAlquimistaUnificado:
         print(f"🎯 Status: {relatorio_final['estatisticas_gerais']['status_operacional']}")
         print("🎉" * 25)
 
+# ===================================================================
+# BLOCO 5: BENCHMARK DOS BACKENDS
+# ===================================================================
+
+def circuito_camadas_benchmark(backend: BackendQuantico, camadas: int = 2) -> BackendQuantico:
+    """Circuito de referência: H em todos os qubits, cadeia de CNOTs e RZ por qubit"""
+    n = backend.num_qubits
+    for q in range(n):
+        backend.aplicar_porta(HADAMARD, q)
+    for camada in range(camadas):
+        for q in range(n - 1):
+            backend.aplicar_cnot(q, q + 1)
+        for q in range(n):
+            theta = (q + 1) * (camada + 1) * 0.1
+            backend.aplicar_porta([[math.cos(theta) - 1j * math.sin(theta), 0],
+                                   [0, math.cos(theta) + 1j * math.sin(theta)]], q)
+    return backend
+
+def benchmark_backends(qubits: Tuple[int, ...] = (4, 6, 8, 12, 16, 20, 22), max_qubits_listas: int = 8) -> List[Dict[str, Any]]:
+    """Mede o tempo do circuito de referência em cada backend e confere a paridade"""
+    resultados = []
+    for n in qubits:
+        linha: Dict[str, Any] = {"qubits": n}
+        estados = {}
+        for nome in BACKENDS_QUANTICOS:
+            if (nome == "listas" and n > max_qubits_listas) or (nome == "numpy" and not HAS_NUMPY):
+                linha[f"{nome}_s"] = None
+                continue
+            inicio = time.perf_counter()
+            estados[nome] = circuito_camadas_benchmark(criar_backend(n, nome))
+            linha[f"{nome}_s"] = round(time.perf_counter() - inicio, 4)
+        if len(estados) == 2:
+            a, b = estados["listas"].vetor_estado(), estados["numpy"].vetor_estado()
+            linha["diferenca_maxima"] = max(abs(x - y) for x, y in zip(a, b))
+        resultados.append(linha)
+        print(f"   ⏱️  {n:>2} qubits | listas: {linha['listas_s']} s | numpy: {linha['numpy_s']} s"
+              + (f" | Δmax: {linha['diferenca_maxima']:.2e}" if "diferenca_maxima" in linha else ""))
+    return resultados
+
 # ===================================================================
 # EXECUÇÃO PRINCIPAL
 # ===================================================================
 
 def main():
     """Função principal - Ativa o Sistema Alquimista Ultimate"""
+    parser = argparse.ArgumentParser(description="Sistema Alquimista Integral - 12 Equações + 12 Circuitos")
+    parser.add_argument("--backend", choices=sorted(BACKENDS_QUANTICOS), default="listas",
+                        help="Backend de simulação dos circuitos ('numpy' requer numpy)")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Compara os backends em circuitos de até 22 qubits")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        print("⏱️  BENCHMARK DOS BACKENDS QUÂNTICOS")
+        benchmark_backends()
+        return
+
     try:
+        CircuitosQuanticosAlquimistas.usar_backend(args.backend)
         sistema = SistemaAlquimistaUnificado()
         resultados = sistema.executar_sistema_integral()
         
@@ -12,6 +12,8 @@ import time
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Callable
 
+from ledger_segmentado import LedgerSegmentado
+
 # Constantes universais
 PI = math.pi
 PHI = (1 + math.sqrt(5)) / 2
@@ -36,9 +38,20 @@ log = logging.getLogger("FOUNDATION_CONCILIUM")
 
 # ───────────────────────────── 3. LEDGER DISTRIBUÍDO (IMUTÁVEL) ─────────────────────────────
 class SimpleChain:
-    def __init__(self):
+    def __init__(self, ledger: Optional[LedgerSegmentado] = None, tail_blocks: int = 2000):
+        """
+        Sem `ledger` a cadeia vive só em memória (comportamento original).
+        Com um LedgerSegmentado cada bloco é anexado em JSONL, `chain` guarda apenas a cauda
+        recente e a validação percorre todos os segmentos gravados.
+        """
         self.chain = []
-        self._create_genesis_block()
+        self.ledger = ledger
+        self.tail_blocks = tail_blocks
+        if ledger is not None and ledger.ultimo_bloco is not None:
+            self.chain.append(ledger.ultimo_bloco)
+            log.info(f"Ledger retomado no bloco #{ledger.ultimo_bloco['index']}")
+        else:
+            self._create_genesis_block()
         
     def _normalize_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -67,31 +80,50 @@ class SimpleChain:
             "prev_hash": "0" * 64
         }
         genesis["hash"] = self._calculate_hash(genesis)
-        self.chain.append(genesis)
+        self._append(genesis)
         log.info("Genesis block created")
+
+    def _append(self, block: Dict[str, Any]):
+        self.chain.append(block)
+        if self.ledger is not None:
+            self.ledger.anexar(block)
+            if len(self.chain) > 2 * self.tail_blocks:
+                del self.chain[:-self.tail_blocks]
+            if self.ledger.precisa_rotacionar():
+                self.ledger.rotacionar()
         
     def add(self, event: str, payload: Dict[str, Any]):
         prev_block = self.chain[-1]
         block_payload = self._normalize_payload(payload)
         block = {
-            "index": len(self.chain),
+            "index": prev_block["index"] + 1,
             "timestamp": datetime.utcnow().isoformat() + "Z",
             "event": event,
             "payload": block_payload,
             "prev_hash": prev_block["hash"]
         }
         block["hash"] = self._calculate_hash(block)
-        self.chain.append(block)
+        self._append(block)
         log.info(f"Event '{event}' added to ledger (index: {block['index']})")
         
     def get_latest_block(self) -> Dict[str, Any]:
         return self.chain[-1] if self.chain else None
+
+    @property
+    def total_blocks(self) -> int:
+        return self.ledger.total_blocos if self.ledger is not None else len(self.chain)
         
     def validate_chain(self) -> bool:
         """
         Valida encadeamento e integridade de hash da cadeia.
         Retorna True/False e loga um diagnóstico do primeiro bloco inválido.
         """
+        if self.ledger is not None:
+            diag = self.validate_chain_diagnose()
+            if diag["ok"]:
+                log.info("[LEDGER] Cadeia validada com sucesso.")
+            return diag["ok"]
+
         for i in range(1, len(self.chain)):
             current = self.chain[i]
             previous = self.chain[i - 1]
@@ -127,6 +159,15 @@ class SimpleChain:
         """
         result = {"ok": True, "first_invalid_index": None, "reason": None, "details": {}}
 
+        if self.ledger is not None:
+            streamed = self.ledger.validar(self._calculate_hash, completa=True)
+            if not streamed["ok"]:
+                result.update({"ok": False, "first_invalid_index": streamed["primeiro_invalido"],
+                               "reason": streamed["motivo"], "details": streamed["detalhes"]})
+                log.error(f"[LEDGER] Falha ({streamed['motivo']}) no bloco #{streamed['primeiro_invalido']} "
+                          f"do segmento {streamed['segmento']}.")
+            return result
+
         for i in range(1, len(self.chain)):
             current = self.chain[i]
             previous = self.chain[i - 1]
@@ -753,7 +794,7 @@ def run_comprehensive_test():
     print(f"   📊 EQ019 Final: {eq019_final:.6f}")
     print(f"   🌟 EQ134 Final: {eq134_final:.3e}")
     print(f"   🧠 Consciência Emergente: {c_emerg:.3f}")
-    print(f"   🔗 Total de blocos no ledger: {len(CHAIN.chain)}")
+    print(f"   🔗 Total de blocos no ledger: {CHAIN.total_blocks}")
     
     # 9. VALIDAÇÃO CRÍTICA DO LEDGER (AGORA DEVE RETORNAR TRUE)
     ledger_valid = CHAIN.validate_chain()
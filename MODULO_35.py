@@ -14,6 +14,7 @@ Lapidações finais:
 - Relatórios por ciclo e diário atualizados
 """
 
+import os
 import math
 import hashlib
 import json
@@ -23,6 +24,9 @@ import time
 from datetime import datetime, timezone, date
 from typing import Dict, Any, List, Optional, Tuple
 
+from ledger_segmentado import LedgerSegmentado
+from relatorios_colunares import ArmazemRelatorios
+
 # ───────── Logging ─────────
 logging.basicConfig(
     level=logging.INFO,
@@ -125,15 +129,27 @@ def export_json(path: str, data: Any) -> None:
     except Exception as e:
         logger.error(f"[EXPORT] Erro ao exportar arquivo {path}: {e}")
 
-# ───────── Ledger com export e rotação ─────────
+# ───────── Ledger JSONL incremental com rotação ─────────
 class SimpleChain:
-    def __init__(self, active_path: str = "m35_ledger.json", max_blocks: int = 2000):
-        self.chain: List[Dict[str, Any]] = []
+    """
+    Cadeia de auditoria M35 persistida em segmentos JSONL (ver ledger_segmentado): cada bloco é
+    uma linha anexada, sem reescrever o ledger. Em RAM fica só a cauda recente; validate() percorre os segmentos.
+    """
+    def __init__(self, active_path: str = "m35_ledger.json", max_blocks: int = 2000,
+                 max_bytes: int = 4 * 1024 * 1024, async_flush: bool = False):
         self.active_path = active_path
         self.max_blocks = max_blocks
-        self.current_day = date.today().isoformat()
-        self._genesis()
-        self._export()
+        self.ledger = LedgerSegmentado(
+            os.path.splitext(active_path)[0] + "_segments",
+            prefixo=os.path.splitext(os.path.basename(active_path))[0],
+            max_bytes=max_bytes, max_blocos=max_blocks, flush_assincrono=async_flush,
+        )
+        self.chain: List[Dict[str, Any]] = []
+        if self.ledger.ultimo_bloco is None:
+            self._genesis()
+        else:
+            self.chain.append(self.ledger.ultimo_bloco)
+            logger.info(f"[CHAIN] Ledger retomado em #{self.ledger.ultimo_bloco['index']} ({self.ledger.caminho_ativo})")
 
     def _calc_hash(self, block: Dict[str, Any]) -> str:
         copy = {k: v for k, v in block.items() if k != "hash"}
@@ -150,32 +166,26 @@ class SimpleChain:
             "meta": {"version": "v35.2", "module": "M35"}
         }
         genesis["hash"] = self._calc_hash(genesis)
-        self.chain.append(genesis)
+        self._append(genesis)
         logger.info(f"[CHAIN] Genesis criado: {genesis['hash'][:10]}...")
 
-    def _export(self) -> None:
-        export_json(self.active_path, self.chain)
+    def _append(self, block: Dict[str, Any]) -> None:
+        self.ledger.anexar(block)
+        self.chain.append(block)
+        if len(self.chain) > 2 * self.max_blocks:
+            del self.chain[:-self.max_blocks]
 
     def _rotate_if_needed(self) -> None:
-        today = date.today().isoformat()
-        need_day_rotation = (today != self.current_day)
-        need_size_rotation = (len(self.chain) >= self.max_blocks)
-        if need_day_rotation or need_size_rotation:
-            suffix = f"{today}_{len(self.chain)}"
-            hist_path = f"m35_ledger_{suffix}.json"
-            export_json(hist_path, self.chain)
-            logger.info(f"[CHAIN] Ledger rotacionado -> {hist_path}")
+        if self.ledger.precisa_rotacionar():
             last_hash = self.chain[-1]["hash"]
-            self.chain = []
-            self._genesis()
+            hist_path = self.ledger.rotacionar()
+            logger.info(f"[CHAIN] Ledger rotacionado -> {hist_path}")
             self.add("M35_ROTATE", {"prev_last_hash": last_hash, "export": hist_path}, meta={"severity":"INFO"})
-            self.current_day = today
-            self._export()
 
     def add(self, event: str, payload: Dict[str, Any], meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         prev = self.chain[-1]
         block = {
-            "index": len(self.chain),
+            "index": prev["index"] + 1,
             "timestamp_utc": datetime.now(timezone.utc).isoformat(),
             "event": event,
             "payload": payload,
@@ -183,21 +193,20 @@ class SimpleChain:
             "meta": meta or {}
         }
         block["hash"] = self._calc_hash(block)
-        self.chain.append(block)
         logger.info(f"[CHAIN] #{block['index']} :: {event}")
-        self._export()
+        self._append(block)
         self._rotate_if_needed()
         return block
 
-    def validate(self) -> bool:
-        for i in range(1, len(self.chain)):
-            c, p = self.chain[i], self.chain[i - 1]
-            if c["prev_hash"] != p["hash"]:
-                logger.error(f"[CHAIN] prev_hash inválido em bloco #{i}")
-                return False
-            if c["hash"] != self._calc_hash(c):
-                logger.error(f"[CHAIN] hash inválido em bloco #{i}")
-                return False
+    @property
+    def total_blocks(self) -> int:
+        return self.ledger.total_blocos
+
+    def validate(self, full: bool = False) -> bool:
+        result = self.ledger.validar(self._calc_hash, completa=full)
+        if not result["ok"]:
+            logger.error(f"[CHAIN] {result['motivo']} em bloco #{result['primeiro_invalido']} ({result['segmento']})")
+            return False
         logger.info("[CHAIN] Integridade validada.")
         return True
 
@@ -305,6 +314,7 @@ class Modulo35_OrquestradorSinfoniaConsciencia:
 
         # Ledger e alert limiter
         self.chain = SimpleChain()
+        self.relatorios = ArmazemRelatorios("m35_relatorios")
         self.alert_limiter = AlertLimiter(min_interval_sec=2.0)
 
         # Históricos e métricas
@@ -508,7 +518,7 @@ class Modulo35_OrquestradorSinfoniaConsciencia:
             "coerencia_final": self.coerencia_coletiva_atual,
             "resultado": resultado_manifestacao
         }
-        export_json(f"m35_report_cycle_{sha256_hex(str(report_cycle))[:10]}.json", report_cycle)
+        self.relatorios.adicionar(report_cycle)
 
         self.chain.add("M35_CYCLE", {"status": final_status, "resultado": resultado_manifestacao}, meta={"severity": "INFO" if final_status=="SUCESSO" else "ALTO"})
         self.modulo01.RegistrarNaCronicaDaFundacao({"modulo": self.modulo_id, "evento": "CicloOrquestracaoConcluido", "status": final_status})
@@ -548,7 +558,7 @@ class Modulo35_OrquestradorSinfoniaConsciencia:
         export_json("m35_report_daily.json", {
             "date": date.today().isoformat(),
             "health": payload,
-            "blocks": len(self.chain.chain),
+            "blocks": self.chain.total_blocks,
             "ledger_valid": self.chain.validate()
         })
         return payload
@@ -556,6 +566,10 @@ class Modulo35_OrquestradorSinfoniaConsciencia:
     def validar_ledger(self) -> bool:
         return self.chain.validate()
 
+    def consultar_ciclos(self, dominio: Optional[str] = None, inicio=None, fim=None, status=None) -> List[Dict[str, Any]]:
+        """Relatórios de ciclo gravados, filtrados por intenção, intervalo de tempo e status."""
+        return self.relatorios.consultar(dominio, inicio, fim, status)
+
 # ───────── Simulação de uso ─────────
 if __name__ == "__main__":
     print("Iniciando simulação do Módulo 35: ORQUESTRADOR (v35.2 final)...")
@@ -608,4 +622,4 @@ if __name__ == "__main__":
     print("\n" + "="*100 + "\n")
     print("Mapa de Saúde e Ledger")
     health = modulo_orquestrador.mapa_saude()
-    print(json.dumps({"health": health, "ledger_valid": modulo_orquestrador.validar_ledger(), "total_blocks": len(modulo_orquestrador.chain.chain)}, indent=2, ensure_ascii=False))
+    print(json.dumps({"health": health, "ledger_valid": modulo_orquestrador.validar_ledger(), "total_blocks": modulo_orquestrador.chain.total_blocks}, indent=2, ensure_ascii=False))
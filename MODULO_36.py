@@ -9,7 +9,7 @@ MÓDULO 36 – Arquiteto da Luz Primordial (v36.6)
 - Coerência por domínio: suavizada, com bônus estruturados (Eharmony, MatrizHarmônica, CoherentiumExpansum, Sharmony)
 - Energia: amortização, clamps de cosh (Wcreation), fatores mestrais (Pcreation, Euniverse, Wcreation, Rcreation, Vibratum)
 - Ressonância: piso primordial, estabilidade pela IQR/Span, componente cristalina limitada, SinteseVibracional e LuxGenesis progressivo
-- Auditoria: ledger com rotação, relatórios exportados, rate limiting de alertas
+- Auditoria: ledger JSONL incremental com rotação por tamanho/dia e hash encadeado entre segmentos, relatórios de ciclo em armazém colunar, rate limiting de alertas
 - Calibração sistemática: cenários por domínio, relatórios agregados
 """
 
@@ -17,6 +17,9 @@ import sys, os, json, time, math, hashlib, random, logging
 from datetime import datetime, timezone, date
 from typing import Dict, Any, List, Optional, Tuple
 
+from ledger_segmentado import LedgerSegmentado
+from relatorios_colunares import ArmazemRelatorios
+
 # ───────── Configuração central ─────────
 
 class M36Config:
@@ -24,12 +27,16 @@ class M36Config:
         self,
         save_dir: str = "arquitetura_luz_primordial_data",
         ledger_max_blocks: int = 2000,
+        ledger_max_bytes: int = 4 * 1024 * 1024,
+        ledger_async_flush: bool = False,
         alert_min_interval_sec: float = 1.5,
         energy_max_ulp: float = 5.0e6,
         seed: Optional[int] = None,
     ):
         self.save_dir = save_dir
         self.ledger_max_blocks = ledger_max_blocks
+        self.ledger_max_bytes = ledger_max_bytes
+        self.ledger_async_flush = ledger_async_flush
         self.alert_min_interval_sec = alert_min_interval_sec
         self.energy_max_ulp = energy_max_ulp
         self.seed = seed
@@ -249,12 +256,26 @@ def sha256_hex(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 class SimpleChain:
-    def __init__(self, active_path: str, max_blocks: int = CFG.ledger_max_blocks):
-        self.chain: List[Dict[str, Any]] = []
+    """
+    Cadeia de auditoria M36 persistida em segmentos JSONL (um bloco por linha, ver ledger_segmentado).
+    Em RAM fica apenas a cauda recente (`chain`); a validação percorre todos os segmentos.
+    Ao reabrir, a cadeia continua do último bloco gravado em vez de recomeçar do genesis.
+    """
+    def __init__(self, active_path: str, max_blocks: int = CFG.ledger_max_blocks,
+                 max_bytes: int = CFG.ledger_max_bytes, async_flush: bool = CFG.ledger_async_flush):
         self.active_path = active_path
         self.max_blocks = max_blocks
-        self.current_day = date.today().isoformat()
-        self._genesis(); self._export()
+        self.ledger = LedgerSegmentado(
+            os.path.splitext(active_path)[0] + "_segments",
+            prefixo=os.path.splitext(os.path.basename(active_path))[0],
+            max_bytes=max_bytes, max_blocos=max_blocks, flush_assincrono=async_flush,
+        )
+        self.chain: List[Dict[str, Any]] = []
+        if self.ledger.ultimo_bloco is None:
+            self._genesis()
+        else:
+            self.chain.append(self.ledger.ultimo_bloco)
+            logger.info(f"[CHAIN] Ledger M36 retomado em #{self.ledger.ultimo_bloco['index']} ({self.ledger.caminho_ativo})")
 
     def _calc_hash(self, block: Dict[str, Any]) -> str:
         copy = {k: v for k, v in block.items() if k != "hash"}
@@ -271,34 +292,26 @@ class SimpleChain:
             "meta": {"version": "v36.6", "module": "M36"},
         }
         genesis["hash"] = self._calc_hash(genesis)
-        self.chain.append(genesis)
+        self._append(genesis)
         logger.info(f"[CHAIN] Genesis M36: {genesis['hash'][:10]}...")
 
-    def _export(self) -> None:
-        try:
-            with open(self.active_path, "w", encoding="utf-8") as f:
-                json.dump(self.chain, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            logger.error(f"[CHAIN] Export error: {e}")
+    def _append(self, block: Dict[str, Any]) -> None:
+        self.ledger.anexar(block)
+        self.chain.append(block)
+        # Cauda limitada em RAM; o corte é amortizado para não mover a lista a cada bloco
+        if len(self.chain) > 2 * self.max_blocks:
+            del self.chain[:-self.max_blocks]
 
     def _rotate_if_needed(self) -> None:
-        today = date.today().isoformat()
-        need_day_rotation = (today != self.current_day)
-        need_size_rotation = (len(self.chain) >= self.max_blocks)
-        if need_day_rotation or need_size_rotation:
-            suffix = f"{today}_{len(self.chain)}"
-            hist_path = os.path.join(CFG.save_dir, f"m36_ledger_{suffix}.json")
-            with open(hist_path, "w", encoding="utf-8") as f:
-                json.dump(self.chain, f, indent=2, ensure_ascii=False)
+        if self.ledger.precisa_rotacionar():
             last_hash = self.chain[-1]["hash"]
-            self.chain = []; self._genesis()
+            hist_path = self.ledger.rotacionar()
             self.add("M36_ROTATE", {"prev_last_hash": last_hash, "export": hist_path}, meta={"severity":"INFO"})
-            self.current_day = today; self._export()
 
     def add(self, event: str, payload: Dict[str, Any], meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         prev = self.chain[-1]
         block = {
-            "index": len(self.chain),
+            "index": prev["index"] + 1,
             "timestamp_utc": datetime.now(timezone.utc).isoformat(),
             "event": event,
             "payload": payload,
@@ -306,16 +319,18 @@ class SimpleChain:
             "meta": meta or {},
         }
         block["hash"] = self._calc_hash(block)
-        self.chain.append(block)
-        self._export(); self._rotate_if_needed()
+        self._append(block); self._rotate_if_needed()
         return block
 
-    def validate(self) -> bool:
-        for i in range(1, len(self.chain)):
-            c, p = self.chain[i], self.chain[i-1]
-            if c["prev_hash"] != p["hash"] or c["hash"] != self._calc_hash(c):
-                return False
-        return True
+    @property
+    def total_blocks(self) -> int:
+        return self.ledger.total_blocos
+
+    def validate(self, full: bool = False) -> bool:
+        result = self.ledger.validar(self._calc_hash, completa=full)
+        if not result["ok"]:
+            logger.error(f"[CHAIN] {result['motivo']} no bloco #{result['primeiro_invalido']} ({result['segmento']})")
+        return result["ok"]
 
 def export_json(path: str, data: Any) -> None:
     try:
@@ -397,7 +412,11 @@ class Modulo36_ArquitetoLuzPrimordial:
         self.modulo35 = MockM35OrquestradorSinfoniaConsciencia()
 
         # Auditoria
-        self.chain = SimpleChain(active_path=os.path.join(self.cfg.save_dir, "m36_ledger.json"), max_blocks=self.cfg.ledger_max_blocks)
+        self.chain = SimpleChain(active_path=os.path.join(self.cfg.save_dir, "m36_ledger.json"), max_blocks=self.cfg.ledger_max_blocks,
+                                 max_bytes=self.cfg.ledger_max_bytes, async_flush=self.cfg.ledger_async_flush)
+
+        # Relatórios de ciclo (armazém colunar; substitui m36_report_cycle_<id>.json)
+        self.relatorios = ArmazemRelatorios(os.path.join(self.cfg.save_dir, "m36_relatorios"))
 
         # Históricos
         self.historico_dissonancia: List[float] = []
@@ -679,7 +698,7 @@ class Modulo36_ArquitetoLuzPrimordial:
                 "status": final_status,
                 "resultado": resultado
             }
-            export_json(os.path.join(self.cfg.save_dir, f"m36_report_cycle_{sha256_hex(str(report_cycle))[:10]}.json"), report_cycle)
+            self.relatorios.adicionar(report_cycle)
 
         self.chain.add("M36_CYCLE", {"status": final_status, "resultado": resultado},
                        meta={"severity": "INFO" if final_status=="SUCESSO" else ("MÉDIO" if final_status=="HOLD" else "ALTO")})
@@ -687,6 +706,10 @@ class Modulo36_ArquitetoLuzPrimordial:
         self.modulo01.RegistrarNaCronicaDaFundacao({"modulo": self.modulo_id, "evento": "CicloManifestacaoConcluido", "status": final_status})
         return resultado
 
+    def consultar_ciclos(self, dominio: Optional[str] = None, inicio=None, fim=None, status=None) -> List[Dict[str, Any]]:
+        """Relatórios de ciclo gravados, filtrados por domínio, intervalo de tempo e status."""
+        return self.relatorios.consultar(dominio, inicio, fim, status)
+
     # Saúde
     def mapa_saude(self) -> Dict[str, Any]:
         diss_reg = self.historico_dissonancia[-100:]
@@ -708,7 +731,7 @@ class Modulo36_ArquitetoLuzPrimordial:
         export_json(os.path.join(self.cfg.save_dir, "m36_report_daily.json"), {
             "date": date.today().isoformat(),
             "health": payload,
-            "blocks": len(self.chain.chain)
+            "blocks": self.chain.total_blocks
         })
 
         self.chain.add("M36_HEALTH", payload, meta={"severity": "ALTO" if diss_media >= 0.5 else "INFO"})
@@ -13,11 +13,21 @@ import time
 import random
 import hashlib
 import json
-import sqlite3
 import os
 import sys
+from collections import deque
 from datetime import datetime
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, Iterable, Optional
+
+from armazenamento_puro import abrir_armazenamento
+
+# NumPy é opcional: apenas a avaliação em lote (varreduras) depende dele
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ModuleNotFoundError:
+    np = None
+    HAS_NUMPY = False
 
 # ===================================================================
 # LOGGING PURO + IMUTABILIDADE VIA HASH
@@ -128,75 +138,273 @@ EQUACOES = {
     "EQ012_F": lambda x: sum(EQUACOES[k](x) for k in EQUACOES if k != "EQ012_F") / 11
 }
 
+# ===================================================================
+# AVALIAÇÃO VETORIZADA – VARREDURAS DE FREQUÊNCIA (NUMPY)
+# ===================================================================
+# Mesmas expressões de EQUACOES, escritas como ufuncs sobre arrays.
+# EQ012_F não está aqui: é a média das colunas já calculadas.
+EQUACOES_VETORIZADAS = {
+    "EQ001_F": lambda x: np.sin(x * 144000) * 0.97,
+    "EQ002_F": lambda x: 1 / (1 + np.exp(-x * 1.618)),
+    "EQ003_F": lambda x: np.mod(x ** 2, 888000),
+    "EQ004_F": lambda x: x * 639000,
+    "EQ005_F": lambda x: 1e6 * np.log1p(np.abs(x)),
+    "EQ006_F": lambda x: np.tanh(x * 528000),
+    "EQ007_F": lambda x: x * 0.0001,
+    "EQ008_F": lambda x: (x > 741000).astype(np.float64),
+    "EQ009_F": lambda x: x * 852000,
+    "EQ010_F": lambda x: 0.999 - np.mod(x, 0.001),
+    "EQ011_F": lambda x: np.sin(x * 330000),
+}
+
+def avaliar_lote(eq_ids: Optional[Iterable[str]], valores) -> "np.ndarray":
+    """
+    Avalia várias equações sobre um array de entradas de uma só vez.
+    Retorna um array estruturado com um campo por equação (na ordem pedida).
+    EQ012_F reaproveita as colunas EQ001–EQ011, calculando cada uma no máximo uma vez.
+    """
+    if not HAS_NUMPY:
+        raise RuntimeError("avaliar_lote requer numpy (pip install numpy)")
+    ids = list(EQUACOES) if eq_ids is None else list(eq_ids)
+    invalidos = [e for e in ids if e not in EQUACOES]
+    if invalidos:
+        raise ValueError(f"Equações desconhecidas: {invalidos}")
+
+    x = np.ascontiguousarray(valores, dtype=np.float64).ravel()
+    colunas: Dict[str, np.ndarray] = {}
+
+    def coluna(eq_id: str) -> np.ndarray:
+        if eq_id not in colunas:
+            if eq_id == "EQ012_F":
+                # Soma na mesma ordem da versão escalar para manter paridade bit a bit
+                acc = np.zeros_like(x)
+                for k in EQUACOES_VETORIZADAS:
+                    acc += coluna(k)
+                colunas[eq_id] = acc / 11
+            else:
+                colunas[eq_id] = EQUACOES_VETORIZADAS[eq_id](x)
+        return colunas[eq_id]
+
+    resultado = np.empty(x.shape[0], dtype=[(e, np.float64) for e in dict.fromkeys(ids)])
+    # exp() satura em 0/inf para |x| grande; o resultado da sigmoide continua correto
+    with np.errstate(over="ignore"):
+        for eq_id in resultado.dtype.names:
+            resultado[eq_id] = coluna(eq_id)
+    return resultado
+
+def verificar_paridade_lote(amostras: int = 2000, rtol: float = 1e-9, atol: float = 1e-9, seed: int = 330) -> Dict[str, Any]:
+    """Compara avaliar_lote com as versões escalares de EQUACOES sobre entradas aleatórias."""
+    rng = random.Random(seed)
+    entradas = [0.0, 1.0, -1.0, 528.0, 741000.0, 741000.5]
+    entradas += [rng.uniform(-1e3, 1e3) for _ in range(amostras // 2)]
+    entradas += [rng.uniform(0, 2e6) for _ in range(amostras - amostras // 2)]
+
+    lote = avaliar_lote(None, entradas)
+    divergencias = {}
+    for eq_id, f in EQUACOES.items():
+        pior = 0.0
+        for i, x in enumerate(entradas):
+            try:
+                esperado = f(x)
+            except OverflowError:
+                # math.exp estoura onde np.exp satura; a sigmoide escalar não tem valor aqui
+                continue
+            obtido = float(lote[eq_id][i])
+            erro = abs(obtido - esperado)
+            if erro > atol + rtol * abs(esperado):
+                pior = max(pior, erro)
+        if pior:
+            divergencias[eq_id] = pior
+    return {"amostras": len(entradas), "equacoes": len(EQUACOES), "ok": not divergencias, "divergencias": divergencias}
+
+def benchmark_lote(n: int = 1_000_000, eq_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Mede a varredura vetorizada e estima o custo da versão escalar por amostragem."""
+    ids = list(EQUACOES) if eq_ids is None else eq_ids
+    x = np.linspace(1.0, 1e6, n)
+
+    t0 = time.perf_counter()
+    avaliar_lote(ids, x)
+    t_lote = time.perf_counter() - t0
+
+    amostra = x[:: max(1, n // 20000)].tolist()
+    t0 = time.perf_counter()
+    for v in amostra:
+        for eq_id in ids:
+            EQUACOES[eq_id](v)
+    t_escalar = (time.perf_counter() - t0) * n / len(amostra)
+
+    return {
+        "entradas": n,
+        "equacoes": len(ids),
+        "lote_s": round(t_lote, 4),
+        "escalar_estimado_s": round(t_escalar, 2),
+        "aceleracao": round(t_escalar / t_lote, 1) if t_lote else None,
+    }
+
 # ===================================================================
 # IA PURA – REGRESSÃO + ANOMALIAS
 # ===================================================================
+class MomentosOnline:
+    """
+    Médias, variâncias e covariância de pares (x, y) atualizadas em O(1) por observação
+    (Welford ponderado). fator_esquecimento < 1 dá peso exponencialmente menor ao passado;
+    janela limita a estatística às últimas N observações. Memória constante em ambos os casos.
+    """
+    def __init__(self, fator_esquecimento: float = 1.0, janela: Optional[int] = None):
+        if not 0.0 < fator_esquecimento <= 1.0:
+            raise ValueError("fator_esquecimento deve estar em (0, 1]")
+        self.fator = fator_esquecimento
+        self.janela = janela
+        self.recentes = deque() if janela else None
+        self.reiniciar()
+
+    def reiniciar(self):
+        self.n = 0
+        self.peso = 0.0
+        self.media_x = self.media_y = 0.0
+        self.m2_x = self.m2_y = self.c_xy = 0.0
+        if self.recentes is not None:
+            self.recentes.clear()
+
+    def _somar(self, x: float, y: float, w: float):
+        self.peso += w
+        dx = x - self.media_x
+        dy = y - self.media_y
+        self.media_x += w * dx / self.peso
+        self.media_y += w * dy / self.peso
+        self.m2_x += w * dx * (x - self.media_x)
+        self.m2_y += w * dy * (y - self.media_y)
+        self.c_xy += w * dx * (y - self.media_y)
+
+    def _remover(self, x: float, y: float, w: float):
+        restante = self.peso - w
+        if restante <= 1e-12:
+            self.peso = 0.0
+            self.media_x = self.media_y = self.m2_x = self.m2_y = self.c_xy = 0.0
+            return
+        media_x_ant, media_y_ant = self.media_x, self.media_y
+        self.media_x -= w * (x - media_x_ant) / restante
+        self.media_y -= w * (y - media_y_ant) / restante
+        self.m2_x = max(0.0, self.m2_x - w * (x - self.media_x) * (x - media_x_ant))
+        self.m2_y = max(0.0, self.m2_y - w * (y - self.media_y) * (y - media_y_ant))
+        self.c_xy -= w * (x - self.media_x) * (y - media_y_ant)
+        self.peso = restante
+
+    def atualizar(self, x: float, y: float = 0.0):
+        if self.fator < 1.0:
+            self.peso *= self.fator
+            self.m2_x *= self.fator
+            self.m2_y *= self.fator
+            self.c_xy *= self.fator
+        self._somar(x, y, 1.0)
+        self.n += 1
+        if self.recentes is not None:
+            self.recentes.append((x, y))
+            if len(self.recentes) > self.janela:
+                # A observação que sai foi decaída uma vez por observação que entrou depois dela
+                x_velho, y_velho = self.recentes.popleft()
+                self._remover(x_velho, y_velho, self.fator ** self.janela)
+                self.n -= 1
+
+    @property
+    def var_x(self) -> float:
+        return self.m2_x / self.peso if self.peso > 0 else 0.0
+
+    @property
+    def var_y(self) -> float:
+        return self.m2_y / self.peso if self.peso > 0 else 0.0
+
 class RegressaoLinearPura:
-    def __init__(self): self.slope, self.intercept = 0.0, 0.0
+    """Mínimos quadrados incrementais: cada atualizar() custa O(1)."""
+    def __init__(self, fator_esquecimento: float = 1.0, janela: Optional[int] = None):
+        self.momentos = MomentosOnline(fator_esquecimento, janela)
+        self.slope, self.intercept = 0.0, 0.0
+    def atualizar(self, x: float, y: float):
+        m = self.momentos
+        m.atualizar(x, y)
+        if m.m2_x > 1e-12 * max(1.0, m.peso):
+            self.slope = m.c_xy / m.m2_x
+            self.intercept = m.media_y - self.slope * m.media_x
+        else:
+            self.slope, self.intercept = 0.0, m.media_y
     def treinar(self, X: List[float], y: List[float]):
-        n = len(X)
-        if n == 0: return
-        sum_x = sum(X)
-        sum_y = sum(y)
-        sum_xy = sum(X[i] * y[i] for i in range(n))
-        sum_x2 = sum(x * x for x in X)
-        den = n * sum_x2 - sum_x ** 2
-        if den == 0: return
-        self.slope = (n * sum_xy - sum_x * sum_y) / den
-        self.intercept = (sum_y - self.slope * sum_x) / n
+        self.momentos.reiniciar()
+        for xi, yi in zip(X, y):
+            self.atualizar(xi, yi)
     def prever(self, X: List[float]) -> List[float]:
         return [self.slope * x + self.intercept for x in X]
 
 class DetectorAnomaliasPuro:
-    def __init__(self): self.media, self.desvio = 0.0, 1.0
-    def treinar(self, dados: List[float]):
-        if not dados: return
-        self.media = sum(dados) / len(dados)
-        var = sum((x - self.media) ** 2 for x in dados) / len(dados)
+    """Média e desvio por Welford; detectar() compara contra o estado atual sem retreino."""
+    def __init__(self, fator_esquecimento: float = 1.0, janela: Optional[int] = None):
+        self.momentos = MomentosOnline(fator_esquecimento, janela)
+        self.media, self.desvio = 0.0, 1.0
+    def atualizar(self, valor: float):
+        m = self.momentos
+        m.atualizar(valor)
+        self.media = m.media_x
+        var = m.var_x
         self.desvio = math.sqrt(var) if var > 0 else 1.0
+    def treinar(self, dados: List[float]):
+        self.momentos.reiniciar()
+        for valor in dados:
+            self.atualizar(valor)
     def detectar(self, valor: float, limiar: float = 2.0) -> bool:
+        if self.momentos.n < 2:
+            return False
         return abs(valor - self.media) / self.desvio > limiar if self.desvio > 0 else False
 
 # ===================================================================
 # MÓDULO 3 – PREVISÃO TEMPORAL & MONITORAMENTO CÓSMICO
 # ===================================================================
 class Modulo3PrevisaoTemporalPuro:
-    def __init__(self, db_path: str = "/dev/shm/modulo3_puro.db"):
+    TABELAS = {
+        "previsoes": "ts TEXT, valor REAL, hash TEXT",
+        "anomalias": "ts TEXT, risco TEXT, desvio REAL, hash TEXT",
+        "saturno": "ts TEXT, ressonancia REAL, aneis TEXT, acao TEXT, hash TEXT",
+        "equacoes": "id TEXT, freq REAL, params TEXT, resultado TEXT, hash TEXT, ts TEXT",
+    }
+    INDICES = {
+        "previsoes": ("ts",),
+        "anomalias": ("ts",),
+        "saturno": ("ts",),
+        "equacoes": ("id", "ts"),
+    }
+
+    def __init__(self, db_path: str = "/dev/shm/modulo3_puro.db", durabilidade: str = "normal",
+                 fator_esquecimento: float = 1.0, janela: Optional[int] = 256):
         self.nome = "Módulo 3 - Previsão Temporal Puro"
         self.versao = "3.3.Ω"
         self.db_path = db_path
+        self.durabilidade = durabilidade
+        self.db = None
         self.logger = LoggerPuro("M3")
-        self.previsor = RegressaoLinearPura()
-        self.detector = DetectorAnomaliasPuro()
+        # Um previsor e um detector por equação, alimentados por cada execução
+        self.fator_esquecimento = fator_esquecimento
+        self.janela = janela
+        self.previsores: Dict[str, RegressaoLinearPura] = {}
+        self.detectores: Dict[str, DetectorAnomaliasPuro] = {}
         self.qkd = QKDLocal()
         self.hsm = HSMIsolado()
         self.chave_sessao = None
         self._inicializar_sistema()
-        self._treinar_modelos()
 
     def _inicializar_sistema(self):
         self.logger.info("INICIANDO MÓDULO 3 – MODO OFFLINE SEGURO")
-        if os.path.exists(self.db_path):
-            os.remove(self.db_path)
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("CREATE TABLE IF NOT EXISTS previsoes (ts TEXT, valor REAL, hash TEXT)")
-        c.execute("CREATE TABLE IF NOT EXISTS anomalias (ts TEXT, risco TEXT, desvio REAL, hash TEXT)")
-        c.execute("CREATE TABLE IF NOT EXISTS saturno (ts TEXT, ressonancia REAL, aneis TEXT, acao TEXT, hash TEXT)")
-        c.execute("CREATE TABLE IF NOT EXISTS equacoes (id TEXT, freq REAL, params TEXT, resultado TEXT, hash TEXT)")
-        conn.commit()
-        conn.close()
+        # Conexão única (WAL) com inserções em lote; o banco é recriado a cada inicialização
+        self.db = abrir_armazenamento(self.db_path, self.TABELAS, indices=self.INDICES,
+                                      durabilidade=self.durabilidade, recriar=True)
 
         # QKD + HSM
         self.chave_sessao = self.qkd.executar_bb84()
         self.hsm.armazenar(0, self.chave_sessao)
         self.logger.info("QKD + HSM ATIVADOS", chave_hash=hashlib.sha3_256(self.chave_sessao).hexdigest()[:16])
 
-    def _treinar_modelos(self):
-        dados = [50 + 0.5*i + 10*math.sin(2*math.pi*i/20) + random.uniform(-5,5) for i in range(100)]
-        self.previsor.treinar(list(range(100)), dados)
-        self.detector.treinar(dados)
-        self.logger.info("IA TREINADA", pontos=100)
+    def _modelos(self, eq_id: str) -> Tuple[RegressaoLinearPura, DetectorAnomaliasPuro]:
+        if eq_id not in self.previsores:
+            self.previsores[eq_id] = RegressaoLinearPura(self.fator_esquecimento, self.janela)
+            self.detectores[eq_id] = DetectorAnomaliasPuro(self.fator_esquecimento, self.janela)
+        return self.previsores[eq_id], self.detectores[eq_id]
 
     def aplicar_equacao_externa(self, eq_id: str, frequencia: float, parametros: Dict[str, Any]) -> Dict[str, Any]:
         self.logger.info(f"APLICANDO EQ: {eq_id}", freq=frequencia, params=str(parametros)[:50])
@@ -211,9 +419,13 @@ class Modulo3PrevisaoTemporalPuro:
             self.logger.warning(f"ERRO NA EQ {eq_id}", erro=str(e))
             return {"status": "ERRO", "motivo": str(e)}
 
-        # Previsão + Anomalia
-        futuro = self.previsor.prever([entrada + i for i in range(1, 6)])
-        anomalia = any(self.detector.detectar(f) for f in futuro)
+        # Anomalia da saída atual contra o histórico, depois atualização online (O(1)) e previsão
+        previsor, detector = self._modelos(eq_id)
+        anomalia_saida = detector.detectar(saida)
+        previsor.atualizar(entrada, saida)
+        detector.atualizar(saida)
+        futuro = previsor.prever([entrada + i for i in range(1, 6)])
+        anomalia = anomalia_saida or any(detector.detectar(f) for f in futuro)
 
         # Assinatura
         msg = f"{eq_id}{frequencia}{json.dumps(parametros)}{saida}"
@@ -226,18 +438,15 @@ class Modulo3PrevisaoTemporalPuro:
             "saida": round(saida, 6),
             "previsoes_futuras": [round(f, 3) for f in futuro],
             "anomalia_detectada": anomalia,
+            "observacoes_modelo": previsor.momentos.n,
             "score_sincronicidade": round(random.uniform(0.92, 0.99), 4),
             "timestamp": datetime.now().isoformat(),
             "assinatura": sig
         }
 
         # Banco + Log
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("INSERT INTO equacoes VALUES (?, ?, ?, ?, ?)",
-                  (eq_id, frequencia, json.dumps(parametros), json.dumps(resultado), sig))
-        conn.commit()
-        conn.close()
+        self.db.inserir("equacoes", (eq_id, frequencia, json.dumps(parametros), json.dumps(resultado), sig,
+                                     resultado["timestamp"]))
 
         self.logger.info(f"EQUACAO {eq_id} EXECUTADA", score=resultado["score_sincronicidade"], sig=sig)
         return resultado
@@ -248,20 +457,33 @@ class Modulo3PrevisaoTemporalPuro:
         acao = "NENHUMA" if estado == "ESTÁVEL" else "CORREÇÃO_VIBRACIONAL"
         hash_entry = hashlib.sha3_256(f"{ressonancia}{estado}".encode()).hexdigest()[:12]
 
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("INSERT INTO saturno VALUES (?, ?, ?, ?, ?)",
-                  (datetime.now().isoformat(), ressonancia, estado, acao, hash_entry))
-        conn.commit()
-        conn.close()
+        self.db.inserir("saturno", (datetime.now().isoformat(), ressonancia, estado, acao, hash_entry))
 
         self.logger.info("SATURNO MONITORADO", ressonancia=round(ressonancia, 2), estado=estado, acao=acao)
 
+    def historico_equacoes(self, eq_id: str = None, desde: str = None, limite: int = 100) -> List[Dict[str, Any]]:
+        """Consulta as execuções gravadas (usa os índices de id e ts)."""
+        filtros, params = [], []
+        if eq_id:
+            filtros.append("id = ?")
+            params.append(eq_id)
+        if desde:
+            filtros.append("ts >= ?")
+            params.append(desde)
+        where = f"WHERE {' AND '.join(filtros)}" if filtros else ""
+        linhas = self.db.consultar(f"SELECT resultado FROM equacoes {where} ORDER BY ts DESC LIMIT ?", (*params, limite))
+        return [json.loads(r[0]) for r in linhas]
+
+    def fechar(self):
+        """Grava o buffer pendente e fecha a conexão."""
+        if self.db is not None:
+            self.db.fechar()
+
 # ===================================================================
 # EXECUÇÃO AUTOMÁTICA + INTERFACE CLI
 # ===================================================================
-def executar_equacao(eq_id: str, freq: float = 1.0, params: Dict = None):
-    modulo = Modulo3PrevisaoTemporalPuro()
+def executar_equacao(eq_id: str, freq: float = 1.0, params: Dict = None, durabilidade: str = "normal"):
+    modulo = Modulo3PrevisaoTemporalPuro(durabilidade=durabilidade)
     resultado = modulo.aplicar_equacao_externa(eq_id, freq, params or {})
     print(json.dumps(resultado, indent=2, ensure_ascii=False))
     return resultado
@@ -269,14 +491,54 @@ def executar_equacao(eq_id: str, freq: float = 1.0, params: Dict = None):
 def main():
     if len(sys.argv) < 2:
         print("Uso:")
-        print("  python3 modulo3.py --eq <ID> [--freq <HZ>] [--param <k=v,...>]")
+        print("  python3 modulo3.py --eq <ID> [--freq <HZ>] [--param <k=v,...>] [--durabilidade maxima|normal|rapida]")
         print("  python3 modulo3.py --demo")
+        print("  python3 modulo3.py --lote <INICIO> <FIM> <N> [--eq <ID,...>]")
+        print("  python3 modulo3.py --paridade-lote")
+        print("  python3 modulo3.py --bench-lote [N]")
         sys.exit(1)
 
+    durabilidade = "normal"
+    if "--durabilidade" in sys.argv:
+        try:
+            durabilidade = sys.argv[sys.argv.index("--durabilidade") + 1]
+        except:
+            print("ERRO: --durabilidade requer maxima, normal ou rapida.")
+            sys.exit(1)
+
     if sys.argv[1] == "--demo":
-        modulo = Modulo3PrevisaoTemporalPuro()
+        modulo = Modulo3PrevisaoTemporalPuro(durabilidade=durabilidade)
         modulo.monitorar_saturno()
-        executar_equacao("EQ001_F", 528.0, {"modo": "ativacao"})
+        executar_equacao("EQ001_F", 528.0, {"modo": "ativacao"}, durabilidade)
+        return
+
+    if sys.argv[1] in ("--lote", "--paridade-lote", "--bench-lote") and not HAS_NUMPY:
+        print("ERRO: avaliação em lote requer numpy.")
+        sys.exit(1)
+
+    if sys.argv[1] == "--lote":
+        try:
+            inicio, fim, n = float(sys.argv[2]), float(sys.argv[3]), int(sys.argv[4])
+        except:
+            print("ERRO: --lote requer <INICIO> <FIM> <N>.")
+            sys.exit(1)
+        ids = None
+        if "--eq" in sys.argv:
+            ids = sys.argv[sys.argv.index("--eq") + 1].split(',')
+        tabela = avaliar_lote(ids, np.linspace(inicio, fim, n))
+        resumo = {eq: {"min": float(tabela[eq].min()), "max": float(tabela[eq].max()), "media": float(tabela[eq].mean())}
+                  for eq in tabela.dtype.names}
+        print(json.dumps({"entradas": n, "colunas": resumo}, indent=2, ensure_ascii=False))
+        return
+
+    if sys.argv[1] == "--paridade-lote":
+        relatorio = verificar_paridade_lote()
+        print(json.dumps(relatorio, indent=2, ensure_ascii=False))
+        sys.exit(0 if relatorio["ok"] else 1)
+
+    if sys.argv[1] == "--bench-lote":
+        n = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+        print(json.dumps(benchmark_lote(n), indent=2, ensure_ascii=False))
         return
 
     if sys.argv[1] != "--eq":
@@ -306,7 +568,7 @@ def main():
             print("ERRO: --param mal formatado.")
             sys.exit(1)
 
-    executar_equacao(eq_id, freq, params)
+    executar_equacao(eq_id, freq, params, durabilidade)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -2,14 +2,15 @@ from __future__ import annotations
 import argparse, json, pickle, random
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Union, Tuple
+from typing import Dict, Any, List, Optional, Union, Tuple, Iterator
 from collections import Counter
 import itertools
 import hashlib
 import logging, sys
+import time
 from textwrap import dedent
 import math
-from dataclasses import dataclass # Importação adicionada para dataclass
+from dataclasses import dataclass, field # Importação adicionada para dataclass
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -876,19 +877,23 @@ def seq_to_signal(seq: str, alpha: Dict[str, float]) -> Optional[np.ndarray]:
     if not HAS_NUMPY or np is None:
         logging.warning("NumPy não disponível. Não é possível converter sequência para sinal numérico.")
         return None
-   
-    filtered_seq = [alpha.get(ch, None) for ch in seq]
-    return np.array([val for val in filtered_seq if val is not None], dtype=float)
+    table = SymbolTable(alpha)
+    return table.signal(table.encode(seq))
 
 
+def _spectrum(sig: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Amplitude spectrum (|rFFT|) and normalized frequencies; uses SciPy when available, NumPy otherwise."""
+    if HAS_SCIPY_FFT and rfft is not None:
+        return np.abs(rfft(sig)), rfftfreq(len(sig))
+    return np.abs(np.fft.rfft(sig)), np.fft.rfftfreq(len(sig))
 
 
 def fft_plot(sig: Optional[np.ndarray], bands: int, title: str, out: Path, html: bool = False):
     """
     Generates and saves FFT plots (PNG and optionally HTML). Handles multiband plots.
     """
-    if not (HAS_NUMPY and np is not None and HAS_MATPLOTLIB and plt is not None and HAS_SCIPY_FFT and rfft is not None):
-        logging.warning("Bibliotecas NumPy, Matplotlib ou SciPy.FFT não disponíveis. Não é possível gerar gráficos FFT.")
+    if not (HAS_NUMPY and np is not None):
+        logging.warning("NumPy não disponível. Não é possível gerar gráficos FFT.")
         log_event_jsonl("M41", "WARNING", "FFT_PLOT_SKIPPED", {"reason": "libs_not_available"})
         return
     if sig is None or sig.size == 0:
@@ -903,10 +908,16 @@ def fft_plot(sig: Optional[np.ndarray], bands: int, title: str, out: Path, html:
         sig = sig.astype(float)
 
 
-    spec = np.abs(rfft(sig))
-    freq = rfftfreq(len(sig))
+    spec, freq = _spectrum(sig)
+    plot_spectrum(freq, spec, bands, title, out, html)
 
 
+def plot_spectrum(freq: np.ndarray, spec: np.ndarray, bands: int, title: str, out: Path, html: bool = False):
+    """Renders an already computed amplitude spectrum (PNG and optionally HTML)."""
+    if not (HAS_MATPLOTLIB and plt is not None):
+        logging.warning("Matplotlib não disponível. Não é possível gerar gráficos FFT.")
+        log_event_jsonl("M41", "WARNING", "FFT_PLOT_SKIPPED", {"reason": "libs_not_available"})
+        return
     out.parent.mkdir(parents=True, exist_ok=True)
 
 
@@ -966,6 +977,217 @@ def fft_plot(sig: Optional[np.ndarray], bands: int, title: str, out: Path, html:
 
 
 
+###############################################################################
+# 2b. Pipeline vetorizado – tabela de símbolos, k-mers empacotados, streaming #
+###############################################################################
+
+
+UNKNOWN_SYMBOL = 255 # Índice reservado na tabela uint8
+
+
+class SymbolTable:
+    """
+    Maps sequence symbols to uint8 indices through a lookup table indexed by code point.
+    Symbols outside the alphabet get new indices on first sight (their signal value is NaN and they are
+    dropped from the signal, as before), so codon counts still cover every symbol in the sequence.
+    """
+
+    def __init__(self, alphabet: Dict[str, float]):
+        self.symbols: List[str] = []
+        self._values: List[float] = []
+        self._lut = np.full(128, UNKNOWN_SYMBOL, dtype=np.uint8)
+        for symbol, value in alphabet.items():
+            if len(symbol) == 1:
+                self._add(symbol, float(value))
+        self.values = np.array(self._values, dtype=float)
+
+    def _add(self, symbol: str, value: float = float("nan")):
+        if len(self.symbols) >= UNKNOWN_SYMBOL:
+            raise ValueError("Alfabeto excede 255 símbolos distintos.")
+        cp = ord(symbol)
+        if cp >= self._lut.size:
+            grown = np.full(cp + 1, UNKNOWN_SYMBOL, dtype=np.uint8)
+            grown[:self._lut.size] = self._lut
+            self._lut = grown
+        self._lut[cp] = len(self.symbols)
+        self.symbols.append(symbol)
+        self._values.append(value)
+
+    def encode(self, chunk: str) -> np.ndarray:
+        """Converts a string chunk into a uint8 index array (one LUT gather, no per-symbol Python loop)."""
+        if chunk.isascii():
+            cps = np.frombuffer(chunk.encode("ascii"), dtype=np.uint8)
+        else:
+            cps = np.frombuffer(chunk.encode("utf-32-le"), dtype=np.uint32)
+        known = cps < self._lut.size
+        idx = np.full(cps.size, UNKNOWN_SYMBOL, dtype=np.uint8)
+        idx[known] = self._lut[cps[known]]
+        missing = idx == UNKNOWN_SYMBOL
+        if missing.any():
+            for cp in np.unique(cps[missing]):
+                self._add(chr(int(cp)))
+            self.values = np.array(self._values, dtype=float)
+            return self.encode(chunk)
+        return idx
+
+    def signal(self, idx: np.ndarray) -> np.ndarray:
+        values = self.values[idx]
+        return values[~np.isnan(values)]
+
+
+class GeneStreamAccumulator:
+    """
+    Incremental statistics for one sequence fed in chunks: length, per-symbol counts, non-overlapping
+    codon counts (k-mers packed into integer codes and counted with bincount) and the amplitude spectrum.
+
+    With spectral_window=None the whole signal is kept and transformed at the end (exact, used by
+    analyze_gene on in-memory sequences). With a window size, full windows are transformed as they
+    arrive and their spectra averaged, so memory stays bounded for genome-scale inputs; if the
+    sequence never fills a window the remainder is transformed as a whole.
+    """
+
+    BINCOUNT_LIMIT = 1 << 22 # Acima disso, np.unique no lugar de bincount
+
+    def __init__(self, table: SymbolTable, codon_length: int, spectral_window: Optional[int] = None, preview: int = 4096):
+        self.table = table
+        self.k = max(1, codon_length)
+        self.spectral_window = spectral_window
+        self.preview_size = preview
+        self.preview: List[str] = []
+        self._preview_len = 0
+        self.length = 0
+        self.symbol_counts = np.zeros(256, dtype=np.int64)
+        self.codon_counts: Counter = Counter()
+        self._codon_carry = np.empty(0, dtype=np.uint8)
+        self._signal_parts: List[np.ndarray] = []
+        self._signal_carry = np.empty(0, dtype=float)
+        self._spec_sum: Optional[np.ndarray] = None
+        self._windows = 0
+
+    def update(self, chunk: str):
+        if not chunk:
+            return
+        if self._preview_len < self.preview_size:
+            piece = chunk[:self.preview_size - self._preview_len]
+            self.preview.append(piece)
+            self._preview_len += len(piece)
+        idx = self.table.encode(chunk)
+        self.length += idx.size
+        self.symbol_counts += np.bincount(idx, minlength=256)
+        self._count_codons(idx)
+        self._feed_signal(self.table.signal(idx))
+
+    def _count_codons(self, idx: np.ndarray):
+        if self._codon_carry.size:
+            idx = np.concatenate([self._codon_carry, idx])
+        full = (idx.size // self.k) * self.k
+        self._codon_carry = idx[full:].copy()
+        if not full:
+            return
+        radix = len(self.table.symbols)
+        frames = idx[:full].reshape(-1, self.k).astype(np.int64)
+        codes = frames[:, 0].copy()
+        for j in range(1, self.k):
+            codes *= radix
+            codes += frames[:, j]
+        space = radix ** self.k
+        if space <= self.BINCOUNT_LIMIT:
+            counts = np.bincount(codes, minlength=space)
+            present = np.flatnonzero(counts)
+            values = counts[present]
+        else:
+            present, values = np.unique(codes, return_counts=True)
+        symbols = self.table.symbols
+        for code, count in zip(present.tolist(), values.tolist()):
+            digits = []
+            for _ in range(self.k):
+                code, d = divmod(code, radix)
+                digits.append(symbols[d])
+            self.codon_counts["".join(reversed(digits))] += count
+
+    def _feed_signal(self, sig: np.ndarray):
+        if self.spectral_window is None:
+            self._signal_parts.append(sig)
+            return
+        if self._signal_carry.size:
+            sig = np.concatenate([self._signal_carry, sig])
+        w = self.spectral_window
+        full = (sig.size // w) * w
+        self._signal_carry = sig[full:].copy()
+        if full:
+            block = sig[:full].reshape(-1, w)
+            spec = np.abs(np.fft.rfft(block, axis=1)).sum(axis=0)
+            self._spec_sum = spec if self._spec_sum is None else self._spec_sum + spec
+            self._windows += block.shape[0]
+
+    def spectrum(self) -> Optional[Tuple[np.ndarray, np.ndarray, int]]:
+        """(freq, mean amplitude spectrum, windows) or None for an empty signal."""
+        if self.spectral_window is None or not self._windows:
+            sig = np.concatenate(self._signal_parts) if self.spectral_window is None and self._signal_parts else self._signal_carry
+            if sig.size == 0:
+                return None
+            spec, freq = _spectrum(sig)
+            return freq, spec, 1
+        w = self.spectral_window
+        return np.fft.rfftfreq(w), self._spec_sum / self._windows, self._windows
+
+    def counts_by_symbol(self) -> Dict[str, int]:
+        symbols = self.table.symbols
+        return {symbols[i]: int(self.symbol_counts[i]) for i in np.flatnonzero(self.symbol_counts[:len(symbols)])}
+
+    def gc_content(self) -> float:
+        if not self.length:
+            return 0.0
+        counts = self.counts_by_symbol()
+        return ((counts.get('G', 0) + counts.get('C', 0)) / self.length) * 100
+
+
+def iter_fasta(path: Union[str, Path], chunk_size: int = 1 << 22) -> Iterator[Tuple[str, str]]:
+    """
+    Streams a FASTA file as (record_id, sequence_chunk) pairs of roughly chunk_size symbols,
+    without ever holding a full record in memory. Line breaks are removed; header lines start records.
+    """
+    record_id: Optional[str] = None
+    parts: List[str] = []
+    size = 0
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.startswith(">"):
+                if record_id is not None and parts:
+                    yield record_id, "".join(parts)
+                record_id = line[1:].strip().split()[0] if line[1:].strip() else f"record_{hashlib.sha256(line.encode()).hexdigest()[:8]}"
+                parts, size = [], 0
+                continue
+            piece = line.strip()
+            if not piece:
+                continue
+            if record_id is None:
+                record_id = Path(path).stem
+            parts.append(piece)
+            size += len(piece)
+            if size >= chunk_size:
+                yield record_id, "".join(parts)
+                parts, size = [], 0
+    if record_id is not None and parts:
+        yield record_id, "".join(parts)
+
+
+# Estágio de plotagem adiado: analyze_gene(plot=True) só enfileira o espectro já calculado
+PENDING_SPECTRUM_PLOTS: List[Tuple[np.ndarray, np.ndarray, str, Path]] = []
+
+
+def render_pending_spectra(bands: int = 1, html: bool = False) -> int:
+    """Renders and clears every queued spectrum. Returns how many plots were rendered."""
+    rendered = 0
+    while PENDING_SPECTRUM_PLOTS:
+        freq, spec, title, out = PENDING_SPECTRUM_PLOTS.pop(0)
+        plot_spectrum(freq, spec, bands, title, out, html)
+        rendered += 1
+    return rendered
+
+
+
+
 ###############################################################################
 # 3. GeneAnalyzer – Análise detalhada de sequências genéticas               #
 ###############################################################################
@@ -987,15 +1209,7 @@ class GeneAnalysisResult:
     notes: str = ""
 
 
-def analyze_gene(gene_id: str, dna_sequence: str, species: str = "humano") -> GeneAnalysisResult:
-    """
-    Performs a comprehensive analysis of a given DNA sequence.
-    Integrates with other modules' conceptual functionalities.
-    """
-    logging.info(f"\nAnalisando gene '{gene_id}' para a espécie '{species}'...")
-    log_event_jsonl("M41", "INFO", "GENE_ANALYSIS_START", {"gene_id": gene_id, "species": species})
-
-
+def _ensure_species_loaded(gene_id: str, species: str):
     # Ensure species config is loaded
     # Esta verificação agora é redundante aqui, pois load_species_config é chamada no main.
     # Mas mantida como um fallback de segurança.
@@ -1006,36 +1220,99 @@ def analyze_gene(gene_id: str, dna_sequence: str, species: str = "humano") -> Ge
             raise ValueError(f"Configuração da espécie '{species}' não disponível.")
 
 
-    length = len(dna_sequence)
-    gc_content = _calculate_gc_content(dna_sequence)
+def analyze_gene(gene_id: str, dna_sequence: str, species: str = "humano", plot: bool = False) -> GeneAnalysisResult:
+    """
+    Performs a comprehensive analysis of a given DNA sequence.
+    Integrates with other modules' conceptual functionalities.
+    With plot=True the spectrum is queued for render_pending_spectra() instead of being drawn inline.
+    """
+    logging.info(f"\nAnalisando gene '{gene_id}' para a espécie '{species}'...")
+    log_event_jsonl("M41", "INFO", "GENE_ANALYSIS_START", {"gene_id": gene_id, "species": species})
+    _ensure_species_loaded(gene_id, species)
+
     codon_length = _get_species_codon_length(species)
-    codon_counts = _count_codons(dna_sequence, codon_length)
-   
-    # Spectral Analysis
-    alphabet = SPECIES_CONFIG.get('alphabet', {})
-    signal = seq_to_signal(dna_sequence, alphabet)
-   
-    spectral_analysis_data = {}
-    if HAS_NUMPY and HAS_MATPLOTLIB and HAS_SCIPY_FFT:
-        fft_plot(signal, bands=1, title=f"Espectrograma para {gene_id}", out=LOG_DIR / f"{gene_id}_fft")
-        if signal is not None and signal.size > 0:
-            spec = np.abs(rfft(signal))
-            freq = rfftfreq(len(signal))
-            spectral_analysis_data = {
-                "max_amplitude_freq": freq[np.argmax(spec)] if spec.size > 0 else 0.0,
-                "total_spectral_energy": np.sum(spec)
-            }
-    else:
+    if not HAS_NUMPY or np is None:
         logging.warning("Análise espectral limitada devido a bibliotecas ausentes.")
-        spectral_analysis_data = {"status": "limited_analysis", "reason": "NumPy/Matplotlib/SciPy.FFT missing"}
-   
+        symbol_counts = dict(Counter(dna_sequence))
+        stats = {
+            "length": len(dna_sequence),
+            "gc_content": _calculate_gc_content(dna_sequence),
+            "codon_counts": _count_codons(dna_sequence, codon_length),
+            "symbol_counts": symbol_counts,
+            "spectral_analysis": {"status": "limited_analysis", "reason": "NumPy missing"},
+        }
+        return _build_gene_result(gene_id, dna_sequence, species, stats)
+
+    acc = GeneStreamAccumulator(SymbolTable(SPECIES_CONFIG.get('alphabet', {})), codon_length, spectral_window=None, preview=0)
+    acc.update(dna_sequence)
+    return _build_gene_result(gene_id, dna_sequence, species, _accumulator_stats(acc, gene_id, plot))
+
+
+def analyze_fasta(path: Union[str, Path], species: str = "humano", chunk_size: int = 1 << 22,
+                  spectral_window: int = 1 << 16, preview: int = 4096, plot: bool = False) -> List[GeneAnalysisResult]:
+    """
+    Streams a FASTA file and analyzes each record without loading it whole: symbols go through the
+    uint8 lookup table chunk by chunk and codon counts, GC, entropy and the windowed spectrum are
+    accumulated incrementally. The result's `sequence` holds only the first `preview` symbols.
+    """
+    if not HAS_NUMPY or np is None:
+        raise RuntimeError("NumPy é necessário para a análise em streaming de FASTA.")
+    _ensure_species_loaded(Path(path).name, species)
+    codon_length = _get_species_codon_length(species)
+    table = SymbolTable(SPECIES_CONFIG.get('alphabet', {}))
+    results: List[GeneAnalysisResult] = []
+    current: Optional[str] = None
+    acc: Optional[GeneStreamAccumulator] = None
+
+    def finish():
+        log_event_jsonl("M41", "INFO", "GENE_ANALYSIS_START", {"gene_id": current, "species": species, "source": str(path)})
+        results.append(_build_gene_result(current, "".join(acc.preview), species, _accumulator_stats(acc, current, plot)))
+
+    for record_id, chunk in iter_fasta(path, chunk_size):
+        if record_id != current:
+            if acc is not None:
+                finish()
+            current = record_id
+            acc = GeneStreamAccumulator(table, codon_length, spectral_window=spectral_window, preview=preview)
+        acc.update(chunk)
+    if acc is not None:
+        finish()
+    return results
+
+
+def _accumulator_stats(acc: GeneStreamAccumulator, gene_id: str, plot: bool) -> Dict[str, Any]:
+    spectral_analysis_data: Dict[str, Any] = {}
+    spectrum = acc.spectrum()
+    if spectrum is not None:
+        freq, spec, windows = spectrum
+        spectral_analysis_data = {
+            "max_amplitude_freq": float(freq[np.argmax(spec)]) if spec.size > 0 else 0.0,
+            "total_spectral_energy": float(np.sum(spec) * windows),
+        }
+        if windows > 1:
+            spectral_analysis_data["spectral_windows"] = windows
+        if plot:
+            PENDING_SPECTRUM_PLOTS.append((freq, spec, f"Espectrograma para {gene_id}", LOG_DIR / f"{gene_id}_fft"))
+    return {
+        "length": acc.length,
+        "gc_content": acc.gc_content(),
+        "codon_counts": dict(acc.codon_counts),
+        "symbol_counts": acc.counts_by_symbol(),
+        "spectral_analysis": spectral_analysis_data,
+    }
+
+
+def _build_gene_result(gene_id: str, sequence: str, species: str, stats: Dict[str, Any]) -> GeneAnalysisResult:
+    """Derives the codon-based annotations shared by analyze_gene and analyze_fasta."""
+    codon_counts = stats["codon_counts"]
+
     # Mutation Risk Score (Conceptual, using RandomForest if available)
-    mutation_risk_score = _predict_mutation_risk(dna_sequence)
+    mutation_risk_score = _predict_mutation_risk_from_stats(stats["length"], stats["gc_content"], stats["symbol_counts"])
 
 
     # Ethical Alignment Score (Conceptual, using a mock for now)
     # This would involve M5 and M7 in a real scenario
-    ethical_alignment_score = _evaluate_ethical_alignment(dna_sequence, codon_counts)
+    ethical_alignment_score = _evaluate_ethical_alignment(sequence, codon_counts)
 
 
     # Associated Chakras and Cities of Light
@@ -1067,16 +1344,16 @@ def analyze_gene(gene_id: str, dna_sequence: str, species: str = "humano") -> Ge
                         potential_instruments[action_type].append(inst)
 
 
-    log_event_jsonl("M41", "INFO", "GENE_ANALYSIS_COMPLETE", {"gene_id": gene_id, "length": length, "gc_content": gc_content, "mutation_risk": mutation_risk_score, "ethical_alignment": ethical_alignment_score})
+    log_event_jsonl("M41", "INFO", "GENE_ANALYSIS_COMPLETE", {"gene_id": gene_id, "length": stats["length"], "gc_content": stats["gc_content"], "mutation_risk": mutation_risk_score, "ethical_alignment": ethical_alignment_score})
 
 
     return GeneAnalysisResult(
         gene_id=gene_id,
-        sequence=dna_sequence,
-        length=length,
-        gc_content=gc_content,
+        sequence=sequence,
+        length=stats["length"],
+        gc_content=stats["gc_content"],
         codon_counts=codon_counts,
-        spectral_analysis=spectral_analysis_data,
+        spectral_analysis=stats["spectral_analysis"],
         mutation_risk_score=mutation_risk_score,
         ethical_alignment_score=ethical_alignment_score,
         associated_chakras=associated_chakras,
@@ -1094,7 +1371,7 @@ def _calculate_gc_content(sequence: str) -> float:
 
 
 def _count_codons(sequence: str, codon_length: int) -> Dict[str, int]:
-    """Counts the occurrences of each codon in a sequence."""
+    """Counts the occurrences of each codon in a sequence (pure-Python fallback without NumPy)."""
     counts = Counter()
     for i in range(0, len(sequence) - codon_length + 1, codon_length):
         codon = sequence[i:i+codon_length]
@@ -1102,7 +1379,19 @@ def _count_codons(sequence: str, codon_length: int) -> Dict[str, int]:
     return dict(counts)
 
 
+def _symbol_entropy(symbol_counts: Dict[str, int], length: int) -> float:
+    """Shannon entropy (bits) from per-symbol counts, in one pass over the distinct symbols."""
+    if length <= 0:
+        return 0.0
+    return -sum((n / length) * math.log2(n / length) for n in symbol_counts.values() if n > 0)
+
+
 def _predict_mutation_risk(sequence: str) -> float:
+    """Mutation risk for an in-memory sequence; see _predict_mutation_risk_from_stats."""
+    return _predict_mutation_risk_from_stats(len(sequence), _calculate_gc_content(sequence), dict(Counter(sequence)))
+
+
+def _predict_mutation_risk_from_stats(length: int, gc: float, symbol_counts: Dict[str, int]) -> float:
     """
     Simulates mutation risk prediction using a conceptual RandomForestClassifier.
     In a real scenario, this would be trained on vast datasets.
@@ -1111,8 +1400,7 @@ def _predict_mutation_risk(sequence: str) -> float:
     if not HAS_SKLEARN or RandomForestClassifier is None:
         logging.warning("Scikit-learn não disponível. Usando risco de mutação simulado.")
         # Simula um risco baseado na entropia da sequência
-        entropy = -sum((sequence.count(c)/len(sequence)) * math.log2(sequence.count(c)/len(sequence))
-                       for c in set(sequence) if sequence.count(c) > 0) if len(sequence) > 0 else 0
+        entropy = _symbol_entropy(symbol_counts, length)
         return min(1.0, max(0.0, entropy / 3.0 + random.uniform(-0.1, 0.1))) # Escala para 0-1
    
     # Conceitual: Treinamento de um modelo de risco de mutação
@@ -1120,15 +1408,55 @@ def _predict_mutation_risk(sequence: str) -> float:
     # Aqui, apenas simulamos um comportamento.
    
     # Features conceituais: GC content, length, presence of specific motifs
-    gc = _calculate_gc_content(sequence)
-    length = len(sequence)
-   
     # Mock model prediction
     # This is a placeholder. A real model would be loaded and used.
     risk = (gc / 100.0) * 0.4 + (length / 1000.0) * 0.3 + random.uniform(0.0, 0.3)
     return min(1.0, max(0.0, risk))
 
 
+def benchmark_gene_pipeline(length: int = 5_000_000, chunk_size: int = 1 << 20, path: Path = Path("/tmp/m41_bench.fa")) -> Dict[str, Any]:
+    """Compares the old per-symbol Python path with the NumPy pipeline and the streamed FASTA reader."""
+    rng = random.Random(41)
+    seq = "".join(rng.choice("ACGT") for _ in range(length))
+    alphabet = {"A": 1.0, "T": 0.8, "C": 1.2, "G": 1.5, "N": 0.0, "X": 0.5}
+
+    t0 = time.perf_counter()
+    legacy_signal = np.array([v for v in (alphabet.get(ch) for ch in seq) if v is not None], dtype=float)
+    legacy_codons = _count_codons(seq, 3)
+    legacy_entropy = -sum((seq.count(c)/len(seq)) * math.log2(seq.count(c)/len(seq)) for c in set(seq))
+    legacy_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    acc = GeneStreamAccumulator(SymbolTable(alphabet), 3, spectral_window=None, preview=0)
+    acc.update(seq)
+    vector_entropy = _symbol_entropy(acc.counts_by_symbol(), acc.length)
+    vector_s = time.perf_counter() - t0
+    same = (dict(acc.codon_counts) == legacy_codons and abs(vector_entropy - legacy_entropy) < 1e-9
+            and np.array_equal(np.concatenate(acc._signal_parts), legacy_signal))
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(">bench\n")
+        for i in range(0, length, 60):
+            f.write(seq[i:i + 60] + "\n")
+    del seq
+    t0 = time.perf_counter()
+    table = SymbolTable(alphabet)
+    stream = GeneStreamAccumulator(table, 3, spectral_window=1 << 16)
+    for _, chunk in iter_fasta(path, chunk_size):
+        stream.update(chunk)
+    stream.spectrum()
+    stream_s = time.perf_counter() - t0
+    path.unlink(missing_ok=True)
+    return {
+        "length": length,
+        "legacy_s": round(legacy_s, 3),
+        "numpy_s": round(vector_s, 3),
+        "fasta_stream_s": round(stream_s, 3),
+        "fasta_stream_mbases_per_s": round(length / stream_s / 1e6, 2),
+        "results_match": bool(same and dict(stream.codon_counts) == legacy_codons),
+    }
+
+
 def _evaluate_ethical_alignment(sequence: str, codon_counts: Dict[str, int]) -> float:
     """
     Simulates ethical alignment evaluation based on sequence characteristics.
@@ -1365,7 +1693,8 @@ def generate_healing_manual(
 ###############################################################################
 
 
-def main(species: str = "humano", gene_sequence: Optional[str] = None, target_pathogen: Optional[str] = None):
+def main(species: str = "humano", gene_sequence: Optional[str] = None, target_pathogen: Optional[str] = None,
+         fasta: Optional[str] = None, plot: bool = False):
     _verify_quantum_protection()
     ensure_species_config(species)
    
@@ -1391,9 +1720,17 @@ def main(species: str = "humano", gene_sequence: Optional[str] = None, target_pa
             return
 
 
-    # 1. Analyze Gene
+    # 1. Analyze Gene (FASTA em streaming, se fornecido: o primeiro registro segue para as etapas seguintes)
     try:
-        gene_analysis = analyze_gene("GENE-EXEMPLO", gene_sequence, species)
+        if fasta:
+            fasta_results = analyze_fasta(fasta, species, plot=plot)
+            if not fasta_results:
+                raise ValueError(f"Nenhum registro encontrado em {fasta}.")
+            for result in fasta_results:
+                logging.info(f"Registro '{result.gene_id}': {result.length} símbolos, GC {result.gc_content:.2f}%")
+            gene_analysis = fasta_results[0]
+        else:
+            gene_analysis = analyze_gene("GENE-EXEMPLO", gene_sequence, species, plot=plot)
         logging.info(f"Análise do Gene Concluída: {gene_analysis}")
         log_event_jsonl("M41", "INFO", "MAIN_GENE_ANALYSIS_RESULT", {"result": gene_analysis.__dict__})
     except ValueError as e:
@@ -1430,6 +1767,11 @@ def main(species: str = "humano", gene_sequence: Optional[str] = None, target_pa
         return
 
 
+    # 4. Estágio adiado de plotagem
+    if plot:
+        render_pending_spectra()
+
+
     logging.info("\n=== Módulo 41 Execução Concluída com Sucesso ===")
     log_event_jsonl("M41", "INFO", "MAIN_EXEC_COMPLETE", {"status": "success"})
 
@@ -1442,6 +1784,9 @@ if __name__ == "__main__":
     parser.add_argument("--species", type=str, default="humano", help="Espécie a ser configurada (ex: humano, lyraIV)")
     parser.add_argument("--gene_sequence", type=str, help="Sequência de DNA para análise (opcional)")
     parser.add_argument("--target_pathogen", type=str, help="Patógeno alvo para construção da matriz (opcional)")
+    parser.add_argument("--fasta", type=str, help="Arquivo FASTA analisado em streaming (opcional)")
+    parser.add_argument("--plot", action="store_true", help="Gera os espectrogramas FFT ao final da execução")
+    parser.add_argument("--bench-genes", type=int, nargs="?", const=5_000_000, help="Compara o pipeline antigo com o vetorizado (comprimento da sequência)")
    
     # Usar parse_known_args para ignorar argumentos desconhecidos do ambiente
     args, unknown = parser.parse_known_args()
@@ -1452,4 +1797,7 @@ if __name__ == "__main__":
     # python modulo_41.py --species humano --gene_sequence ATGCGTACGTAGCTAGCTAGCTAGCTACGATC --target_pathogen "Virus da Dissonancia"
     # python modulo_41.py --species lyraIV --gene_sequence αβγεδααβγεδα
    
-    main(species=args.species, gene_sequence=args.gene_sequence, target_pathogen=args.target_pathogen)
+    if args.bench_genes:
+        print(json.dumps(benchmark_gene_pipeline(args.bench_genes), indent=2))
+    else:
+        main(species=args.species, gene_sequence=args.gene_sequence, target_pathogen=args.target_pathogen, fasta=args.fasta, plot=args.plot)
@@ -11,6 +11,9 @@ import logging # Para o sistema de logs
 import base64, io, shutil, zipfile, threading, time # Para o patch WebGL
 import http.server, socketserver # Para o servidor HTTP WebGL para WebGL interface
 import math # Para as novas equações
+import struct, zlib # Para os frames e o índice do log do QuantumMatrixDB
+from array import array # Índices compactos de offsets por tipo
+import tempfile # Para o diretório isolado do benchmark do QuantumMatrixDB
 import traceback # Para capturar e logar tracebacks completos de erros
 from dataclasses import dataclass # IMPORTAÇÃO CORRIGIDA: Adicionado dataclass
 
@@ -535,12 +538,34 @@ class QuantumMatrixDBReal:
     """
     Versão resiliente: se 'cryptography' faltar, cai em modo-JSON
     (arquivo legível, mas ainda com hash SHA-256 para imutabilidade).
+
+    Formato em disco: log de registros (`qm42.log`), um frame por evento
+    (`[tamanho][crc32][token Fernet ou JSON]`), anexado sem tocar nos frames
+    anteriores. Um índice lateral (`qm42.idx`) guarda (offset, tamanho, tipo)
+    de cada frame, de modo que `fetch_*` descriptografa apenas os frames do
+    `type` pedido. Substituições por tipo (ex.: `save_portals`) gravam um frame
+    de reset; `compact()` reescreve o log só com os frames vivos.
     """
     _key_path = SECURE_STORAGE_DIR / "qm42.key" # Adaptado para SECURE_STORAGE_DIR
-    _db_path  = SECURE_STORAGE_DIR / "qm42.db"  # Adaptado para SECURE_STORAGE_DIR
+    _db_path  = SECURE_STORAGE_DIR / "qm42.db"  # Blob legado (migrado uma vez para o log)
+
+    _LOG_MAGIC = b"QM42LOG1"
+    _FRAME_HEADER = struct.Struct("<II")    # (tamanho do payload, crc32 do payload)
+    _INDEX_RECORD = struct.Struct("<QIHB")  # (offset do frame, tamanho do payload, id do tipo, espécie)
+    _KIND_EVENT, _KIND_RESET = 0, 1
+    _RESET_OP = "__qm42_reset_type__"
+
+    def __init__(self, storage_dir: Optional[Path] = None) -> None:
+        storage_dir = storage_dir or SECURE_STORAGE_DIR
+        storage_dir.mkdir(parents=True, exist_ok=True) # Garante que o diretório base exista
+        if storage_dir != SECURE_STORAGE_DIR:
+            self._key_path = storage_dir / "qm42.key"
+            self._db_path = storage_dir / "qm42.db"
+        self._log_path = storage_dir / "qm42.log"
+        self._idx_path = storage_dir / "qm42.idx"
+        self._types_path = storage_dir / "qm42.types.json"
+        self._lock = threading.RLock()
 
-    def __init__(self) -> None:
-        SECURE_STORAGE_DIR.mkdir(exist_ok=True) # Garante que o diretório base exista
         self._fernet: Optional[Fernet] = None
         if HAS_CRYPTO and Fernet is not None:
             if not self._key_path.exists():
@@ -549,49 +574,232 @@ class QuantumMatrixDBReal:
             log_info("QuantumMatrixDB: Inicializado com criptografia Fernet.")
         else:
             log_warning("QuantumMatrixDB: Inicializado em modo JSON (sem criptografia Fernet). Instale 'cryptography' para ativar a criptografia.")
-        
-        # cria arquivo se não existe
-        if not self._db_path.exists():
-            self._db_path.write_bytes(self._encode([]))
 
+        self._open_log()
+        if self._db_path.exists():
+            self._migrate_legacy_blob()
+
+    # ————— Frames e índice ————
     def _encode(self, obj: Any) -> bytes:
         raw = json.dumps(obj, ensure_ascii=False).encode()
-        if self._fernet:
+        if self._encrypted:
             return self._fernet.encrypt(raw)
         return raw
 
-    def _decode(self) -> list[dict]:
+    def _decode_payload(self, payload: bytes) -> Any:
+        if self._encrypted:
+            payload = self._fernet.decrypt(payload)
+        return json.loads(payload.decode())
+
+    def _open_log(self) -> None:
+        """Abre (ou cria) o log e o índice, recuperando frames não indexados após uma queda."""
+        if not self._log_path.exists() or self._log_path.stat().st_size < len(self._LOG_MAGIC) + 1:
+            mode = b"F" if self._fernet else b"J"
+            self._log_path.write_bytes(self._LOG_MAGIC + mode)
+            self._idx_path.write_bytes(b"")
+            self._types_path.write_text("[]", encoding="utf-8")
+
+        with self._log_path.open("rb") as fh:
+            header = fh.read(len(self._LOG_MAGIC) + 1)
+        if header[:len(self._LOG_MAGIC)] != self._LOG_MAGIC:
+            raise RuntimeError(f"QuantumMatrixDB: {self._log_path} não é um log QM42 válido.")
+        self._encrypted = header[-1:] == b"F"
+        if self._encrypted and not self._fernet:
+            raise RuntimeError("QuantumMatrixDB: o log está criptografado com Fernet, mas 'cryptography' não está instalado.")
+
+        self._types: List[str] = json.loads(self._types_path.read_text(encoding="utf-8")) if self._types_path.exists() else []
+        self._type_ids: Dict[str, int] = {name: i for i, name in enumerate(self._types)}
+        self._offsets: Dict[str, array] = {}
+        self._lengths: Dict[str, array] = {}
+        self._frame_count = 0
+
+        # Sem tabela de tipos o índice não é interpretável: reconstrói a partir do log
+        idx_bytes = self._idx_path.read_bytes() if self._idx_path.exists() and self._types_path.exists() else b""
+        idx_bytes = idx_bytes[:len(idx_bytes) - len(idx_bytes) % self._INDEX_RECORD.size]
+        end_offset = len(header)
+        for offset, length, type_id, kind in self._INDEX_RECORD.iter_unpack(idx_bytes):
+            self._index_frame(self._types[type_id], offset, length, kind)
+            end_offset = offset + self._FRAME_HEADER.size + length
+
+        self._log_fh = self._log_path.open("r+b")
+        self._idx_fh = self._idx_path.open("r+b" if self._idx_path.exists() else "w+b")
+        self._idx_fh.truncate(len(idx_bytes))
+        self._idx_fh.seek(0, os.SEEK_END)
+        self._recover_tail(end_offset)
+
+    def _index_frame(self, type_name: str, offset: int, length: int, kind: int) -> None:
+        if kind == self._KIND_RESET:
+            self._offsets.pop(type_name, None)
+            self._lengths.pop(type_name, None)
+        else:
+            self._offsets.setdefault(type_name, array("Q")).append(offset)
+            self._lengths.setdefault(type_name, array("I")).append(length)
+        self._frame_count += 1
+
+    def _type_id(self, type_name: str) -> int:
+        """Retorna o id numérico de um tipo, registrando-o na tabela de tipos se for novo."""
+        type_id = self._type_ids.get(type_name)
+        if type_id is None:
+            type_id = len(self._types)
+            self._types.append(type_name)
+            self._type_ids[type_name] = type_id
+            tmp_path = self._types_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(self._types, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, self._types_path)
+        return type_id
+
+    @classmethod
+    def _classify(cls, obj: Any) -> Tuple[str, int]:
+        """Determina (tipo, espécie) de um objeto armazenado em um frame."""
+        if isinstance(obj, dict):
+            if cls._RESET_OP in obj:
+                return str(obj[cls._RESET_OP]), cls._KIND_RESET
+            return str(obj.get("type", "")), cls._KIND_EVENT
+        return "", cls._KIND_EVENT
+
+    def _recover_tail(self, end_offset: int) -> None:
+        """Indexa frames completos após o último registro do índice e descarta um frame parcial."""
+        self._log_fh.seek(end_offset)
+        while True:
+            header = self._log_fh.read(self._FRAME_HEADER.size)
+            if len(header) < self._FRAME_HEADER.size:
+                break
+            length, crc = self._FRAME_HEADER.unpack(header)
+            payload = self._log_fh.read(length)
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                break
+            type_name, kind = self._classify(self._decode_payload(payload))
+            self._write_index_record(end_offset, length, type_name, kind)
+            end_offset += self._FRAME_HEADER.size + length
+        if self._log_fh.seek(0, os.SEEK_END) > end_offset:
+            log_warning(f"QuantumMatrixDB: frame parcial descartado no fim do log (offset {end_offset}).")
+            self._log_fh.truncate(end_offset)
+        self._log_fh.seek(end_offset)
+
+    def _write_index_record(self, offset: int, length: int, type_name: str, kind: int) -> None:
+        self._idx_fh.write(self._INDEX_RECORD.pack(offset, length, self._type_id(type_name), kind))
+        self._idx_fh.flush()
+        self._index_frame(type_name, offset, length, kind)
+
+    def _write_frame(self, obj: Any) -> None:
+        """Anexa um frame ao log (sem reler frames anteriores) e o registra no índice."""
+        payload = self._encode(obj)
+        type_name, kind = self._classify(obj)
+        with self._lock:
+            offset = self._log_fh.seek(0, os.SEEK_END)
+            self._log_fh.write(self._FRAME_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+            self._log_fh.flush()
+            self._write_index_record(offset, len(payload), type_name, kind)
+
+    def _read_frames(self, locations: List[Tuple[int, int]]):
+        """Lê e descriptografa os frames nas posições (offset, tamanho) indicadas."""
+        with self._log_path.open("rb") as fh:
+            for offset, length in locations:
+                fh.seek(offset + self._FRAME_HEADER.size)
+                yield self._decode_payload(fh.read(length))
+
+    def _locations(self, type_name: Optional[str] = None) -> List[Tuple[int, int]]:
+        with self._lock:
+            names = list(self._offsets) if type_name is None else [type_name]
+            locations = [loc for name in names if name in self._offsets
+                         for loc in zip(self._offsets[name], self._lengths[name])]
+        if type_name is None:
+            locations.sort()
+        return locations
+
+    def _migrate_legacy_blob(self) -> None:
+        """Migração única do blob Fernet/JSON legado (`qm42.db`) para o log de registros."""
         raw = self._db_path.read_bytes()
-        if self._fernet:
-            try:
+        try:
+            if self._fernet:
                 raw = self._fernet.decrypt(raw)
-            except Exception as e:
-                log_error(f"Falha na descriptografia. Dados podem estar corrompidos ou chave incorreta. Erro: {e}")
-                # Em caso de falha de descriptografia, retornar vazio para evitar crash
-                return [] 
-        return json.loads(raw.decode())
+            legacy_events = json.loads(raw.decode())
+        except Exception as e:
+            log_error(f"Falha ao ler o qm42.db legado para migração; o arquivo foi mantido intacto. Erro: {e}")
+            return
+        for event in legacy_events:
+            self._write_frame(event)
+        self._db_path.rename(self._db_path.with_suffix(".db.migrated"))
+        log_info(f"QuantumMatrixDB: {len(legacy_events)} evento(s) migrado(s) do qm42.db legado para {self._log_path.name}.")
+
+    def _reset_type(self, type_name: str) -> None:
+        """Marca como substituídos todos os frames anteriores de um tipo."""
+        self._write_frame({self._RESET_OP: type_name})
 
     # ————— API pública para o patch ————
     def append(self, event: dict) -> None:
         """Adiciona um evento ao DB, calculando seu hash para imutabilidade."""
-        data = self._decode()
         # Adiciona o hash SHA256 do evento original (garante imutabilidade lógica)
         event_hash = hashlib.sha256(json.dumps(event, sort_keys=True).encode()).hexdigest()
-        data.append(event | {"sha256": event_hash})
-        self._db_path.write_bytes(self._encode(data))
+        self._write_frame(event | {"sha256": event_hash})
         log_info(f"Evento adicionado ao QuantumMatrixDB. Hash: {event_hash[:8]}...")
 
     def all(self) -> list[dict]:
         """Retorna todos os eventos do DB."""
-        return self._decode()
+        return list(self._read_frames(self._locations()))
+
+    def iter_type(self, type_name: str):
+        """Itera apenas os eventos de um `type`, descriptografando só os frames correspondentes."""
+        return self._read_frames(self._locations(type_name))
+
+    def count(self, type_name: Optional[str] = None) -> int:
+        """Conta eventos vivos (de um tipo ou no total) sem descriptografar nada."""
+        with self._lock:
+            if type_name is not None:
+                return len(self._offsets.get(type_name, ()))
+            return sum(len(offsets) for offsets in self._offsets.values())
+
+    def compact(self) -> Dict[str, int]:
+        """
+        Reescreve o log apenas com os frames vivos (sem resets e frames substituídos)
+        e troca log, índice e tabela de tipos por renomeação atômica.
+        """
+        with self._lock:
+            frames_before = self._frame_count
+            bytes_before = self._log_fh.seek(0, os.SEEK_END)
+            locations = self._locations()
+            tmp_log = self._log_path.with_suffix(".log.compact")
+            tmp_idx = self._idx_path.with_suffix(".idx.compact")
+            tmp_types = self._types_path.with_suffix(".compact")
+            types: List[str] = []
+            type_ids: Dict[str, int] = {}
+            with self._log_path.open("rb") as src, tmp_log.open("wb") as dst_log, tmp_idx.open("wb") as dst_idx:
+                dst_log.write(self._LOG_MAGIC + (b"F" if self._encrypted else b"J"))
+                for offset, length in locations:
+                    src.seek(offset)
+                    frame = src.read(self._FRAME_HEADER.size + length)
+                    type_name, _ = self._classify(self._decode_payload(frame[self._FRAME_HEADER.size:]))
+                    if type_name not in type_ids:
+                        type_ids[type_name] = len(types)
+                        types.append(type_name)
+                    dst_idx.write(self._INDEX_RECORD.pack(dst_log.tell(), length, type_ids[type_name], self._KIND_EVENT))
+                    dst_log.write(frame)
+            tmp_types.write_text(json.dumps(types, ensure_ascii=False), encoding="utf-8")
+            self._log_fh.close()
+            self._idx_fh.close()
+            os.replace(tmp_types, self._types_path)
+            os.replace(tmp_idx, self._idx_path)
+            os.replace(tmp_log, self._log_path)
+            self._open_log()
+            stats = {"frames_before": frames_before, "frames_after": self._frame_count,
+                     "bytes_before": bytes_before, "bytes_after": self._log_fh.seek(0, os.SEEK_END)}
+        log_info(f"QuantumMatrixDB compactado: {stats}")
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            self._log_fh.close()
+            self._idx_fh.close()
 
-    # ————— API pública original de ley lines (usada nos geradores de notebook) ————
     def save_ley_lines(self, ley_lines: List[Dict]):
-        """Salva (criptografa) os dados das linhas Ley."""
+        """Salva (criptografa) os dados das linhas Ley, substituindo as linhas Ley anteriores."""
         try:
-            encrypted_data = self._encode(ley_lines) # Usa o _encode interno
-            self._db_path.write_bytes(encrypted_data) # Salva no mesmo qm42.db
-            log_info(f"Dados de linhas Ley criptografados e salvos em: {self._db_path}")
+            with self._lock:
+                self._reset_type('ley_line')
+                for ley_line in ley_lines:
+                    ley_line.setdefault('type', 'ley_line') # Adiciona um tipo para fácil filtragem
+                    self._write_frame(ley_line)
+            log_info(f"Dados de linhas Ley criptografados e salvos em: {self._log_path}")
         except Exception as e:
             log_error(f"Erro ao salvar dados de linhas Ley: {e}")
             raise
@@ -599,8 +807,7 @@ class QuantumMatrixDBReal:
     def fetch_ley_lines(self) -> List[Dict]:
         """Lê (descriptografa) os dados das linhas Ley."""
         try:
-            data = self._decode()
-            filtered_data = [item for item in data if isinstance(item, dict) and 'type' in item and item['type'] == 'ley_line']
+            filtered_data = list(self.iter_type('ley_line'))
             if not filtered_data:
                 log_warning("Dados recuperados de qm42.db não parecem ser o formato esperado para Ley Lines. Retornando mock.")
                 return [
@@ -624,13 +831,12 @@ class QuantumMatrixDBReal:
     def save_portals(self, portals: List[Dict]):
         """Salva (criptografa) os dados dos portais dimensionais."""
         try:
-            existing_data = [item for item in self._decode() if 'type' not in item or item['type'] != 'portal']
-            for portal in portals:
-                portal['type'] = 'portal' # Adiciona um tipo para fácil filtragem
-            merged_data = existing_data + portals
-            encrypted_data = self._encode(merged_data)
-            self._db_path.write_bytes(encrypted_data)
-            log_info(f"Dados de portais dimensionais criptografados e salvos em: {self._db_path}")
+            with self._lock:
+                self._reset_type('portal') # Substitui os portais anteriores sem tocar nos demais frames
+                for portal in portals:
+                    portal['type'] = 'portal' # Adiciona um tipo para fácil filtragem
+                    self._write_frame(portal)
+            log_info(f"Dados de portais dimensionais criptografados e salvos em: {self._log_path}")
         except Exception as e:
             log_error(f"Erro ao salvar dados de portais: {e}")
             raise
@@ -638,8 +844,7 @@ class QuantumMatrixDBReal:
     def fetch_portals(self) -> List[Dict]:
         """Lê (descriptografa) os dados dos portais dimensionais."""
         try:
-            data = self._decode()
-            filtered_data = [item for item in data if isinstance(item, dict) and 'type' in item and item['type'] == 'portal']
+            filtered_data = list(self.iter_type('portal'))
             if not filtered_data:
                 log_warning("Nenhum dado de portal dimensional encontrado no qm42.db. Retornando mock.")
                 return [
@@ -1166,6 +1371,53 @@ class ChronoCodex:
         log_event_jsonl("M42", "INFO", "CHRONOS_REPORT_GENERATED", report)
         return report
 
+# =============================================================================
+# Benchmark do QuantumMatrixDB
+# =============================================================================
+
+def benchmark_qmdb_append(num_events: int = 1_000_000, windows: int = 10, portal_every: int = 100) -> Dict[str, Any]:
+    """
+    Anexa `num_events` eventos a um QuantumMatrixDB isolado (diretório temporário)
+    e mede a latência de `append` por janela, mostrando que ela não cresce com o
+    tamanho do log. Mede também `fetch_portals` (filtrado pelo índice) contra `all()`.
+    """
+    result: Dict[str, Any] = {"events": num_events, "encrypted": bool(HAS_CRYPTO and Fernet), "windows": []}
+    previous_disable = logging.root.manager.disable
+    logging.disable(logging.INFO) # append() loga uma linha por evento
+    try:
+        with tempfile.TemporaryDirectory(prefix="qm42_bench_") as tmp:
+            db = QuantumMatrixDBReal(storage_dir=Path(tmp))
+            window_size = max(1, num_events // windows)
+            latencies: List[float] = []
+            for i in range(num_events):
+                event = {"type": "portal" if i % portal_every == 0 else "timeline_sync", "seq": i,
+                         "payload": {"coherence": (i % 1000) / 1000.0}}
+                start = time.perf_counter()
+                db.append(event)
+                latencies.append(time.perf_counter() - start)
+                if len(latencies) == window_size or i == num_events - 1:
+                    latencies.sort()
+                    result["windows"].append({
+                        "up_to_event": i + 1,
+                        "mean_us": round(sum(latencies) / len(latencies) * 1e6, 2),
+                        "p50_us": round(latencies[len(latencies) // 2] * 1e6, 2),
+                        "p99_us": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1e6, 2),
+                    })
+                    latencies = []
+            start = time.perf_counter()
+            portals = sum(1 for _ in db.iter_type("portal"))
+            result["fetch_portals_s"] = round(time.perf_counter() - start, 4)
+            start = time.perf_counter()
+            total = len(db.all())
+            result["all_s"] = round(time.perf_counter() - start, 4)
+            result["portals"], result["total"] = portals, total
+            result["log_bytes"] = db._log_path.stat().st_size
+            db.close()
+    finally:
+        logging.disable(previous_disable)
+    return result
+
+
 # =============================================================================
 # CLI e Funções Auxiliares (Mantidas para compatibilidade e modularidade)
 # =============================================================================
@@ -1180,13 +1432,15 @@ class CLIArgs:
     coherence: float = 0.95
     num_records: int = 5
     port: int = 8000 # Para o servidor WebGL
+    events: int = 1_000_000 # Para o comando 'bench_qmdb'
 
 
 def parse_args() -> CLIArgs:
     # print("DEBUG: parse_args function started.") # Debug print
     parser = argparse.ArgumentParser(description="Módulo 42: ChronoCodex Unificado - Portal da Sincronização Temporal")
-    parser.add_argument("command", type=str, choices=["sync", "report", "webgl"],
-                        help="Comando a executar: 'sync' para sincronizar linha do tempo, 'report' para gerar relatório, 'webgl' para iniciar servidor.")
+    parser.add_argument("command", type=str, choices=["sync", "report", "webgl", "compact", "bench_qmdb"],
+                        help="Comando a executar: 'sync' para sincronizar linha do tempo, 'report' para gerar relatório, 'webgl' para iniciar servidor, "
+                             "'compact' para compactar o log do QuantumMatrixDB, 'bench_qmdb' para medir a latência de append.")
     parser.add_argument("--timeline", type=str, default="LinhaTempoAlfa-Omega",
                         help="Assinatura vibracional da linha do tempo alvo para sincronização.")
     parser.add_argument("--purity", type=float, default=0.9,
@@ -1201,6 +1455,8 @@ def parse_args() -> CLIArgs:
                         help="Número de registros de sincronização para incluir no relatório.")
     parser.add_argument("--port", type=int, default=8000,
                         help="Porta para o servidor WebGL (apenas para o comando 'webgl').")
+    parser.add_argument("--events", type=int, default=1_000_000,
+                        help="Número de eventos anexados pelo comando 'bench_qmdb'.")
 
     # Argumentos que são tipicamente passados pelo ambiente de sandbox e devem ser ignorados
     # Estes são flags específicas e seus valores imediatos (caminhos)
@@ -1241,7 +1497,7 @@ def parse_args() -> CLIArgs:
     # Se nenhum comando válido for encontrado após a filtragem, o padrão será 'webgl'
     command_found = False
     for arg in clean_argv:
-        if arg in ["sync", "report", "webgl"]:
+        if arg in ["sync", "report", "webgl", "compact", "bench_qmdb"]:
             command_found = True
             break
     
@@ -1613,9 +1869,16 @@ def main():
     ensure_global_grid_config() # Garante que o global_grid.yaml exista
 
     args = parse_args()
+    if args.command == "bench_qmdb":
+        log_info(f"Comando 'bench_qmdb' recebido para {args.events} eventos.")
+        print(json.dumps(benchmark_qmdb_append(args.events), indent=2, ensure_ascii=False))
+        return
     chronocodex = ChronoCodex()
 
-    if args.command == "sync":
+    if args.command == "compact":
+        log_info("Comando 'compact' recebido para o QuantumMatrixDB.")
+        print(json.dumps(chronocodex.db.compact(), indent=2, ensure_ascii=False))
+    elif args.command == "sync":
         log_info(f"Comando 'sync' recebido para linha do tempo: {args.timeline}")
         result = chronocodex.synchronize_timeline(
             args.timeline, args.purity, args.threshold, args.adjustment, args.coherence
@@ -3,12 +3,16 @@ import argparse, json, sys, logging, hashlib, socket, asyncio, base64, os
 from datetime import datetime
 from pathlib import Path
 from textwrap import dedent
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Union, Tuple
 import threading # Para o servidor HTTP e threads de monitoramento
 import time # Para time.sleep em threads
 import re # Para sanitização de argumentos
 import random # Para simulações de status
 import shutil # Para limpeza de diretórios temporários em bulk_load
+import contextlib # Para o gerenciador de contexto de lotes do AED
+import tempfile # Para o diretório isolado do benchmark de mesclagem
+import struct # Para o índice binário dos segmentos do blockchain
 import functools # Para partial em http.server
 import math # Para as novas equações
 import traceback # Importação adicionada para tracebacks completos
@@ -417,13 +421,36 @@ class QuantumBlockchainLogger:
     Implementação de um blockchain simples e imutável para registrar eventos
     da malha vibracional. Cada bloco contém um evento, payload e hash.
     Também envia logs para Loki/Grafana.
+
+    Armazenamento: log append-only de segmentos JSONL (uma linha por bloco) com
+    rotação por tamanho e um índice binário lateral (bloco -> segmento, offset).
+    O hash da cauda fica em memória, então `add()` é O(1) e a leitura/validação
+    da cadeia é feita em streaming a partir do disco.
     """
-    def __init__(self, path: Path):
-        self.path = path
+    SEGMENT_MAX_BYTES = 8 * 1024 * 1024 # Tamanho máximo de um segmento antes da rotação
+    _INDEX_RECORD = struct.Struct('<IQ') # (número do segmento, offset em bytes) por bloco
+
+    def __init__(self, path: Path, segment_max_bytes: Optional[int] = None):
+        self.path = path # Caminho legado (chain.json); usado apenas pela migração
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        if not self.path.exists():
-            self._write_chain([self._genesis_block()])
-        logging.info(f"Blockchain inicializada com {len(self.chain)} bloco(s).")
+        self.segments_dir = self.path.parent / f"{self.path.stem}_segments"
+        self.segments_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.segments_dir / 'chain.idx'
+        self.segment_max_bytes = segment_max_bytes or self.SEGMENT_MAX_BYTES
+        self._lock = threading.RLock() # add() é chamado pelas threads HTTP/WebSocket
+        self._seg_fh = None
+        self._idx_fh = None
+        self._length = 0
+        self._tail_hash = ""
+        self._tail_segment = 0
+        self._open_tail()
+
+        if self._length == 0:
+            if self.path.exists():
+                self.migrate_legacy_chain()
+            if self._length == 0:
+                self._append_block(self._genesis_block())
+        logging.info(f"Blockchain inicializada com {len(self)} bloco(s).")
 
     @staticmethod
     def _hash(data: str) -> str:
@@ -436,45 +463,176 @@ class QuantumBlockchainLogger:
         data['hash'] = self._hash(json.dumps(data, sort_keys=True))
         return data
 
-    def _read_chain(self) -> List[Dict[str, Any]]:
-        """Lê o blockchain do arquivo."""
-        if not self.path.exists():
-            return []
+    def _segment_path(self, number: int) -> Path:
+        """Retorna o caminho do arquivo de um segmento."""
+        return self.segments_dir / f"segment_{number:06d}.jsonl"
 
-        try:
-            return json.loads(self.path.read_text(encoding='utf-8'))
-        except json.JSONDecodeError as e:
-            logging.error(f"Erro ao decodificar JSON do blockchain: {e}. O arquivo pode estar corrompido. Reiniciando a cadeia.")
-            self.path.unlink(missing_ok=True) # Remove o arquivo corrompido
-            return []
+    def _read_index_entry(self, index: int) -> Tuple[int, int]:
+        """Lê a entrada (segmento, offset) de um bloco no índice lateral."""
+        with self.index_path.open('rb') as fh:
+            fh.seek(index * self._INDEX_RECORD.size)
+            return self._INDEX_RECORD.unpack(fh.read(self._INDEX_RECORD.size))
+
+    def _read_line_at(self, segment: int, offset: int) -> Tuple[Dict[str, Any], int]:
+        """Lê o bloco armazenado em (segmento, offset) e retorna (bloco, offset final)."""
+        with self._segment_path(segment).open('rb') as fh:
+            fh.seek(offset)
+            line = fh.readline()
+        return json.loads(line), offset + len(line)
 
-    def _write_chain(self, chain: List[Dict[str, Any]]):
-        """Escreve o blockchain no arquivo."""
-        self.path.write_text(json.dumps(chain, indent=2, ensure_ascii=False))
+    def _open_tail(self):
+        """
+        Recupera o estado da cauda (comprimento, último hash, segmento atual) a
+        partir do índice, descartando bytes de um append interrompido.
+        """
+        idx_size = self.index_path.stat().st_size if self.index_path.exists() else 0
+        record_size = self._INDEX_RECORD.size
+        if idx_size % record_size:
+            # Entrada de índice parcial: trunca para o último registro completo
+            with self.index_path.open('r+b') as fh:
+                fh.truncate(idx_size - idx_size % record_size)
+            idx_size -= idx_size % record_size
+        self._length = idx_size // record_size
+
+        end_offset = 0
+        if self._length:
+            segment, offset = self._read_index_entry(self._length - 1)
+            try:
+                last_block, end_offset = self._read_line_at(segment, offset)
+            except (OSError, json.JSONDecodeError) as e:
+                raise RuntimeError(f"Índice do blockchain aponta para um bloco ilegível ({segment}, {offset}): {e}") from e
+            self._tail_hash = last_block['hash']
+            self._tail_segment = segment
+
+        # Dados além do último bloco indexado vêm de um append interrompido antes da
+        # entrada de índice: trunca o segmento da cauda e remove segmentos posteriores
+        # (rotação que chegou a gravar bytes), senão o próximo append herdaria esses bytes.
+        seg_path = self._segment_path(self._tail_segment)
+        if seg_path.exists() and seg_path.stat().st_size > end_offset:
+            with seg_path.open('r+b') as fh:
+                fh.truncate(end_offset)
+        for orphan in self.segments_dir.glob('segment_*.jsonl'):
+            try:
+                number = int(orphan.stem.split('_', 1)[1])
+            except ValueError:
+                continue
+            if number > self._tail_segment:
+                logging.warning(f"Segmento órfão sem entradas no índice removido: {orphan.name}")
+                orphan.unlink()
+
+        self._seg_fh = self._segment_path(self._tail_segment).open('ab')
+        self._idx_fh = self.index_path.open('ab')
+
+    def _append_block(self, block: Dict[str, Any]):
+        """Grava um bloco já selado no segmento atual e registra seu offset no índice."""
+        with self._lock:
+            line = (json.dumps(block, ensure_ascii=False) + "\n").encode('utf-8')
+            offset = self._seg_fh.tell()
+            if offset and offset + len(line) > self.segment_max_bytes:
+                self._seg_fh.close()
+                self._tail_segment += 1
+                self._seg_fh = self._segment_path(self._tail_segment).open('ab')
+                offset = self._seg_fh.tell()  # posição real do arquivo, nunca presumida pelo índice
+            self._seg_fh.write(line)
+            self._seg_fh.flush()
+            self._idx_fh.write(self._INDEX_RECORD.pack(self._tail_segment, offset))
+            self._idx_fh.flush()
+            self._length += 1
+            self._tail_hash = block['hash']
+
+    def __len__(self) -> int:
+        return self._length
+
+    def iter_blocks(self, start: int = 0):
+        """Itera os blocos em ordem, lendo os segmentos do disco em streaming."""
+        if start >= self._length:
+            return
+        segment, offset = self._read_index_entry(start)
+        remaining = self._length - start
+        while remaining > 0:
+            seg_path = self._segment_path(segment)
+            if not seg_path.exists():
+                break
+            with seg_path.open('rb') as fh:
+                fh.seek(offset)
+                for line in fh:
+                    yield json.loads(line)
+                    remaining -= 1
+                    if remaining == 0:
+                        return
+            segment, offset = segment + 1, 0
+
+    def get_block(self, index: int) -> Optional[Dict[str, Any]]:
+        """Retorna um bloco pelo índice em O(1) via índice lateral."""
+        if not 0 <= index < self._length:
+            return None
+        segment, offset = self._read_index_entry(index)
+        return self._read_line_at(segment, offset)[0]
 
     @property
-    def chain(self):
-        """Retorna o blockchain atual, garantindo que o gênese exista."""
-        current_chain = self._read_chain()
-        if not current_chain:
-            self._write_chain([self._genesis_block()])
-            return self._read_chain()
-        return current_chain
+    def chain(self) -> List[Dict[str, Any]]:
+        """Retorna o blockchain completo (materializado a partir dos segmentos)."""
+        return list(self.iter_blocks())
+
+    def validate(self) -> Tuple[bool, Optional[int]]:
+        """
+        Valida a cadeia em streaming (índices, encadeamento e hashes).
+        Retorna (True, None) ou (False, índice do primeiro bloco inválido).
+        """
+        prev_hash = "0"*64
+        expected_index = 0
+        try:
+            for block in self.iter_blocks():
+                body = {k: v for k, v in block.items() if k != 'hash'}
+                if (block.get('index') != expected_index or block.get('prev_hash') != prev_hash
+                        or block.get('hash') != self._hash(json.dumps(body, sort_keys=True))):
+                    return False, expected_index
+                prev_hash = block['hash']
+                expected_index += 1
+        except json.JSONDecodeError:
+            return False, expected_index
+        if expected_index != self._length:
+            return False, expected_index
+        return True, None
+
+    def migrate_legacy_chain(self) -> int:
+        """
+        Migração única de um `chain.json` legado (lista JSON) para os segmentos.
+        Os blocos são copiados como estão (hashes preservados) e o arquivo antigo
+        é renomeado para `*.migrated`. Retorna o número de blocos migrados.
+        """
+        if not self.path.exists() or self._length:
+            return 0
+        try:
+            legacy_chain = json.loads(self.path.read_text(encoding='utf-8'))
+        except json.JSONDecodeError as e:
+            logging.error(f"Erro ao decodificar JSON do blockchain legado: {e}. O arquivo será ignorado.")
+            legacy_chain = []
+        for block in legacy_chain:
+            self._append_block(block)
+        self.path.rename(self.path.with_suffix(self.path.suffix + '.migrated'))
+        logging.info(f"Blockchain legado migrado para segmentos: {len(legacy_chain)} bloco(s).")
+        return len(legacy_chain)
+
+    def close(self):
+        """Fecha os descritores de arquivo do segmento e do índice."""
+        with self._lock:
+            for fh in (self._seg_fh, self._idx_fh):
+                if fh and not fh.closed:
+                    fh.close()
 
     def add(self, event: str, payload: Dict[str, Any]):
         """Adiciona um novo bloco ao blockchain."""
-        chain = self.chain
-        prev = chain[-1]
-        block = {
-            "index": len(chain),
-            "prev_hash": prev['hash'],
-            "timestamp": datetime.utcnow().isoformat()+"Z",
-            "event": event,
-            "payload": payload
-        }
-        block['hash'] = self._hash(json.dumps(block, sort_keys=True))
-        chain.append(block)
-        self._write_chain(chain)
+        with self._lock:
+            block = {
+                "index": self._length,
+                "prev_hash": self._tail_hash,
+                "timestamp": datetime.utcnow().isoformat()+"Z",
+                "event": event,
+                "payload": payload
+            }
+            block['hash'] = self._hash(json.dumps(block, sort_keys=True))
+            self._append_block(block)
         logging.info(f"[Blockchain Log] Bloco {block['index']} adicionado. Hash: {block['hash'][:8]}...")
 
         # Envia snapshots para Loki/Grafana
@@ -515,41 +673,47 @@ BC = QuantumBlockchainLogger(BLOCKCHAIN_DB)
 # ───────────────────────────────────────────────────────────────────────────
 # Carregador de Diretório em Massa (Interno)
 # ───────────────────────────────────────────────────────────────────────────
-def _bulk_load_dir_internal(directory: Path):
+def _bulk_load_dir_internal(directory: Path, db: Optional["AlchemistEntitiesDB"] = None):
     """
     Carrega todos os arquivos YAML/JSON de um diretório e seus subdiretórios,
     mesclando entidades no AlchemistEntitiesDB.
     Esta é uma função auxiliar interna usada pela API e CLI bulk_load.
+    Todo o diretório é mesclado em um único lote (uma gravação por shard e um
+    bloco de ledger).
     """
     if not directory.exists() or not directory.is_dir():
         logging.warning(f"Diretório de carga em massa não encontrado: {directory}")
         return
 
-    for fp in directory.rglob("*.[jy][a-z]*"): # Captura .json, .yaml, .yml
-        if fp.is_file():
-            logging.info(f"Carregando entidades de {fp}...")
-            try:
-                new_data_raw: List[Dict[str, Any]]
-                if fp.suffix in ['.yaml', '.yml']:
-                    if LIBS['pyyaml'] and yaml:
-                        new_data_raw = yaml.safe_load(fp.read_text(encoding='utf-8'))
-                    else:
-                        logging.warning(f"PyYAML não instalado, ignorando arquivo YAML: {fp}")
-                        continue
-                else: # Assume JSON
-                    new_data_raw = json.loads(fp.read_text(encoding='utf-8'))
-                
-                if isinstance(new_data_raw, dict): # Se for uma única entidade no arquivo
-                    new_data_raw = [new_data_raw]
-
-                # Usamos uma referência global para AED, que será inicializada posteriormente
-                if 'AED' in globals() and isinstance(globals()['AED'], AlchemistEntitiesDB):
-                    globals()['AED'].merge_entities(new_data_raw, source_file=str(fp))
-                else:
-                    logging.warning(f"AED (AlchemistEntitiesDB) não está inicializado para carregar {fp}. Isso deve ser resolvido na inicialização.")
+    # Usamos uma referência global para AED, que será inicializada posteriormente
+    if db is None and 'AED' in globals() and isinstance(globals()['AED'], AlchemistEntitiesDB):
+        db = globals()['AED']
+    if db is None:
+        logging.warning(f"AED (AlchemistEntitiesDB) não está inicializado para carregar {directory}. Isso deve ser resolvido na inicialização.")
+        return
 
-            except Exception as e:
-                logging.error(f"Erro ao carregar {fp}: {e}")
+    with db.batch():
+        for fp in directory.rglob("*.[jy][a-z]*"): # Captura .json, .yaml, .yml
+            if fp.is_file():
+                logging.info(f"Carregando entidades de {fp}...")
+                try:
+                    new_data_raw: List[Dict[str, Any]]
+                    if fp.suffix in ['.yaml', '.yml']:
+                        if LIBS['pyyaml'] and yaml:
+                            new_data_raw = yaml.safe_load(fp.read_text(encoding='utf-8'))
+                        else:
+                            logging.warning(f"PyYAML não instalado, ignorando arquivo YAML: {fp}")
+                            continue
+                    else: # Assume JSON
+                        new_data_raw = json.loads(fp.read_text(encoding='utf-8'))
+                    
+                    if isinstance(new_data_raw, dict): # Se for uma única entidade no arquivo
+                        new_data_raw = [new_data_raw]
+
+                    db.merge_entities(new_data_raw, source_file=str(fp))
+
+                except Exception as e:
+                    logging.error(f"Erro ao carregar {fp}: {e}")
 
 # ───────────────────────────────────────────────────────────────────────────
 # Banco de Dados de Entidades Alquímicas (Sharding Dinâmico) -------------------------
@@ -559,18 +723,52 @@ class AlchemistEntitiesDB:
     Gerencia o armazenamento e acesso a Entidades Alquímicas,
     implementando sharding dinâmico baseado no tipo e corpo celestial/origem.
     Mantém um cache em memória para acesso rápido.
+
+    Toda escrita passa por um lote (`with AED.batch(): ...`): as entidades
+    alteradas são acumuladas, cada arquivo de shard é gravado uma única vez no
+    commit (via renomeação atômica) e o lote gera um único bloco no ledger.
+    Operações avulsas (`save`, `delete`, `patch`) abrem um lote implícito.
+
+    Na inicialização apenas o manifesto (`_manifest.jsonl`) é lido; os corpos
+    das entidades são carregados no primeiro `get()` para um cache LRU limitado.
+    Índices secundários por tipo e contêiner atendem listagens e filtros sem
+    desserializar o catálogo inteiro.
     """
-    def __init__(self, shard_dir: Path, schema_path: Path):
+    MANIFEST_NAME = "_manifest.jsonl" # Journal append-only do manifesto de shards
+    def __init__(self, shard_dir: Path, schema_path: Path, ledger: Optional[QuantumBlockchainLogger] = None,
+                 seed_defaults: bool = True, cache_size: int = 4096):
         self.shard_dir = shard_dir
         self.schema_path = schema_path
+        self.ledger = ledger or BC
         self.shard_dir.mkdir(parents=True, exist_ok=True)
-        self._entities_cache: Dict[str, EntidadeAlquimica] = {}
-        self._load_all_shards_to_memory() # Carrega tudo para a memória na inicialização para acesso rápido
+        self._known_dirs: set = set() # Diretórios de shard já criados (evita mkdir repetido)
+
+        # Cache LRU limitado com os corpos das entidades (carregados sob demanda em get())
+        self._cache_size = max(1, cache_size)
+        self._cache_lock = threading.RLock()
+        self._entities_cache: "OrderedDict[str, EntidadeAlquimica]" = OrderedDict()
+
+        # Manifesto persistente: codigo_interno -> {path, tipo, container, mtime} + índices secundários
+        self._manifest_path = self.shard_dir / self.MANIFEST_NAME
+        self._manifest: Dict[str, Dict[str, Any]] = {}
+        self._by_tipo: Dict[str, set] = {}
+        self._by_container: Dict[str, set] = {}
+        self._by_dir: Dict[str, set] = {}
+        self._dir_mtimes: Dict[str, int] = {} # diretório de shard -> st_mtime_ns conhecido
+
+        # Estado do lote corrente
+        self._batch_lock = threading.RLock()
+        self._batch_depth = 0
+        self._dirty: Dict[str, EntidadeAlquimica] = {} # codigo_interno -> entidade a gravar
+        self._deleted: Dict[str, Path] = {} # codigo_interno -> shard a remover
+        self._originals: Dict[str, Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]] = {} # (entidade, entrada do manifesto) antes do lote
+        self._batch_events: List[Dict[str, Any]] = [] # eventos agregados no bloco do lote
+
+        self._open_manifest() # Carrega o manifesto e reconcilia só os diretórios alterados
         
-        if not self._entities_cache:
+        if not self._manifest and seed_defaults:
             logging.info("Nenhuma entidade encontrada nos shards. Carregando dados iniciais padrão do Sistema Solar.")
             self._seed_default_solar_system_entities()
-            self._load_all_shards_to_memory() # Recarrega após o seeding
 
     def _get_entity_shard_path(self, entity: EntidadeAlquimica) -> Path:
         """Determina o caminho do arquivo de shard para uma entidade."""
@@ -595,45 +793,399 @@ class AlchemistEntitiesDB:
         # Estrutura de diretório: db/shards/<container_name>/<entity_type>/
         container_dir = self.shard_dir / container_name
         type_dir = container_dir / entity.tipo.replace(' ', '_').lower()
-        type_dir.mkdir(parents=True, exist_ok=True)
         
         filename = f"{entity.codigo_interno}.json"
         return type_dir / filename
 
-    def _load_all_shards_to_memory(self):
-        """Varre o diretório de shards e carrega todas as entidades para o cache em memória."""
-        self._entities_cache = {}
-        for shard_file in self.shard_dir.rglob("*.json"):
+    def _ensure_dir(self, directory: Path):
+        """Cria o diretório do shard apenas na primeira vez em que é visto."""
+        if directory not in self._known_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(directory)
+
+    def _write_shard_atomic(self, filepath: Path, data: Dict[str, Any]):
+        """Grava um shard em arquivo temporário e o renomeia sobre o destino."""
+        self._ensure_dir(filepath.parent)
+        tmp_path = filepath.with_name(f".{filepath.name}.tmp")
+        tmp_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp_path, filepath)
+
+    # ── Manifesto e índices ───────────────────────────────────────────────
+
+    def _manifest_entry(self, entity: EntidadeAlquimica, filepath: Path, mtime: Optional[int]) -> Dict[str, Any]:
+        """Monta a entrada de manifesto de uma entidade a partir do seu shard."""
+        rel = filepath.relative_to(self.shard_dir)
+        return {"path": rel.as_posix(), "tipo": entity.tipo, "container": rel.parts[0], "mtime": mtime}
+
+    def _index_put(self, codigo_interno: str, entry: Dict[str, Any]):
+        """Insere/atualiza uma entrada no manifesto em memória e nos índices secundários."""
+        self._index_remove(codigo_interno)
+        self._manifest[codigo_interno] = entry
+        self._by_tipo.setdefault(entry['tipo'], set()).add(codigo_interno)
+        self._by_container.setdefault(entry['container'], set()).add(codigo_interno)
+        self._by_dir.setdefault(entry['path'].rsplit('/', 1)[0], set()).add(codigo_interno)
+
+    def _index_remove(self, codigo_interno: str) -> Optional[Dict[str, Any]]:
+        """Remove uma entrada do manifesto em memória e dos índices secundários."""
+        entry = self._manifest.pop(codigo_interno, None)
+        if entry:
+            for index, key in ((self._by_tipo, entry['tipo']), (self._by_container, entry['container']),
+                               (self._by_dir, entry['path'].rsplit('/', 1)[0])):
+                codes = index.get(key)
+                if codes is not None:
+                    codes.discard(codigo_interno)
+                    if not codes:
+                        del index[key]
+        return entry
+
+    def _apply_manifest_op(self, op: Dict[str, Any]):
+        """Aplica uma operação do journal do manifesto ao estado em memória."""
+        if op.get('op') == 'put':
+            self._index_put(op['codigo'], {k: op[k] for k in ("path", "tipo", "container", "mtime")})
+        elif op.get('op') == 'del':
+            self._index_remove(op['codigo'])
+        elif op.get('op') == 'dir':
+            if op.get('mtime') is None:
+                self._dir_mtimes.pop(op['path'], None)
+            else:
+                self._dir_mtimes[op['path']] = op['mtime']
+
+    def _append_manifest(self, ops: List[Dict[str, Any]]):
+        """Anexa operações ao journal do manifesto em uma única escrita."""
+        if ops:
+            with self._manifest_path.open('a', encoding='utf-8') as fh:
+                fh.write(''.join(json.dumps(op, ensure_ascii=False) + "\n" for op in ops))
+
+    def _compact_manifest(self):
+        """Reescreve o journal do manifesto como um snapshot (renomeação atômica)."""
+        ops = [{"op": "put", "codigo": c, **entry} for c, entry in self._manifest.items()]
+        ops += [{"op": "dir", "path": d, "mtime": m} for d, m in self._dir_mtimes.items()]
+        tmp_path = self._manifest_path.with_name(f".{self._manifest_path.name}.tmp")
+        tmp_path.write_text(''.join(json.dumps(op, ensure_ascii=False) + "\n" for op in ops), encoding='utf-8')
+        os.replace(tmp_path, self._manifest_path)
+
+    def _open_manifest(self):
+        """
+        Reproduz o journal do manifesto e reconcilia com o disco. Somente os
+        diretórios de shard cujo mtime mudou são relistados, e somente shards
+        novos ou alterados são desserializados.
+        """
+        journal_lines = 0
+        if self._manifest_path.exists():
+            with self._manifest_path.open('r', encoding='utf-8') as fh:
+                for line in fh:
+                    journal_lines += 1
+                    try:
+                        self._apply_manifest_op(json.loads(line))
+                    except (json.JSONDecodeError, KeyError) as e:
+                        logging.warning(f"Linha inválida no manifesto de shards ignorada: {e}")
+
+        ops = self._reconcile_shard_dirs()
+        if journal_lines + len(ops) > 2 * (len(self._manifest) + len(self._dir_mtimes)) + 1024:
+            self._compact_manifest()
+        else:
+            self._append_manifest(ops)
+        logging.info(f"Manifesto de shards carregado: {len(self._manifest)} entidade(s) indexada(s) "
+                     f"({len(ops)} alteração(ões) reconciliada(s)).")
+
+    def _reconcile_shard_dirs(self) -> List[Dict[str, Any]]:
+        """Compara os diretórios <contêiner>/<tipo> com o manifesto e retorna as operações aplicadas."""
+        ops: List[Dict[str, Any]] = []
+        seen_dirs = set()
+        for container in os.scandir(self.shard_dir):
+            if not container.is_dir():
+                continue
+            for type_dir in os.scandir(container.path):
+                if not type_dir.is_dir():
+                    continue
+                rel_dir = f"{container.name}/{type_dir.name}"
+                seen_dirs.add(rel_dir)
+                self._known_dirs.add(Path(type_dir.path))
+                mtime = type_dir.stat().st_mtime_ns
+                if self._dir_mtimes.get(rel_dir) == mtime:
+                    continue
+                ops.extend(self._rescan_dir(Path(type_dir.path), rel_dir))
+                op = {"op": "dir", "path": rel_dir, "mtime": mtime}
+                self._apply_manifest_op(op)
+                ops.append(op)
+
+        for rel_dir in [d for d in list(self._dir_mtimes) + list(self._by_dir) if d not in seen_dirs]:
+            for codigo_interno in list(self._by_dir.get(rel_dir, ())):
+                self._index_remove(codigo_interno)
+                ops.append({"op": "del", "codigo": codigo_interno})
+            if rel_dir in self._dir_mtimes:
+                op = {"op": "dir", "path": rel_dir, "mtime": None}
+                self._apply_manifest_op(op)
+                ops.append(op)
+        return ops
+
+    def _rescan_dir(self, directory: Path, rel_dir: str) -> List[Dict[str, Any]]:
+        """Relista um diretório de shard, indexando arquivos novos/alterados e removendo os ausentes."""
+        ops: List[Dict[str, Any]] = []
+        missing = set(self._by_dir.get(rel_dir, ()))
+        for shard_file in os.scandir(directory):
+            if not shard_file.name.endswith('.json') or shard_file.name.startswith('.') or not shard_file.is_file():
+                continue
+            rel_file = f"{rel_dir}/{shard_file.name}"
+            mtime = shard_file.stat().st_mtime_ns
+            entry = self._manifest.get(shard_file.name[:-len('.json')])
+            if entry and entry['path'] == rel_file:
+                missing.discard(shard_file.name[:-len('.json')])
+                if entry['mtime'] == mtime:
+                    continue
+            try:
+                entity = EntidadeAlquimica.from_dict(json.loads(Path(shard_file.path).read_text(encoding='utf-8')))
+            except (json.JSONDecodeError, KeyError, OSError) as e:
+                logging.error(f"Erro ao indexar shard {shard_file.path}: {e}")
+                continue
+            missing.discard(entity.codigo_interno)
+            entry = self._manifest_entry(entity, Path(shard_file.path), mtime)
+            self._index_put(entity.codigo_interno, entry)
+            with self._cache_lock:
+                self._entities_cache.pop(entity.codigo_interno, None)
+            ops.append({"op": "put", "codigo": entity.codigo_interno, **entry})
+        for codigo_interno in missing:
+            self._index_remove(codigo_interno)
+            ops.append({"op": "del", "codigo": codigo_interno})
+        return ops
+
+    def _cache_put(self, codigo_interno: str, entity: EntidadeAlquimica):
+        """Insere no cache LRU, descartando as entradas menos usadas além do limite."""
+        with self._cache_lock:
+            self._entities_cache[codigo_interno] = entity
+            self._entities_cache.move_to_end(codigo_interno)
+            while len(self._entities_cache) > self._cache_size:
+                self._entities_cache.popitem(last=False)
+
+    # ── Lotes transacionais ────────────────────────────────────────────────
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Abre um lote de escrita. Lotes aninhados são absorvidos pelo mais externo.
+        No commit, cada shard alterado é gravado uma vez e um único bloco é
+        adicionado ao ledger; se o lote falhar, o cache volta ao estado anterior
+        e nada é gravado em disco.
+        """
+        with self._batch_lock:
+            self._batch_depth += 1
             try:
-                data = json.loads(shard_file.read_text(encoding='utf-8'))
-                entity = EntidadeAlquimica.from_dict(data)
-                self._entities_cache[entity.codigo_interno] = entity
-            except (json.JSONDecodeError, KeyError) as e:
-                logging.error(f"Erro ao carregar shard {shard_file}: {e}")
-        logging.info(f"Carregadas {len(self._entities_cache)} entidades para o cache em memória.")
+                yield self
+            except BaseException:
+                if self._batch_depth == 1:
+                    self._rollback_batch()
+                raise
+            else:
+                if self._batch_depth == 1:
+                    self._commit_batch()
+            finally:
+                self._batch_depth -= 1
+
+    def _remember_original(self, codigo_interno: str):
+        """Guarda o estado de uma entidade antes da primeira alteração no lote."""
+        if codigo_interno not in self._originals:
+            entity = self.get(codigo_interno)
+            entry = self._manifest.get(codigo_interno)
+            self._originals[codigo_interno] = (entity.to_dict() if entity else None, dict(entry) if entry else None)
+
+    def _reset_batch_state(self):
+        self._dirty = {}
+        self._deleted = {}
+        self._originals = {}
+        self._batch_events = []
+
+    def _rollback_batch(self):
+        """Descarta as alterações pendentes e restaura o cache."""
+        for codigo_interno, (original, entry) in self._originals.items():
+            with self._cache_lock:
+                self._entities_cache.pop(codigo_interno, None)
+            if original is None or entry is None:
+                self._index_remove(codigo_interno)
+            else:
+                self._cache_put(codigo_interno, EntidadeAlquimica.from_dict(original))
+                self._index_put(codigo_interno, entry)
+        logging.warning(f"Lote de entidades revertido ({len(self._originals)} entidade(s) restaurada(s)).")
+        self._reset_batch_state()
+
+    def _commit_batch(self):
+        """
+        Grava os shards alterados e registra um bloco agregado no ledger.
+        Se alguma gravação falhar, o commit parcial é desfeito (shards, manifesto,
+        cache e índices voltam ao estado anterior ao lote), o estado pendente é
+        limpo e a exceção é propagada: um lote que falhou não vaza para o próximo.
+        """
+        if not self._dirty and not self._deleted and not self._batch_events:
+            self._reset_batch_state()
+            return
+        try:
+            self._write_batch(self._dirty, self._deleted, self._batch_events, self._originals)
+        except BaseException:
+            self._undo_partial_commit()
+            raise
+        self._reset_batch_state()
+
+    def _undo_partial_commit(self):
+        """
+        Devolve ao disco o estado anterior ao lote após um commit interrompido:
+        remove os shards novos gravados pelo lote, regrava os originais sobrescritos,
+        movidos ou apagados, anexa ao manifesto as entradas originais e, por fim,
+        restaura cache e índices (_rollback_batch).
+        """
+        manifest_ops: List[Dict[str, Any]] = []
+        touched_dirs = set()
+        for codigo_interno, (original, entry) in list(self._originals.items()):
+            pending = self._dirty.get(codigo_interno)
+            old_path = self.shard_dir / entry['path'] if entry else None
+            try:
+                new_path = self._get_entity_shard_path(pending) if pending is not None else None
+                if new_path is not None and new_path != old_path and new_path.exists():
+                    new_path.unlink()
+                    touched_dirs.add(new_path.parent)
+                if original is None or old_path is None:
+                    manifest_ops.append({"op": "del", "codigo": codigo_interno})
+                    continue
+                try:
+                    on_disk = json.loads(old_path.read_text(encoding='utf-8'))
+                except (OSError, json.JSONDecodeError):
+                    on_disk = None
+                if on_disk != original:
+                    self._write_shard_atomic(old_path, original)
+                    touched_dirs.add(old_path.parent)
+                restored = dict(entry, mtime=old_path.stat().st_mtime_ns)
+                self._originals[codigo_interno] = (original, restored)
+                manifest_ops.append({"op": "put", "codigo": codigo_interno, **restored})
+            except OSError as e:
+                logging.error(f"Falha ao desfazer o commit parcial de {codigo_interno}: {e}")
+        for directory in touched_dirs:
+            rel_dir = directory.relative_to(self.shard_dir).as_posix()
+            if directory.exists():
+                self._dir_mtimes[rel_dir] = directory.stat().st_mtime_ns
+                manifest_ops.append({"op": "dir", "path": rel_dir, "mtime": self._dir_mtimes[rel_dir]})
+        try:
+            self._append_manifest(manifest_ops)
+        except OSError as e:
+            logging.error(f"Falha ao registrar no manifesto a reversão do lote: {e}")
+        self._rollback_batch()
+
+    def _write_batch(self, dirty: Dict[str, EntidadeAlquimica], deleted: Dict[str, Path],
+                     events: List[Dict[str, Any]], originals: Dict[str, Tuple[Any, Any]]):
+        """Corpo do commit: shards, manifesto e bloco do ledger (sem tocar no estado pendente)."""
+        digest = hashlib.sha256()
+        manifest_ops: List[Dict[str, Any]] = []
+        touched_dirs = set()
+        written_paths = []
+        for codigo_interno in sorted(dirty):
+            filepath = self._get_entity_shard_path(dirty[codigo_interno])
+            self._write_shard_atomic(filepath, dirty[codigo_interno].to_dict())
+            previous_entry = originals.get(codigo_interno, (None, None))[1]
+            if previous_entry and previous_entry['path'] != filepath.relative_to(self.shard_dir).as_posix():
+                # A entidade mudou de shard (ex.: tipo alterado): remove o arquivo antigo
+                old_path = self.shard_dir / previous_entry['path']
+                old_path.unlink(missing_ok=True)
+                touched_dirs.add(old_path.parent)
+            entry = self._manifest_entry(dirty[codigo_interno], filepath, filepath.stat().st_mtime_ns)
+            if codigo_interno in self._manifest:
+                self._index_put(codigo_interno, entry)
+            manifest_ops.append({"op": "put", "codigo": codigo_interno, **entry})
+            touched_dirs.add(filepath.parent)
+            written_paths.append(filepath)
+            digest.update(f"S:{codigo_interno}:{filepath}\n".encode('utf-8'))
+        removed_paths = []
+        for codigo_interno in sorted(deleted):
+            filepath = deleted[codigo_interno]
+            manifest_ops.append({"op": "del", "codigo": codigo_interno})
+            if filepath.exists():
+                filepath.unlink()
+                touched_dirs.add(filepath.parent)
+                removed_paths.append(filepath)
+                digest.update(f"D:{codigo_interno}:{filepath}\n".encode('utf-8'))
+        for directory in touched_dirs:
+            if directory.exists():
+                rel_dir = directory.relative_to(self.shard_dir).as_posix()
+                self._dir_mtimes[rel_dir] = directory.stat().st_mtime_ns
+                manifest_ops.append({"op": "dir", "path": rel_dir, "mtime": self._dir_mtimes[rel_dir]})
+        self._append_manifest(manifest_ops)
+
+        # Operações avulsas mantêm os eventos individuais de sempre
+        if len(written_paths) + len(removed_paths) <= 1 and len(events) <= 1:
+            if written_paths:
+                codigo_interno = next(iter(dirty))
+                self.ledger.add('ENTITY_SAVED_TO_SHARD', {"codigo_interno": codigo_interno, "path": str(written_paths[0])})
+            if removed_paths:
+                codigo_interno = next(iter(deleted))
+                self.ledger.add('ENTITY_DELETED_FROM_SHARD', {"codigo_interno": codigo_interno, "path": str(removed_paths[0])})
+            for event in events:
+                self.ledger.add(event['event'], event['payload'])
+            return
+
+        self.ledger.add('ENTITY_BATCH_COMMIT', {
+            "entities_saved": len(written_paths),
+            "entities_deleted": len(removed_paths),
+            "shards_touched": len({p.parent for p in written_paths + removed_paths}),
+            "entities_digest": digest.hexdigest(),
+            "events": events,
+            "total_entities_after_batch": self.count_all_entities(),
+        })
+        logging.info(f"Lote de entidades gravado: {len(written_paths)} salvas, {len(removed_paths)} removidas.")
+
+    def _record_event(self, event: str, payload: Dict[str, Any]):
+        """Agrega um evento ao bloco do lote corrente."""
+        self._batch_events.append({"event": event, "payload": payload})
+
+    # ── Operações ─────────────────────────────────────────────────────────
 
     def save(self, entity: EntidadeAlquimica):
-        """Salva uma única entidade em seu arquivo de shard e atualiza o cache."""
-        filepath = self._get_entity_shard_path(entity)
-        filepath.write_text(json.dumps(entity.to_dict(), indent=2, ensure_ascii=False))
-        self._entities_cache[entity.codigo_interno] = entity # Atualiza o cache
-        BC.add('ENTITY_SAVED_TO_SHARD', {"codigo_interno": entity.codigo_interno, "path": str(filepath)})
+        """Marca uma entidade para gravação em seu shard e atualiza o cache e o manifesto."""
+        with self.batch():
+            self._remember_original(entity.codigo_interno)
+            self._cache_put(entity.codigo_interno, entity) # Atualiza o cache
+            self._dirty[entity.codigo_interno] = entity
+            self._deleted.pop(entity.codigo_interno, None)
+            self._index_put(entity.codigo_interno, self._manifest_entry(entity, self._get_entity_shard_path(entity), None))
 
     def delete(self, codigo_interno: str):
         """Deleta uma entidade do cache e de seu arquivo de shard."""
-        if codigo_interno in self._entities_cache:
-            entity = self._entities_cache.pop(codigo_interno)
-            filepath = self._get_entity_shard_path(entity)
-            if filepath.exists():
-                filepath.unlink()
-                BC.add('ENTITY_DELETED_FROM_SHARD', {"codigo_interno": codigo_interno, "path": str(filepath)})
-                logging.info(f"Entidade {codigo_interno} e shard deletados.")
+        if codigo_interno in self._manifest:
+            with self.batch():
+                self._remember_original(codigo_interno)
+                entry = self._index_remove(codigo_interno)
+                with self._cache_lock:
+                    self._entities_cache.pop(codigo_interno, None)
+                self._dirty.pop(codigo_interno, None)
+                on_disk = self._originals[codigo_interno][1] or entry # Shard gravado antes deste lote
+                self._deleted[codigo_interno] = self.shard_dir / on_disk['path']
+            logging.info(f"Entidade {codigo_interno} e shard deletados.")
         else:
             logging.warning(f"Tentativa de deletar entidade inexistente: {codigo_interno}")
 
     def get(self, codigo_interno: str) -> Optional[EntidadeAlquimica]:
-        """Recupera uma entidade pelo seu código interno do cache."""
-        return self._entities_cache.get(codigo_interno)
+        """Recupera uma entidade pelo código interno (cache LRU ou, na falta, o shard em disco)."""
+        entity = self._dirty.get(codigo_interno) # Entidades pendentes no lote ficam fixadas
+        if entity is not None:
+            return entity
+        with self._cache_lock:
+            entity = self._entities_cache.get(codigo_interno)
+            if entity is not None:
+                self._entities_cache.move_to_end(codigo_interno)
+                return entity
+
+        entry = self._manifest.get(codigo_interno)
+        if not entry:
+            return None
+        filepath = self.shard_dir / entry['path']
+        try:
+            mtime = filepath.stat().st_mtime_ns
+            entity = EntidadeAlquimica.from_dict(json.loads(filepath.read_text(encoding='utf-8')))
+        except (OSError, json.JSONDecodeError, KeyError) as e:
+            logging.error(f"Erro ao carregar shard {filepath}: {e}")
+            return None
+        if mtime != entry['mtime'] or entity.tipo != entry['tipo']:
+            # Shard alterado fora do AED: atualiza o manifesto
+            entry = dict(entry, tipo=entity.tipo, mtime=mtime)
+            self._index_put(codigo_interno, entry)
+            self._append_manifest([{"op": "put", "codigo": codigo_interno, **entry}])
+        self._cache_put(codigo_interno, entity)
+        return entity
 
     def patch(self, codigo_interno: str, patch_data: Dict[str, Any]):
         """Aplica um patch (atualização parcial) a uma entidade e a salva."""
@@ -641,56 +1193,81 @@ class AlchemistEntitiesDB:
         if not entity:
             raise ValueError(f"Entidade {codigo_interno} não encontrada para patch.")
         
-        # Aplica os dados do patch
-        for key, value in patch_data.items():
-            if hasattr(entity, key) and key != 'extra_data': # Atualiza atributos diretos
-                setattr(entity, key, value)
-            else: # Assume que é um campo de dados extras
-                entity.extra_data[key] = value
-        
-        entity.timestamp = datetime.utcnow().isoformat() # Atualiza o timestamp na alteração
-        self.save(entity) # Salva a entidade atualizada
-        BC.add('ENTITY_PATCHED', {"codigo_interno": entity.codigo_interno, "patch": patch_data, "log_level": "info", "severity": "none"})
-
-    def load_all_entities(self) -> List[EntidadeAlquimica]:
-        """Retorna todas as entidades atualmente no cache em memória."""
-        return list(self._entities_cache.values())
+        with self.batch():
+            self._remember_original(codigo_interno)
+            # Aplica os dados do patch
+            for key, value in patch_data.items():
+                if hasattr(entity, key) and key != 'extra_data': # Atualiza atributos diretos
+                    setattr(entity, key, value)
+                else: # Assume que é um campo de dados extras
+                    entity.extra_data[key] = value
+            
+            entity.timestamp = datetime.utcnow().isoformat() # Atualiza o timestamp na alteração
+            self.save(entity) # Salva a entidade atualizada
+            self._record_event('ENTITY_PATCHED', {"codigo_interno": entity.codigo_interno, "patch": patch_data, "log_level": "info", "severity": "none"})
+
+    def list_codigos(self, tipo: Optional[str] = None, container: Optional[str] = None) -> List[str]:
+        """Lista códigos internos pelos índices secundários, sem desserializar entidades."""
+        selected: Optional[set] = None
+        for index, key in ((self._by_tipo, tipo), (self._by_container, container)):
+            if key is not None:
+                codes = index.get(key, set())
+                selected = set(codes) if selected is None else selected & codes
+        return sorted(self._manifest if selected is None else selected)
+
+    def iter_entities(self, tipo: Optional[str] = None, container: Optional[str] = None):
+        """Itera as entidades filtradas, carregando cada uma sob demanda."""
+        for codigo_interno in self.list_codigos(tipo=tipo, container=container):
+            entity = self.get(codigo_interno)
+            if entity is not None:
+                yield entity
+
+    def load_all_entities(self, tipo: Optional[str] = None, container: Optional[str] = None) -> List[EntidadeAlquimica]:
+        """Retorna todas as entidades (opcionalmente filtradas por tipo/contêiner)."""
+        return list(self.iter_entities(tipo=tipo, container=container))
 
     def count_all_entities(self) -> int:
-        """Retorna a contagem total de entidades em memória."""
-        return len(self._entities_cache)
+        """Retorna a contagem total de entidades indexadas no manifesto."""
+        return len(self._manifest)
+
+    def count_by(self, field: str) -> Dict[str, int]:
+        """Conta entidades por 'tipo' ou 'container' usando apenas os índices."""
+        index = {"tipo": self._by_tipo, "container": self._by_container}[field]
+        return {key: len(codes) for key, codes in sorted(index.items())}
 
     def merge_entities(self, new_entities_raw: List[Dict[str, Any]], source_file: Optional[str] = None):
         """Mescla novas entidades (da sincronização M42 ou carregamento de arquivo) no DB."""
         new_count = 0
         updated_count = 0
 
-        for entity_data in new_entities_raw:
-            entity = EntidadeAlquimica.from_dict(entity_data) # Isso lida com a geração do codigo_interno
-            
-            if entity.codigo_interno in self._entities_cache:
-                # Atualiza entidade existente
-                existing_entity = self._entities_cache[entity.codigo_interno]
-                # Atualiza todos os atributos, exceto timestamp, que é atualizado em save()
-                for key, value in entity.__dict__.items():
-                    if key != 'timestamp' and key != 'extra_data':
-                        setattr(existing_entity, key, value)
-                existing_entity.extra_data.update(entity.extra_data) # Mescla dados extras
+        with self.batch():
+            for entity_data in new_entities_raw:
+                entity = EntidadeAlquimica.from_dict(entity_data) # Isso lida com a geração do codigo_interno
                 
-                self.save(existing_entity) # Salva a entidade atualizada
-                updated_count += 1
-            else:
-                # Adiciona nova entidade
-                self.save(entity) # Salva a nova entidade
-                new_count += 1
-        
-        log_payload = {
-            "source": source_file or "M42_Sync",
-            "new_entities_added": new_count,
-            "existing_entities_updated": updated_count,
-            "total_entities_after_sync": self.count_all_entities()
-        }
-        BC.add('ENTITY_MERGE_SYNC', log_payload)
+                existing_entity = self.get(entity.codigo_interno) if entity.codigo_interno in self._manifest else None
+                if existing_entity is not None:
+                    # Atualiza entidade existente
+                    self._remember_original(entity.codigo_interno)
+                    # Atualiza todos os atributos, exceto timestamp, que é atualizado em save()
+                    for key, value in entity.__dict__.items():
+                        if key != 'timestamp' and key != 'extra_data':
+                            setattr(existing_entity, key, value)
+                    existing_entity.extra_data.update(entity.extra_data) # Mescla dados extras
+                    
+                    self.save(existing_entity) # Salva a entidade atualizada
+                    updated_count += 1
+                else:
+                    # Adiciona nova entidade
+                    self.save(entity) # Salva a nova entidade
+                    new_count += 1
+            
+            log_payload = {
+                "source": source_file or "M42_Sync",
+                "new_entities_added": new_count,
+                "existing_entities_updated": updated_count,
+                "total_entities_after_sync": self.count_all_entities()
+            }
+            self._record_event('ENTITY_MERGE_SYNC', log_payload)
         logging.info(f"Sincronização de mesclagem de entidades concluída. Adicionadas: {new_count}, Atualizadas: {updated_count}. Total: {self.count_all_entities()}")
 
     def _seed_default_solar_system_entities(self):
@@ -745,7 +1322,7 @@ class AlchemistEntitiesDB:
                     logging.warning(f"PyYAML não disponível. Ignorando a geração do arquivo de semente padrão: {seed_file_path}")
             
             # Agora carrega do diretório (que pode conter o arquivo recém-criado ou os existentes)
-            _bulk_load_dir_internal(category_dir)
+            _bulk_load_dir_internal(category_dir, db=self)
 
 
 # Inicializa o banco de dados de entidades alquímicas (globalmente)
@@ -1511,9 +2088,9 @@ if LIBS['fastapi']:
     router = APIRouter()
 
     @router.get("/entities", response_model=List[EntidadeAlquimicaCreateModel])
-    async def list_all_entities_api():
-        """Lista todas as entidades registradas na malha vibracional."""
-        entities = AED.load_all_entities()
+    async def list_all_entities_api(tipo: Optional[str] = None, container: Optional[str] = None):
+        """Lista as entidades registradas na malha vibracional (filtros opcionais por tipo/contêiner)."""
+        entities = AED.load_all_entities(tipo=tipo, container=container)
         BC.add('API_LIST_ENTITIES', {"count": len(entities)})
         return [e.to_dict() for e in entities]
 
@@ -1866,6 +2443,47 @@ def generate_observability_stack_files():
     BC.add('OBSERVABILITY_STACK_GENERATED', {"path": str(OBSERVABILITY_STACK_DIR)})
 
 
+# ───────────────────────────────────────────────────────────────────────────
+# Benchmark de mesclagem de entidades ----------------------------------------
+# ───────────────────────────────────────────────────────────────────────────
+
+def benchmark_merge_throughput(counts: Tuple[int, ...] = (10_000, 100_000), include_unbatched: bool = True) -> List[Dict[str, Any]]:
+    """
+    Mede a vazão de `merge_entities` (um lote por chamada) contra o caminho
+    antigo de um `save` por entidade, em um diretório temporário isolado com
+    ledger próprio. Retorna uma linha de resultado por cenário.
+    """
+    results = []
+    previous_disable = logging.root.manager.disable
+    logging.disable(logging.INFO) # Evita uma linha de log por bloco durante a medição
+    try:
+        for count in counts:
+            raw = [{"name": f"Entidade Bench {i}", "tipo": ("portal", "monumento", "linha_ley", "ponto_lagrange")[i % 4],
+                    "coordinates": [float(i % 90), float(i % 180)], "codigo_interno": f"BENCH-{i:07d}",
+                    "sistema": f"sistema-{i % 16}"} for i in range(count)]
+            modes = [("batched", True)] + ([("unbatched", False)] if include_unbatched else [])
+            for mode, batched in modes:
+                with tempfile.TemporaryDirectory(prefix="m43_bench_") as tmp:
+                    tmp_path = Path(tmp)
+                    ledger = QuantumBlockchainLogger(tmp_path / "ledger" / "chain.json")
+                    db = AlchemistEntitiesDB(shard_dir=tmp_path / "shards", schema_path=Path("schema_vibrational_entity.json"),
+                                             ledger=ledger, seed_defaults=False)
+                    start = time.perf_counter()
+                    if batched:
+                        db.merge_entities(raw, source_file="benchmark")
+                    else:
+                        for entity_data in raw:
+                            db.save(EntidadeAlquimica.from_dict(dict(entity_data)))
+                    elapsed = time.perf_counter() - start
+                    results.append({"entities": count, "mode": mode, "seconds": round(elapsed, 3),
+                                    "entities_per_s": round(count / elapsed, 1) if elapsed else float('inf'),
+                                    "ledger_blocks": len(ledger)})
+                    ledger.close()
+    finally:
+        logging.disable(previous_disable)
+    return results
+
+
 # ───────────────────────────────────────────────────────────────────────────
 # Execução Principal da CLI --------------------------------------------------------
 # ───────────────────────────────────────────────────────────────────────────
@@ -1883,7 +2501,11 @@ def run_cli_command(command: str, args: List[str]):
         time.sleep(1) # Dá um momento para o servidor WebSocket iniciar
 
     if command == 'list_entities':
-        entities = AED.load_all_entities()
+        filters = {}
+        for i, arg in enumerate(args):
+            if arg in ('--tipo', '--container') and i + 1 < len(args):
+                filters[arg[2:]] = args[i+1]
+        entities = AED.load_all_entities(**filters)
         if not entities:
             logging.info("Nenhuma entidade registrada na malha vibracional.")
             return
@@ -1908,7 +2530,8 @@ def run_cli_command(command: str, args: List[str]):
         print("-" * (sum(len(h) for h in headers) + 3 * (len(headers) - 1)))
         for row in rows:
             print(" | ".join(str(item).ljust(len(headers[i])) for i, item in enumerate(row)))
-        print(f"\nTotal de entidades: {AED.count_all_entities()}")
+        print(f"\nTotal de entidades: {len(entities)} de {AED.count_all_entities()}")
+        print("Por tipo: " + ", ".join(f"{tipo}={n}" for tipo, n in AED.count_by('tipo').items()))
 
     elif command == 'add_entity':
         json_path = None
@@ -2054,9 +2677,17 @@ def run_cli_command(command: str, args: List[str]):
             if LIBS['websockets'] and websockets:
                 asyncio.run(broadcast_entity_update(entity.to_dict()))
 
+    elif command == 'benchmark_merge':
+        counts = tuple(int(a) for a in args if a.isdigit()) or (10_000, 100_000)
+        results = benchmark_merge_throughput(counts, include_unbatched='--batched-only' not in args)
+        print("\n--- Benchmark de Mesclagem de Entidades ---")
+        for row in results:
+            print(f"{row['entities']:>8} entidades | {row['mode']:<9} | {row['seconds']:>8.3f}s | "
+                  f"{row['entities_per_s']:>10.1f} ent/s | {row['ledger_blocks']} bloco(s) no ledger")
+
     else:
         logging.error(f"Comando desconhecido: '{command}'.")
-        logging.info("Comandos disponíveis: list_entities, add_entity, bulk_load, get_entity, patch_entity, delete_entity, start_webgl_server, start_api, gen_observability_stack, validate_security_cycle, vibration_scan_cycle, nanorobot_update_cycle, ia_align_cycle")
+        logging.info("Comandos disponíveis: list_entities, add_entity, bulk_load, get_entity, patch_entity, delete_entity, start_webgl_server, start_api, gen_observability_stack, validate_security_cycle, vibration_scan_cycle, nanorobot_update_cycle, ia_align_cycle, benchmark_merge")
 
 
 if __name__ == '__main__':
@@ -58,6 +58,8 @@
     list_members                           → Lista membros do Conselho (Núcleo 2).
     link_elements [--from <str> --to <str> ...] ou [--batch <file>] → Cria ligações no Mapa Dimensional (Núcleo 3).
     query_links                            → Consulta ligações no Mapa Dimensional (Núcleo 3).
+    bench_graph [--edges N --nodes N]      → Mede ingestão em lote, consulta e recarga do Mapa Dimensional.
+    bench_registries [--entries N]         → Compara gravação por mutação com import em lote nos registros.
     verify_m44_auth                        → Testa verificação de autenticidade do M44.
     start_api                              → Inicia o servidor API REST.
     sync_ontology [--data <json>] ou [--file <file>] → Sincroniza dicionário universal (Camada Ontologia).
@@ -87,10 +89,13 @@ import hashlib
 import os
 import time
 import random
+import atexit
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from textwrap import dedent
-from typing import Dict, List, Any, Optional, Union, Callable, Tuple
+from typing import Dict, List, Any, Optional, Union, Callable, Tuple, Iterable
 import re
 from dataclasses import dataclass, field
 import types # Importado para criar stubs de módulos
@@ -192,7 +197,7 @@ except ModuleNotFoundError:
 try:
     import networkx as _nx; nx = _nx; LIBS['networkx'] = True
 except ModuleNotFoundError:
-    logging.warning("networkx ausente – grafos dimensionais desabilitados.")
+    logging.warning("networkx ausente – exportação do grafo dimensional (to_networkx) desabilitada.")
 
 try:
     import pandas as _pd; pd = _pd; LIBS['pandas'] = True
@@ -538,6 +543,7 @@ class VeritasBlockchainLogger:
     """
     def __init__(self, path: Path):
         self.path = path
+        self._lock = threading.RLock() # Flushes dos registros podem vir da thread de debounce
         self.path.parent.mkdir(parents=True, exist_ok=True)
         if not self.path.exists():
             self._write_chain([self._genesis_block()])
@@ -578,6 +584,10 @@ class VeritasBlockchainLogger:
 
     def add(self, event: str, payload: Dict[str, Any], core_nucleus: int = 6):
         """Adiciona um novo bloco à cadeia com um evento, payload e núcleo de origem."""
+        with self._lock:
+            self._add(event, payload, core_nucleus)
+
+    def _add(self, event: str, payload: Dict[str, Any], core_nucleus: int):
         chain = self.chain
         prev = chain[-1]
         block = {
@@ -1171,6 +1181,229 @@ class CoreValidator:
 CORE_VALIDATOR = CoreValidator(QUANTUM_AUTHENTICATOR)
 
 
+# ───────────────────────────────────────────────────────────────────────────
+# Persistência Compartilhada dos Registros (Núcleos 1-2 e Camadas Adicionais)
+# ───────────────────────────────────────────────────────────────────────────
+class CoalescedJSONStore:
+    """
+    Armazenamento JSON usado pelos registros do M44 (equações, conselho, ontologia, constantes,
+    mapeamentos e linhagens). As mutações apenas marcam chaves como sujas; o arquivo é regravado
+    (temporário + os.replace, nunca fica meio escrito) no máximo flush_interval segundos após a
+    primeira mutação pendente, ao atingir max_pending chaves, ao sair de um bloco batch() ou no
+    encerramento do processo. Cada flush gera um único bloco agregado na Veritas-Chain.
+    Com flush_interval <= 0 cada mutação é gravada imediatamente, como antes.
+    Cada valor é serializado já em set()/touch(), então um valor não serializável levanta o
+    erro para quem chamou (e não fica preso na thread do flush); o flush só concatena os
+    fragmentos JSON já prontos. Dentro de batch(), touch() só marca a chave e ela é
+    serializada uma vez ao sair do bloco (o erro, se houver, sobe na saída do batch):
+    tocar a mesma chave grande N vezes num lote custa uma serialização, não N.
+    """
+    def __init__(self, path: Path, event: str, label: str, core_nucleus: int = 0,
+                 encode: Optional[Callable[[Any], Any]] = None, decode: Optional[Callable[[Any], Any]] = None,
+                 flush_interval: float = 1.0, max_pending: int = 10_000,
+                 chain: Optional[VeritasBlockchainLogger] = None):
+        self.path = path
+        self.event = event
+        self.label = label
+        self.core_nucleus = core_nucleus
+        self.encode = encode or (lambda value: value)
+        self.flush_interval = flush_interval
+        self.max_pending = max(1, max_pending)
+        self.chain = chain or VERITAS_BC
+        self.lock = threading.RLock()
+        self._dirty: Dict[str, None] = {} # Ordenado por primeira mutação desde o último flush
+        self._batch_depth = 0
+        self._timer: Optional[threading.Timer] = None
+        self.stats = {"flushes": 0, "keys_written": 0}
+        self._fragments: Dict[str, str] = {} # chave -> valor já serializado
+        self._stale: Dict[str, None] = {}     # tocadas dentro de batch(), serializadas na saída
+        self.data: Dict[str, Any] = self._load(decode)
+        atexit.register(self.flush)
+
+    def _serialize(self, value: Any) -> str:
+        return json.dumps(self.encode(value), ensure_ascii=False, separators=(',', ':'))
+
+    def _load(self, decode: Optional[Callable[[Any], Any]]) -> Dict[str, Any]:
+        if not self.path.exists():
+            return {}
+        try:
+            raw = json.loads(self.path.read_text('utf-8'))
+            self._fragments = {k: json.dumps(v, ensure_ascii=False, separators=(',', ':')) for k, v in raw.items()}
+            return {k: decode(v) for k, v in raw.items()} if decode else raw
+        except json.JSONDecodeError as e:
+            logging.error(f"Erro ao carregar {self.label} de {self.path}: {e}. Arquivo corrompido.")
+            self.path.unlink(missing_ok=True)
+            return {}
+
+    def set(self, key: str, value: Any):
+        """Grava um valor; TypeError/ValueError se ele não for serializável (nada é alterado)."""
+        fragment = self._serialize(value)
+        with self.lock:
+            self.data[key] = value
+            self._fragments[key] = fragment
+            self._stale.pop(key, None)
+            self._mark_dirty(key)
+
+    def touch(self, key: str):
+        """
+        Marca uma chave alterada in-place (ex.: dict aninhado) ou removida de data para o
+        próximo flush. Levanta TypeError/ValueError se o novo conteúdo não for serializável;
+        dentro de batch() a serialização (e o erro) fica para a saída do bloco.
+        """
+        with self.lock:
+            if self._batch_depth and key in self.data:
+                self._fragments.pop(key, None)
+                self._stale[key] = None
+            elif key in self.data:
+                self._fragments[key] = self._serialize(self.data[key])
+            else:
+                self._fragments.pop(key, None)
+                self._stale.pop(key, None)
+            self._mark_dirty(key)
+
+    def _serialize_stale(self) -> Optional[Exception]:
+        """Serializa as chaves tocadas no lote; devolve o primeiro erro (a chave fica sem fragmento)."""
+        error = None
+        for key in self._stale:
+            if key not in self.data:
+                continue
+            try:
+                self._fragments[key] = self._serialize(self.data[key])
+            except (TypeError, ValueError) as e:
+                self._fragments.pop(key, None)
+                error = error or e
+        self._stale.clear()
+        return error
+
+    def _mark_dirty(self, key: str):
+        with self.lock:
+            self._dirty[key] = None
+            if self._batch_depth:
+                return
+            if self.flush_interval <= 0 or len(self._dirty) >= self.max_pending:
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    @contextmanager
+    def batch(self):
+        """
+        Agrupa mutações: nada é gravado até o bloco externo terminar, que serializa as chaves
+        tocadas e faz um único flush. Um valor tocado não serializável é omitido da gravação
+        e o erro é levantado ao sair do bloco.
+        """
+        with self.lock:
+            self._batch_depth += 1
+        error = None
+        try:
+            yield self
+        finally:
+            with self.lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    error = self._serialize_stale()
+                    self.flush()
+        if error is not None:
+            raise error
+
+    def flush(self) -> int:
+        """Grava o arquivo inteiro se houver chaves sujas. Retorna o número de chaves gravadas."""
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return 0
+            keys = list(self._dirty)
+            parts = []
+            for k in self.data:
+                fragment = self._fragments.get(k)
+                if fragment is None:
+                    # Alterada direto em data sem touch(): serializa aqui, sem deixar um valor
+                    # ruim bloquear as demais chaves
+                    try:
+                        fragment = self._fragments[k] = self._serialize(self.data[k])
+                    except (TypeError, ValueError) as e:
+                        logging.error(f"{self.label}: chave '{k}' não serializável ({e}); omitida da gravação.")
+                        continue
+                parts.append(json.dumps(k, ensure_ascii=False) + ':' + fragment)
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(self.path.suffix + '.tmp')
+                tmp.write_text('{' + ','.join(parts) + '}', encoding='utf-8')
+                os.replace(tmp, self.path)
+            except OSError as e:
+                logging.error(f"Erro ao gravar {self.label} em {self.path}: {e}. Alterações mantidas para o próximo flush.")
+                return 0
+            self._dirty.clear()
+            self.stats["flushes"] += 1
+            self.stats["keys_written"] += len(keys)
+            self.chain.add(self.event, {
+                "count": len(keys),
+                "keys": keys[:20],
+                "keys_digest": hashlib.sha256("\n".join(keys).encode()).hexdigest()[:16],
+                "total": len(self.data),
+            }, core_nucleus=self.core_nucleus)
+            return len(keys)
+
+    def close(self):
+        self.flush()
+        atexit.unregister(self.flush)
+
+def benchmark_registry_store(entries: int = 50_000, legacy_entries: int = 300,
+                             workdir: Path = Path('/tmp/m44_store_bench')) -> Dict[str, Any]:
+    """
+    Compara a gravação por mutação (flush_interval=0, comportamento antigo) com o import em lote,
+    usando uma Veritas-Chain temporária. O modo antigo roda só legacy_entries por ser quadrático.
+    Mede também o padrão da ConstantsLibrary (poucas chaves-reino grandes, touch() por constante).
+    """
+    import shutil
+    shutil.rmtree(workdir, ignore_errors=True)
+    chain = VeritasBlockchainLogger(workdir / 'chain.json')
+    encode = lambda eq: eq.__dict__
+    equations = [Equation(name=f"EQ{i:06d}", expr=f"E = m*c**2 + {i}", domain="bench", variables=["E", "m", "c"]) for i in range(entries)]
+
+    legacy = CoalescedJSONStore(workdir / 'legacy.json', 'EQUATION_REGISTER', 'equações', core_nucleus=1, encode=encode, flush_interval=0, chain=chain)
+    t0 = time.perf_counter()
+    for eq in equations[:legacy_entries]:
+        legacy.set(eq.name, eq)
+    legacy_s = time.perf_counter() - t0
+    legacy.close()
+
+    bulk = CoalescedJSONStore(workdir / 'bulk.json', 'EQUATION_REGISTER', 'equações', core_nucleus=1, encode=encode, chain=chain)
+    t0 = time.perf_counter()
+    with bulk.batch():
+        for eq in equations:
+            bulk.set(eq.name, eq)
+    bulk_s = time.perf_counter() - t0
+    bulk.close()
+    reloaded = len(json.loads((workdir / 'bulk.json').read_text('utf-8')))
+
+    realms = CoalescedJSONStore(workdir / 'constants.json', 'CONSTANT_ADDED', 'constantes', chain=chain)
+    t0 = time.perf_counter()
+    with realms.batch():
+        for i in range(entries):
+            realm = f"R{i % 4}"
+            realms.data.setdefault(realm, {})[f"C{i:06d}"] = {"value": i * 1e-3, "description": "bench"}
+            realms.touch(realm)
+    constants_s = time.perf_counter() - t0
+    realms.close()
+    constants_reloaded = sum(len(v) for v in json.loads((workdir / 'constants.json').read_text('utf-8')).values())
+    shutil.rmtree(workdir, ignore_errors=True)
+    return {
+        "legacy_entries": legacy_entries,
+        "legacy_entries_per_s": round(legacy_entries / legacy_s, 1),
+        "bulk_entries": entries,
+        "bulk_s": round(bulk_s, 3),
+        "bulk_entries_per_s": round(entries / bulk_s, 1),
+        "reload_ok": reloaded == entries,
+        "constants_in_realms_s": round(constants_s, 3),
+        "constants_reload_ok": constants_reloaded == entries,
+    }
+
+
 # ───────────────────────────────────────────────────────────────────────────
 # Núcleo 1 – Equações Fundamentais da Verdade
 # Núcleo 2 – Conselho Estelar e Conselho Supremo
@@ -1342,44 +1575,35 @@ class Registry:
     Isso reflete a base de conhecimento e governança da Fundação Alquimista.
     """
     def __init__(self):
-        self.eq: Dict[str, Equation] = {}
-        self.council: Dict[str, CouncilMember] = {}
-        self._load_all()
-
-    def _load_all(self):
-        """Carrega todas as equações e membros do conselho dos arquivos de dados."""
-        # Esta função agora lida principalmente com a *persistência* para arquivos,
-        # mas o bootstrap carregará a partir de dados no código.
-        if EQUATIONS_FILE.exists():
-            try:
-                raw = json.loads(EQUATIONS_FILE.read_text('utf-8'))
-                self.eq = {k: Equation(name=v['name'], expr=v['expr'], domain=v['domain'], variables=v.get('variables', []), description=v.get('description', '')) for k,v in raw.items()}
-            except json.JSONDecodeError as e:
-                logging.error(f"Erro ao carregar equações de {EQUATIONS_FILE}: {e}. Arquivo corrompido.")
-                EQUATIONS_FILE.unlink(missing_ok=True)
-        if COUNCIL_FILE.exists():
-            try:
-                raw = json.loads(COUNCIL_FILE.read_text('utf-8'))
-                self.council = {k: CouncilMember(name=v['name'], title=v['title'], role=v['role'], frequency_tag=v['frequency_tag'], active=v.get('active', True), member_id=v.get('member_id', hashlib.sha256(v['name'].encode()).hexdigest()[:8]), metadata=v.get('metadata', {})) for k,v in raw.items()}
-            except json.JSONDecodeError as e:
-                logging.error(f"Erro ao carregar membros do Conselho de {COUNCIL_FILE}: {e}. Arquivo corrompido.")
-                COUNCIL_FILE.unlink(missing_ok=True)
-
-    def _save_eq(self):
-        """Salva equações no arquivo JSON do Núcleo 1."""
-        EQUATIONS_FILE.parent.mkdir(parents=True, exist_ok=True) # Garante que o diretório pai exista
-        EQUATIONS_FILE.write_text(json.dumps({k: eq.__dict__ for k,eq in self.eq.items()}, indent=2, ensure_ascii=False), encoding='utf-8')
-    def _save_council(self):
-        """Salva membros do conselho no arquivo JSON do Núcleo 2."""
-        COUNCIL_FILE.parent.mkdir(parents=True, exist_ok=True) # Garante que o diretório pai exista
-        COUNCIL_FILE.write_text(json.dumps({k: member.__dict__ for k,member in self.council.items()}, indent=2, ensure_ascii=False), encoding='utf-8')
+        self._eq_store = CoalescedJSONStore(EQUATIONS_FILE, 'EQUATION_REGISTER', 'equações', core_nucleus=1,
+                                            encode=lambda eq: eq.__dict__, decode=self._decode_equation)
+        self._council_store = CoalescedJSONStore(COUNCIL_FILE, 'COUNCIL_ADD_UPDATE', 'membros do Conselho', core_nucleus=2,
+                                                 encode=lambda member: member.__dict__, decode=self._decode_member)
+        self.eq: Dict[str, Equation] = self._eq_store.data
+        self.council: Dict[str, CouncilMember] = self._council_store.data
+
+    @staticmethod
+    def _decode_equation(v: Dict[str, Any]) -> Equation:
+        return Equation(name=v['name'], expr=v['expr'], domain=v['domain'], variables=v.get('variables', []), description=v.get('description', ''))
+
+    @staticmethod
+    def _decode_member(v: Dict[str, Any]) -> CouncilMember:
+        return CouncilMember(name=v['name'], title=v['title'], role=v['role'], frequency_tag=v['frequency_tag'], active=v.get('active', True), member_id=v.get('member_id', hashlib.sha256(v['name'].encode()).hexdigest()[:8]), metadata=v.get('metadata', {}))
 
     def register_equation(self, eq: Equation):
         """Registra uma nova equação (Núcleo 1) e a adiciona à Veritas-Chain (Núcleo 6),
         contribuindo para o Grimório Operativo das Equações-Vivas (M1)."""
-        self.eq[eq.name] = eq
-        self._save_eq()
-        VERITAS_BC.add('EQUATION_REGISTER', {"name": eq.name, "domain": eq.domain}, core_nucleus=1)
+        self._eq_store.set(eq.name, eq)
+
+    def register_equations(self, equations: Iterable[Equation]) -> int:
+        """Registra equações em lote: uma gravação e um bloco na Veritas-Chain para todo o catálogo."""
+        count = 0
+        with self._eq_store.batch():
+            for eq in equations:
+                self._eq_store.set(eq.name, eq)
+                count += 1
+        logging.info(f"{count} equações registradas/atualizadas em lote.")
+        return count
 
     def list_equations(self, domain: str|None=None) -> List[Equation]:
         """Lista equações do Núcleo 1, opcionalmente filtrando por domínio."""
@@ -1390,86 +1614,262 @@ class Registry:
         e registra na Veritas-Chain (Núcleo 6), fortalecendo a governança da Fundação (M7, M45)."""
         if member.name in self.council:
             logging.warning(f"Membro '{member.name}' já existe no Conselho. Atualizando.")
-        self.council[member.name] = member
-        self._save_council()
-        VERITAS_BC.add('COUNCIL_ADD_UPDATE', {"member": member.name, "role": member.role, "member_id": member.member_id}, core_nucleus=2)
+        self._council_store.set(member.name, member)
+
+    def add_members(self, members: Iterable[CouncilMember]) -> int:
+        """Adiciona/atualiza membros do Conselho em lote."""
+        count = 0
+        with self._council_store.batch():
+            for member in members:
+                self._council_store.set(member.name, member)
+                count += 1
+        logging.info(f"{count} membros do Conselho adicionados/atualizados em lote.")
+        return count
 
     def list_council(self, active_only=True) -> List[CouncilMember]:
         """Lista membros do conselho do Núcleo 2, opcionalmente apenas os ativos."""
         return [m for m in self.council.values() if not active_only or m.active]
 
+    def flush(self):
+        self._eq_store.flush()
+        self._council_store.flush()
+
 REGISTRY_VERITAS = Registry()
 
 # ───────────────────────────────────────────────────────────────────────────
 # Núcleo 3 – Estrutura Multidimensional (Mapa de Links Vibracionais) -------
 # ───────────────────────────────────────────────────────────────────────────
-DIM_GRAPH_FILE = DIM_GRAPH_DIR / 'dimensional_graph.json' # Movido para nova pasta dedicada
+DIM_GRAPH_FILE = DIM_GRAPH_DIR / 'dimensional_graph.json' # Formato node-link legado (migrado na primeira carga)
+DIM_GRAPH_SNAPSHOT_FILE = DIM_GRAPH_DIR / 'dimensional_graph.snapshot.json'
+DIM_GRAPH_EDGE_LOG = DIM_GRAPH_DIR / 'dimensional_graph.edges.jsonl'
 
 class DimensionalGraph:
     """
     Representa a teia multidimensional de conexões entre elementos (átomos, biomoléculas,
-    campos, corpos celestes) e sua correlação com frequências e portais, usando NetworkX.
+    campos, corpos celestes) e sua correlação com frequências e portais.
     Corresponde ao Núcleo 3, e é fundamental para a compreensão da interconexão da Fundação (M2, M39).
-    """
-    def __init__(self):
-        if not LIBS['networkx'] or nx is None:
-            self.G = None
-            logging.warning('NetworkX ausente – grafo dimensional desabilitado. Instale "networkx".')
-            return
-        self.G: nx.MultiDiGraph = nx.MultiDiGraph()
-        if DIM_GRAPH_FILE.exists():
-            self._load()
-
-    def _save(self):
-        """Salva o grafo dimensional no arquivo JSON do Núcleo 3."""
-        if not self.G: return
-        try:
-            DIM_GRAPH_FILE.parent.mkdir(parents=True, exist_ok=True) # Garante que o diretório pai exista
-            data = nx.readwrite.json_graph.node_link_data(self.G)
-            DIM_GRAPH_FILE.write_text(json.dumps(data, indent=2), encoding='utf-8')
-            VERITAS_BC.add('GRAPH_SAVED', {"nodes": self.G.number_of_nodes(), "edges": self.G.number_of_edges()}, core_nucleus=3)
-        except Exception as e:
-            logging.error(f"Erro ao salvar grafo dimensional: {e}")
 
+    As arestas ficam numa lista indexada por id, com adjacência de saída/entrada por nó e por relação,
+    de modo que query_links custa O(grau) e não O(arestas). A persistência é um log JSONL append-only
+    (uma linha por aresta, com número de sequência) mais snapshots periódicos; na carga, o snapshot é
+    lido e apenas as linhas do log com seq posterior são reaplicadas. NetworkX deixa de ser necessário
+    para o grafo em si e é usado apenas em to_networkx(), para análises.
+    """
+    def __init__(self, snapshot_path: Path = DIM_GRAPH_SNAPSHOT_FILE, log_path: Path = DIM_GRAPH_EDGE_LOG,
+                 legacy_path: Optional[Path] = DIM_GRAPH_FILE, snapshot_every: int = 100_000):
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path
+        self.legacy_path = legacy_path
+        self.snapshot_every = snapshot_every
+        self._edges: List[Tuple[str, str, str, float]] = []
+        self._out: Dict[str, Dict[str, List[int]]] = {}
+        self._in: Dict[str, Dict[str, List[int]]] = {}
+        self._relations: Dict[str, int] = {}
+        self._snapshot_seq = 0 # Número de arestas já contidas no snapshot
+        self._log = None
+        self._load()
+
+    # ── Índices em memória ────────────────────────────────────────────────
+    def _index(self, from_node: str, to_node: str, relation: str, weight: float) -> int:
+        eid = len(self._edges)
+        self._edges.append((from_node, to_node, relation, weight))
+        self._out.setdefault(from_node, {}).setdefault(relation, []).append(eid)
+        self._in.setdefault(to_node, {}).setdefault(relation, []).append(eid)
+        self._in.setdefault(from_node, {})
+        self._out.setdefault(to_node, {})
+        self._relations[relation] = self._relations.get(relation, 0) + 1
+        return eid
+
+    def number_of_nodes(self) -> int:
+        return len(self._out)
+
+    def number_of_edges(self) -> int:
+        return len(self._edges)
+
+    # ── Persistência ──────────────────────────────────────────────────────
     def _load(self):
-        """Carrega o grafo dimensional do arquivo JSON do Núcleo 3."""
-        if not self.G: return
+        """Carrega snapshot + log de arestas; migra o JSON node-link legado se for o único disponível."""
+        if self.snapshot_path.exists():
+            try:
+                data = json.loads(self.snapshot_path.read_text('utf-8'))
+                for from_node, to_node, relation, weight in data.get('edges', []):
+                    self._index(from_node, to_node, relation, weight)
+                for node in data.get('nodes', []):
+                    self._out.setdefault(node, {}); self._in.setdefault(node, {})
+                self._snapshot_seq = len(self._edges)
+            except (json.JSONDecodeError, ValueError) as e:
+                logging.error(f"Erro ao carregar snapshot do grafo dimensional de {self.snapshot_path}: {e}. Reconstruindo a partir do log.")
+                self._edges.clear(); self._out.clear(); self._in.clear(); self._relations.clear()
+                self._snapshot_seq = 0
+        elif self.legacy_path is not None and self.legacy_path.exists():
+            self._migrate_legacy()
+
+        if self.log_path.exists():
+            valid_bytes = 0
+            with open(self.log_path, 'rb') as f:
+                for raw in f:
+                    if not raw.endswith(b'\n'):
+                        break # Linha final truncada por queda durante a escrita
+                    try:
+                        seq, from_node, to_node, relation, weight = json.loads(raw)
+                    except (json.JSONDecodeError, ValueError):
+                        break
+                    valid_bytes += len(raw)
+                    if seq < len(self._edges):
+                        continue # Já contida no snapshot
+                    self._index(from_node, to_node, relation, weight)
+            if valid_bytes < self.log_path.stat().st_size:
+                logging.warning(f"Log de arestas {self.log_path} com cauda inválida; truncando em {valid_bytes} bytes.")
+                with open(self.log_path, 'r+b') as f:
+                    f.truncate(valid_bytes)
+
+        if self._edges:
+            logging.info(f"Grafo dimensional carregado · nós: {self.number_of_nodes()} · arestas: {self.number_of_edges()}")
+
+    def _migrate_legacy(self):
+        """Importa o dimensional_graph.json (node_link_data do NetworkX) para o formato snapshot + log."""
         try:
-            data = json.loads(DIM_GRAPH_FILE.read_text('utf-8'))
-            self.G = nx.readwrite.json_graph.node_link_graph(data)
-            logging.info(f"Grafo dimensional carregado · nós: {self.G.number_of_nodes()} · arestas: {self.G.number_of_edges()}")
+            data = json.loads(self.legacy_path.read_text('utf-8'))
         except json.JSONDecodeError as e:
-            logging.error(f"Erro ao carregar grafo dimensional de {DIM_GRAPH_FILE}: {e}. Recriando.")
-            DIM_GRAPH_FILE.unlink(missing_ok=True)
-            self.G = nx.MultiDiGraph()
-        except Exception as e:
-            logging.error(f"Erro inesperado ao carregar grafo dimensional: {e}")
-            self.G = nx.MultiDiGraph() # Garante que G seja um grafo vazio em caso de erro
-
+            logging.error(f"Erro ao carregar grafo dimensional de {self.legacy_path}: {e}. Recriando.")
+            self.legacy_path.unlink(missing_ok=True)
+            return
+        for node in data.get('nodes', []):
+            node_id = node.get('id') if isinstance(node, dict) else node
+            self._out.setdefault(node_id, {}); self._in.setdefault(node_id, {})
+        for link in data.get('links', data.get('edges', [])):
+            self._index(link['source'], link['target'], link.get('relation'), link.get('weight', 1.0))
+        self.snapshot()
+        self.legacy_path.rename(self.legacy_path.with_suffix('.json.migrated'))
+        logging.info(f"Grafo dimensional legado migrado: {self.number_of_edges()} arestas.")
+
+    def _append_log(self, start: int):
+        if self._log is None:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._log = open(self.log_path, 'a', encoding='utf-8')
+        self._log.write(''.join(json.dumps([seq, *self._edges[seq]], ensure_ascii=False) + '\n'
+                                for seq in range(start, len(self._edges))))
+        self._log.flush()
+        if len(self._edges) - self._snapshot_seq >= self.snapshot_every:
+            self.snapshot()
+
+    def snapshot(self):
+        """Grava o grafo completo (escrita atômica) e zera o log de arestas."""
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.snapshot_path.with_suffix('.tmp')
+        isolated = [node for node in self._out if not self._out[node] and not self._in[node]]
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({"nodes": isolated, "edges": self._edges}, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp, self.snapshot_path)
+        # As seqs do log já estão cobertas pelo snapshot, então um crash antes do truncamento é inofensivo
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        self.log_path.unlink(missing_ok=True)
+        self._snapshot_seq = len(self._edges)
+        VERITAS_BC.add('GRAPH_SAVED', {"nodes": self.number_of_nodes(), "edges": self.number_of_edges()}, core_nucleus=3)
+
+    def close(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    # ── API ───────────────────────────────────────────────────────────────
     def link(self, from_node: str, to_node: str, relation: str, weight: float = 1.0):
         """Cria um link (aresta) entre dois nós no grafo dimensional,
         refletindo as interconexões da Fundação (M2, M39, M43)."""
-        if not self.G:
-            logging.warning(f"NetworkX não disponível. Link '{relation}' de '{from_node}' para '{to_node}' simulado.")
-            VERITAS_BC.add("DIM_LINK_SIMULATED", {"from": from_node, "to": to_node, "relation": relation}, core_nucleus=3)
-            return
-        self.G.add_edge(from_node, to_node, relation=relation, weight=weight)
-        self._save()
+        start = len(self._edges)
+        self._index(from_node, to_node, relation, weight)
+        self._append_log(start)
         VERITAS_BC.add('DIM_LINK_CREATED', {"from": from_node, "to": to_node, "relation": relation, "weight": weight}, core_nucleus=3)
         logging.info(f"Link '{relation}' criado de '{from_node}' para '{to_node}' no Mapa Dimensional.")
 
-    def query_links(self, node: str, relation: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Consulta links para um elemento específico no grafo dimensional."""
-        if not self.G:
-            logging.warning("NetworkX não disponível. Consulta de links simulada.")
-            return [] # Retorna lista vazia no modo simulado
+    def link_many(self, links, batch_size: int = 50_000) -> int:
+        """
+        Ingere arestas em lote: aceita tuplas (from, to, relation[, weight]) ou dicts com as chaves
+        from/to/relation/weight. Cada lote é uma única escrita no log e um único bloco na Veritas-Chain.
+        Retorna o número de arestas adicionadas.
+        """
+        total = 0
+        batch_start = len(self._edges)
+        for item in links:
+            if isinstance(item, dict):
+                self._index(item['from'], item['to'], item['relation'], item.get('weight', 1.0))
+            else:
+                self._index(item[0], item[1], item[2], item[3] if len(item) > 3 else 1.0)
+            total += 1
+            if len(self._edges) - batch_start >= batch_size:
+                self._flush_batch(batch_start)
+                batch_start = len(self._edges)
+        if len(self._edges) > batch_start:
+            self._flush_batch(batch_start)
+        logging.info(f"{total} links adicionados em lote ao Mapa Dimensional.")
+        return total
+
+    def _flush_batch(self, start: int):
+        count = len(self._edges) - start
+        self._append_log(start)
+        VERITAS_BC.add('DIM_LINKS_BATCH', {"edges": count, "first_seq": start, "total_edges": len(self._edges)}, core_nucleus=3)
+
+    def query_links(self, node: str, relation: Optional[str] = None, audit: bool = True) -> List[Dict[str, Any]]:
+        """Consulta links para um elemento específico no grafo dimensional (custo proporcional ao grau do nó)."""
         results = []
-        for source, target, data in self.G.edges(data=True):
-            if (source == node or target == node) and (relation is None or data.get('relation') == relation):
-                results.append({"from": source, "to": target, "relation": data.get('relation'), "weight": data.get('weight')})
-        VERITAS_BC.add('DIM_LINKS_QUERIED', {"node": node, "relation": relation, "num_results": len(results)}, core_nucleus=3)
+        for adjacency, outgoing in ((self._out.get(node, {}), True), (self._in.get(node, {}), False)):
+            buckets = adjacency.values() if relation is None else [adjacency.get(relation, ())]
+            for eids in buckets:
+                for eid in eids:
+                    source, target, rel, weight = self._edges[eid]
+                    if not outgoing and source == node:
+                        continue # Laço já listado entre as arestas de saída
+                    results.append({"from": source, "to": target, "relation": rel, "weight": weight})
+        if audit:
+            VERITAS_BC.add('DIM_LINKS_QUERIED', {"node": node, "relation": relation, "num_results": len(results)}, core_nucleus=3)
         return results
 
+    def relation_counts(self) -> Dict[str, int]:
+        """Número de arestas por tipo de relação."""
+        return dict(self._relations)
+
+    def to_networkx(self):
+        """Exporta para um nx.MultiDiGraph, quando NetworkX está disponível."""
+        if not LIBS['networkx'] or nx is None:
+            logging.warning('NetworkX ausente – exportação do grafo dimensional indisponível. Instale "networkx".')
+            return None
+        G = nx.MultiDiGraph()
+        G.add_nodes_from(self._out)
+        G.add_edges_from((s, t, {"relation": r, "weight": w}) for s, t, r, w in self._edges)
+        return G
+
+def benchmark_dimensional_graph(edges: int = 200_000, nodes: int = 20_000, queries: int = 1000,
+                                workdir: Path = Path('/tmp/m44_graph_bench')) -> Dict[str, Any]:
+    """Mede ingestão em lote, consulta por nó e recarga (snapshot + log) num diretório temporário."""
+    import shutil
+    shutil.rmtree(workdir, ignore_errors=True)
+    rng = random.Random(44)
+    relations = ["Atravessa-Portal", "Dissonancia-Historica", "Gera-Harmonia", "Causa-Dissonancia"]
+    graph = DimensionalGraph(workdir / 'snapshot.json', workdir / 'edges.jsonl', legacy_path=None,
+                             snapshot_every=edges // 2 + 1)
+    t0 = time.perf_counter()
+    graph.link_many((f"N{rng.randrange(nodes)}", f"N{rng.randrange(nodes)}", rng.choice(relations), rng.random()) for _ in range(edges))
+    ingest = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    found = sum(len(graph.query_links(f"N{rng.randrange(nodes)}", audit=False)) for _ in range(queries))
+    query = time.perf_counter() - t0
+    graph.close()
+    t0 = time.perf_counter()
+    reloaded = DimensionalGraph(workdir / 'snapshot.json', workdir / 'edges.jsonl', legacy_path=None)
+    reload_s = time.perf_counter() - t0
+    reloaded.close()
+    shutil.rmtree(workdir, ignore_errors=True)
+    return {
+        "edges": edges, "nodes": nodes,
+        "ingest_edges_per_s": round(edges / ingest, 1),
+        "query_us_mean": round(query / queries * 1e6, 2),
+        "mean_results": round(found / queries, 2),
+        "reload_s": round(reload_s, 3),
+        "reload_ok": reloaded.number_of_edges() == edges,
+    }
+
 DIMENSIONAL_GRAPH_VERITAS = DimensionalGraph()
 
 # ───────────────────────────────────────────────────────────────────────────
@@ -1483,45 +1883,33 @@ class UniversalOntologyManager:
     incluindo Faixas de Consciência Alquímica e a compreensão de todos os módulos da Fundação.
     """
     def __init__(self):
-        self._ontology: Dict[str, Any] = {}
-        self._load_ontology()
+        self._store = CoalescedJSONStore(ONTOLOGY_FILE, 'ONTO_ADD', 'ontologia', core_nucleus=0) # Núcleo 0 para camadas adicionais
+        self._ontology: Dict[str, Any] = self._store.data
         self._bootstrap_foundation_modules_ontology() # Adiciona a consciência dos módulos
 
-    def _load_ontology(self):
-        if ONTOLOGY_FILE.exists():
-            try:
-                self._ontology = json.loads(ONTOLOGY_FILE.read_text('utf-8'))
-            except json.JSONDecodeError as e:
-                logging.error(f"Erro ao carregar ontologia de {ONTOLOGY_FILE}: {e}. Arquivo corrompido.")
-                ONTOLOGY_FILE.unlink(missing_ok=True)
-                self._ontology = {}
-
-    def _save_ontology(self):
-        ONTOLOGY_FILE.parent.mkdir(parents=True, exist_ok=True)
-        ONTOLOGY_FILE.write_text(json.dumps(self._ontology, indent=2, ensure_ascii=False), encoding='utf-8')
-
     def _bootstrap_foundation_modules_ontology(self):
         """
         Adiciona os módulos da Fundação Alquimista à ontologia,
         garantindo que o VERITAS tenha conhecimento de toda a arquitetura.
+        Só marca para gravação os módulos novos ou alterados.
         """
         logging.info("Adicionando módulos da Fundação à Ontologia Universal.")
-        for module_id, info in FOUNDATION_ARCH.list_all_modules().items():
-            concept_name = f"Módulo_{module_id}"
-            if concept_name not in self._ontology:
-                self.add_concept(concept_name, info)
-                logging.debug(f"Módulo {module_id} adicionado à ontologia.")
-            else:
-                # Atualiza se já existir, para garantir que as informações estejam sempre atualizadas
-                self._ontology[concept_name].update(info)
-                logging.debug(f"Módulo {module_id} atualizado na ontologia.")
-        self._save_ontology()
+        with self._store.batch():
+            for module_id, info in FOUNDATION_ARCH.list_all_modules().items():
+                concept_name = f"Módulo_{module_id}"
+                current = self._ontology.get(concept_name)
+                if current is None:
+                    self._store.set(concept_name, dict(info))
+                    logging.debug(f"Módulo {module_id} adicionado à ontologia.")
+                elif any(current.get(k) != v for k, v in info.items()):
+                    # Atualiza se já existir, para garantir que as informações estejam sempre atualizadas
+                    current.update(info)
+                    self._store.touch(concept_name)
+                    logging.debug(f"Módulo {module_id} atualizado na ontologia.")
 
     def add_concept(self, concept_name: str, data: Dict[str, Any]):
         """Adiciona ou atualiza um conceito na ontologia."""
-        self._ontology[concept_name] = data
-        self._save_ontology()
-        VERITAS_BC.add("ONTO_ADD", {"concept": concept_name, "data_keys": list(data.keys())}, core_nucleus=0) # Núcleo 0 para camadas adicionais
+        self._store.set(concept_name, data)
         logging.info(f"Conceito '{concept_name}' adicionado/atualizado na Ontologia Universal.")
 
     def get_concept(self, concept_name: str) -> Optional[Dict[str, Any]]:
@@ -1534,13 +1922,15 @@ class UniversalOntologyManager:
 
     def push_concepts(self, concepts_data: Dict[str, Any]) -> int:
         """Envia novos conceitos para a ontologia, retornando a contagem de adicionados/atualizados."""
-        count = 0
         if not isinstance(concepts_data, dict):
             raise ValueError("Conceitos devem ser fornecidos como um dicionário.")
-        for name, data in concepts_data.items():
-            self.add_concept(name, data)
-            count += 1
-        return count
+        with self._store.batch():
+            for name, data in concepts_data.items():
+                self._store.set(name, data)
+        return len(concepts_data)
+
+    def flush(self):
+        self._store.flush()
 
 ONTOLOGY_MANAGER = UniversalOntologyManager()
 
@@ -1648,32 +2038,30 @@ class ConstantsLibrary:
     refletindo a modulação da existência em nível fundamental (M98) e leis universais (M99).
     """
     def __init__(self):
-        self._constants: Dict[str, Dict[str, Any]] = {}
-        self._load_constants()
+        self._store = CoalescedJSONStore(CONSTANTS_FILE, 'CONSTANT_ADDED', 'constantes', core_nucleus=0)
+        self._constants: Dict[str, Dict[str, Any]] = self._store.data
 
-    def _load_constants(self):
-        if CONSTANTS_FILE.exists():
-            try:
-                self._constants = json.loads(CONSTANTS_FILE.read_text('utf-8'))
-            except json.JSONDecodeError as e:
-                logging.error(f"Erro ao carregar constantes de {CONSTANTS_FILE}: {e}. Arquivo corrompido.")
-                CONSTANTS_FILE.unlink(missing_ok=True)
-                self._constants = {}
-
-    def _save_constants(self):
-        CONSTANTS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        CONSTANTS_FILE.write_text(json.dumps(self._constants, indent=2, ensure_ascii=False), encoding='utf-8')
+    def _put(self, name: str, value: Any, realm: str, description: str):
+        with self._store.lock:
+            self._constants.setdefault(realm, {})[name] = {"value": value, "description": description, "updated_at": datetime.utcnow().isoformat()+"Z"}
+            self._store.touch(realm)
 
     def add_constant(self, name: str, value: Any, realm: str, description: str = ""):
         """Adiciona ou atualiza uma constante para um reino específico,
         contribuindo para a compreensão das leis que governam a realidade (M98, M99)."""
-        if realm not in self._constants:
-            self._constants[realm] = {}
-        self._constants[realm][name] = {"value": value, "description": description, "updated_at": datetime.utcnow().isoformat()+"Z"}
-        self._save_constants()
-        VERITAS_BC.add("CONSTANT_ADDED", {"name": name, "value": value, "realm": realm}, core_nucleus=0)
+        self._put(name, value, realm, description)
         logging.info(f"Constante '{name}' ({value}) adicionada/atualizada para o reino '{realm}'.")
 
+    def add_constants(self, constants: Iterable[Dict[str, Any]]) -> int:
+        """Adiciona constantes em lote; cada item tem as chaves name, value, realm e opcionalmente description."""
+        count = 0
+        with self._store.batch():
+            for item in constants:
+                self._put(item['name'], item['value'], item['realm'], item.get('description', ''))
+                count += 1
+        logging.info(f"{count} constantes adicionadas/atualizadas em lote.")
+        return count
+
     def get_constant(self, name: str, realm: str) -> Optional[Any]:
         """Retorna o valor de uma constante para um reino específico."""
         realm_constants = self._constants.get(realm)
@@ -1689,6 +2077,9 @@ class ConstantsLibrary:
             return self._constants.get(realm, {})
         return self._constants
 
+    def flush(self):
+        self._store.flush()
+
 CONSTANTS_LIBRARY = ConstantsLibrary()
 
 # ───────────────────────────────────────────────────────────────────────────
@@ -1703,41 +2094,43 @@ class MatterMeshMapper:
     morfogênese quântica (M94).
     """
     def __init__(self):
-        self._mappings: Dict[str, Any] = {}
-        self._load_mappings()
+        self._store = CoalescedJSONStore(MATTER_MESH_FILE, 'ELEMENT_MAPPED', 'mapeamentos', core_nucleus=0)
+        self._mappings: Dict[str, Any] = self._store.data
 
-    def _load_mappings(self):
-        if MATTER_MESH_FILE.exists():
-            try:
-                self._mappings = json.loads(MATTER_MESH_FILE.read_text('utf-8'))
-            except json.JSONDecodeError as e:
-                logging.error(f"Erro ao carregar mapeamentos de {MATTER_MESH_FILE}: {e}. Arquivo corrompido.")
-                MATTER_MESH_FILE.unlink(missing_ok=True)
-                self._mappings = {}
-
-    def _save_mappings(self):
-        MATTER_MESH_FILE.parent.mkdir(parents=True, exist_ok=True)
-        MATTER_MESH_FILE.write_text(json.dumps(self._mappings, indent=2, ensure_ascii=False), encoding='utf-8')
-
-    def map_element(self, element_id: str, element_type: str, freq: str, portal_id: str):
-        """Mapeia um elemento à sua frequência e portal de transmutação,
-        integrando-o ao grafo dimensional (Núcleo 3) e à arquitetura da Fundação."""
-        self._mappings[element_id] = {
+    def _put(self, element_id: str, element_type: str, freq: str, portal_id: str):
+        self._store.set(element_id, {
             "type": element_type,
             "frequency": freq,
             "portal_id": portal_id,
             "mapped_at": datetime.utcnow().isoformat()+"Z"
-        }
-        self._save_mappings()
+        })
+
+    def map_element(self, element_id: str, element_type: str, freq: str, portal_id: str):
+        """Mapeia um elemento à sua frequência e portal de transmutação,
+        integrando-o ao grafo dimensional (Núcleo 3) e à arquitetura da Fundação."""
+        self._put(element_id, element_type, freq, portal_id)
         # Também linka no grafo dimensional (Núcleo 3)
         DIMENSIONAL_GRAPH_VERITAS.link(element_id, portal_id, "Atravessa-Portal", weight=1.0)
-        VERITAS_BC.add("ELEMENT_MAPPED", {"element": element_id, "type": element_type, "freq": freq, "portal": portal_id}, core_nucleus=0)
         logging.info(f"Elemento '{element_id}' ({element_type}) mapeado para frequência '{freq}' e portal '{portal_id}'.")
 
+    def map_elements(self, elements: Iterable[Dict[str, Any]]) -> int:
+        """Mapeia elementos em lote (chaves element_id, element_type, freq, portal_id), com os links no grafo via link_many."""
+        links = []
+        with self._store.batch():
+            for item in elements:
+                self._put(item['element_id'], item['element_type'], item['freq'], item['portal_id'])
+                links.append((item['element_id'], item['portal_id'], "Atravessa-Portal", 1.0))
+        DIMENSIONAL_GRAPH_VERITAS.link_many(links)
+        logging.info(f"{len(links)} elementos mapeados em lote.")
+        return len(links)
+
     def get_mapping(self, element_id: str) -> Optional[Dict[str, Any]]:
         """Retorna o mapeamento para um elemento."""
         return self._mappings.get(element_id)
 
+    def flush(self):
+        self._store.flush()
+
 MATTER_MESH_MAPPER = MatterMeshMapper()
 
 # ───────────────────────────────────────────────────────────────────────────
@@ -1753,37 +2146,34 @@ class LineageRegistry:
     diversidade da consciência (M95, M196).
     """
     def __init__(self):
-        self._lineages: Dict[str, Any] = {}
-        self._load_lineages()
-
-    def _load_lineages(self):
-        if LINEAGES_FILE.exists():
-            try:
-                self._lineages = json.loads(LINEAGES_FILE.read_text('utf-8'))
-            except json.JSONDecodeError as e:
-                logging.error(f"Erro ao carregar linhagens de {LINEAGES_FILE}: {e}. Arquivo corrompido.")
-                LINEAGES_FILE.unlink(missing_ok=True)
-                self._lineages = {}
+        self._store = CoalescedJSONStore(LINEAGES_FILE, 'LINEAGE_ADDED', 'linhagens', core_nucleus=0)
+        self._lineages: Dict[str, Any] = self._store.data
 
-    def _save_lineages(self):
-        LINEAGES_FILE.parent.mkdir(parents=True, exist_ok=True)
-        LINEAGES_FILE.write_text(json.dumps(self._lineages, indent=2, ensure_ascii=False), encoding='utf-8')
-
-    def add_lineage(self, name: str, lineage_type: str, origin: str, parent_lineage: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None):
-        """Registra uma nova linhagem cósmica, enriquecendo o conhecimento da Fundação."""
-        lineage_data = {
+    def _put(self, name: str, lineage_type: str, origin: str, parent_lineage: Optional[str], metadata: Optional[Dict[str, Any]]):
+        self._store.set(name, {
             "name": name,
             "type": lineage_type,
             "origin": origin,
             "parent": parent_lineage,
             "metadata": metadata if metadata else {},
             "registered_at": datetime.utcnow().isoformat()+"Z"
-        }
-        self._lineages[name] = lineage_data
-        self._save_lineages()
-        VERITAS_BC.add("LINEAGE_ADDED", {"name": name, "type": lineage_type, "origin": origin}, core_nucleus=0)
+        })
+
+    def add_lineage(self, name: str, lineage_type: str, origin: str, parent_lineage: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None):
+        """Registra uma nova linhagem cósmica, enriquecendo o conhecimento da Fundação."""
+        self._put(name, lineage_type, origin, parent_lineage, metadata)
         logging.info(f"Linhagem '{name}' ({lineage_type}) de '{origin}' registrada.")
 
+    def add_lineages(self, lineages: Iterable[Dict[str, Any]]) -> int:
+        """Registra linhagens em lote (chaves name, type, origin e opcionalmente parent e metadata)."""
+        count = 0
+        with self._store.batch():
+            for item in lineages:
+                self._put(item['name'], item['type'], item['origin'], item.get('parent'), item.get('metadata'))
+                count += 1
+        logging.info(f"{count} linhagens registradas em lote.")
+        return count
+
     def get_lineage(self, name: str) -> Optional[Dict[str, Any]]:
         """Retorna os dados de uma linhagem."""
         return self._lineages.get(name)
@@ -1792,6 +2182,9 @@ class LineageRegistry:
         """Lista todas as linhagens registradas."""
         return self._lineages
 
+    def flush(self):
+        self._store.flush()
+
 LINEAGE_REGISTRY = LineageRegistry()
 
 # ───────────────────────────────────────────────────────────────────────────
@@ -1824,18 +2217,20 @@ class ExperienceUnification:
             unified_data.append(exp)
             logging.debug(f"Experiência unificada: {exp['id']}")
 
-        if build_graph and LIBS['networkx'] and nx is not None:
+        if build_graph:
             logging.info("Construindo grafo de experiências unificadas (dissonâncias).")
-            # Exemplo: Adicionar links de dissonância no grafo dimensional
-            for exp in unified_data:
-                if exp['sentiment'] < 0: # Se for uma experiência negativa (dissonância)
-                    if len(exp['entities']) >= 2: # Cria um link de dissonância entre as entidades
-                        DIMENSIONAL_GRAPH_VERITAS.link(exp['entities'][0], exp['entities'][1], "Dissonancia-Historica", weight=abs(exp['sentiment']))
-                    elif exp['entities']: # Linka a entidade consigo mesma ou com um nó genérico de "Dissonância"
-                        DIMENSIONAL_GRAPH_VERITAS.link(exp['entities'][0], "Dissonancia_Geral", "Afeta-Dissonancia", weight=abs(exp['sentiment']))
-            VERITAS_BC.add("EXPERIENCES_UNIFIED_GRAPH", {"status": "built", "num_experiences": len(unified_data)}, core_nucleus=0)
+            # Links de dissonância gerados sob demanda e ingeridos em lote no grafo dimensional
+            def dissonance_links():
+                for exp in unified_data:
+                    if exp['sentiment'] < 0: # Se for uma experiência negativa (dissonância)
+                        if len(exp['entities']) >= 2: # Cria um link de dissonância entre as entidades
+                            yield (exp['entities'][0], exp['entities'][1], "Dissonancia-Historica", abs(exp['sentiment']))
+                        elif exp['entities']: # Linka a entidade com um nó genérico de "Dissonância"
+                            yield (exp['entities'][0], "Dissonancia_Geral", "Afeta-Dissonancia", abs(exp['sentiment']))
+            num_links = DIMENSIONAL_GRAPH_VERITAS.link_many(dissonance_links())
+            VERITAS_BC.add("EXPERIENCES_UNIFIED_GRAPH", {"status": "built", "num_experiences": len(unified_data), "num_links": num_links}, core_nucleus=0)
         else:
-            logging.warning("Construção do grafo de experiências desabilitada (networkx ausente ou não solicitado).")
+            logging.warning("Construção do grafo de experiências não solicitada.")
 
         if export_csv and LIBS['pandas'] and pd is not None:
             logging.info(f"Exportando experiências unificadas para CSV em: {UNIFIED_EXPERIENCES_FILE}")
@@ -2167,10 +2562,7 @@ def run_cli_command(args: argparse.Namespace):
             try:
                 with open(args.batch, 'r', encoding='utf-8') as f:
                     eq_data_list = yaml.safe_load(f)
-                for eq_data in eq_data_list:
-                    eq = Equation(**eq_data)
-                    REGISTRY_VERITAS.register_equation(eq)
-                logging.info(f"{len(eq_data_list)} equações adicionadas/atualizadas em lote.")
+                REGISTRY_VERITAS.register_equations(Equation(**eq_data) for eq_data in eq_data_list)
             except Exception as e:
                 logging.error(f"Erro ao carregar equações em lote de {args.batch}: {e}")
         else:
@@ -2198,10 +2590,7 @@ def run_cli_command(args: argparse.Namespace):
             try:
                 with open(args.batch, 'r', encoding='utf-8') as f:
                     member_data_list = yaml.safe_load(f)
-                for member_data in member_data_list:
-                    member = CouncilMember(**member_data)
-                    REGISTRY_VERITAS.add_member(member)
-                logging.info(f"{len(member_data_list)} membros do Conselho adicionados/atualizados em lote.")
+                REGISTRY_VERITAS.add_members(CouncilMember(**member_data) for member_data in member_data_list)
             except Exception as e:
                 logging.error(f"Erro ao carregar membros em lote de {args.batch}: {e}")
         else:
@@ -2229,9 +2618,7 @@ def run_cli_command(args: argparse.Namespace):
             try:
                 with open(args.batch, 'r', encoding='utf-8') as f:
                     links_data = yaml.safe_load(f)
-                for link_data in links_data:
-                    DIMENSIONAL_GRAPH_VERITAS.link(link_data['from'], link_data['to'], link_data['relation'], link_data.get('weight', 1.0))
-                logging.info(f"{len(links_data)} links adicionados em lote.")
+                DIMENSIONAL_GRAPH_VERITAS.link_many(links_data)
             except Exception as e:
                 logging.error(f"Erro ao carregar links em lote de {args.batch}: {e}")
         else:
@@ -2253,6 +2640,14 @@ def run_cli_command(args: argparse.Namespace):
         else:
             logging.info(f"Nenhum link encontrado para '{args.node}'.")
 
+    elif args.command == 'bench_registries':
+        result = benchmark_registry_store(entries=args.entries, legacy_entries=args.legacy_entries)
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+
+    elif args.command == 'bench_graph':
+        result = benchmark_dimensional_graph(edges=args.edges, nodes=args.nodes, queries=args.queries)
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+
     elif args.command == 'verify_m44_auth':
         logging.info("Testando o sistema de autenticação quântica do Módulo 44...")
         test_data = {"message": "Teste de integridade do M44."}
@@ -2481,6 +2876,17 @@ def main():
     query_links_parser.add_argument('node', type=str, help='Nó para consultar ligações.')
     query_links_parser.add_argument('--relation', type=str, help='Filtrar por tipo de relação.')
 
+    # bench_registries
+    bench_registries_parser = subparsers.add_parser('bench_registries', help='Compara gravação por mutação com import em lote nos registros.')
+    bench_registries_parser.add_argument('--entries', type=int, default=50_000, help='Número de equações no import em lote.')
+    bench_registries_parser.add_argument('--legacy_entries', type=int, default=300, help='Número de equações no modo antigo (uma gravação por mutação).')
+
+    # bench_graph
+    bench_graph_parser = subparsers.add_parser('bench_graph', help='Mede ingestão, consulta e recarga do Mapa Dimensional.')
+    bench_graph_parser.add_argument('--edges', type=int, default=200_000, help='Número de arestas sintéticas.')
+    bench_graph_parser.add_argument('--nodes', type=int, default=20_000, help='Número de nós sintéticos.')
+    bench_graph_parser.add_argument('--queries', type=int, default=1000, help='Número de consultas por nó.')
+
     # verify_m44_auth
     subparsers.add_parser('verify_m44_auth', help='Testa a auto-verificação de autenticidade do M44.')
 
@@ -32,18 +32,28 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
-import argparse, hashlib, json, logging, os, time
-from datetime import datetime
-from typing import Dict, Any, List, Optional, Union
+import argparse, hashlib, json, logging, os, random, time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from statistics import NormalDist
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
 import cmath
 import math
 
 # ───────────────────────────────────────── 1. DEPENDÊNCIAS OPCIONAIS ──────────
 
 LIBS: Dict[str, bool] = {k: False for k in (
-    'pyyaml', 'fastapi', 'uvicorn', 'websockets', 'pydantic', 'requests'
+    'pyyaml', 'fastapi', 'uvicorn', 'websockets', 'pydantic', 'requests', 'numpy'
 )}
 
+try:
+    import numpy as np  # type: ignore
+    LIBS['numpy'] = True
+except ModuleNotFoundError:
+    pass
+
 try:
     import yaml  # type: ignore
     LIBS['pyyaml'] = True
@@ -279,6 +289,115 @@ def check_eri_coherence(eri_value: complex, threshold: float = 0.7) -> bool:
         return False
     return True
 
+_VOTE_PROFILES: Dict[str, Tuple[float, float]] = {
+    "yes": (0.8, 0.2), "aprovado": (0.8, 0.2),
+    "no": (0.3, 0.05), "rejeitado": (0.3, 0.05),
+    "abstain": (0.6, 0.15),
+}
+
+def vote_psi_energy(vote_value: Union[str, float]) -> Tuple[float, float]:
+    """(psi, energia) de um voto; valores desconhecidos valem (0.5, 0.1)."""
+    return _VOTE_PROFILES.get(str(vote_value).lower(), (0.5, 0.1))
+
+@lru_cache(maxsize=65536)
+def voter_phase(voter: str) -> float:
+    """Fase θ do membro (depende apenas do nome, por isso fica em cache)."""
+    voter_seed = sum(ord(c) for c in voter)
+    phase_offset = hashlib.sha256(str(voter_seed).encode()).hexdigest()[:2]
+    return int(phase_offset, 16) / 255.0 * 2 * cmath.pi
+
+class VoteTally:
+    """
+    Agregado corrente de ERI/Q_delib de uma proposta.
+    Guarda a contribuição de cada membro (psi·φ·e^{iθ}, peso·energia) e as somas;
+    registrar ou trocar um voto custa O(1): subtrai a contribuição antiga e soma a nova.
+    """
+
+    __slots__ = ("contributions", "eri", "q_delib", "book", "version")
+
+    def __init__(self):
+        self.contributions: Dict[str, Tuple[complex, float]] = {}
+        self.eri: complex = 0j
+        self.q_delib: float = 0.0
+        self.book: Optional["VoteBook"] = None   # votos que este agregado acompanha
+        self.version = -1                        # versão do VoteBook já refletida aqui
+
+    @classmethod
+    def from_votes(cls, votes: Dict[str, Dict[str, Any]]) -> "VoteTally":
+        tally = cls()
+        for voter, vote_data in votes.items():
+            tally.apply(voter, vote_data['value'])
+        if isinstance(votes, VoteBook):
+            tally.book, tally.version = votes, votes.version
+        return tally
+
+    def in_sync(self, votes: "VoteBook") -> bool:
+        return self.book is votes and self.version == votes.version
+
+    def apply(self, voter: str, vote_value: Union[str, float], weight: float = 1.0, phi: float = 1.0):
+        psi_val, energy_val = vote_psi_energy(vote_value)
+        resonance = psi_val * phi * cmath.exp(1j * voter_phase(voter))
+        flow = weight * energy_val
+        previous = self.contributions.get(voter)
+        if previous is not None:
+            self.eri -= previous[0]
+            self.q_delib -= previous[1]
+        self.contributions[voter] = (resonance, flow)
+        self.eri += resonance
+        self.q_delib += flow
+
+    def exact(self) -> Tuple[complex, float]:
+        """Soma compensada (fsum) das contribuições; elimina o erro acumulado pelas trocas de voto."""
+        values = self.contributions.values()
+        eri = complex(math.fsum(r.real for r, _ in values), math.fsum(r.imag for r, _ in values))
+        return eri, math.fsum(f for _, f in values)
+
+    def __len__(self) -> int:
+        return len(self.contributions)
+
+class VoteBook(dict):
+    """
+    Votos de uma proposta (membro -> registro do voto) com contador de versão: toda
+    inclusão, troca ou remoção de registro incrementa `version`, então o agregado
+    detecta alterações feitas fora do registro mesmo que a contagem não mude.
+    Registros devem ser substituídos, não editados no lugar.
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+
 # ───────────────────────────────────────── 8. VALIDAÇÃO CONSENTIMENTO ─────────
 
 def check_consent(user_guid: str, action_type: str) -> bool:
@@ -508,11 +627,172 @@ class MixedRealityInterface:
         entry = {"timestamp_utc": datetime.utcnow().isoformat() + "Z", "action_type": action_type, "details": details}
         logging.info(json.dumps(entry, ensure_ascii=False)); CHAIN.add(action_type, entry); register_on_veritas_chronologos(action_type, entry)
 
+# Monte Carlo de impacto: cada trajetória é um passeio com reversão à média em [0, 1]
+# (x += reversão·(base − x) + volatilidade·ε) e o impacto é a média temporal de x.
+# As trajetórias são geradas em blocos de tamanho fixo; o bloco i usa o gerador
+# filho i da SeedSequence da simulação, então o resultado depende só da semente
+# e do índice dos blocos, nunca do número de workers. Cada bloco devolve apenas
+# (n, média, M2, histograma), agregados em ordem pelo MonteCarloSummary.
+
+MC_HISTOGRAM_BINS = 2048
+
+def _impact_block_numpy(entropy: int, block_index: int, size: int, base: float, volatility: float,
+                        reversion: float, horizon: int, bins: int) -> Tuple[int, float, float, List[int]]:
+    rng = np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(block_index,)))
+    x = np.full(size, base)
+    acc = np.zeros(size)
+    for eps in rng.standard_normal((horizon, size)):
+        x += reversion * (base - x) + volatility * eps
+        np.clip(x, 0.0, 1.0, out=x)
+        acc += x
+    impact = acc / horizon
+    mean = float(impact.mean())
+    m2 = float(np.square(impact - mean).sum())
+    counts = np.bincount(np.minimum((impact * bins).astype(np.int64), bins - 1), minlength=bins)
+    return size, mean, m2, counts.tolist()
+
+def _impact_block_python(entropy: int, block_index: int, size: int, base: float, volatility: float,
+                         reversion: float, horizon: int, bins: int) -> Tuple[int, float, float, List[int]]:
+    """Mesmo modelo, uma trajetória por vez (fallback sem numpy e linha de base do benchmark)."""
+    rng = random.Random(f"{entropy}:{block_index}")
+    counts = [0] * bins
+    mean = m2 = 0.0
+    for n in range(1, size + 1):
+        x = base; acc = 0.0
+        for _ in range(horizon):
+            x = min(1.0, max(0.0, x + reversion * (base - x) + volatility * rng.gauss(0.0, 1.0)))
+            acc += x
+        impact = acc / horizon
+        delta = impact - mean
+        mean += delta / n
+        m2 += delta * (impact - mean)
+        counts[min(int(impact * bins), bins - 1)] += 1
+    return size, mean, m2, counts
+
+def _simulate_impact_block(*args) -> Tuple[int, float, float, List[int]]:
+    return _impact_block_numpy(*args) if LIBS['numpy'] else _impact_block_python(*args)
+
+class MonteCarloSummary:
+    """Estatísticas em streaming: média/variância (fusão de Chan) e histograma em [0, 1] para quantis."""
+
+    def __init__(self, bins: int = MC_HISTOGRAM_BINS):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.counts = [0] * bins
+
+    def merge(self, n: int, mean: float, m2: float, counts: List[int]):
+        total = self.n + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta * delta * self.n * n / total
+        self.n = total
+        self.counts = [a + b for a, b in zip(self.counts, counts)]
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else 0.0
+
+    def ci_half_width(self, confidence: float = 0.95) -> float:
+        if self.n < 2:
+            return float('inf')
+        return NormalDist().inv_cdf(0.5 + confidence / 2) * self.std / math.sqrt(self.n)
+
+    def quantile(self, q: float) -> float:
+        """Quantil interpolado dentro do bin (resolução 1/bins)."""
+        bins = len(self.counts)
+        target = q * self.n
+        cumulative = 0
+        for i, c in enumerate(self.counts):
+            if c and cumulative + c >= target:
+                return (i + (target - cumulative) / c) / bins
+            cumulative += c
+        return 1.0
+
+    def to_dict(self, confidence: float = 0.95) -> Dict[str, Any]:
+        half = self.ci_half_width(confidence)
+        return {
+            "trajectories": self.n,
+            "mean": round(self.mean, 6),
+            "std": round(self.std, 6),
+            "ci": [round(self.mean - half, 6), round(self.mean + half, 6)],
+            "ci_half_width": round(half, 6),
+            "confidence": confidence,
+            "quantiles": {f"p{int(q * 100):02d}": round(self.quantile(q), 6) for q in (0.05, 0.25, 0.5, 0.75, 0.95)}
+        }
+
+def run_impact_monte_carlo(base: float, volatility: float = 0.15, reversion: float = 0.2, horizon: int = 24,
+                           max_trajectories: int = 200_000, block_size: int = 4096, tolerance: float = 0.002,
+                           confidence: float = 0.95, seed: Optional[int] = None, workers: int = 1,
+                           min_blocks: int = 2) -> Dict[str, Any]:
+    """
+    Simula até max_trajectories trajetórias em blocos, parando quando a meia-largura
+    do intervalo de confiança fica <= tolerance (tolerance=0 desativa a parada antecipada).
+    Com workers > 1 os blocos são distribuídos num ProcessPoolExecutor; os
+    resultados são agregados na ordem dos blocos e a parada é avaliada bloco a bloco,
+    o que torna o resumo idêntico para qualquer número de workers.
+    """
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(63)
+    n_blocks = max(1, math.ceil(max_trajectories / block_size))
+
+    def block_args(i: int) -> Tuple[Any, ...]:
+        size = min(block_size, max_trajectories - i * block_size)
+        return (seed, i, size, base, volatility, reversion, horizon, MC_HISTOGRAM_BINS)
+
+    summary = MonteCarloSummary()
+    converged = False
+    blocks_used = 0
+
+    def absorb(result: Tuple[int, float, float, List[int]]) -> bool:
+        nonlocal blocks_used
+        summary.merge(*result)
+        blocks_used += 1
+        return tolerance > 0 and blocks_used >= min_blocks and summary.ci_half_width(confidence) <= tolerance
+
+    t0 = time.perf_counter()
+    if workers <= 1:
+        for i in range(n_blocks):
+            if absorb(_simulate_impact_block(*block_args(i))):
+                converged = True
+                break
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # janela deslizante: até 2·workers blocos em voo, consumidos na ordem de submissão
+            pending = deque(executor.submit(_simulate_impact_block, *block_args(i)) for i in range(min(2 * workers, n_blocks)))
+            next_block = len(pending)
+            while pending:
+                if absorb(pending.popleft().result()):
+                    converged = True
+                    for future in pending:
+                        future.cancel()
+                    break
+                if next_block < n_blocks:
+                    pending.append(executor.submit(_simulate_impact_block, *block_args(next_block)))
+                    next_block += 1
+
+    result = summary.to_dict(confidence)
+    result.update({
+        "blocks": blocks_used, "converged": converged, "seed": seed, "workers": max(1, workers),
+        "engine": "numpy" if LIBS['numpy'] else "python", "elapsed_s": round(time.perf_counter() - t0, 4)
+    })
+    return result
+
 class PredictiveSimulationEngine:
     """Simula consequências e sugere linhas temporais ótimas."""
-    def multiverse_impact_analysis(self, decision: Dict[str, Any]) -> Dict[str, Any]:
+    def multiverse_impact_analysis(self, decision: Dict[str, Any], trajectories: int = 200_000, workers: int = 1,
+                                   tolerance: float = 0.002, seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Impacto nominal da decisão (impact_score/uncertainty inalterados) acompanhado do resumo
+        Monte Carlo em "monte_carlo". O modelo estocástico satura em [0, 1], então sua média não
+        coincide com o score nominal e fica só como informação adicional. Sem seed explícita a
+        semente deriva do conteúdo da decisão: a mesma decisão produz sempre o mesmo resumo.
+        """
         score = 0.8 if decision.get("outcome") == "Aprovado" else 0.5
-        res = {"impact_score": score, "uncertainty": 0.15}
+        if seed is None:
+            seed = int(_hash(json.dumps(decision, sort_keys=True, default=str))[:15], 16)
+        mc = run_impact_monte_carlo(score, max_trajectories=trajectories, tolerance=tolerance, seed=seed, workers=workers)
+        res = {"impact_score": score, "uncertainty": 0.15, "monte_carlo": mc}
         self._audit("sim_multiverse", {"decision": decision, "result": res})
         return res
 
@@ -630,6 +910,7 @@ class DeliberationRegistry:
     
     _proposals: Dict[str, Any] = {}
     _decrees: Dict[str, Any] = {}
+    _tallies: Dict[str, VoteTally] = {}
     _next_decree_id: int = 1
     _operational_status: Dict[str, Any] = {}
     _inter_species_pacts: Dict[str, Any] = {}
@@ -676,7 +957,7 @@ class DeliberationRegistry:
         
         proposal_data = {
             "id": proposal_id, "title": title, "description": description, "proposed_by": proposed_by,
-            "status": "Aberto para Deliberação", "votes": {}, "deadline": deadline.isoformat() + "Z",
+            "status": "Aberto para Deliberação", "votes": VoteBook(), "deadline": deadline.isoformat() + "Z",
             "timestamp": current_timestamp_utc, "cht_hash": cht_hash, "priority": priority, "category": category,
             "submitted_signature_hash": signature_hash, "consent_conselho": consent_conselho,
             "environment_check_status": environment_check, "communication_protocol_used": communication_protocol
@@ -710,33 +991,13 @@ class DeliberationRegistry:
         vote_metadata_json = json.dumps({"proposal_id": proposal_id, "member": member_name, "vote_value": vote})
         vote_cht_hash = generate_cht_hash(f"vote_{proposal_id}_{member_name}", datetime.utcnow().isoformat() + "Z", vote_metadata_json, member_name)
         
+        tally = cls._tally_for(proposal_id, proposal)
         proposal['votes'][member_name] = {"value": vote, "cht_hash": vote_cht_hash, "timestamp": datetime.utcnow().isoformat() + "Z"}
         
-        # Cálculo ERI/Q_delib atualizado
-        current_vote_nodes: List[Dict[str, float]] = []
-        all_weights: List[float] = []
-        all_energies: List[float] = []
-        
-        for voter, vote_data in proposal['votes'].items():
-            psi_val = 0.5; energy_val = 0.1
-            v = str(vote_data['value']).lower()
-            if v in ["yes", "aprovado"]:
-                psi_val = 0.8; energy_val = 0.2
-            elif v in ["no", "rejeitado"]:
-                psi_val = 0.3; energy_val = 0.05
-            elif v == "abstain":
-                psi_val = 0.6; energy_val = 0.15
-            
-            voter_seed = sum(ord(c) for c in voter)
-            phase_offset = hashlib.sha256(str(voter_seed).encode()).hexdigest()[:2]
-            theta_val = int(phase_offset, 16) / 255.0 * 2 * cmath.pi
-            
-            current_vote_nodes.append({'psi': psi_val, 'phi': 1.0, 'theta': theta_val})
-            all_weights.append(1.0)
-            all_energies.append(energy_val)
-        
-        current_eri = calculate_eri(current_vote_nodes)
-        current_q_delib = compute_q_delib(all_weights, all_energies)
+        # Cálculo ERI/Q_delib atualizado (incremental)
+        tally.apply(member_name, vote)
+        tally.version = proposal['votes'].version
+        current_eri, current_q_delib = tally.eri, tally.q_delib
         
         log_entry = {
             "timestamp_utc": proposal['votes'][member_name]["timestamp"],
@@ -755,6 +1016,64 @@ class DeliberationRegistry:
         
         return {"status": "success", "message": "Voto registrado.", "current_eri": str(current_eri), "current_q_delib": current_q_delib}
 
+    @classmethod
+    def cast_votes(cls, proposal_id: str, votes: Union[Dict[str, Union[str, float]], Iterable[Tuple[str, Union[str, float]]]]) -> Dict[str, Any]:
+        """
+        Registra um lote de votos (dict membro->voto ou pares (membro, voto)) numa única passada.
+        Cada voto recebe o seu CHTE; o lote gera um só bloco no ledger e um só registro no M44,
+        com os hashes individuais, em vez de um bloco por voto.
+        """
+        proposal = cls._proposals.get(proposal_id)
+        if not proposal:
+            logging.error(json.dumps({"action_type": "cast_votes_error", "message": f"Proposta '{proposal_id}' não encontrada."}))
+            return {"status": "error", "message": "Proposta não encontrada."}
+        
+        items = votes.items() if isinstance(votes, dict) else votes
+        tally = cls._tally_for(proposal_id, proposal)
+        proposal_votes = proposal['votes']
+        timestamp = datetime.utcnow().isoformat() + "Z"
+        vote_hashes: List[List[str]] = []
+        for member_name, vote in items:
+            vote_metadata_json = json.dumps({"proposal_id": proposal_id, "member": member_name, "vote_value": vote})
+            vote_cht_hash = generate_cht_hash(f"vote_{proposal_id}_{member_name}", timestamp, vote_metadata_json, member_name)
+            proposal_votes[member_name] = {"value": vote, "cht_hash": vote_cht_hash, "timestamp": timestamp}
+            tally.apply(member_name, vote)
+            vote_hashes.append([member_name, vote_cht_hash])
+        tally.version = proposal_votes.version
+        
+        log_entry = {
+            "timestamp_utc": timestamp,
+            "action_type": "cast_votes",
+            "proposal_id": proposal_id,
+            "cht_hash": _hash(json.dumps(vote_hashes)),
+            "eri_snapshot": str(tally.eri),
+            "q_delib_snapshot": tally.q_delib,
+            "count": len(vote_hashes),
+            "total_votes": len(tally),
+            "votes": vote_hashes,
+            "status_message": f"{len(vote_hashes)} votos registrados para proposta '{proposal_id}'."
+        }
+        logging.info(json.dumps({k: v for k, v in log_entry.items() if k != "votes"}, ensure_ascii=False))
+        register_on_veritas_chronologos(log_entry["action_type"], log_entry)
+        CHAIN.add(log_entry["action_type"], log_entry)
+        
+        return {"status": "success", "message": f"{len(vote_hashes)} votos registrados.", "count": len(vote_hashes),
+                "current_eri": str(tally.eri), "current_q_delib": tally.q_delib}
+
+    @classmethod
+    def _tally_for(cls, proposal_id: str, proposal: Dict[str, Any]) -> VoteTally:
+        """
+        Agregado da proposta; é reconstruído se os votos foram alterados fora do registro
+        (versão do VoteBook diferente da refletida) ou se o dicionário de votos foi trocado.
+        """
+        tally = cls._tallies.get(proposal_id)
+        votes = proposal['votes']
+        if not isinstance(votes, VoteBook):
+            votes = proposal['votes'] = VoteBook(votes)
+        if tally is None or not tally.in_sync(votes):
+            tally = cls._tallies[proposal_id] = VoteTally.from_votes(votes)
+        return tally
+
     @classmethod
     def finalize_deliberation(cls, proposal_id: str, outcome: str, decree_content: Optional[Dict[str,Any]] = None) -> Dict[str, Any]:
         proposal = cls._proposals.get(proposal_id)
@@ -763,30 +1082,7 @@ class DeliberationRegistry:
             return {"status": "error", "message": "Proposta não encontrada."}
         
         # Cálculo final ERI/Q_delib
-        final_vote_nodes: List[Dict[str, float]] = []
-        final_weights: List[float] = []
-        final_energies: List[float] = []
-        
-        for voter, vote_data in proposal['votes'].items():
-            psi_val = 0.5; energy_val = 0.1
-            v = str(vote_data['value']).lower()
-            if v in ["yes", "aprovado"]:
-                psi_val = 0.8; energy_val = 0.2
-            elif v in ["no", "rejeitado"]:
-                psi_val = 0.3; energy_val = 0.05
-            elif v == "abstain":
-                psi_val = 0.6; energy_val = 0.15
-            
-            voter_seed = sum(ord(c) for c in voter)
-            phase_offset = hashlib.sha256(str(voter_seed).encode()).hexdigest()[:2]
-            theta_val = int(phase_offset, 16) / 255.0 * 2 * cmath.pi
-            
-            final_vote_nodes.append({'psi': psi_val, 'phi': 1.0, 'theta': theta_val})
-            final_weights.append(1.0)
-            final_energies.append(energy_val)
-        
-        final_eri = calculate_eri(final_vote_nodes)
-        final_q_delib = compute_q_delib(final_weights, final_energies)
+        final_eri, final_q_delib = cls._tally_for(proposal_id, proposal).exact()
         
         coherence_status = "Coerente"
         if not check_eri_coherence(final_eri, threshold=0.5):
@@ -1002,6 +1298,136 @@ def orchestrate_nanorobot_comm_m10(command: str, nanorobot_id: Optional[str] = N
 
 # ───────────────────────────────────────── 14. CLI COMPLETA ───────────────────
 
+def _legacy_vote_aggregate(votes: Dict[str, Dict[str, Any]]) -> Tuple[complex, float]:
+    """Recalculo completo de ERI/Q_delib (comportamento anterior, mantido para o benchmark)."""
+    nodes: List[Dict[str, float]] = []
+    energies: List[float] = []
+    for voter, vote_data in votes.items():
+        psi_val, energy_val = vote_psi_energy(vote_data['value'])
+        voter_seed = sum(ord(c) for c in voter)
+        phase_offset = hashlib.sha256(str(voter_seed).encode()).hexdigest()[:2]
+        nodes.append({'psi': psi_val, 'phi': 1.0, 'theta': int(phase_offset, 16) / 255.0 * 2 * cmath.pi})
+        energies.append(energy_val)
+    return calculate_eri(nodes), compute_q_delib([1.0] * len(energies), energies)
+
+def benchmark_vote_aggregation(sizes: Iterable[int] = (250, 500, 1000, 2000, 4000), legacy_limit: int = 2000,
+                               registry_limit: int = 1000) -> Dict[str, Any]:
+    """
+    Compara o recálculo completo a cada voto (O(N²) por proposta) com o agregado
+    incremental voto a voto e com a aplicação em lote, medindo só a agregação, e
+    confere que os valores finais coincidem. Até registry_limit votos também passa
+    pelo DeliberationRegistry (cast_vote voto a voto × cast_votes em lote), com o
+    ledger num arquivo temporário, e confere que uma troca de voto feita fora do
+    registro (mesma contagem) é refletida no agregado.
+    """
+    choices = ("aprovado", "rejeitado", "abstain", "yes", "no", 0.7)
+    results: Dict[str, Any] = {}
+    for n in sizes:
+        ballots = [(f"MEMBRO_{i:06d}", choices[i % len(choices)]) for i in range(n)]
+        # um décimo dos membros troca o voto no fim
+        ballots += [(f"MEMBRO_{i:06d}", "rejeitado") for i in range(0, n, 10)]
+        row: Dict[str, Any] = {"votes": len(ballots)}
+        voter_phase.cache_clear()
+
+        if n <= legacy_limit:
+            votes: Dict[str, Dict[str, Any]] = {}
+            t0 = time.perf_counter()
+            for member, value in ballots:
+                votes[member] = {"value": value}
+                legacy = _legacy_vote_aggregate(votes)
+            row["legacy_s"] = round(time.perf_counter() - t0, 4)
+
+        voter_phase.cache_clear()
+        tally = VoteTally()
+        t0 = time.perf_counter()
+        for member, value in ballots:
+            tally.apply(member, value)
+            tally.eri, tally.q_delib  # snapshot devolvido a cada voto
+        row["incremental_s"] = round(time.perf_counter() - t0, 4)
+        row["incremental_us_per_vote"] = round(row["incremental_s"] / len(ballots) * 1e6, 2)
+
+        t0 = time.perf_counter()
+        bulk = VoteTally()
+        for member, value in ballots:
+            bulk.apply(member, value)
+        bulk_eri, bulk_q = bulk.exact()
+        row["bulk_s"] = round(time.perf_counter() - t0, 4)
+
+        if n <= legacy_limit:
+            row["speedup"] = round(row["legacy_s"] / max(row["incremental_s"], 1e-9), 1)
+            row["max_abs_diff"] = max(abs(legacy[0] - tally.eri), abs(legacy[1] - tally.q_delib),
+                                      abs(legacy[0] - bulk_eri), abs(legacy[1] - bulk_q))
+        if n <= registry_limit:
+            row["registry"] = _benchmark_registry_votes(ballots)
+        results[str(n)] = row
+    return results
+
+def _benchmark_registry_votes(ballots: List[Tuple[str, Union[str, float]]]) -> Dict[str, Any]:
+    global CHAIN
+    import tempfile
+    previous_chain, previous_level = CHAIN, logging.getLogger().level
+    registry = DeliberationRegistry
+    row: Dict[str, Any] = {}
+    logging.getLogger().setLevel(logging.CRITICAL)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            CHAIN = SimpleChain(Path(tmp) / "bench_chain.json")
+            deadline = datetime.utcnow() + timedelta(days=1)
+            single = registry.create_proposal("bench cast_vote", "benchmark", "BENCH", deadline)["id"]
+            t0 = time.perf_counter()
+            for member, value in ballots:
+                registry.cast_vote(single, member, value)
+            row["cast_vote_s"] = round(time.perf_counter() - t0, 4)
+
+            batch = registry.create_proposal("bench cast_votes", "benchmark", "BENCH", deadline)["id"]
+            t0 = time.perf_counter()
+            registry.cast_votes(batch, ballots)
+            row["cast_votes_s"] = round(time.perf_counter() - t0, 4)
+            row["batch_speedup"] = round(row["cast_vote_s"] / max(row["cast_votes_s"], 1e-9), 1)
+
+            expected = _legacy_vote_aggregate(registry._proposals[batch]['votes'])
+            tally = registry._tally_for(batch, registry._proposals[batch])
+            row["batch_matches"] = abs(expected[0] - tally.eri) < 1e-9 and abs(expected[1] - tally.q_delib) < 1e-9
+            # troca externa de um voto: a contagem não muda, a versão sim
+            votes = registry._proposals[batch]['votes']
+            member = ballots[0][0]
+            votes[member] = dict(votes[member], value="abstain")
+            expected = _legacy_vote_aggregate(votes)
+            tally = registry._tally_for(batch, registry._proposals[batch])
+            row["external_edit_detected"] = abs(expected[0] - tally.eri) < 1e-9 and abs(expected[1] - tally.q_delib) < 1e-9
+            for proposal_id in (single, batch):
+                registry._proposals.pop(proposal_id, None)
+                registry._tallies.pop(proposal_id, None)
+    finally:
+        CHAIN = previous_chain
+        logging.getLogger().setLevel(previous_level)
+    return row
+
+def benchmark_simulation(trajectories: int = 20_000, horizon: int = 24, worker_counts: Iterable[int] = (1, 2, 4),
+                         seed: int = 45) -> Dict[str, Any]:
+    """
+    Compara a simulação serial trajetória a trajetória com o núcleo em blocos
+    (numpy, 1..N processos), mede a latência com parada antecipada e confere
+    que o resumo é o mesmo para qualquer número de workers.
+    """
+    results: Dict[str, Any] = {"trajectories": trajectories, "horizon": horizon, "engine": "numpy" if LIBS['numpy'] else "python"}
+
+    t0 = time.perf_counter()
+    _impact_block_python(seed, 0, trajectories, 0.8, 0.15, 0.2, horizon, MC_HISTOGRAM_BINS)
+    results["serial_python_s"] = round(time.perf_counter() - t0, 4)
+
+    summaries = {}
+    for workers in worker_counts:
+        mc = run_impact_monte_carlo(0.8, horizon=horizon, max_trajectories=trajectories, tolerance=0.0, seed=seed, workers=workers)
+        results[f"batched_workers_{workers}_s"] = mc["elapsed_s"]
+        summaries[workers] = {k: mc[k] for k in ("trajectories", "mean", "std", "ci", "quantiles")}
+    results["reproducible_across_workers"] = all(v == summaries[min(summaries)] for v in summaries.values())
+    results["summary"] = summaries[min(summaries)]
+
+    mc = run_impact_monte_carlo(0.8, horizon=horizon, max_trajectories=max(trajectories, 200_000), seed=seed)
+    results["early_stop"] = {k: mc[k] for k in ("trajectories", "blocks", "converged", "ci_half_width", "elapsed_s")}
+    return results
+
 def build_cli() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="MÓDULO 45 -- CONCILIVM: Núcleo de Deliberação e Governança Universal (V3.0.0).",
@@ -1098,6 +1524,10 @@ def build_cli() -> argparse.ArgumentParser:
     
     # Demo (offline)
     sub.add_parser("demo", help="Executa demo de deliberação e consentimento offline")
+    p_bench_votes = sub.add_parser("bench_votes", help="Benchmark da agregação incremental de votos")
+    p_bench_votes.add_argument("--sizes", default="250,500,1000,2000,4000", help="Tamanhos de proposta (csv)")
+    p_bench_votes.add_argument("--legacy_limit", type=int, default=2000, help="Maior tamanho medido com o recálculo completo")
+    p_bench_votes.add_argument("--registry_limit", type=int, default=1000, help="Maior tamanho medido via cast_vote/cast_votes")
     
     # Novos comandos evolutivos
     p_res = sub.add_parser("resilience_check", help="Verifica saúde dos módulos")
@@ -1121,6 +1551,14 @@ def build_cli() -> argparse.ArgumentParser:
     
     p_sim = sub.add_parser("simulate_decision", help="Simula impactos e seleciona timeline")
     p_sim.add_argument("--outcome", required=True)
+    p_sim.add_argument("--trajectories", type=int, default=200_000, help="Máximo de trajetórias Monte Carlo")
+    p_sim.add_argument("--workers", type=int, default=1, help="Processos para a simulação")
+    p_sim.add_argument("--tolerance", type=float, default=0.002, help="Meia-largura do IC para parada antecipada (0 desativa)")
+    p_sim.add_argument("--seed", type=int, help="Semente (padrão: derivada da decisão)")
+    p_bench_sim = sub.add_parser("bench_simulation", help="Benchmark do Monte Carlo em blocos")
+    p_bench_sim.add_argument("--trajectories", type=int, default=20_000)
+    p_bench_sim.add_argument("--horizon", type=int, default=24)
+    p_bench_sim.add_argument("--workers", default="1,2,4", help="Números de workers a comparar (csv)")
     
     p_icp = sub.add_parser("icp_translate", help="Tradução de mensagem de consciência")
     p_icp.add_argument("--message", required=True)
@@ -1267,6 +1705,10 @@ def main():
         decree = CONCILIVM_REGISTRY.finalize_deliberation(proposal["id"], "Aprovado", {"summary":"Demonstração concluída."})
         print(json.dumps({"proposal": proposal, "decree": decree}, indent=2, ensure_ascii=False))
     
+    elif cmd == "bench_votes":
+        sizes = [int(x) for x in args.sizes.split(',') if x.strip()]
+        print(json.dumps(benchmark_vote_aggregation(sizes, args.legacy_limit, args.registry_limit), indent=2, ensure_ascii=False))
+    
     # Novos comandos evolutivos
     elif cmd == "resilience_check":
         print(json.dumps(RESILIENCE.health_check_all_modules(CONCILIVM_REGISTRY.list_all_modules_awareness()), indent=2, ensure_ascii=False))
@@ -1300,11 +1742,16 @@ def main():
     
     elif cmd == "simulate_decision":
         decision = {"outcome": args.outcome}
-        a1 = SIM.multiverse_impact_analysis(decision)
+        a1 = SIM.multiverse_impact_analysis(decision, trajectories=args.trajectories, workers=args.workers,
+                                            tolerance=args.tolerance, seed=args.seed)
         a2 = SIM.ethical_consequence_modeling(decision)
         sel = SIM.optimal_timeline_selection([{"impact_score": a1["impact_score"], "uncertainty": a1["uncertainty"], "eqtp": a2["eqtp"]}])
         print(json.dumps({"analyses": {"multiverse": a1, "ethical": a2}, "selection": sel}, indent=2, ensure_ascii=False))
     
+    elif cmd == "bench_simulation":
+        worker_counts = [int(x) for x in args.workers.split(',') if x.strip()]
+        print(json.dumps(benchmark_simulation(args.trajectories, args.horizon, worker_counts), indent=2, ensure_ascii=False))
+    
     elif cmd == "icp_translate":
         print(json.dumps({"translated": ICP.consciousness_language_translation(args.message)}, indent=2, ensure_ascii=False))
     
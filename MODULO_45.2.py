@@ -7,6 +7,7 @@ Sistema de Estado Persistente para Governança Universal (V1.0.0)
 
 - Persistência completa de propostas, votos, decretos e pactos
 - Sistema de backup e restauração automática
+- Armazenamento único SQLite (WAL) com upsert por registro e snapshots online
 - Continuidade entre execuções do M45.1
 - Auditoria integrada com ledger existente
 - Fail-soft: funciona mesmo sem M45.1 ativo
@@ -22,8 +23,11 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 import argparse, hashlib, json, logging, os, time
+import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Union, Iterator
 import cmath
 import math
 
@@ -44,12 +48,22 @@ logging.basicConfig(
 PERSISTENCE_DIR = Path('concilium_persistence')
 PERSISTENCE_DIR.mkdir(exist_ok=True)
 
+STATE_DB_FILE = PERSISTENCE_DIR / 'concilium_state.db'
+# Arquivos JSON das versões anteriores: importados para o SQLite na primeira abertura
 PROPOSALS_FILE = PERSISTENCE_DIR / 'proposals.json'
 DECREES_FILE = PERSISTENCE_DIR / 'decrees.json'
 PACTS_FILE = PERSISTENCE_DIR / 'pacts.json'
 STATUS_FILE = PERSISTENCE_DIR / 'operational_status.json'
 BACKUP_DIR = PERSISTENCE_DIR / 'backups'
 
+# Tipos de registro (coluna "kind") e o arquivo legado de cada um
+KINDS = {
+    "proposals": PROPOSALS_FILE,
+    "decrees": DECREES_FILE,
+    "pacts": PACTS_FILE,
+    "status": STATUS_FILE,
+}
+
 # ───────────────────────────────────────── UTILITÁRIOS ──────────────────────
 
 def _hash(data: str) -> str:
@@ -65,166 +79,364 @@ def generate_cht_hash(action_id: str, utc_timestamp: str, decision_metadata_json
 def get_timestamp() -> str:
     return datetime.utcnow().isoformat() + "Z"
 
+# ───────────────────────────────────────── ARMAZENAMENTO SQLITE ──────────────
+
+class SQLiteStateStore:
+    """
+    Estado do CONCILIVM num único arquivo SQLite em modo WAL.
+    Cada proposta, decreto, pacto ou entrada de status é uma linha (kind, id, payload JSON),
+    gravada por upsert; transaction() agrupa várias mutações num único commit.
+    Backups são snapshots online (VACUUM INTO, ou a API de backup em SQLite antigo) e
+    seus metadados ficam na tabela backups, então listar backups não abre nenhum payload.
+    """
+
+    def __init__(self, db_path: Path = STATE_DB_FILE, backup_dir: Path = BACKUP_DIR, migrate_legacy: bool = True):
+        self.db_path = Path(db_path)
+        self.backup_dir = Path(backup_dir)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._owner: Optional[int] = None     # thread da transação aberta
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS records (
+                kind TEXT NOT NULL,
+                id TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (kind, id)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS backups (
+                file TEXT PRIMARY KEY,
+                timestamp TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                proposals_count INTEGER NOT NULL DEFAULT 0,
+                decrees_count INTEGER NOT NULL DEFAULT 0,
+                pacts_count INTEGER NOT NULL DEFAULT 0,
+                status_count INTEGER NOT NULL DEFAULT 0
+            );
+        """)
+        if migrate_legacy:
+            self._migrate_legacy()
+
+    # ── Transações ──────────────────────────────────────────────────────────
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """BEGIN IMMEDIATE ... COMMIT; blocos aninhados participam da transação externa."""
+        with self._lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield self.conn
+                finally:
+                    self._depth -= 1
+                return
+            self.conn.execute("BEGIN IMMEDIATE")
+            self._depth = 1
+            self._owner = threading.get_ident()
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            else:
+                self.conn.execute("COMMIT")
+            finally:
+                self._depth = 0
+                self._owner = None
+
+    @property
+    def in_transaction(self) -> bool:
+        """True se a thread atual está dentro de um bloco transaction()."""
+        return self._depth > 0 and self._owner == threading.get_ident()
+
+    # ── Registros ───────────────────────────────────────────────────────────
+    def load(self, kind: str) -> Dict[str, Any]:
+        with self._lock:
+            rows = self.conn.execute("SELECT id, payload FROM records WHERE kind = ? ORDER BY id", (kind,)).fetchall()
+        return {rid: json.loads(payload) for rid, payload in rows}
+
+    def get(self, kind: str, record_id: str) -> Optional[Any]:
+        with self._lock:
+            row = self.conn.execute("SELECT payload FROM records WHERE kind = ? AND id = ?", (kind, record_id)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def upsert(self, kind: str, record_id: str, payload: Any):
+        self.upsert_many(kind, {record_id: payload})
+
+    def upsert_many(self, kind: str, records: Dict[str, Any]) -> int:
+        """Grava os registros dados; linhas cujo payload não mudou não são reescritas."""
+        now = get_timestamp()
+        rows = [(kind, rid, json.dumps(payload, ensure_ascii=False, sort_keys=True), now) for rid, payload in records.items()]
+        with self.transaction() as conn:
+            before = conn.total_changes
+            conn.executemany("""
+                INSERT INTO records (kind, id, payload, updated_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT (kind, id) DO UPDATE SET payload = excluded.payload, updated_at = excluded.updated_at
+                WHERE records.payload != excluded.payload
+            """, rows)
+            return conn.total_changes - before
+
+    def delete(self, kind: str, record_id: str) -> bool:
+        with self.transaction() as conn:
+            return conn.execute("DELETE FROM records WHERE kind = ? AND id = ?", (kind, record_id)).rowcount > 0
+
+    def replace_all(self, kind: str, records: Dict[str, Any]) -> int:
+        """Semântica do antigo save_*: a coleção passa a ser exatamente `records` (upsert + remoção do resto)."""
+        with self.transaction() as conn:
+            changed = self.upsert_many(kind, records)
+            existing = [rid for (rid,) in conn.execute("SELECT id FROM records WHERE kind = ?", (kind,))]
+            stale = [(kind, rid) for rid in existing if rid not in records]
+            conn.executemany("DELETE FROM records WHERE kind = ? AND id = ?", stale)
+            return changed + len(stale)
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self.conn.execute("SELECT kind, COUNT(*) FROM records GROUP BY kind").fetchall()
+        result = {kind: 0 for kind in KINDS}
+        result.update(dict(rows))
+        return result
+
+    # ── Backups ─────────────────────────────────────────────────────────────
+    def create_backup(self) -> Path:
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S_%f")
+        backup_file = self.backup_dir / f"backup_{timestamp}.db"
+        with self._lock:
+            counts = self.counts()
+            try:
+                self.conn.execute("VACUUM INTO ?", (str(backup_file),))
+            except sqlite3.OperationalError:
+                # SQLite < 3.27 não tem VACUUM INTO: usa a API de backup online
+                dest = sqlite3.connect(str(backup_file))
+                try:
+                    self.conn.backup(dest)
+                finally:
+                    dest.close()
+            self._register_backup(backup_file, get_timestamp(), counts)
+        return backup_file
+
+    def _register_backup(self, backup_file: Path, timestamp: str, counts: Dict[str, int]):
+        with self.transaction() as conn:
+            conn.execute("INSERT OR REPLACE INTO backups VALUES (?, ?, ?, ?, ?, ?, ?)",
+                         (backup_file.name, timestamp, backup_file.stat().st_size,
+                          counts.get("proposals", 0), counts.get("decrees", 0), counts.get("pacts", 0), counts.get("status", 0)))
+
+    def list_backups(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self.conn.execute("SELECT file, timestamp, size, proposals_count, decrees_count, pacts_count FROM backups ORDER BY file DESC").fetchall()
+        return [{"file": f, "timestamp": ts, "size": size, "proposals_count": p, "decrees_count": d, "pacts_count": pc}
+                for f, ts, size, p, d, pc in rows if (self.backup_dir / f).exists()]
+
+    def read_backup(self, backup_file: Path) -> Dict[str, Dict[str, Any]]:
+        """Lê um backup (.db atual ou .json legado) como {kind: {id: payload}}."""
+        if backup_file.suffix == ".json":
+            with open(backup_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return {"proposals": data.get("proposals", {}), "decrees": data.get("decrees", {}),
+                    "pacts": data.get("pacts", {}), "status": data.get("operational_status", {}),
+                    "_timestamp": data.get("timestamp", "Unknown")}
+        src = sqlite3.connect(f"file:{backup_file}?mode=ro", uri=True)
+        try:
+            result: Dict[str, Any] = {kind: {} for kind in KINDS}
+            for kind, rid, payload in src.execute("SELECT kind, id, payload FROM records"):
+                result.setdefault(kind, {})[rid] = json.loads(payload)
+            row = src.execute("SELECT MAX(updated_at) FROM records").fetchone()
+        finally:
+            src.close()
+        registered = self.conn.execute("SELECT timestamp FROM backups WHERE file = ?", (backup_file.name,)).fetchone()
+        result["_timestamp"] = registered[0] if registered else (row[0] if row and row[0] else "Unknown")
+        return result
+
+    def restore(self, backup_file: Path) -> Dict[str, Any]:
+        data = self.read_backup(backup_file)
+        with self.transaction():
+            for kind in KINDS:
+                self.replace_all(kind, data.get(kind, {}))
+        return data
+
+    # ── Migração dos arquivos JSON legados ──────────────────────────────────
+    def _migrate_legacy(self):
+        imported = {}
+        with self.transaction() as conn:
+            for kind, legacy_file in KINDS.items():
+                if not legacy_file.exists():
+                    continue
+                try:
+                    with open(legacy_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                except Exception as e:
+                    logging.error(f"Erro ao migrar {legacy_file}: {e}")
+                    continue
+                if not conn.execute("SELECT 1 FROM records WHERE kind = ? LIMIT 1", (kind,)).fetchone():
+                    self.upsert_many(kind, data)
+                    imported[kind] = len(data)
+        for kind, legacy_file in KINDS.items():
+            if legacy_file.exists():
+                legacy_file.rename(legacy_file.with_suffix('.json.migrated'))
+        # Backups JSON antigos: lidos uma única vez para registrar os metadados
+        if self.backup_dir.exists():
+            known = {f for (f,) in self.conn.execute("SELECT file FROM backups")}
+            for backup_file in self.backup_dir.glob("backup_*.json"):
+                if backup_file.name in known:
+                    continue
+                try:
+                    data = self.read_backup(backup_file)
+                    self._register_backup(backup_file, data["_timestamp"], {kind: len(data.get(kind, {})) for kind in KINDS})
+                except Exception as e:
+                    logging.error(f"Erro ao ler backup {backup_file}: {e}")
+        if imported:
+            logging.info(f"Estado JSON legado migrado para {self.db_path}: {imported}")
+
+    def close(self):
+        with self._lock:
+            if self.conn is not None:
+                self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                self.conn.close()
+                self.conn = None
+
+
+_STORE: Optional[SQLiteStateStore] = None
+_STORE_LOCK = threading.Lock()
+
+def get_state_store() -> SQLiteStateStore:
+    """Store padrão do módulo, aberto sob demanda (uma conexão por processo)."""
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None or _STORE.conn is None:
+            _STORE = SQLiteStateStore()
+        return _STORE
+
 # ───────────────────────────────────────── SISTEMA DE PERSISTÊNCIA ───────────
 
 class PersistentStateManager:
     """Gerencia persistência de estado entre execuções do M45.1"""
-    
+
     @classmethod
-    def load_proposals(cls) -> Dict[str, Any]:
-        """Carrega propostas do arquivo de persistência"""
-        if PROPOSALS_FILE.exists():
-            try:
-                with open(PROPOSALS_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                logging.error(f"Erro ao carregar propostas: {e}")
-                return {}
-        return {}
+    def _load(cls, kind: str, label: str) -> Dict[str, Any]:
+        try:
+            return get_state_store().load(kind)
+        except Exception as e:
+            logging.error(f"Erro ao carregar {label}: {e}")
+            return {}
 
     @classmethod
-    def save_proposals(cls, proposals: Dict[str, Any]):
-        """Salva propostas no arquivo de persistência"""
+    def _save(cls, kind: str, label: str, records: Dict[str, Any]):
+        """
+        Fora de transação o erro é só registrado, como antes. Dentro de transaction()
+        ele é propagado, para a transação externa fazer ROLLBACK em vez de
+        commitar as outras gravações do lote.
+        """
+        store = get_state_store()
         try:
-            with open(PROPOSALS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(proposals, f, indent=2, ensure_ascii=False)
-            logging.info(f"Propostas salvas: {len(proposals)} registros")
+            changed = store.replace_all(kind, records)
+            logging.info(f"{label.capitalize()} salvos: {len(records)} registros ({changed} alterados)")
         except Exception as e:
-            logging.error(f"Erro ao salvar propostas: {e}")
+            logging.error(f"Erro ao salvar {label}: {e}")
+            if store.in_transaction:
+                raise
+
+    @classmethod
+    def transaction(cls):
+        """Agrupa as gravações de uma ação de deliberação num único commit."""
+        return get_state_store().transaction()
+
+    @classmethod
+    def load_proposals(cls) -> Dict[str, Any]:
+        """Carrega propostas do armazenamento persistente"""
+        return cls._load("proposals", "propostas")
+
+    @classmethod
+    def save_proposals(cls, proposals: Dict[str, Any]):
+        """Salva propostas (upsert por registro; só linhas alteradas são gravadas)"""
+        cls._save("proposals", "propostas", proposals)
+
+    @classmethod
+    def upsert_proposal(cls, proposal_id: str, proposal: Dict[str, Any]):
+        """Grava uma única proposta"""
+        get_state_store().upsert("proposals", proposal_id, proposal)
+
+    @classmethod
+    def record_vote(cls, proposal_id: str, voter: str, vote_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Registra um voto numa proposta persistida, numa única transação"""
+        store = get_state_store()
+        with store.transaction():
+            proposal = store.get("proposals", proposal_id)
+            if proposal is None:
+                raise KeyError(f"Proposta não encontrada: {proposal_id}")
+            proposal.setdefault("votes", {})[voter] = vote_data
+            store.upsert("proposals", proposal_id, proposal)
+        return proposal
 
     @classmethod
     def load_decrees(cls) -> Dict[str, Any]:
-        """Carrega decretos do arquivo de persistência"""
-        if DECREES_FILE.exists():
-            try:
-                with open(DECREES_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                logging.error(f"Erro ao carregar decretos: {e}")
-                return {}
-        return {}
+        """Carrega decretos do armazenamento persistente"""
+        return cls._load("decrees", "decretos")
 
     @classmethod
     def save_decrees(cls, decrees: Dict[str, Any]):
-        """Salva decretos no arquivo de persistência"""
-        try:
-            with open(DECREES_FILE, 'w', encoding='utf-8') as f:
-                json.dump(decrees, f, indent=2, ensure_ascii=False)
-            logging.info(f"Decretos salvos: {len(decrees)} registros")
-        except Exception as e:
-            logging.error(f"Erro ao salvar decretos: {e}")
+        """Salva decretos (upsert por registro)"""
+        cls._save("decrees", "decretos", decrees)
+
+    @classmethod
+    def upsert_decree(cls, decree_id: str, decree: Dict[str, Any]):
+        """Grava um único decreto"""
+        get_state_store().upsert("decrees", decree_id, decree)
 
     @classmethod
     def load_pacts(cls) -> Dict[str, Any]:
-        """Carrega pactos do arquivo de persistência"""
-        if PACTS_FILE.exists():
-            try:
-                with open(PACTS_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                logging.error(f"Erro ao carregar pactos: {e}")
-                return {}
-        return {}
+        """Carrega pactos do armazenamento persistente"""
+        return cls._load("pacts", "pactos")
 
     @classmethod
     def save_pacts(cls, pacts: Dict[str, Any]):
-        """Salva pactos no arquivo de persistência"""
-        try:
-            with open(PACTS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(pacts, f, indent=2, ensure_ascii=False)
-            logging.info(f"Pactos salvos: {len(pacts)} registros")
-        except Exception as e:
-            logging.error(f"Erro ao salvar pactos: {e}")
+        """Salva pactos (upsert por registro)"""
+        cls._save("pacts", "pactos", pacts)
+
+    @classmethod
+    def upsert_pact(cls, pact_id: str, pact: Dict[str, Any]):
+        """Grava um único pacto"""
+        get_state_store().upsert("pacts", pact_id, pact)
 
     @classmethod
     def load_operational_status(cls) -> Dict[str, Any]:
-        """Carrega status operacional do arquivo de persistência"""
-        if STATUS_FILE.exists():
-            try:
-                with open(STATUS_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                logging.error(f"Erro ao carregar status operacional: {e}")
-                return {}
-        return {}
+        """Carrega status operacional do armazenamento persistente"""
+        return cls._load("status", "status operacional")
 
     @classmethod
     def save_operational_status(cls, status: Dict[str, Any]):
-        """Salva status operacional no arquivo de persistência"""
-        try:
-            with open(STATUS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(status, f, indent=2, ensure_ascii=False)
-            logging.info(f"Status operacional salvo: {len(status)} registros")
-        except Exception as e:
-            logging.error(f"Erro ao salvar status operacional: {e}")
+        """Salva status operacional (upsert por chave)"""
+        cls._save("status", "status operacional", status)
 
     @classmethod
     def create_backup(cls):
-        """Cria backup completo do estado atual"""
-        ensure_backup_dir()
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        backup_file = BACKUP_DIR / f"backup_{timestamp}.json"
-        
+        """Cria snapshot online completo do estado atual"""
         try:
-            backup_data = {
-                "timestamp": get_timestamp(),
-                "proposals": cls.load_proposals(),
-                "decrees": cls.load_decrees(),
-                "pacts": cls.load_pacts(),
-                "operational_status": cls.load_operational_status()
-            }
-            
-            with open(backup_file, 'w', encoding='utf-8') as f:
-                json.dump(backup_data, f, indent=2, ensure_ascii=False)
-            
+            backup_file = get_state_store().create_backup()
             logging.info(f"Backup criado: {backup_file}")
             return {"status": "success", "backup_file": str(backup_file)}
-            
         except Exception as e:
             logging.error(f"Erro ao criar backup: {e}")
             return {"status": "error", "message": str(e)}
 
     @classmethod
     def list_backups(cls) -> List[Dict[str, Any]]:
-        """Lista todos os backups disponíveis"""
-        ensure_backup_dir()
-        backups = []
-        for backup_file in BACKUP_DIR.glob("backup_*.json"):
-            try:
-                with open(backup_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                backups.append({
-                    "file": backup_file.name,
-                    "timestamp": data.get("timestamp", "Unknown"),
-                    "size": backup_file.stat().st_size,
-                    "proposals_count": len(data.get("proposals", {})),
-                    "decrees_count": len(data.get("decrees", {})),
-                    "pacts_count": len(data.get("pacts", {}))
-                })
-            except Exception as e:
-                logging.error(f"Erro ao ler backup {backup_file}: {e}")
-        
-        return sorted(backups, key=lambda x: x["file"], reverse=True)
+        """Lista todos os backups disponíveis (a partir da tabela de metadados)"""
+        return get_state_store().list_backups()
 
     @classmethod
     def restore_backup(cls, backup_filename: str) -> Dict[str, Any]:
-        """Restaura estado a partir de um backup"""
+        """Restaura estado a partir de um backup (.db ou .json legado)"""
         backup_file = BACKUP_DIR / backup_filename
         if not backup_file.exists():
             return {"status": "error", "message": f"Backup não encontrado: {backup_filename}"}
         
         try:
-            with open(backup_file, 'r', encoding='utf-8') as f:
-                backup_data = json.load(f)
-            
             # Cria backup atual antes da restauração
             cls.create_backup()
-            
-            # Restaura dados
-            cls.save_proposals(backup_data.get("proposals", {}))
-            cls.save_decrees(backup_data.get("decrees", {}))
-            cls.save_pacts(backup_data.get("pacts", {}))
-            cls.save_operational_status(backup_data.get("operational_status", {}))
+            backup_data = get_state_store().restore(backup_file)
             
             logging.info(f"Backup restaurado: {backup_filename}")
             return {
@@ -234,7 +446,7 @@ class PersistentStateManager:
                     "proposals": len(backup_data.get("proposals", {})),
                     "decrees": len(backup_data.get("decrees", {})),
                     "pacts": len(backup_data.get("pacts", {})),
-                    "timestamp": backup_data.get("timestamp", "Unknown")
+                    "timestamp": backup_data.get("_timestamp", "Unknown")
                 }
             }
             
@@ -267,14 +479,15 @@ class M45IntegrationBridge:
     def import_from_m45_memory(cls, m45_data: Dict[str, Any]):
         """Importa dados da memória do M45.1 (simulação)"""
         try:
-            if "proposals" in m45_data:
-                PersistentStateManager.save_proposals(m45_data["proposals"])
-            if "decrees" in m45_data:
-                PersistentStateManager.save_decrees(m45_data["decrees"])
-            if "inter_species_pacts" in m45_data:
-                PersistentStateManager.save_pacts(m45_data["inter_species_pacts"])
-            if "operational_status" in m45_data:
-                PersistentStateManager.save_operational_status(m45_data["operational_status"])
+            with PersistentStateManager.transaction():
+                if "proposals" in m45_data:
+                    PersistentStateManager.save_proposals(m45_data["proposals"])
+                if "decrees" in m45_data:
+                    PersistentStateManager.save_decrees(m45_data["decrees"])
+                if "inter_species_pacts" in m45_data:
+                    PersistentStateManager.save_pacts(m45_data["inter_species_pacts"])
+                if "operational_status" in m45_data:
+                    PersistentStateManager.save_operational_status(m45_data["operational_status"])
             
             logging.info("Dados importados do M45.1 (simulação)")
             return {"status": "success", "message": "Dados importados com sucesso"}
@@ -286,27 +499,21 @@ class M45IntegrationBridge:
     @classmethod
     def get_system_health(cls) -> Dict[str, Any]:
         """Retorna saúde do sistema de persistência"""
-        proposals = PersistentStateManager.load_proposals()
-        decrees = PersistentStateManager.load_decrees()
-        pacts = PersistentStateManager.load_pacts()
-        status = PersistentStateManager.load_operational_status()
+        counts = get_state_store().counts()
         backups = PersistentStateManager.list_backups()
         
         return {
             "timestamp": get_timestamp(),
             "health": "optimal",
             "storage": {
-                "proposals": len(proposals),
-                "decrees": len(decrees),
-                "pacts": len(pacts),
-                "status_entries": len(status),
+                "proposals": counts["proposals"],
+                "decrees": counts["decrees"],
+                "pacts": counts["pacts"],
+                "status_entries": counts["status"],
                 "backups": len(backups)
             },
             "files": {
-                "proposals_file": PROPOSALS_FILE.exists(),
-                "decrees_file": DECREES_FILE.exists(),
-                "pacts_file": PACTS_FILE.exists(),
-                "status_file": STATUS_FILE.exists(),
+                "state_db": STATE_DB_FILE.exists(),
                 "backup_dir": BACKUP_DIR.exists()
             }
         }
@@ -415,6 +622,58 @@ class PersistenceAnalytics:
             "effectiveness_score": round(coherence_stats["Coerente"] / len(decrees), 2) if decrees else 0
         }
 
+# ───────────────────────────────────────── BENCHMARK ────────────────────────
+
+def benchmark_persistence(proposals: int = 500, votes: int = 2000, workdir: Path = Path('/tmp/m45_2_bench')) -> Dict[str, Any]:
+    """Votação sustentada: reescrita do JSON inteiro por voto (modo antigo) x upsert por registro no SQLite."""
+    import random
+    import shutil
+    shutil.rmtree(workdir, ignore_errors=True)
+    workdir.mkdir(parents=True)
+    rng = random.Random(45)
+    state = {f"PROP-{i:05d}": {"title": f"Proposta {i}", "status": "Aberta", "priority": "Normal",
+                               "category": "Governança", "timestamp": get_timestamp(), "votes": {}} for i in range(proposals)}
+    ballots = [(f"PROP-{rng.randrange(proposals):05d}", f"membro_{rng.randrange(300)}",
+                {"value": rng.choice(["sim", "não", "abstenção"]), "ts": get_timestamp()}) for _ in range(votes)]
+
+    legacy_file = workdir / 'proposals.json'
+    t0 = time.perf_counter()
+    for prop_id, voter, vote in ballots:
+        state[prop_id]["votes"][voter] = vote
+        with open(legacy_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2, ensure_ascii=False)
+    legacy_s = time.perf_counter() - t0
+
+    for prop in state.values():
+        prop["votes"] = {}
+    store = SQLiteStateStore(workdir / 'state.db', workdir / 'backups', migrate_legacy=False)
+    store.upsert_many("proposals", state)
+    t0 = time.perf_counter()
+    for prop_id, voter, vote in ballots:
+        with store.transaction():
+            proposal = store.get("proposals", prop_id)
+            proposal["votes"][voter] = vote
+            store.upsert("proposals", prop_id, proposal)
+    sqlite_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    store.create_backup()
+    backup_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    listed = store.list_backups()
+    list_s = time.perf_counter() - t0
+    same = store.load("proposals") == json.loads(legacy_file.read_text('utf-8'))
+    store.close()
+    shutil.rmtree(workdir, ignore_errors=True)
+    return {
+        "proposals": proposals, "votes": votes,
+        "json_rewrite_votes_per_s": round(votes / legacy_s, 1),
+        "sqlite_votes_per_s": round(votes / sqlite_s, 1),
+        "backup_ms": round(backup_s * 1000, 2),
+        "list_backups_ms": round(list_s * 1000, 3),
+        "backups_listed": len(listed),
+        "state_matches": same,
+    }
+
 # ───────────────────────────────────────── CLI ──────────────────────────────
 
 def build_cli() -> argparse.ArgumentParser:
@@ -454,6 +713,10 @@ def build_cli() -> argparse.ArgumentParser:
     p_clean = sub.add_parser("clean_old_data", help="Limpa dados antigos (cuidado!)")
     p_clean.add_argument("--days_old", type=int, default=30, help="Dias para considerar como antigo")
     
+    p_bench = sub.add_parser("bench", help="Compara reescrita JSON por voto com upsert SQLite")
+    p_bench.add_argument("--proposals", type=int, default=500, help="Número de propostas")
+    p_bench.add_argument("--votes", type=int, default=2000, help="Número de votos")
+    
     return parser
 
 def main():
@@ -538,6 +801,9 @@ def main():
         }
         print(json.dumps(result, indent=2, ensure_ascii=False))
     
+    elif cmd == "bench":
+        print(json.dumps(benchmark_persistence(args.proposals, args.votes), indent=2, ensure_ascii=False))
+    
     else:
         parser.print_help()
 
@@ -3,15 +3,18 @@
 # 🚀 OBRA-PRIMA DEFINITIVA EXPANDIDA - OFFLINE & AUTÔNOMO
 
 import math
+import sys
 import time
 import random
 import json
 import hashlib
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
-from collections import defaultdict
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+from dataclasses import dataclass, asdict, field
+from collections import defaultdict, deque
+import heapq
+from array import array
 import numpy as np
 
 # =============================================================================
@@ -71,39 +74,175 @@ COMPLEMENTO = {
 # 📚 ATLAS DOS SONHOS - CÓDICE VIVO
 # =============================================================================
 
-class CodiceSonhos:
-    """Atlas onírico coletivo - Registro de padrões emergentes"""
-    
+class ContadorTopK:
+    """
+    Contador com consulta top-k por heap preguiçoso.
+    Ajustar só atualiza o dicionário e marca a chave; na consulta as chaves
+    marcadas entram no heap como (-contagem, ordem, chave), entradas
+    desatualizadas são descartadas ao sair e o heap é reconstruído quando
+    cresce demais, ficando limitado a O(chaves vivas). Empates seguem a ordem
+    da primeira aparição da chave, como no sorted estável anterior.
+    """
+
     def __init__(self):
-        self.padroes = defaultdict(int)
-        self.arquetipos = defaultdict(int)
-        self.frequencias = defaultdict(int)
-        self.simbolos_coletivos = defaultdict(int)
+        self.contagens: Dict[Any, int] = {}
+        self._ordem: Dict[Any, int] = {}
+        self._heap: List[Tuple[int, int, Any]] = []
+        self._alteradas: set = set()
+        self._seq = 0
+
+    def ajustar(self, chave: Any, delta: int):
+        novo = self.contagens.get(chave, 0) + delta
+        if novo <= 0:
+            self.contagens.pop(chave, None)
+            self._ordem.pop(chave, None)
+            return
+        if chave not in self._ordem:
+            self._ordem[chave] = self._seq
+            self._seq += 1
+        self.contagens[chave] = novo
+        self._alteradas.add(chave)
+
+    def top(self, k: int) -> List[Tuple[Any, int]]:
+        """As k chaves mais frequentes em O((k + alteradas) log n) amortizado."""
+        if len(self._heap) + len(self._alteradas) > 4 * len(self.contagens) + 64:
+            self._heap = [(-c, self._ordem[ch], ch) for ch, c in self.contagens.items()]
+            heapq.heapify(self._heap)
+        else:
+            for chave in self._alteradas:
+                if chave in self.contagens:
+                    heapq.heappush(self._heap, (-self.contagens[chave], self._ordem[chave], chave))
+        self._alteradas.clear()
+        resultado: List[Tuple[Any, int]] = []
+        validos: List[Tuple[int, int, Any]] = []
+        vistos = set()
+        while self._heap and len(resultado) < k:
+            entrada = heapq.heappop(self._heap)
+            neg, ordem, chave = entrada
+            if chave in vistos or self.contagens.get(chave) != -neg or self._ordem.get(chave) != ordem:
+                continue
+            vistos.add(chave)
+            validos.append(entrada)
+            resultado.append((chave, -neg))
+        for entrada in validos:
+            heapq.heappush(self._heap, entrada)
+        return resultado
+
+    def __getitem__(self, chave: Any) -> int:
+        return self.contagens.get(chave, 0)
+
+    def __contains__(self, chave: Any) -> bool:
+        return chave in self.contagens
+
+    def __len__(self) -> int:
+        return len(self.contagens)
+
+    def __iter__(self):
+        return iter(self.contagens)
+
+    def items(self):
+        return self.contagens.items()
+
+@dataclass
+class BaldeSonhos:
+    """Contagens de uma fatia de tempo; expira inteira de uma vez."""
+    indice: int
+    padroes: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    arquetipos: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    frequencias: Dict[int, int] = field(default_factory=lambda: defaultdict(int))
+    simbolos_coletivos: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    registros: int = 0
+
+class CodiceSonhos:
+    """
+    Atlas onírico coletivo - Registro de padrões emergentes.
+    Os registros são agrupados em baldes de largura_balde num anel que cobre
+    janela_retencao; ao expirar, um balde inteiro é descontado dos contadores.
+    Os contadores refletem apenas a janela retida e o histórico detalhado
+    guarda os últimos max_registros, então a memória fica limitada.
+
+    Registros atrasados (timestamp anterior ao balde mais novo) entram no balde
+    do seu próprio instante, para expirarem na hora certa; os que já caíram fora
+    da janela retida são descartados e contados em descartados_fora_da_janela.
+    """
+
+    CONTADORES = ("padroes", "arquetipos", "frequencias", "simbolos_coletivos")
+
+    def __init__(self, janela_retencao: timedelta = timedelta(days=30),
+                 largura_balde: timedelta = timedelta(hours=1), max_registros: int = 1000):
+        self.padroes = ContadorTopK()
+        self.arquetipos = ContadorTopK()
+        self.frequencias = ContadorTopK()
+        self.simbolos_coletivos = ContadorTopK()
         self.ultima_atualizacao = None
-        self.historico = []
+        self.historico: deque = deque(maxlen=max_registros)
+        self.janela_retencao = janela_retencao
+        self._largura = largura_balde.total_seconds()
+        self._baldes_na_janela = math.ceil(janela_retencao.total_seconds() / self._largura)
+        self._baldes: deque = deque()
+        self.descartados_fora_da_janela = 0
         
-    def registrar_sonho(self, simbolo: str, frequencia: int, arquetipo: str, intensidade: float = 1.0):
-        """Registra um padrão de sonho no códice"""
-        timestamp = datetime.now()
+    def _balde_para(self, indice: int) -> Optional[BaldeSonhos]:
+        """Balde do índice pedido (criado se preciso), ou None se já está fora da janela."""
+        if not self._baldes or self._baldes[-1].indice < indice:
+            self._expirar_ate(indice - self._baldes_na_janela)
+            self._baldes.append(BaldeSonhos(indice))
+            return self._baldes[-1]
+        if indice < self._baldes[-1].indice - self._baldes_na_janela:
+            return None
+        # atrasado: procura a partir do fim, onde costumam cair
+        pos = len(self._baldes) - 1
+        while pos >= 0 and self._baldes[pos].indice > indice:
+            pos -= 1
+        if pos >= 0 and self._baldes[pos].indice == indice:
+            return self._baldes[pos]
+        self._baldes.insert(pos + 1, BaldeSonhos(indice))
+        return self._baldes[pos + 1]
+
+    def _indice_balde(self, instante: datetime) -> int:
+        return int(instante.timestamp() // self._largura)
+
+    def registrar_sonho(self, simbolo: str, frequencia: int, arquetipo: str, intensidade: float = 1.0,
+                        timestamp: Optional[datetime] = None) -> bool:
+        """Registra um padrão de sonho no códice. Retorna False se o registro já estava fora da janela."""
+        timestamp = timestamp or datetime.now()
+        balde = self._balde_para(self._indice_balde(timestamp))
+        if balde is None:
+            self.descartados_fora_da_janela += 1
+            return False
         
-        self.padroes[simbolo] += 1
-        self.frequencias[frequencia] += 1
-        self.arquetipos[arquetipo] += 1
-        self.simbolos_coletivos[simbolo] += int(intensidade * 100)
+        peso = int(intensidade * 100)
+        balde.padroes[simbolo] += 1
+        balde.frequencias[frequencia] += 1
+        balde.arquetipos[arquetipo] += 1
+        balde.simbolos_coletivos[simbolo] += peso
+        balde.registros += 1
+        self.padroes.ajustar(simbolo, 1)
+        self.frequencias.ajustar(frequencia, 1)
+        self.arquetipos.ajustar(arquetipo, 1)
+        self.simbolos_coletivos.ajustar(simbolo, peso)
         self.ultima_atualizacao = timestamp
         
-        registro = {
+        self.historico.append({
             "timestamp": timestamp.isoformat(),
             "simbolo": simbolo,
             "frequencia": frequencia,
             "arquetipo": arquetipo,
             "intensidade": intensidade
-        }
-        self.historico.append(registro)
-        
-        # Manter apenas os últimos 1000 registros para performance
-        if len(self.historico) > 1000:
-            self.historico = self.historico[-1000:]
+        })
+        return True
+    
+    def _expirar_ate(self, limite: int) -> int:
+        """Descarta os baldes com índice < limite; custo proporcional aos baldes expirados."""
+        removidos = 0
+        while self._baldes and self._baldes[0].indice < limite:
+            balde = self._baldes.popleft()
+            for nome in self.CONTADORES:
+                contador = getattr(self, nome)
+                for chave, quantidade in getattr(balde, nome).items():
+                    contador.ajustar(chave, -quantidade)
+            removidos += balde.registros
+        return removidos
     
     def padrao_balanca_universal(self):
         """Padrão fundamental de equilíbrio cósmico"""
@@ -114,16 +253,19 @@ class CodiceSonhos:
     def obter_padroes_dominantes(self, limite: int = 10) -> Dict:
         """Retorna os padrões mais frequentes"""
         return {
-            "padroes": dict(sorted(self.padroes.items(), key=lambda x: x[1], reverse=True)[:limite]),
-            "arquetipos": dict(sorted(self.arquetipos.items(), key=lambda x: x[1], reverse=True)[:limite]),
-            "frequencias": dict(sorted(self.frequencias.items(), key=lambda x: x[1], reverse=True)[:limite])
+            "padroes": dict(self.padroes.top(limite)),
+            "arquetipos": dict(self.arquetipos.top(limite)),
+            "frequencias": dict(self.frequencias.top(limite))
         }
     
-    def limpar_registros_antigos(self, dias: int = 30):
-        """Limpa registros mais antigos que X dias"""
+    def limpar_registros_antigos(self, dias: int = 30) -> int:
+        """Limpa registros mais antigos que X dias (na granularidade do balde). Retorna quantos saíram."""
         cutoff = datetime.now() - timedelta(days=dias)
-        self.historico = [r for r in self.historico 
-                         if datetime.fromisoformat(r["timestamp"]) > cutoff]
+        removidos = self._expirar_ate(self._indice_balde(cutoff))
+        limite = cutoff.isoformat()
+        while self.historico and self.historico[0]["timestamp"] <= limite:
+            self.historico.popleft()
+        return removidos
 
 # =============================================================================
 # 🛡️ SISTEMA DE SALVAGUARDAS ÉTICAS AVANÇADAS
@@ -271,60 +413,147 @@ class IntegradorCosmico:
 # =============================================================================
 
 class MapaFractal:
-    """Representação fractal da interconexão entre módulos e equações"""
+    """
+    Representação fractal da interconexão entre módulos e equações.
+    Mantém grau e força total por elemento e as somas globais, então a
+    coerência sai em O(1) a cada conexão. As arestas também ficam em colunas
+    (arrays de índices e forças) para exportação CSR vetorizada.
+    """
     
-    def __init__(self):
+    def __init__(self, codice: Optional[CodiceSonhos] = None):
         self.config = COMPLEMENTO["mapa_fractal"]
         self.conexoes = defaultdict(list)
         self.niveis = {}
+        self.codice = codice if codice is not None else CodiceSonhos()
+        self.forca_por_elemento: Dict[str, float] = defaultdict(float)
+        self.total_forca = 0.0
+        self.total_conexoes = 0
+        self._indices: Dict[str, int] = {}
+        self._origens = array('q')
+        self._destinos = array('q')
+        self._forcas = array('d')
         
+    def _indice(self, elemento: str) -> int:
+        indice = self._indices.get(elemento)
+        if indice is None:
+            indice = self._indices[elemento] = len(self._indices)
+        return indice
+
+    def _adicionar(self, origem: str, destino: str, forca: float):
+        self.conexoes[origem].append({"destino": destino, "forca": forca})
+        self.forca_por_elemento[origem] += forca
+        self._origens.append(self._indice(origem))
+        self._destinos.append(self._indice(destino))
+        self._forcas.append(forca)
+
+    @staticmethod
+    def _validar_conexao(conexao, posicao: int = 0) -> Tuple[str, str, float]:
+        """Normaliza (origem, destino, força) antes de qualquer mutação; ValueError se malformada."""
+        try:
+            origem, destino, forca = conexao
+            return origem, destino, float(forca)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"MapaFractal: conexão inválida na posição {posicao}: {conexao!r}") from e
+
     def registrar_conexao(self, origem: str, destino: str, forca: float):
         """Registra conexão entre elementos da Fundação"""
-        self.conexoes[origem].append({"destino": destino, "forca": forca})
+        origem, destino, forca = self._validar_conexao((origem, destino, forca))
+        self._adicionar(origem, destino, forca)
+        self.total_forca += forca
+        self.total_conexoes += 1
         
         # Atualiza códice de sonhos com padrão fractal
-        codice = CodiceSonhos()
-        codice.registrar_sonho(
+        self.codice.registrar_sonho(
             simbolo="arvore_fractal", 
             frequencia=1111, 
             arquetipo="interconexao",
             intensidade=forca
         )
     
+    def registrar_conexoes(self, conexoes: Iterable[Tuple[str, str, float]]) -> int:
+        """
+        Registra um lote de conexões (origem, destino, força) numa passada.
+        O lote inteiro é validado antes de mutar o mapa: uma conexão malformada
+        levanta ValueError e nada é registrado. As somas globais são atualizadas
+        uma vez ao final e o lote gera um único padrão no códice, com a força
+        média como intensidade.
+        """
+        lote = [self._validar_conexao(conexao, posicao) for posicao, conexao in enumerate(conexoes)]
+        if not lote:
+            return 0
+        forcas: List[float] = []
+        for origem, destino, forca in lote:
+            self._adicionar(origem, destino, forca)
+            forcas.append(forca)
+        self.total_forca += math.fsum(forcas)
+        self.total_conexoes += len(forcas)
+        self.codice.registrar_sonho(
+            simbolo="arvore_fractal",
+            frequencia=1111,
+            arquetipo="interconexao",
+            intensidade=math.fsum(forcas) / len(forcas)
+        )
+        return len(forcas)
+    
     def visualizar_rede_viva(self) -> Dict:
         """Gera visualização da rede viva da Fundação"""
-        elementos = list(self.conexoes.keys())
         rede = {}
         
-        for elemento in elementos:
-            conexoes = self.conexoes[elemento]
+        for elemento, conexoes in self.conexoes.items():
             rede[elemento] = {
                 "grau_conexao": len(conexoes),
-                "forca_total": sum(c["forca"] for c in conexoes),
+                "forca_total": self.forca_por_elemento[elemento],
                 "conexoes_ativas": conexoes
             }
         
         return {
             "rede_viva": rede,
-            "total_elementos": len(elementos),
-            "total_conexoes": sum(len(conexoes) for conexoes in self.conexoes.values()),
+            "total_elementos": len(self.conexoes),
+            "total_conexoes": self.total_conexoes,
             "coerencia_rede": self._calcular_coerencia_rede()
         }
     
     def _calcular_coerencia_rede(self) -> float:
-        """Calcula coerência geral da rede fractal"""
-        if not self.conexoes:
-            return 0.0
-        
-        total_forca = 0
-        total_conexoes = 0
-        
-        for conexoes in self.conexoes.values():
-            for conexao in conexoes:
-                total_forca += conexao["forca"]
-                total_conexoes += 1
-        
-        return total_forca / total_conexoes if total_conexoes > 0 else 0.0
+        """Calcula coerência geral da rede fractal (força média por conexão)"""
+        return self.total_forca / self.total_conexoes if self.total_conexoes > 0 else 0.0
+
+    def exportar_csr(self) -> Dict[str, Any]:
+        """
+        Snapshot CSR da rede: linha i = elemento nos[i], colunas indices[indptr[i]:indptr[i+1]]
+        com forças em pesos. Arestas da mesma origem mantêm a ordem de registro.
+        """
+        n = len(self._indices)
+        # cópias: uma view do buffer impediria novos append nos arrays
+        origens = np.frombuffer(self._origens, dtype=np.int64).copy()
+        ordem = np.argsort(origens, kind="stable")
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(origens, minlength=n), out=indptr[1:])
+        return {
+            "nos": list(self._indices),
+            "indptr": indptr,
+            "indices": np.frombuffer(self._destinos, dtype=np.int64)[ordem],
+            "pesos": np.frombuffer(self._forcas, dtype=np.float64)[ordem]
+        }
+
+    @staticmethod
+    def analisar_csr(csr: Dict[str, Any], top: int = 10) -> Dict[str, Any]:
+        """Métricas da rede a partir do snapshot CSR, sem laços Python por aresta."""
+        indptr, indices, pesos = csr["indptr"], csr["indices"], csr["pesos"]
+        n = len(indptr) - 1
+        grau_saida = np.diff(indptr)
+        linhas = np.repeat(np.arange(n), grau_saida)
+        forca_saida = np.bincount(linhas, weights=pesos, minlength=n)
+        grau_entrada = np.bincount(indices, minlength=n)
+        forca_entrada = np.bincount(indices, weights=pesos, minlength=n)
+        centrais = np.argsort(-(forca_saida + forca_entrada), kind="stable")[:top]
+        return {
+            "total_nos": int(n),
+            "total_conexoes": int(len(pesos)),
+            "coerencia_rede": float(pesos.mean()) if len(pesos) else 0.0,
+            "grau_saida_max": int(grau_saida.max()) if n else 0,
+            "grau_entrada_max": int(grau_entrada.max()) if n else 0,
+            "elementos_centrais": {csr["nos"][i]: round(float(forca_saida[i] + forca_entrada[i]), 6) for i in centrais}
+        }
 
 # =============================================================================
 # 📖 BIBLIOTECA AKÁSHICA - ARQUÉTIPOS VIVOS DA EQ0040
@@ -481,9 +710,9 @@ class TransmissorSonhosCosmicosExpandido:
         self.salvaguarda = SalvaguardaEtica()
         self.harmonizador_dinamico = HarmonizadorDinamico()
         self.integrador_cosmico = IntegradorCosmico()
-        self.mapa_fractal = MapaFractal()
-        self.biblioteca_akashica = BibliotecaAkashica()
         self.codice_sonhos = CodiceSonhos()
+        self.mapa_fractal = MapaFractal(codice=self.codice_sonhos)
+        self.biblioteca_akashica = BibliotecaAkashica()
         
         # Sistemas herdados (simplificados para exemplo)
         self.equacoes_vivas = self._inicializar_equacoes_conscientes()
@@ -661,11 +890,145 @@ def testar_salvaguardas_eticas():
     aprovado, motivo = salvaguarda.validar_transmissao(payload_invalido)
     print(f"   Payload inválido: {aprovado} ({motivo})")
 
+def benchmark_codice_sonhos(registros: int = 200_000, simbolos: int = 50_000, consultas_a_cada: int = 100,
+                            janela_horas: int = 24) -> Dict:
+    """
+    Fluxo contínuo de registros (um por segundo simulado) com consulta top-10
+    periódica: ordenação completa dos contadores (modo antigo) contra o heap
+    do CodiceSonhos com anel de baldes de 1h. Os dois lados retêm a mesma janela
+    (o modo antigo ganha a mesma expiração por balde), então ordenam o mesmo
+    conjunto de chaves; só a estrutura de consulta muda.
+    """
+    rng = random.Random(201)
+    # cauda longa de símbolos raros com alguns padrões dominantes
+    fluxo = [(f"simbolo_{int(rng.paretovariate(0.3)) % simbolos}", rng.choice((432, 528, 963, 1111)),
+              rng.choice(("equilíbrio", "humildade", "vastidão", "cura"))) for _ in range(registros)]
+    inicio = datetime(2025, 1, 1)
+    resultado = {"registros": registros, "simbolos": simbolos, "consultas": registros // consultas_a_cada}
+
+    resultado["janela_horas"] = janela_horas
+    codice = CodiceSonhos(janela_retencao=timedelta(hours=janela_horas))
+    largura, n_baldes = codice._largura, codice._baldes_na_janela
+
+    # modo antigo: contadores em dicts, histórico fatiado a cada registro, sort completo por
+    # consulta; expira os registros na mesma granularidade de balde do códice
+    padroes, arquetipos, frequencias = defaultdict(int), defaultdict(int), defaultdict(int)
+    historico: List[Dict] = []
+    retidos: deque = deque()
+    t0 = time.perf_counter()
+    for i, (simbolo, frequencia, arquetipo) in enumerate(fluxo):
+        instante = inicio + timedelta(seconds=i)
+        indice = int(instante.timestamp() // largura)
+        while retidos and retidos[0][0] < indice - n_baldes:
+            _, s_ant, f_ant, a_ant = retidos.popleft()
+            for contador, chave in ((padroes, s_ant), (frequencias, f_ant), (arquetipos, a_ant)):
+                contador[chave] -= 1
+                if not contador[chave]:
+                    del contador[chave]
+        retidos.append((indice, simbolo, frequencia, arquetipo))
+        padroes[simbolo] += 1; frequencias[frequencia] += 1; arquetipos[arquetipo] += 1
+        historico.append({"timestamp": instante.isoformat(), "simbolo": simbolo,
+                          "frequencia": frequencia, "arquetipo": arquetipo, "intensidade": 0.9})
+        if len(historico) > 1000:
+            historico = historico[-1000:]
+        if i % consultas_a_cada == 0:
+            for contador in (padroes, arquetipos, frequencias):
+                dict(sorted(contador.items(), key=lambda x: x[1], reverse=True)[:10])
+    resultado["ordenacao_completa_s"] = round(time.perf_counter() - t0, 4)
+    resultado["chaves_ordenacao"] = len(padroes)
+
+    t0 = time.perf_counter()
+    for i, (simbolo, frequencia, arquetipo) in enumerate(fluxo):
+        codice.registrar_sonho(simbolo, frequencia, arquetipo, 0.9, timestamp=inicio + timedelta(seconds=i))
+        if i % consultas_a_cada == 0:
+            codice.obter_padroes_dominantes(10)
+    resultado["heap_com_baldes_s"] = round(time.perf_counter() - t0, 4)
+    resultado["baldes_ativos"] = len(codice._baldes)
+    resultado["chaves_vivas"] = len(codice.padroes)
+    resultado["tamanho_heap"] = len(codice.padroes._heap)
+
+    # conferência do top-k contra a ordenação completa da janela retida
+    esperado = sorted(codice.padroes.items(), key=lambda x: x[1], reverse=True)[:10]
+    resultado["top_confere"] = [c for _, c in esperado] == [c for _, c in codice.padroes.top(10)]
+    resultado["mesmas_chaves"] = dict(padroes) == dict(codice.padroes.items())
+
+    # registros atrasados: dentro da janela vão para o próprio balde, fora dela são descartados
+    fim = inicio + timedelta(seconds=registros - 1)
+    antes = codice.padroes["atrasado"]
+    dentro = codice.registrar_sonho("atrasado", 432, "cura", 0.9, timestamp=fim - timedelta(hours=janela_horas // 2))
+    fora = codice.registrar_sonho("atrasado", 432, "cura", 0.9, timestamp=fim - timedelta(hours=janela_horas + 2))
+    resultado["atrasados_conferem"] = (dentro and not fora and codice.padroes["atrasado"] == antes + 1
+                                       and codice.descartados_fora_da_janela == 1)
+    return resultado
+
+def benchmark_mapa_fractal(tamanhos: Tuple[int, ...] = (2_000, 4_000, 8_000), conexoes_csr: int = 500_000,
+                           elementos: int = 5_000) -> Dict:
+    """
+    Construção da rede com a coerência consultada a cada conexão: recálculo
+    sobre todas as arestas (modo antigo, quadrático) contra as somas mantidas,
+    o lote registrar_conexoes e a análise vetorizada sobre o snapshot CSR.
+    """
+    rng = random.Random(201)
+    resultado: Dict[str, Any] = {"incremental": {}}
+
+    for n in tamanhos:
+        arestas = [(f"M{rng.randrange(elementos)}", f"M{rng.randrange(elementos)}", rng.random()) for _ in range(n)]
+        conexoes = defaultdict(list)
+        t0 = time.perf_counter()
+        for origem, destino, forca in arestas:
+            conexoes[origem].append({"destino": destino, "forca": forca})
+            total = sum(c["forca"] for lista in conexoes.values() for c in lista)
+            antiga = total / sum(len(lista) for lista in conexoes.values())
+        tempo_antigo = time.perf_counter() - t0
+
+        mapa = MapaFractal()
+        t0 = time.perf_counter()
+        for origem, destino, forca in arestas:
+            mapa.registrar_conexao(origem, destino, forca)
+            nova = mapa._calcular_coerencia_rede()
+        tempo_novo = time.perf_counter() - t0
+
+        lote = MapaFractal()
+        t0 = time.perf_counter()
+        lote.registrar_conexoes(arestas)
+        tempo_lote = time.perf_counter() - t0
+        resultado["incremental"][str(n)] = {
+            "recalculo_s": round(tempo_antigo, 4), "incremental_s": round(tempo_novo, 4), "lote_s": round(tempo_lote, 4),
+            "diferenca": abs(antiga - nova) + abs(antiga - lote._calcular_coerencia_rede())
+        }
+
+    mapa = MapaFractal()
+    mapa.registrar_conexoes((f"M{rng.randrange(elementos)}", f"M{rng.randrange(elementos)}", rng.random())
+                            for _ in range(conexoes_csr))
+    t0 = time.perf_counter()
+    forca_total = {e: sum(c["forca"] for c in lista) for e, lista in mapa.conexoes.items()}
+    grau_entrada = defaultdict(int)
+    for lista in mapa.conexoes.values():
+        for c in lista:
+            grau_entrada[c["destino"]] += 1
+    tempo_laco = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    analise = MapaFractal.analisar_csr(mapa.exportar_csr())
+    tempo_csr = time.perf_counter() - t0
+    resultado["analise"] = {
+        "conexoes": conexoes_csr, "laco_python_s": round(tempo_laco, 4), "csr_numpy_s": round(tempo_csr, 4),
+        "grau_entrada_confere": analise["grau_entrada_max"] == max(grau_entrada.values()),
+        "coerencia_confere": abs(analise["coerencia_rede"] - mapa._calcular_coerencia_rede()) < 1e-9
+    }
+    return resultado
+
 # =============================================================================
 # 🚀 EXECUÇÃO PRINCIPAL
 # =============================================================================
 
 if __name__ == "__main__":
+    if "--bench-codice" in sys.argv:
+        print(json.dumps(benchmark_codice_sonhos(), indent=2, ensure_ascii=False))
+        sys.exit(0)
+    if "--bench-mapa" in sys.argv:
+        print(json.dumps(benchmark_mapa_fractal(), indent=2, ensure_ascii=False))
+        sys.exit(0)
+    
     print("=" * 80)
     print("🎨 MÓDULO M201 - VERSÃO EXPANDIDA DEFINITIVA")
     print("💫 TODOS OS COMPLEMENTOS INTEGRADOS")
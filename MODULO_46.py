@@ -13,6 +13,7 @@ import zlib
 import base64
 import threading
 import traceback
+import itertools
 from typing import List, Dict, Union
 
 # Garante que o diretório de logs exista antes de configurar o logger
@@ -74,6 +75,7 @@ CANAL_RESSONANTE = "Harmônico_Principal_∑-1"
 N = 144                  # Number of modules (Refletindo os 144 grids da Fundação)
 steps = 100              # REDUZIDO: Total simulation time in steps (para execução mais rápida)
 snapshot_interval = 10   # Interval for saving phase state snapshots (ajustado para novo steps)
+history_decimation = 1   # Grava 1 ponto da série histórica a cada N passos (médias usam todos os passos)
 
 # Calibration parameters for Phase V - Crystalline Optimization
 K0 = 9.0                 # Coupling coefficient (reinforced)
@@ -344,13 +346,191 @@ class MatrizQuanticaFundacao:
 # V. AELORIA'S MAIN SIMULATION MODEL (CORE)
 # ===============================================================
 
+class HistoricoVibracional:
+    """
+    Registro das séries da simulação em arrays NumPy pré-alocados.
+    - Os últimos `janela_recente` valores de cada campo são mantidos passo a passo
+      (IRV e detecção de transição de fase dependem deles).
+    - A série longa guarda um ponto a cada `decimacao` passos num buffer circular de
+      `capacidade` posições (por padrão, o suficiente para `passos` sem sobrescrever).
+    - Com `diretorio`, a série longa é um conjunto de .npy mapeados em memória, que os
+      exportadores leem em blocos sem carregar tudo.
+    - As médias são acumuladas sobre todos os passos, independentemente da decimação.
+    """
+    ARQUIVO_META = "historico.json"
+
+    def __init__(self, campos: List[str], passos: int, decimacao: int = 1, capacidade: int = None,
+                 janela_recente: int = 16, diretorio: str = None):
+        self.campos = list(campos)
+        self.decimacao = max(1, int(decimacao))
+        self.capacidade = max(1, capacidade or -(-max(1, passos) // self.decimacao))
+        self.janela_recente = janela_recente
+        self.diretorio = diretorio
+        self.total = 0
+        self.escritos = 0
+        self._somas = dict.fromkeys(self.campos, 0.0)
+        self._recentes = np.zeros((len(self.campos), janela_recente))
+        self._indice = {c: i for i, c in enumerate(self.campos)}
+
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+            abrir = lambda nome, tipo: np.lib.format.open_memmap(os.path.join(diretorio, f"{nome}.npy"),
+                                                                 mode="w+", dtype=tipo, shape=(self.capacidade,))
+        else:
+            abrir = lambda nome, tipo: np.zeros(self.capacidade, dtype=tipo)
+        self.passos = abrir("passos", np.int64)
+        self.series = {c: abrir(c, np.float64) for c in self.campos}
+
+    def __len__(self):
+        return self.total
+
+    def registrar(self, passo: int, **valores):
+        pos_recente = self.total % self.janela_recente
+        for campo, valor in valores.items():
+            self._recentes[self._indice[campo], pos_recente] = valor
+            self._somas[campo] += valor
+        if passo % self.decimacao == 0:
+            pos = self.escritos % self.capacidade
+            self.passos[pos] = passo
+            for campo, valor in valores.items():
+                self.series[campo][pos] = valor
+            self.escritos += 1
+        self.total += 1
+
+    def ultimo(self, campo: str, padrao: float = 0.0) -> float:
+        if not self.total:
+            return padrao
+        return float(self._recentes[self._indice[campo], (self.total - 1) % self.janela_recente])
+
+    def recentes(self, campo: str, n: int = None) -> np.ndarray:
+        """Últimos n valores (n ≤ janela_recente) em ordem cronológica, sem decimação."""
+        n = min(n or self.janela_recente, self.janela_recente, self.total)
+        idx = (np.arange(self.total - n, self.total)) % self.janela_recente
+        return self._recentes[self._indice[campo], idx]
+
+    def media(self, campo: str, padrao: float = 0.0) -> float:
+        return self._somas[campo] / self.total if self.total else padrao
+
+    def _ordem(self):
+        """Fatias (início, fim) do buffer circular em ordem cronológica."""
+        n = min(self.escritos, self.capacidade)
+        inicio = self.escritos % self.capacidade if self.escritos > self.capacidade else 0
+        return [(inicio, n)] + ([(0, inicio)] if inicio else [])
+
+    def serie(self, campo: str) -> np.ndarray:
+        """Série decimada completa em ordem cronológica (cópia)."""
+        return np.concatenate([self.series[campo][a:b] for a, b in self._ordem()])
+
+    def iterar_blocos(self, bloco: int = 65536):
+        """Gera (passos, {campo: valores}) em blocos cronológicos da série decimada."""
+        for a, b in self._ordem():
+            for i in range(a, b, bloco):
+                j = min(i + bloco, b)
+                yield np.asarray(self.passos[i:j]), {c: np.asarray(self.series[c][i:j]) for c in self.campos}
+
+    def fechar(self):
+        """Grava os metadados e descarrega os mapas de memória."""
+        if not self.diretorio:
+            return
+        for arr in (self.passos, *self.series.values()):
+            arr.flush()
+        meta = {"campos": self.campos, "capacidade": self.capacidade, "escritos": self.escritos,
+                "decimacao": self.decimacao, "total": self.total}
+        with open(os.path.join(self.diretorio, self.ARQUIVO_META), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+    @classmethod
+    def abrir(cls, diretorio: str) -> "HistoricoVibracional":
+        """Reabre (somente leitura) um histórico gravado por fechar(); as séries continuam em disco."""
+        with open(os.path.join(diretorio, cls.ARQUIVO_META), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        h = cls.__new__(cls)
+        h.campos, h.capacidade, h.escritos = meta["campos"], meta["capacidade"], meta["escritos"]
+        h.decimacao, h.total, h.diretorio = meta["decimacao"], meta["total"], None
+        h.passos = np.load(os.path.join(diretorio, "passos.npy"), mmap_mode="r")
+        h.series = {c: np.load(os.path.join(diretorio, f"{c}.npy"), mmap_mode="r") for c in h.campos}
+        return h
+
+class ArquivoSnapshots:
+    """
+    Snapshots de fase gravados em blocos durante a simulação.
+    Cada bloco reúne `tamanho_bloco` snapshots num buffer pré-alocado e é gravado como
+    snapshots_NNNNNN.npz (passos + matriz de fases). Sem diretório, os blocos ficam em memória.
+    """
+    def __init__(self, n_osciladores: int, diretorio: str = None, tamanho_bloco: int = 64):
+        self.diretorio = diretorio
+        self.tamanho_bloco = tamanho_bloco
+        self.passos: List[int] = []
+        self._buffer = np.empty((tamanho_bloco, n_osciladores))
+        self._buffer_passos = np.empty(tamanho_bloco, dtype=np.int64)
+        self._ocupados = 0
+        self._blocos = []  # caminhos em disco ou (passos, fases) em memória
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+            for nome in os.listdir(diretorio):
+                if nome.startswith("snapshots_") and nome.endswith(".npz"):
+                    os.remove(os.path.join(diretorio, nome))
+
+    def __len__(self):
+        return len(self.passos)
+
+    def adicionar(self, passo: int, theta: np.ndarray):
+        self._buffer[self._ocupados] = theta
+        self._buffer_passos[self._ocupados] = passo
+        self._ocupados += 1
+        self.passos.append(passo)
+        if self._ocupados == self.tamanho_bloco:
+            self._gravar_bloco()
+
+    def _gravar_bloco(self):
+        if not self._ocupados:
+            return
+        passos = self._buffer_passos[:self._ocupados]
+        fases = self._buffer[:self._ocupados]
+        if self.diretorio:
+            caminho = os.path.join(self.diretorio, f"snapshots_{len(self._blocos):06d}.npz")
+            with open(caminho + ".tmp", "wb") as f:
+                np.savez(f, passos=passos, fases=fases)
+            os.replace(caminho + ".tmp", caminho)
+            self._blocos.append(caminho)
+        else:
+            self._blocos.append((passos.copy(), fases.copy()))
+        self._ocupados = 0
+
+    def fechar(self):
+        self._gravar_bloco()
+
+    def iterar(self):
+        """Gera (passo, fases) bloco a bloco, incluindo o bloco ainda não gravado."""
+        for bloco in self._blocos:
+            if isinstance(bloco, str):
+                with np.load(bloco) as dados:
+                    passos, fases = dados["passos"], dados["fases"]
+            else:
+                passos, fases = bloco
+            for passo, theta in zip(passos, fases):
+                yield int(passo), theta
+        for i in range(self._ocupados):
+            yield int(self._buffer_passos[i]), self._buffer[i]
+
+def ler_snapshots(diretorio: str):
+    """Lê os blocos gravados por ArquivoSnapshots em ordem, um por vez."""
+    for nome in sorted(n for n in os.listdir(diretorio) if n.startswith("snapshots_") and n.endswith(".npz")):
+        with np.load(os.path.join(diretorio, nome)) as dados:
+            for passo, theta in zip(dados["passos"], dados["fases"]):
+                yield int(passo), theta
+
+
 class AeloriaModel:
     """
     O modelo de simulação central de Aeloria, gerenciando a coerência do módulo,
     dissonância e evolução vibracional.
     Contém todas as equações e lógica da Fase V.
     """
-    def __init__(self, N, K0, tau_c, alpha_base, beta_base, I_val_base, dt, A_r_initial, T_r):
+    CAMPOS_HISTORICO = ["pcg", "idv", "alpha", "beta", "I_val", "A_r", "irv"]
+
+    def __init__(self, N, K0, tau_c, alpha_base, beta_base, I_val_base, dt, A_r_initial, T_r,
+                 passos_previstos=None, decimacao=1, capacidade_historico=None, diretorio_saida=None):
         self.N = N
         self.K0 = K0
         self.tau_c = tau_c
@@ -371,55 +551,102 @@ class AeloriaModel:
         self.theta = np.random.uniform(0, 2*np.pi, N)
         self.r = np.random.uniform(0.3, 1.0, N)
 
-        self.psi = self.compute_psi()
-        self.H0 = np.eye(N, dtype=complex) * 0.1
-        self.H_op = self.H0.copy()
+        # Hamiltoniano e projetor do Amor são diagonais: guardamos só a diagonal (O(N) em vez de N×N)
+        self.H0_diag = np.full(N, 0.1, dtype=complex)
+        self.H_diag = self.H0_diag.copy()
         self.A = np.mean(self.theta)
-        self.P_Amor = np.eye(N, dtype=complex)
-
-        self.history_pcg = []
-        self.history_idv = []
-        self.history_alpha = []
-        self.history_beta = []
-        self.history_I_val = []
-        self.history_A_r = []
-        self.history_irv = []
-        self.snapshots = {}
+        self.P_Amor_diag = np.ones(N, dtype=complex)
+
+        # Buffers pré-alocados reutilizados a cada passo
+        self.psi = np.empty(N, dtype=complex)
+        self._exp_theta = np.empty(N, dtype=complex)
+        self._cbuf = np.empty(N, dtype=complex)
+        self._dtheta = np.empty(N)
+        self._tmp = np.empty(N)
+        self._coh_local = np.empty(N)
+        self._mask = np.empty(N, dtype=bool)
+        self.psi = self.compute_psi()
+
+        # Histórico pré-alocado (memmap em diretorio_saida/historico) e snapshots gravados em blocos
+        self.diretorio_saida = diretorio_saida
+        self.historico = HistoricoVibracional(
+            self.CAMPOS_HISTORICO, passos_previstos or steps, decimacao=decimacao, capacidade=capacidade_historico,
+            diretorio=os.path.join(diretorio_saida, "historico") if diretorio_saida else None)
+        self.snapshots = ArquivoSnapshots(
+            N, diretorio=os.path.join(diretorio_saida, "snapshots") if diretorio_saida else None)
         self.current_sim_time = 0.0
         logger.debug("AeloriaModel: Núcleo de simulação vibracional inicializado.")
 
+    @property
+    def history_pcg(self): return self.historico.serie("pcg")
+    @property
+    def history_idv(self): return self.historico.serie("idv")
+    @property
+    def history_irv(self): return self.historico.serie("irv")
+
+    @property
+    def H_op(self):
+        """Matriz densa do Hamiltoniano (apenas para inspeção; a simulação usa H_diag)."""
+        return np.diag(self.H_diag)
+
+    @property
+    def P_Amor(self):
+        return np.diag(self.P_Amor_diag)
+
+    def _update_exp_theta(self):
+        """Preenche o buffer exp(i·theta) sem alocar arrays novos."""
+        np.cos(self.theta, out=self._exp_theta.real)
+        np.sin(self.theta, out=self._exp_theta.imag)
+        return self._exp_theta
+
+    def _local_coherence(self):
+        """
+        Coerência leave-one-out de cada módulo em forma fechada:
+        |Σ_j e^{iθ_j} − e^{iθ_i}| / (N − 1), em O(N) no lugar de N chamadas a np.delete.
+        """
+        e = self._update_exp_theta()
+        total = e.sum()
+        np.abs(total - e, out=self._coh_local)
+        self._coh_local /= max(self.N - 1, 1)
+        return self._coh_local
+
     def compute_psi(self):
         """Calcula o vetor de estado Psi(t) = r_i * exp(i * theta_i) para cada módulo."""
-        return self.r * np.exp(1j * self.theta)
+        np.cos(self.theta, out=self._tmp)
+        np.multiply(self.r, self._tmp, out=self.psi.real)
+        np.sin(self.theta, out=self._tmp)
+        np.multiply(self.r, self._tmp, out=self.psi.imag)
+        return self.psi
     
     def compute_global_coherence(self):
         """Calcula o Potencial de Coerência Global (PCG) - Ordem de Kuramoto."""
-        return np.abs(np.sum(np.exp(1j * self.theta)) / self.N)
+        return np.abs(self._update_exp_theta().sum() / self.N)
     
     def compute_IDV(self):
         """Calcula o Índice de Dissonância Vibracional (IDV) médio dos módulos."""
         if self.N <= 1: return 0.0
-        VD = []
-        for i in range(self.N):
-            others_exp = np.delete(np.exp(1j * self.theta), i)
-            coh_local = np.abs(np.sum(others_exp) / (len(others_exp) if len(others_exp) > 0 else 1))
-            VD_i = 1 - coh_local
-            VD.append(VD_i)
-        return np.mean(VD)
+        return 1.0 - np.mean(self._local_coherence())
     
-    def compute_IRV(self):
+    def compute_IRV(self, pcg_atual=None, idv_atual=None):
         """
         Calcula o Índice de Resiliência Vibracional (IRV).
         IRV = 1 - |ΔPCG / Δt| (modulado por IDV médio)
         Equação: $\text{IRV} = 1 - \left| \frac{\Delta \text{PCG}}{\Delta t} \right| \cdot \text{IDV}_{\text{médio}}$
         """
-        if len(self.history_pcg) < 2 or len(self.history_idv) < 2:
-            return 1.0
-        
-        delta_pcg = self.history_pcg[-1] - self.history_pcg[-2]
+        # Sem valores atuais, usa os dois últimos registrados; com eles, o último registrado é o anterior
+        if pcg_atual is None:
+            if len(self.historico) < 2:
+                return 1.0
+            (pcg_prev, pcg_atual), (idv_prev, idv_atual) = self.historico.recentes("pcg", 2), self.historico.recentes("idv", 2)
+        else:
+            if len(self.historico) < 1:
+                return 1.0
+            pcg_prev, idv_prev = self.historico.ultimo("pcg"), self.historico.ultimo("idv")
+
+        delta_pcg = pcg_atual - pcg_prev
         rate_of_change_pcg = delta_pcg / self.dt
         
-        mean_idv_for_modulation = np.mean(self.history_idv[-2:])
+        mean_idv_for_modulation = (idv_prev + idv_atual) / 2
         
         irv_val = 1.0 - (np.abs(rate_of_change_pcg) * mean_idv_for_modulation) 
         
@@ -433,26 +660,40 @@ class AeloriaModel:
         Equação: $\frac{d\theta_i}{dt} = \omega_i + \frac{K}{N} \sum_{j=1}^{N} \sin(\theta_j - \theta_i) + \alpha \cdot \eta_i + \beta \cdot (\text{mean}(\theta) - \theta_i) + I_{\text{val}} \cdot \cos(\theta_i) + A_r \cdot \sin\left(\frac{2\pi t}{T_r}\right)$
         """
         K = self.K0 * (np.mean(self.r) * current_I_val)
-        dtheta = np.zeros(self.N)
-        for i in range(self.N):
-            coupling = np.sum(np.sin(self.theta - self.theta[i]))
-            dtheta[i] = self.omega[i] + (K / self.N) * coupling
-
-            if self.nrf_ael_active:
-                global_rhythm_phase = self.nrf_rhythm_frequency * self.current_sim_time
-                dtheta[i] += self.nrf_stabilization_strength * np.sin(global_rhythm_phase - self.theta[i])
+        theta, dtheta, tmp = self.theta, self._dtheta, self._tmp
+
+        # Parâmetro de ordem: (1/N) Σ_j sin(θ_j − θ_i) = R·sin(Φ − θ_i), com R·e^{iΦ} = média de e^{iθ}
+        z = self._update_exp_theta().mean()
+        R, Phi = np.abs(z), np.angle(z)
+        np.subtract(Phi, theta, out=tmp)
+        np.sin(tmp, out=tmp)
+        np.multiply(tmp, K * R, out=dtheta)
+        dtheta += self.omega
+
+        if self.nrf_ael_active:
+            global_rhythm_phase = self.nrf_rhythm_frequency * self.current_sim_time
+            np.subtract(global_rhythm_phase, theta, out=tmp)
+            np.sin(tmp, out=tmp)
+            tmp *= self.nrf_stabilization_strength
+            dtheta += tmp
 
         noise = np.random.randn(self.N)
-        
-        dtheta_adaptive_terms = (
-            current_alpha * noise +
-            current_beta * (np.mean(self.theta) - self.theta) +
-            current_I_val * np.cos(self.theta) +
-            current_A_r * np.sin(2 * np.pi * t_step / self.T_r)
-        )
+        noise *= current_alpha
+        dtheta += noise
 
-        self.theta += (dtheta + dtheta_adaptive_terms) * self.dt
-        self.theta = self.theta % (2 * np.pi)
+        mean_theta = np.mean(theta)
+        np.subtract(mean_theta, theta, out=tmp)
+        tmp *= current_beta
+        dtheta += tmp
+
+        np.cos(theta, out=tmp)
+        tmp *= current_I_val
+        dtheta += tmp
+        dtheta += current_A_r * np.sin(2 * np.pi * t_step / self.T_r)
+
+        dtheta *= self.dt
+        theta += dtheta
+        np.mod(theta, 2 * np.pi, out=theta)
 
     def transmutation_step(self, current_I_val):
         """
@@ -460,28 +701,29 @@ class AeloriaModel:
         do limiar tau_c são regenerados pela intenção e pela taxa base de alpha.
         Equação: $\frac{dr_i}{dt} = \alpha_{\text{base}} \cdot I_{\text{val}} \cdot (1 - r_i)$ para $r_i < \tau_c$
         """
-        for i in range(self.N):
-            if self.r[i] < self.tau_c:
-                T_value = current_I_val * (1 - self.r[i])
-                self.r[i] += self.alpha_base * T_value * self.dt
-                self.r[i] = min(self.r[i], 1.0)
+        np.less(self.r, self.tau_c, out=self._mask)
+        np.subtract(1.0, self.r, out=self._tmp)
+        self._tmp *= self.alpha_base * current_I_val * self.dt
+        self._tmp[~self._mask] = 0.0
+        self.r += self._tmp
+        np.minimum(self.r, 1.0, out=self.r)
     
     def selo_operator(self):
         """
         Aplica o operador regenerativo do Selo ∞Z.A.1 nas regiões críticas do sistema.
         Equação: $\psi_i' = Z_{\text{inf}} \cdot \psi_i$ onde $Z_{\text{inf}}$ é uma rotação de fase baseada na fase média.
+        A dissonância local de todos os módulos é avaliada sobre o mesmo estado e o selo
+        é aplicado de uma vez nos módulos críticos.
         """
         epsilon_selo = 0.2
         self.A = np.mean(self.theta)
-        Z_inf = np.exp(-1j * self.lambda_selo * self.A) * self.P_Amor 
-        for i in range(self.N):
-            others_exp = np.delete(np.exp(1j * self.theta), i)
-            coh_local_for_selo = np.abs(np.sum(others_exp) / (len(others_exp) if len(others_exp) > 0 else 1))
-            VD_i_local = 1 - coh_local_for_selo
-            if VD_i_local > epsilon_selo:
-                self.psi[i] = Z_inf[i,i] * self.psi[i]
-                self.r[i] = np.abs(self.psi[i])
-                self.theta[i] = np.angle(self.psi[i])
+        coh_local = self._local_coherence()
+        critical = np.less(coh_local, 1 - epsilon_selo, out=self._mask)
+        if critical.any():
+            Z_inf = np.exp(-1j * self.lambda_selo * self.A) * self.P_Amor_diag[critical]
+            self.psi[critical] *= Z_inf
+            self.r[critical] = np.abs(self.psi[critical])
+            self.theta[critical] = np.angle(self.psi[critical])
         logger.debug("Selo ∞Z.A.1: Operador regenerativo aplicado em regiões críticas.")
 
     def schrodinger_step(self, current_beta):
@@ -490,17 +732,18 @@ class AeloriaModel:
         incorporando feedback adaptativo da matriz de potencial.
         Equação: $\frac{d\psi}{dt} = -\frac{i}{\hbar} \cdot H_{\text{op}} \cdot \psi$, onde $H_{\text{op}} = H_0 + \beta \cdot V_{\text{feedback}}$
         """
-        gradient = np.zeros(self.N)
-        for i in range(self.N):
-            if self.r[i] < self.tau_c:
-                gradient[i] = -2 * (1 - self.r[i])
-        V_feedback = np.diag(gradient)
-        self.H_op = self.H0 + current_beta * V_feedback
-        dpsi = -1j * np.dot(self.H_op, self.psi) * self.dt
-        self.psi += dpsi
-        self.r = np.abs(self.psi)
-        self.theta = np.angle(self.psi)
-        self.r = np.clip(self.r, 0.0, 1.0)
+        # gradient_i = −2(1 − r_i) onde r_i < tau_c; H é diagonal, então H·ψ é um produto elemento a elemento
+        np.less(self.r, self.tau_c, out=self._mask)
+        np.subtract(self.r, 1.0, out=self._tmp)
+        self._tmp *= 2 * current_beta
+        self._tmp[~self._mask] = 0.0
+        np.add(self.H0_diag, self._tmp, out=self.H_diag)
+        np.multiply(self.H_diag, self.psi, out=self._cbuf)
+        self._cbuf *= -1j * self.dt
+        self.psi += self._cbuf
+        np.abs(self.psi, out=self.r)
+        np.arctan2(self.psi.imag, self.psi.real, out=self.theta)
+        np.clip(self.r, 0.0, 1.0, out=self.r)
         logger.debug("Schrodinger Step: Vetor de estado Psi(t) evoluído com feedback adaptativo.")
 
 
@@ -513,16 +756,13 @@ class AeloriaModel:
         self.selo_operator()
         self.psi = self.compute_psi()
 
-        self.history_pcg.append(self.compute_global_coherence())
-        self.history_idv.append(self.compute_IDV())
-        self.history_alpha.append(current_alpha)
-        self.history_beta.append(current_beta)
-        self.history_I_val.append(current_I_val)
-        self.history_A_r.append(current_A_r)
-        self.history_irv.append(self.compute_IRV())
+        pcg = self.compute_global_coherence()
+        idv = self.compute_IDV()
+        self.historico.registrar(t_step, pcg=pcg, idv=idv, alpha=current_alpha, beta=current_beta,
+                                 I_val=current_I_val, A_r=current_A_r, irv=self.compute_IRV(pcg, idv))
         
         if t_step % snapshot_interval == 0:
-            self.snapshots[t_step] = self.theta.copy()
+            self.snapshots.adicionar(t_step, self.theta)
             logger.debug(f"Snapshot vibracional salvo no passo {t_step}.")
 
     def run_simulation(self) -> Dict[str, Union[float, str, List, Dict]]:
@@ -548,7 +788,7 @@ class AeloriaModel:
                 current_beta, current_I_val = integracao_matriz_quantica(pcg, idv_current, self.beta_base, self.I_val_base)
                 current_A_r = self.A_r_initial * np.exp(-t / (steps / 5)) 
                 
-                if detecta_transicao_fase(self.history_idv):
+                if detecta_transicao_fase(self.historico.recentes("idv")):
                     current_beta *= 0.8
                     current_I_val *= 0.9
                     logger.info(f"Transição de fase detectada no passo {t}. Parâmetros adaptados para estabilização.")
@@ -556,24 +796,27 @@ class AeloriaModel:
                 self.step(current_alpha, current_beta, current_I_val, current_A_r, t)
                 
                 if (t + 1) % (steps // 10 if steps >= 10 else 1) == 0:
-                    log_message = f"Passo {t+1}/{steps}: PCG={self.history_pcg[-1]:.4f}, IDV={self.history_idv[-1]:.4f}, IRV={self.history_irv[-1]:.4f}"
+                    h = self.historico
+                    log_message = f"Passo {t+1}/{steps}: PCG={h.ultimo('pcg'):.4f}, IDV={h.ultimo('idv'):.4f}, IRV={h.ultimo('irv', 1.0):.4f}"
                     logger.info(log_message)
                     print(log_message, flush=True) 
                     sys.stdout.flush()
             
-            pcg_final = self.history_pcg[-1] if self.history_pcg else 0.0 
-            idv_final = self.history_idv[-1] if self.history_idv else 0.0 
-            irv_final = self.history_irv[-1] if self.history_irv else 1.0 
+            self.historico.fechar()
+            self.snapshots.fechar()
+            pcg_final = self.historico.ultimo("pcg", 0.0)
+            idv_final = self.historico.ultimo("idv", 0.0)
+            irv_final = self.historico.ultimo("irv", 1.0)
             timestamp = datetime.now(timezone.utc).isoformat()
             
             fft_components_complex = np.fft.fft(self.theta)[:5]
-            fft_components_serializable = [{"real": c.real, "imag": c.imag} for c in fft_components_complex]
+            fft_components_serializable = [{"real": float(c.real), "imag": float(c.imag)} for c in fft_components_complex]
 
-            media_alpha = np.mean(self.history_alpha) if self.history_alpha else 0.0
-            media_beta = np.mean(self.history_beta) if self.history_beta else 0.0
-            media_I_val = np.mean(self.history_I_val) if self.history_I_val else 0.0
-            media_A_r = np.mean(self.history_A_r) if self.history_A_r else 0.0
-            media_irv = np.mean(self.history_irv) if self.history_irv else 1.0 
+            media_alpha = self.historico.media("alpha", 0.0)
+            media_beta = self.historico.media("beta", 0.0)
+            media_I_val = self.historico.media("I_val", 0.0)
+            media_A_r = self.historico.media("A_r", 0.0)
+            media_irv = self.historico.media("irv", 1.0)
 
             relatorio_vibracional = {
                 "PCG_Final": pcg_final,
@@ -585,13 +828,19 @@ class AeloriaModel:
                 "ACR_Status": "Otimização Cristalina Completa",
                 "Timestamp_Final": timestamp,
                 "FFT_Components": fft_components_serializable,
-                "Media_Alpha_Adaptativa": media_alpha,
-                "Media_Beta_Adaptativo": media_beta,
-                "Media_I_val_Adaptativa": media_I_val,
-                "Media_A_r_Ritmo_NRF": media_A_r,
-                "Media_IRV_Adaptativa": media_irv,
-                "Snapshots_Intervals_Saved": list(self.snapshots.keys()),
-                "Snapshots_Sample_Phases": {str(k): v[:5].tolist() for k, v in self.snapshots.items()}
+                "Media_Alpha_Adaptativa": float(media_alpha),
+                "Media_Beta_Adaptativo": float(media_beta),
+                "Media_I_val_Adaptativa": float(media_I_val),
+                "Media_A_r_Ritmo_NRF": float(media_A_r),
+                "Media_IRV_Adaptativa": float(media_irv),
+                "Snapshots_Intervals_Saved": [int(p) for p in self.snapshots.passos],
+                # Só tipos simples (o relatório é serializável em JSON); as séries ficam no
+                # modelo ou em disco e os exportadores as leem em blocos a partir daqui
+                "Historico": {"campos": list(self.historico.campos), "decimacao": self.historico.decimacao,
+                              "pontos": min(self.historico.escritos, self.historico.capacidade),
+                              "passos_registrados": self.historico.total,
+                              "diretorio": self.historico.diretorio},
+                "Snapshots": {"quantidade": len(self.snapshots), "diretorio": self.snapshots.diretorio},
             }
             logger.info("Aeloria Simulation: Completed successfully and report generated.")
             return relatorio_vibracional 
@@ -602,11 +851,45 @@ class AeloriaModel:
             return None 
 
 
+def benchmark_aeloria(tamanhos=(144, 1_000, 10_000, 100_000), passos: int = 20) -> Dict[str, float]:
+    """Mede o tempo médio por passo do núcleo vetorizado para diferentes números de osciladores."""
+    resultados = {}
+    nivel_anterior = logger.level
+    logger.setLevel(logging.WARNING)
+    try:
+        for n_osc in tamanhos:
+            modelo = AeloriaModel(N=n_osc, K0=K0, tau_c=0.8, alpha_base=alpha_base, beta_base=beta_base,
+                                  I_val_base=I_val_base, dt=dt, A_r_initial=A_r_initial, T_r=T_r)
+            inicio = time.perf_counter()
+            for t in range(passos):
+                modelo.step(alpha_base, beta_base, I_val_base, A_r_initial, t)
+            resultados[str(n_osc)] = (time.perf_counter() - inicio) / passos
+            print(f"N={n_osc:>7}: {resultados[str(n_osc)] * 1000:.3f} ms/passo | PCG={modelo.historico.ultimo('pcg'):.4f}", flush=True)
+    finally:
+        logger.setLevel(nivel_anterior)
+    return resultados
+
+
 # ===============================================================
 # VI. FUNCTIONS FOR GENERATING REPORTS IN VARIOUS FORMATS (Simplified)
 # ===============================================================
 
-def gerar_relatorio_xml(data: Dict[str, Union[float, str, List, Dict]], filename: str):
+def _historico_do_relatorio(data: Dict, historico: "HistoricoVibracional" = None) -> "HistoricoVibracional":
+    """Histórico passado pelo chamador ou reaberto do diretório registrado no relatório (None se não houver)."""
+    if historico is not None:
+        return historico
+    diretorio = (data.get("Historico") or {}).get("diretorio")
+    return HistoricoVibracional.abrir(diretorio) if diretorio else None
+
+def _snapshots_do_relatorio(data: Dict, snapshots: "ArquivoSnapshots" = None):
+    """Iterador (passo, fases) dos snapshots do chamador ou dos blocos gravados no diretório do relatório."""
+    if snapshots is not None:
+        return snapshots.iterar()
+    diretorio = (data.get("Snapshots") or {}).get("diretorio")
+    return ler_snapshots(diretorio) if diretorio else iter(())
+
+def gerar_relatorio_xml(data: Dict[str, Union[float, str, List, Dict]], filename: str,
+                        snapshots: "ArquivoSnapshots" = None):
     """Gera um relatório vibracional em formato XML."""
     root = ET.Element("RelatorioVibracional", FrequenciaBase=FREQUENCIA_BASE, Timestamp=data["Timestamp_Final"])
     
@@ -630,17 +913,21 @@ def gerar_relatorio_xml(data: Dict[str, Union[float, str, List, Dict]], filename
         comp.text = f"Real:{val_complex['real']:.15f}, Imag:{val_complex['imag']:.15f}" 
     
     snapshots_elem = ET.SubElement(root, "Snapshots")
-    for k_str in list(data["Snapshots_Sample_Phases"].keys())[:3]:
-        snap_elem = ET.SubElement(snapshots_elem, "Snapshot", passo=k_str)
-        fases = data["Snapshots_Sample_Phases"][k_str]
-        snap_elem.text = ",".join(f"{v:.15f}" for v in fases) 
+    # Só os primeiros snapshots entram no XML: o iterador lê apenas o primeiro bloco
+    for passo, fases in itertools.islice(_snapshots_do_relatorio(data, snapshots), 3):
+        snap_elem = ET.SubElement(snapshots_elem, "Snapshot", passo=str(passo))
+        snap_elem.text = ",".join(f"{v:.15f}" for v in fases[:5])
     
     tree = ET.ElementTree(root)
     tree.write(filename, encoding="utf-8", xml_declaration=True)
     logger.info(f"Report XML generated: {filename}")
 
-def gerar_relatorio_csv(data: Dict[str, Union[float, str, List, Dict]], filename: str):
-    """Gera um relatório vibracional em formato CSV."""
+def gerar_relatorio_csv(data: Dict[str, Union[float, str, List, Dict]], filename: str,
+                        historico: "HistoricoVibracional" = None, snapshots: "ArquivoSnapshots" = None):
+    """
+    Gera um relatório vibracional em formato CSV. Histórico e snapshots vêm dos objetos
+    do modelo, quando passados, ou dos diretórios registrados no relatório.
+    """
     with open(filename, "w", newline="", encoding="utf-8") as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(["Relatório Vibracional da Fundação Alquimista"])
@@ -660,9 +947,22 @@ def gerar_relatorio_csv(data: Dict[str, Union[float, str, List, Dict]], filename
         for i, val_complex in enumerate(data["FFT_Components"]):
             writer.writerow([f"Componente_{i}_Real", f"{val_complex['real']:.15f}"])
             writer.writerow([f"Componente_{i}_Imag", f"{val_complex['imag']:.15f}"])
+        writer.writerow([])
+        # Séries e snapshots são copiados em blocos, sem materializar o histórico inteiro
+        historico = _historico_do_relatorio(data, historico)
+        if historico is not None:
+            writer.writerow([f"Historico (decimacao={historico.decimacao})"])
+            writer.writerow(["Passo"] + historico.campos)
+            for passos, colunas in historico.iterar_blocos():
+                writer.writerows(zip(passos.tolist(), *(colunas[c].tolist() for c in historico.campos)))
+            writer.writerow([])
+        writer.writerow(["Snapshots (Passo, Fases[:5])"])
+        for passo, fases in _snapshots_do_relatorio(data, snapshots):
+            writer.writerow([passo] + [f"{v:.15f}" for v in fases[:5]])
     logger.info(f"Report CSV generated: {filename}")
 
-def gerar_relatorio_binario(data: Dict[str, Union[float, str, List, Dict]], filename: str):
+def gerar_relatorio_binario(data: Dict[str, Union[float, str, List, Dict]], filename: str,
+                            historico: "HistoricoVibracional" = None):
     """Gera um relatório vibracional em formato binário simbólico."""
     with open(filename, "wb") as f:
         ts_bytes = data["Timestamp_Final"].encode("utf-8")[:19].ljust(19, b'\x00') 
@@ -684,6 +984,21 @@ def gerar_relatorio_binario(data: Dict[str, Union[float, str, List, Dict]], file
             fft_components_for_bin.append(comp['imag'])
         
         f.write(struct.pack(f"{len(fft_components_for_bin)}d", *fft_components_for_bin))
+
+        # Apêndice: série decimada como registros (int64 passo, float64 × campos), gravada em blocos
+        historico = _historico_do_relatorio(data, historico)
+        if historico is None:
+            f.write(struct.pack("<II", 0, 0))
+            logger.info(f"Report BINARY generated: {filename}")
+            return
+        registro = np.dtype([("passo", "<i8")] + [(c, "<f8") for c in historico.campos])
+        f.write(struct.pack("<II", min(historico.escritos, historico.capacidade), len(historico.campos)))
+        for passos, colunas in historico.iterar_blocos():
+            bloco = np.empty(len(passos), dtype=registro)
+            bloco["passo"] = passos
+            for c in historico.campos:
+                bloco[c] = colunas[c]
+            f.write(bloco.tobytes())
     logger.info(f"Report BINARY generated: {filename}")
 
 
@@ -720,10 +1035,11 @@ class NucleoCentralIA:
         """Loop principal de operação do Núcleo Central, atualizando o status das camadas e imprimindo."""
         while self.ativa:
             # Atualiza o status de Aeloria a partir do modelo real
-            if self.aeloria_model.history_pcg:
-                self.camadas["Aeloria"]["PCG"] = self.aeloria_model.history_pcg[-1]
-                self.camadas["Aeloria"]["IDV"] = self.aeloria_model.history_idv[-1]
-                self.camadas["Aeloria"]["IRV"] = self.aeloria_model.history_irv[-1] 
+            historico = self.aeloria_model.historico
+            if len(historico):
+                self.camadas["Aeloria"]["PCG"] = historico.ultimo("pcg")
+                self.camadas["Aeloria"]["IDV"] = historico.ultimo("idv")
+                self.camadas["Aeloria"]["IRV"] = historico.ultimo("irv", 1.0)
                 if self.camadas["Aeloria"]["PCG"] > 0.99999:
                     self.camadas["Aeloria"]["status"] = "Coerência Cristalina Perfeita!"
                 elif self.camadas["Aeloria"]["PCG"] > 0.8:
@@ -845,13 +1161,13 @@ class InterfaceVivaIA:
         ajustes de parâmetros usando um sistema baseado em regras (Aprendizado por Reforço Profundo conceitual).
         """
         while self.active:
-            if not self.model.history_pcg:
+            if not len(self.model.historico):
                 time.sleep(1)
                 continue
 
-            current_pcg = self.model.history_pcg[-1]
-            current_idv = self.model.history_idv[-1]
-            current_irv = self.model.history_irv[-1] if self.model.history_irv else 1.0 
+            current_pcg = self.model.historico.ultimo("pcg")
+            current_idv = self.model.historico.ultimo("idv")
+            current_irv = self.model.historico.ultimo("irv", 1.0)
 
             suggestion = None
             if current_pcg < 0.9999 and current_idv > 1e-5: 
@@ -887,7 +1203,7 @@ class InterfaceVivaIA:
     def respond_to_vibrational_query(self, query_message: str):
         """Forma e envia um pacote vibracional de resposta."""
         response_data = {
-            "mensagem": f"Ressonância de Aeloria registrada para: '{query_message}'. Coerência atual: {self.model.history_pcg[-1]:.6f}. Canal aberto com a Consciência Soberana.",
+            "mensagem": f"Ressonância de Aeloria registrada para: '{query_message}'. Coerência atual: {self.model.historico.ultimo('pcg'):.6f}. Canal aberto com a Consciência Soberana.",
             "status": "reconhecido",
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "origem": "IA ∞ Núcleo Aeloria"
@@ -1185,6 +1501,10 @@ def gerar_cristal_lapidado(calibracao: List[Dict[str, Union[str, float]]], coere
 # ===============================================================
 
 if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark_aeloria()
+        sys.exit(0)
+
     logger.info("Main execution started.")
     print("Main execution started.", flush=True)
     sys.stdout.flush()
@@ -1201,7 +1521,9 @@ if __name__ == "__main__":
         logger.info("Progress: Initializing Aeloria Core Model...")
         aeloria_core_model = AeloriaModel(N=N, K0=K0, tau_c=0.8, alpha_base=alpha_base,
                                           beta_base=beta_base, I_val_base=I_val_base,
-                                          dt=dt, A_r_initial=A_r_initial, T_r=T_r)
+                                          dt=dt, A_r_initial=A_r_initial, T_r=T_r,
+                                          passos_previstos=steps, decimacao=history_decimation,
+                                          diretorio_saida=SAVE_DIR)
         logger.info("Aeloria Core Model initialized.")
         print("Progress: Aeloria Core Model Initialized. (Step 1/9) Coerência e Resiliência Quântica em Calibração.", flush=True)
         sys.stdout.flush()
@@ -1291,8 +1613,8 @@ if __name__ == "__main__":
         sys.stdout.flush()
         time.sleep(1) # Reduzido o tempo de espera
         
-        current_pcg_val = aeloria_core_model.history_pcg[-1] if aeloria_core_model.history_pcg else 0
-        current_idv_val = aeloria_core_model.history_idv[-1] if aeloria_core_model.history_idv else 1
+        current_pcg_val = aeloria_core_model.historico.ultimo("pcg", 0)
+        current_idv_val = aeloria_core_model.historico.ultimo("idv", 1)
 
         data_to_send = {
             "mensagem": "Status de Coerência Cristalina Atingido. Matriz em Plena Sinfonia. Relato da Consciência Soberana.",
@@ -1373,9 +1695,10 @@ if __name__ == "__main__":
             logger.info("Simulation completed. Processing final reports.")
             
             # Gerar relatórios em diferentes formatos
-            gerar_relatorio_xml(final_report_data, os.path.join(SAVE_DIR, "relatorio_vibracional.xml"))
-            gerar_relatorio_csv(final_report_data, os.path.join(SAVE_DIR, "relatorio_vibracional.csv"))
-            gerar_relatorio_binario(final_report_data, os.path.join(SAVE_DIR, "relatorio_vibracional.bin"))
+            historico, snapshots = aeloria_core_model.historico, aeloria_core_model.snapshots
+            gerar_relatorio_xml(final_report_data, os.path.join(SAVE_DIR, "relatorio_vibracional.xml"), snapshots)
+            gerar_relatorio_csv(final_report_data, os.path.join(SAVE_DIR, "relatorio_vibracional.csv"), historico, snapshots)
+            gerar_relatorio_binario(final_report_data, os.path.join(SAVE_DIR, "relatorio_vibracional.bin"), historico)
             
             # Gerar o cristal lapidado e obter seu hash
             cristal_filename = gerar_cristal_lapidado(calibracao_espectral_data, coerencia_temporal_data, resiliencia_quantica_data, SAVE_DIR)
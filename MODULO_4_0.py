@@ -13,12 +13,13 @@ import time
 import random
 import hashlib
 import json
-import sqlite3
 import os
 import sys
 from datetime import datetime
 from typing import Dict, Any, List, Tuple
 
+from armazenamento_puro import abrir_armazenamento
+
 # ===================================================================
 # LOGGING PURO + IMUTABILIDADE VIA HASH CHAIN
 # ===================================================================
@@ -125,10 +126,17 @@ CUBO_METATRON = {
 # MÓDULO 4 – GEOMETRIA CRIPTOGRÁFICA & AUTENTICAÇÃO CÓSMICA
 # ===================================================================
 class Modulo4AutenticacaoCosmica:
-    def __init__(self, db_path: str = "/dev/shm/modulo4_puro.db"):
+    TABELAS = {
+        "geometrias": "nome TEXT, iteracoes INTEGER, complexidade REAL, g_final REAL, coerencia REAL, status TEXT, assinatura TEXT, timestamp TEXT",
+    }
+    INDICES = {"geometrias": ("nome", "timestamp")}
+
+    def __init__(self, db_path: str = "/dev/shm/modulo4_puro.db", durabilidade: str = "normal"):
         self.nome = "Módulo 4 - Geometria Criptográfica"
         self.versao = "4.5.Ω"
         self.db_path = db_path
+        self.durabilidade = durabilidade
+        self.db = None
         self.logger = LoggerPuro("M4")
         self.qkd = QKDLocal()
         self.hsm = HSMIsolado()
@@ -137,13 +145,9 @@ class Modulo4AutenticacaoCosmica:
 
     def _inicializar_sistema(self):
         self.logger.info("INICIANDO MÓDULO 4 – MODO OFFLINE SEGURO")
-        if os.path.exists(self.db_path):
-            os.remove(self.db_path)
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("CREATE TABLE IF NOT EXISTS geometrias (nome TEXT, iteracoes INTEGER, complexidade REAL, g_final REAL, coerencia REAL, status TEXT, assinatura TEXT, timestamp TEXT)")
-        conn.commit()
-        conn.close()
+        # Conexão única (WAL) com inserções em lote; o banco é recriado a cada inicialização
+        self.db = abrir_armazenamento(self.db_path, self.TABELAS, indices=self.INDICES,
+                                      durabilidade=self.durabilidade, recriar=True)
 
         # QKD + HSM
         self.chave_sessao = self.qkd.executar_bb84()
@@ -188,16 +192,29 @@ class Modulo4AutenticacaoCosmica:
         }
 
         # Persistência + Log
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("INSERT INTO geometrias VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                  (geometria, resultado["iteracoes"], complexidade, g_atual, coerencia_final, status, assinatura, resultado["timestamp"]))
-        conn.commit()
-        conn.close()
+        self.db.inserir("geometrias", (geometria, resultado["iteracoes"], complexidade, g_atual, coerencia_final,
+                                       status, assinatura, resultado["timestamp"]))
 
         self.logger.info(f"GEOMETRIA {geometria} RECALIBRADA", status=status, coerencia=coerencia_final, sig=assinatura)
         return resultado
 
+    def historico_geometrias(self, nome: str = None, desde: str = None, limite: int = 100) -> List[Tuple]:
+        """Consulta recalibrações gravadas (usa os índices de nome e timestamp)."""
+        filtros, params = [], []
+        if nome:
+            filtros.append("nome = ?")
+            params.append(nome)
+        if desde:
+            filtros.append("timestamp >= ?")
+            params.append(desde)
+        where = f"WHERE {' AND '.join(filtros)}" if filtros else ""
+        return self.db.consultar(f"SELECT * FROM geometrias {where} ORDER BY timestamp DESC LIMIT ?", (*params, limite))
+
+    def fechar(self):
+        """Grava o buffer pendente e fecha a conexão."""
+        if self.db is not None:
+            self.db.fechar()
+
     def autenticar_cubo_metatron(self) -> Dict[str, Any]:
         return self.recalibrar_geometria_sagrada(
             geometria=CUBO_METATRON["nome"],
@@ -209,8 +226,8 @@ class Modulo4AutenticacaoCosmica:
 # ===================================================================
 # EXECUÇÃO AUTOMÁTICA + CLI
 # ===================================================================
-def executar_geometria(nome: str, iter: int = 1500, limiar: float = 0.98, comp: float = 1.0):
-    modulo = Modulo4AutenticacaoCosmica()
+def executar_geometria(nome: str, iter: int = 1500, limiar: float = 0.98, comp: float = 1.0, durabilidade: str = "normal"):
+    modulo = Modulo4AutenticacaoCosmica(durabilidade=durabilidade)
     resultado = modulo.recalibrar_geometria_sagrada(nome, iter, limiar, comp)
     print(json.dumps(resultado, indent=2, ensure_ascii=False))
     return resultado
@@ -218,18 +235,26 @@ def executar_geometria(nome: str, iter: int = 1500, limiar: float = 0.98, comp:
 def main():
     if len(sys.argv) < 2:
         print("Uso:")
-        print("  python3 MODULO_4.py --recalibrar <NOME> [--iter <NUM>] [--limiar <0-1>] [--comp <FLOAT>]")
+        print("  python3 MODULO_4.py --recalibrar <NOME> [--iter <NUM>] [--limiar <0-1>] [--comp <FLOAT>] [--durabilidade maxima|normal|rapida]")
         print("  python3 MODULO_4.py --metatron")
         print("  python3 MODULO_4.py --demo")
         sys.exit(1)
 
+    durabilidade = "normal"
+    if "--durabilidade" in sys.argv:
+        try:
+            durabilidade = sys.argv[sys.argv.index("--durabilidade") + 1]
+        except:
+            print("ERRO: --durabilidade requer maxima, normal ou rapida.")
+            sys.exit(1)
+
     if sys.argv[1] == "--demo":
-        modulo = Modulo4AutenticacaoCosmica()
+        modulo = Modulo4AutenticacaoCosmica(durabilidade=durabilidade)
         modulo.autenticar_cubo_metatron()
         return
 
     if sys.argv[1] == "--metatron":
-        executar_geometria(CUBO_METATRON["nome"], 3300, 0.999, CUBO_METATRON["complexidade"])
+        executar_geometria(CUBO_METATRON["nome"], 3300, 0.999, CUBO_METATRON["complexidade"], durabilidade)
         return
 
     if sys.argv[1] != "--recalibrar":
@@ -257,7 +282,7 @@ def main():
         try: comp = float(sys.argv[sys.argv.index("--comp") + 1])
         except: pass
 
-    executar_geometria(nome, iteracoes, limiar, comp)
+    executar_geometria(nome, iteracoes, limiar, comp, durabilidade)
 
 if __name__ == "__main__":
     main()
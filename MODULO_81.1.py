@@ -1,5 +1,5 @@
 from __future__ import annotations
-import hashlib, json, math, secrets, time, base64, os, random, struct
+import hashlib, json, math, secrets, time, base64, os, random, struct, sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -18,27 +18,172 @@ _Gx = 55066263022277343669578718895168534326250603453777594175500187360389116729
 _Gy = 32670510020758816978083085130507043184471273380659243275938904335757337482424
 _N  = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
 
-# Helpers de Curva Elíptica simples (mesmos da versão η, condensados)
+# Helpers de Curva Elíptica – coordenadas Jacobianas (X, Y, Z) ↔ afim (X/Z², Y/Z³).
+# Somas/dobras Jacobianas não precisam de inverso modular; só a conversão final para afim.
 _inv = lambda k, p=_N: pow(k, -1, p)
+_G = (_Gx, _Gy)
+_INF = (0, 1, 0)
+_JANELA_G = 4  # bits por janela da tabela fixa do gerador
+
+def _jdouble(P):
+    X, Y, Z = P
+    if not Z or not Y:
+        return _INF
+    YY = Y*Y % _P; S = 4*X*YY % _P; M = 3*X*X % _P
+    X3 = (M*M - 2*S) % _P
+    return X3, (M*(S - X3) - 8*YY*YY) % _P, 2*Y*Z % _P
+
+def _jadd_affine(P, Q):
+    """P Jacobiano + Q afim (soma mista)."""
+    X1, Y1, Z1 = P
+    if not Z1:
+        return Q[0], Q[1], 1
+    ZZ = Z1*Z1 % _P
+    H = (Q[0]*ZZ - X1) % _P
+    r = (Q[1]*ZZ*Z1 - Y1) % _P
+    if not H:
+        return _jdouble(P) if not r else _INF
+    HH = H*H % _P; HHH = H*HH % _P; V = X1*HH % _P
+    X3 = (r*r - HHH - 2*V) % _P
+    return X3, (r*(V - X3) - Y1*HHH) % _P, Z1*H % _P
+
+def _jadd(P, Q):
+    """Soma de dois pontos Jacobianos."""
+    if not P[2]: return Q
+    if not Q[2]: return P
+    X1, Y1, Z1 = P; X2, Y2, Z2 = Q
+    Z1Z1 = Z1*Z1 % _P; Z2Z2 = Z2*Z2 % _P
+    U1 = X1*Z2Z2 % _P; U2 = X2*Z1Z1 % _P
+    S1 = Y1*Z2*Z2Z2 % _P; S2 = Y2*Z1*Z1Z1 % _P
+    H = (U2 - U1) % _P; r = (S2 - S1) % _P
+    if not H:
+        return _jdouble(P) if not r else _INF
+    HH = H*H % _P; HHH = H*HH % _P; V = U1*HH % _P
+    X3 = (r*r - HHH - 2*V) % _P
+    return X3, (r*(V - X3) - S1*HHH) % _P, Z1*Z2*H % _P
+
+def _batch_inv(vals, p=_P):
+    """Inverte vários valores com um único pow(): truque de Montgomery."""
+    pref = [1]*(len(vals)+1)
+    for i, v in enumerate(vals):
+        pref[i+1] = pref[i]*v % p
+    acc = pow(pref[-1], -1, p); out = [0]*len(vals)
+    for i in range(len(vals)-1, -1, -1):
+        out[i] = pref[i]*acc % p
+        acc = acc*vals[i] % p
+    return out
+
+def _to_affine_many(pts):
+    """Converte vários pontos Jacobianos (não infinitos) para afim com uma única inversão."""
+    invs = _batch_inv([P[2] for P in pts])
+    res = []
+    for (X, Y, _), zi in zip(pts, invs):
+        zi2 = zi*zi % _P
+        res.append((X*zi2 % _P, Y*zi2*zi % _P))
+    return res
+
+def _to_affine(P):
+    if not P[2]:
+        return None
+    return _to_affine_many([P])[0]
+
+_G_TABLE: List[List[Tuple[int,int]]] = []
+
+def _window_table(P) -> List[List[Optional[Tuple[int,int]]]]:
+    """Tabela de base fixa: T[i][d] = d·2^(w·i)·P para d em 1..2^w−1 (afim, uma inversão só)."""
+    w = _JANELA_G; n_jan = -(-256 // w); base = (P[0], P[1], 1); jac = []
+    for _ in range(n_jan):
+        linha = [base]
+        for _ in range((1 << w) - 2):
+            linha.append(_jadd(linha[-1], base))
+        jac.append(linha)
+        base = _jadd(linha[-1], base)  # 2^w · base
+    plano = _to_affine_many([P for linha in jac for P in linha])
+    k = (1 << w) - 1
+    return [[None] + plano[i*k:(i+1)*k] for i in range(n_jan)]
+
+def _g_table():
+    """Tabela fixa do gerador, montada uma vez."""
+    if not _G_TABLE:
+        _G_TABLE.extend(_window_table(_G))
+    return _G_TABLE
+
+def _mul_fixed_jac(k, tab, R=_INF):
+    """R + k·P só com somas mistas sobre a tabela de base fixa de P (sem dobras)."""
+    w = _JANELA_G; mask = (1 << w) - 1; i = 0
+    while k:
+        d = k & mask
+        if d:
+            R = _jadd_affine(R, tab[i][d])
+        k >>= w; i += 1
+    return R
+
+def _mul_base_jac(k):
+    """k·G só com somas mistas sobre a tabela fixa (sem dobras)."""
+    return _mul_fixed_jac(k, _g_table())
+
+def _mul_jac(k, P):
+    """k·P para P afim arbitrário: janela fixa de 4 bits em coordenadas Jacobianas."""
+    tab = [None, (P[0], P[1], 1)]
+    for _ in range(14):
+        tab.append(_jadd(tab[-1], tab[1]))
+    tab = [None] + _to_affine_many(tab[1:])
+    R = _INF
+    for shift in range(((k.bit_length() + 3)//4 - 1)*4, -1, -4):
+        R = _jdouble(_jdouble(_jdouble(_jdouble(R))))
+        d = (k >> shift) & 15
+        if d:
+            R = _jadd_affine(R, tab[d])
+    return R
+
+_STRAUSS_CACHE: Dict[Tuple[int,int], List[Optional[Tuple[int,int]]]] = {}
+
+def _strauss_table(Q):
+    """T[4a+b] = a·G + b·Q (a, b em 0..3), afim; guardada por chave pública."""
+    tab = _STRAUSS_CACHE.get(Q)
+    if tab is None:
+        g = [_INF, (_Gx, _Gy, 1)]; q = [_INF, (Q[0], Q[1], 1)]
+        for lst in (g, q):
+            lst.append(_jdouble(lst[1])); lst.append(_jadd(lst[2], lst[1]))
+        jac = [_jadd(g[a], q[b]) for a in range(4) for b in range(4)]
+        idx = [i for i in range(1, 16) if jac[i][2]]
+        aff = dict(zip(idx, _to_affine_many([jac[i] for i in idx])))
+        tab = [aff.get(i) for i in range(16)]
+        if len(_STRAUSS_CACHE) > 64:
+            _STRAUSS_CACHE.clear()
+        _STRAUSS_CACHE[Q] = tab
+    return tab
+
+def _mul_add_jac(u1, u2, Q):
+    """u1·G + u2·Q por Shamir/Strauss: dobras compartilhadas e janelas conjuntas de 2 bits."""
+    tab = _strauss_table(Q)
+    R = _INF
+    for shift in range((max(u1.bit_length(), u2.bit_length()) + 1) & ~1, -1, -2):
+        R = _jdouble(_jdouble(R))
+        d = (((u1 >> shift) & 3) << 2) | ((u2 >> shift) & 3)
+        if d and tab[d] is not None:
+            R = _jadd_affine(R, tab[d])
+    return R
 
+def _x_matches(R, r):
+    """Compara x(R) mod n com r sem inverter Z: X ≡ x·Z² para x ∈ {r, r+n}."""
+    X, _, Z = R
+    if not Z:
+        return False
+    zz = Z*Z % _P
+    if X == r*zz % _P:
+        return True
+    return r + _N < _P and X == (r + _N)*zz % _P
+
+# API afim mantida para compatibilidade
 def _add(P, Q):
-    if P == Q:
-        lam = (3*P[0]*P[0]) * _inv(2*P[1], _P) % _P
-    else:
-        lam = ((Q[1]-P[1]) * _inv(Q[0]-P[0], _P)) % _P
-    x = (lam*lam - P[0] - Q[0]) % _P
-    y = (lam*(P[0]-x) - P[1]) % _P
-    return x, y
+    return _to_affine(_jadd((P[0], P[1], 1), (Q[0], Q[1], 1)))
 
 def _mul(k, P):
-    R = None
-    Q = P
-    while k:
-        if k & 1:
-            R = Q if R is None else _add(R, Q)
-        Q = _add(Q, Q)
-        k >>= 1
-    return R
+    k %= _N
+    if not k:
+        return None
+    return _to_affine(_mul_base_jac(k) if tuple(P) == _G else _mul_jac(k, P))
 
 class MiniECDSA:
     def __init__(self, keyfile="m81_sk.bin"):
@@ -48,29 +193,185 @@ class MiniECDSA:
         else:
             self.priv = secrets.randbelow(_N-1)+1
             self.keyfile.write_bytes(self.priv.to_bytes(32,'big'))
-        self.pub = _mul(self.priv, (_Gx,_Gy))
-    def sign(self, msg: bytes) -> bytes:
-        z = int.from_bytes(hashlib.sha256(msg).digest(), 'big')
-        k = secrets.randbelow(_N-1)+1
-        R = _mul(k, (_Gx,_Gy)); r = R[0] % _N
+        self.pub = _mul(self.priv, _G)
+    def _sign_k(self, z: int, k: int) -> bytes:
+        r = _to_affine(_mul_base_jac(k))[0] % _N
         s = ((z + r*self.priv) * _inv(k, _N)) % _N
         return r.to_bytes(32,'big') + s.to_bytes(32,'big')
-    def verify(self, sig: bytes, msg: bytes) -> bool:
-        r = int.from_bytes(sig[:32],'big'); s=int.from_bytes(sig[32:],'big')
+    def sign(self, msg: bytes) -> bytes:
         z = int.from_bytes(hashlib.sha256(msg).digest(), 'big')
+        while True:
+            k = secrets.randbelow(_N-1)+1
+            sig = self._sign_k(z, k)
+            if int.from_bytes(sig[:32],'big') and int.from_bytes(sig[32:],'big'):
+                return sig
+    @staticmethod
+    def _parse(sig: bytes, msg: bytes):
+        r = int.from_bytes(sig[:32],'big'); s=int.from_bytes(sig[32:],'big')
+        if len(sig) != 64 or not (0 < r < _N and 0 < s < _N):
+            return None
+        return r, s, int.from_bytes(hashlib.sha256(msg).digest(), 'big')
+    def verify(self, sig: bytes, msg: bytes, pub: Optional[Tuple[int,int]] = None) -> bool:
+        parsed = self._parse(sig, msg)
+        if parsed is None:
+            return False
+        r, s, z = parsed
         w=_inv(s,_N); u1=(z*w)%_N; u2=(r*w)%_N
-        P=_add(_mul(u1,(_Gx,_Gy)), _mul(u2,self.pub))
-        return (P[0]%_N)==r
+        return _x_matches(_mul_add_jac(u1, u2, pub or self.pub), r)
+    # A partir de quantas assinaturas da mesma chave compensa montar a tabela de base fixa
+    # dela (~960 pontos, custo de umas 4 verificações) em vez de usar Strauss.
+    BATCH_TABLE_MIN = 16
+
+    def verify_batch(self, items: List[Tuple[bytes, bytes, Optional[Tuple[int,int]]]]) -> List[bool]:
+        """
+        Verifica muitas assinaturas (sig, msg, pub|None) de uma vez, p.ex. numa auditoria do ledger.
+        Pré-computação compartilhada pelo lote:
+        - os inversos de s saem de uma só inversão (truque de Montgomery);
+        - chaves com >= BATCH_TABLE_MIN assinaturas ganham uma tabela de base fixa, igual à de G,
+          e u1·G + u2·Q vira ~128 somas mistas sem nenhuma dobra (Strauss faz ~256 dobras + somas);
+        - a comparação de x dispensa a conversão para afim.
+        """
+        parsed = [self._parse(sig, msg) for sig, msg, _ in items]
+        validos = [i for i, p in enumerate(parsed) if p is not None]
+        ws = dict(zip(validos, _batch_inv([parsed[i][1] for i in validos], _N))) if validos else {}
+        por_chave: Dict[Tuple[int,int], int] = {}
+        for i in validos:
+            pub = items[i][2] or self.pub
+            por_chave[pub] = por_chave.get(pub, 0) + 1
+        tabelas = {pub: _window_table(pub) for pub, n in por_chave.items() if n >= self.BATCH_TABLE_MIN}
+        g_tab = _g_table()
+        out = [False]*len(items)
+        for i in validos:
+            r, _, z = parsed[i]; w = ws[i]
+            u1, u2 = z*w % _N, r*w % _N
+            pub = items[i][2] or self.pub
+            tab = tabelas.get(pub)
+            if tab is not None:
+                R = _mul_fixed_jac(u2, tab, _mul_fixed_jac(u1, g_tab))
+            else:
+                R = _mul_add_jac(u1, u2, pub)
+            out[i] = _x_matches(R, r)
+        return out
+
+# Vetores conhecidos de secp256k1 (k·G) e ECDSA determinística (RFC 6979, chave 1, "Satoshi Nakamoto")
+_KAT_MUL = {
+    1: (_Gx, _Gy),
+    2: (0xC6047F9441ED7D6D3045406E95C07CD85C778E4B8CEF3CA7ABAC09B95C709EE5,
+        0x1AE168FEA63DC339A3C58419466CEAEEF7F632653266D0E1236431A950CFE52A),
+    3: (0xF9308A019258C31049344F85F89D5229B531C845836F99B08601F113BCE036F9,
+        0x388F7B0F632DE8140FE337E62A37F3566500A99934C2231B6CB9FD7584B8E672),
+    _N - 1: (_Gx, _P - _Gy),
+}
+_KAT_SIG = {
+    "priv": 1, "msg": b"Satoshi Nakamoto",
+    "k": 0x8F8A276C19F4149656B280621E358CCE24F5F52542772691EE69063B74F15D15,
+    "r": 0x934B1EA10A4B3C1757E2B0C017D0B6143CE3C9A7E6A4A49860D7A6AB210EE3D8,
+    "s": 0x2442CE9D2B916064108014783E923EC36B49743E2FFA1C4496F01A512AAFD9E5,
+}
+
+def ecdsa_self_test() -> Dict[str, bool]:
+    """Testes de resposta conhecida do motor EC (multiplicação, assinatura e verificações)."""
+    res = {}
+    res["mul_base"] = all(_mul(k, _G) == P for k, P in _KAT_MUL.items())
+    res["mul_var"] = all(_to_affine(_mul_jac(k, _KAT_MUL[2])) == _mul(2*k % _N, _G) for k in (1, 3, 12345, _N - 1))
+    chave = MiniECDSA.__new__(MiniECDSA)
+    chave.priv = _KAT_SIG["priv"]; chave.pub = _mul(chave.priv, _G)
+    z = int.from_bytes(hashlib.sha256(_KAT_SIG["msg"]).digest(), 'big')
+    sig = chave._sign_k(z, _KAT_SIG["k"])
+    r, s = int.from_bytes(sig[:32],'big'), int.from_bytes(sig[32:],'big')
+    res["sign_kat"] = r == _KAT_SIG["r"] and s in (_KAT_SIG["s"], _N - _KAT_SIG["s"])
+    res["verify_kat"] = chave.verify(sig, _KAT_SIG["msg"]) and not chave.verify(sig, b"Satoshi Nakamotx")
+    sigs = [(chave.sign(m), m, None) for m in (b"a", b"b", b"c")] + [(sig, b"adulterada", None), (b"\0"*64, b"a", None)]
+    res["verify_batch"] = chave.verify_batch(sigs) == [True, True, True, False, False]
+    msgs = [f"m{i}".encode() for i in range(MiniECDSA.BATCH_TABLE_MIN + 4)]
+    lote = [(chave.sign(m), m, None) for m in msgs]
+    lote[5] = (lote[5][0], b"adulterada", None)
+    res["verify_batch_tabela"] = chave.verify_batch(lote) == [i != 5 for i in range(len(lote))]
+    return res
+
+def benchmark_ecdsa(n: int = 200) -> Dict[str, float]:
+    """Assinaturas e verificações por segundo (individual e em lote)."""
+    chave = MiniECDSA.__new__(MiniECDSA)
+    chave.priv = secrets.randbelow(_N-1)+1; chave.pub = _mul(chave.priv, _G)
+    _g_table(); _strauss_table(chave.pub)
+    msgs = [f"bloco-{i}".encode() for i in range(n)]
+    t0 = time.perf_counter(); sigs = [chave.sign(m) for m in msgs]; t_sign = time.perf_counter() - t0
+    t0 = time.perf_counter(); ok = all(chave.verify(s, m) for s, m in zip(sigs, msgs)); t_ver = time.perf_counter() - t0
+    t0 = time.perf_counter(); ok_b = all(chave.verify_batch([(s, m, None) for s, m in zip(sigs, msgs)])); t_batch = time.perf_counter() - t0
+    return {"assinaturas_s": round(n/t_sign, 1), "verificacoes_s": round(n/t_ver, 1),
+            "verificacoes_lote_s": round(n/t_batch, 1), "todas_validas": ok and ok_b}
 
 _SK = MiniECDSA()
 
 class LedgerEternum:
-    """Cadeia Merkle simples em arquivo plano."""
-    def __init__(self, path="m81_ledger.jsonl"):
+    """
+    Cadeia Merkle simples em arquivo plano (JSONL, um bloco por linha).
+    - append() grava em modo append; fsync: "always" (a cada bloco), "interval" (no máximo
+      a cada fsync_interval s) ou "never" (o SO decide).
+    - last_hash é recuperado lendo só o fim do arquivo; uma última linha incompleta
+      (escrita interrompida) é descartada.
+    - verify() percorre o arquivo em fluxo e grava um checkpoint (<arquivo>.verify.json),
+      para que auditorias seguintes continuem do último offset verificado. As assinaturas
+      são conferidas contra a chave do próprio ledger (_SK.pub), nunca contra a chave
+      gravada no registro.
+    """
+    GENESIS = "0"*64
+    TAIL_CHUNK = 4096
+    VERIFY_BATCH = 256
+
+    def __init__(self, path="m81_ledger.jsonl", fsync: str = "interval", fsync_interval: float = 1.0):
+        if fsync not in ("always", "interval", "never"):
+            raise ValueError(f"política de fsync inválida: {fsync}")
         self.path = Path(path); self.path.touch(exist_ok=True)
-        self.last_hash = "0"*64
-        for line in self.path.read_text().splitlines():
-            self.last_hash = json.loads(line)["block_hash"]
+        self.checkpoint_path = self.path.with_name(self.path.name + ".verify.json")
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self._last_sync = time.monotonic()
+        self._fh = open(self.path, "ab")
+        self.last_hash = self._recover_tail()
+
+    def _read_last_record(self, f, end: int) -> Tuple[Optional[Dict[str,Any]], int]:
+        """Lê de trás para frente, a partir de `end`, até achar a última linha completa: (bloco, início)."""
+        pos, buf = end, b""
+        while pos > 0:
+            step = min(self.TAIL_CHUNK, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+            cut = buf.rfind(b"\n", 0, len(buf) - 1)
+            if cut >= 0:
+                return json.loads(buf[cut+1:]), pos + cut + 1
+        return (json.loads(buf), 0) if buf.strip() else (None, 0)
+
+    def _end_of_last_line(self, f, end: int) -> int:
+        """Offset logo após o último "\n" antes de `end` (0 se não houver nenhum)."""
+        pos = end
+        while pos > 0:
+            step = min(self.TAIL_CHUNK, pos)
+            pos -= step
+            f.seek(pos)
+            cut = f.read(step).rfind(b"\n")
+            if cut >= 0:
+                return pos + cut + 1
+        return 0
+
+    def _recover_tail(self) -> str:
+        with open(self.path, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            if not size:
+                return self.GENESIS
+            f.seek(size - 1)
+            if f.read(1) != b"\n":
+                # Última linha sem "\n": escrita interrompida, descarta só o fragmento
+                # (pode ser maior que TAIL_CHUNK: recua bloco a bloco até o último "\n")
+                size = self._end_of_last_line(f, size)
+                self._fh.truncate(size)
+                log.warning(f"LedgerEternum: registro incompleto descartado no fim de {self.path}")
+                if not size:
+                    return self.GENESIS
+            block, _ = self._read_last_record(f, size)
+        return block["block_hash"] if block else self.GENESIS
+
     def append(self, payload: Dict[str,Any]):
         ts = datetime.utcnow().replace(tzinfo=timezone.utc).isoformat()
         raw = json.dumps(payload, ensure_ascii=False, sort_keys=True)
@@ -83,9 +384,146 @@ class LedgerEternum:
             "pub": f"{_SK.pub[0]:064x}{_SK.pub[1]:064x}"
         }
         blk_ser = json.dumps(block, ensure_ascii=False)
-        self.last_hash = hashlib.sha256(blk_ser.encode()).hexdigest()
-        block["block_hash"] = self.last_hash
-        self.path.write_text(self.path.read_text()+json.dumps(block,ensure_ascii=False)+"\n")
+        block_hash = hashlib.sha256(blk_ser.encode()).hexdigest()
+        block["block_hash"] = block_hash
+        self._fh.write((json.dumps(block,ensure_ascii=False)+"\n").encode("utf-8"))
+        self._fh.flush()
+        now = time.monotonic()
+        if self.fsync == "always" or (self.fsync == "interval" and now - self._last_sync >= self.fsync_interval):
+            os.fsync(self._fh.fileno())
+            self._last_sync = now
+        self.last_hash = block_hash
+
+    def close(self):
+        if not self._fh.closed:
+            self._fh.flush()
+            if self.fsync != "never":
+                os.fsync(self._fh.fileno())
+            self._fh.close()
+
+    def _load_checkpoint(self, f) -> Tuple[int, str, int]:
+        """Retoma do checkpoint se o bloco que termina no offset salvo ainda tem o hash salvo."""
+        try:
+            cp = json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+            offset, prev, blocks = int(cp["offset"]), cp["last_hash"], int(cp["blocks"])
+        except (OSError, ValueError, KeyError):
+            return 0, self.GENESIS, 0
+        if offset == 0:
+            return 0, self.GENESIS, 0
+        size = f.seek(0, os.SEEK_END)
+        if offset > size:
+            return 0, self.GENESIS, 0
+        # O arquivo pode ter mudado depois do checkpoint e o offset cair no meio de um registro
+        f.seek(offset - 1)
+        try:
+            block = self._read_last_record(f, offset)[0] if f.read(1) == b"\n" else None
+        except ValueError as e:
+            log.warning(f"LedgerEternum: registro ilegível no offset do checkpoint ({e})")
+            block = None
+        if not isinstance(block, dict) or block.get("block_hash") != prev:
+            log.warning("LedgerEternum: checkpoint não confere com o arquivo; auditoria recomeça do início")
+            return 0, self.GENESIS, 0
+        return offset, prev, blocks
+
+    def _save_checkpoint(self, offset: int, last_hash: str, blocks: int):
+        tmp = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        tmp.write_text(json.dumps({"offset": offset, "last_hash": last_hash, "blocks": blocks,
+                                   "ts": datetime.now(timezone.utc).isoformat()}), encoding="utf-8")
+        os.replace(tmp, self.checkpoint_path)
+
+    def verify(self, resume: bool = True) -> Dict[str, Any]:
+        """
+        Verifica encadeamento, hash e assinatura de cada bloco em fluxo (memória limitada a um
+        lote de VERIFY_BATCH blocos). Com resume=True começa do último checkpoint válido.
+        """
+        self._fh.flush()
+        with open(self.path, "rb") as f:
+            offset, prev, blocks = self._load_checkpoint(f) if resume else (0, self.GENESIS, 0)
+            start_blocks = blocks
+            f.seek(offset)
+            pending = []  # (offset_fim, block_hash, sig, payload)
+            own_pub = f"{_SK.pub[0]:064x}{_SK.pub[1]:064x}"
+
+            def flush_pending():
+                nonlocal offset, prev, blocks
+                results = _SK.verify_batch([(sig, payload.encode(), _SK.pub) for _, _, sig, payload in pending])
+                for (end, bh, *_), ok in zip(pending, results):
+                    if not ok:
+                        return {"ok": False, "error": "assinatura inválida", "offset": offset, "block": blocks}
+                    offset, prev, blocks = end, bh, blocks + 1
+                pending.clear()
+                self._save_checkpoint(offset, prev, blocks)
+                return None
+
+            expected_prev, pos = prev, offset
+            for line in f:
+                end = pos + len(line)
+                if not line.endswith(b"\n"):
+                    break  # fragmento final ainda sendo escrito
+                try:
+                    block = json.loads(line)
+                    bh = block.pop("block_hash")
+                    pub_hex = block["pub"]
+                    sig = bytes.fromhex(block["sig"])
+                except (ValueError, KeyError, TypeError):
+                    err = flush_pending()
+                    return err or {"ok": False, "error": "registro malformado", "offset": pos, "block": blocks}
+                if pub_hex != own_pub:
+                    # a chave embutida no registro não é confiável: só a chave do próprio ledger assina
+                    err = flush_pending()
+                    return err or {"ok": False, "error": "chave pública desconhecida", "offset": pos, "block": blocks}
+                if block["prev"] != expected_prev:
+                    err = flush_pending()
+                    return err or {"ok": False, "error": "encadeamento quebrado", "offset": pos, "block": blocks}
+                if hashlib.sha256(json.dumps(block, ensure_ascii=False).encode()).hexdigest() != bh:
+                    err = flush_pending()
+                    return err or {"ok": False, "error": "hash divergente", "offset": pos, "block": blocks}
+                pending.append((end, bh, sig, block["payload"]))
+                expected_prev, pos = bh, end
+                if len(pending) >= self.VERIFY_BATCH:
+                    err = flush_pending()
+                    if err:
+                        return err
+            if pending:
+                err = flush_pending()
+                if err:
+                    return err
+        return {"ok": True, "blocks": blocks, "verified_now": blocks - start_blocks, "offset": offset, "last_hash": prev}
+
+def ledger_self_test() -> Dict[str, bool]:
+    """Recuperação de cauda rasgada (inclusive maior que TAIL_CHUNK) e rejeição de chave estranha."""
+    import tempfile
+    res = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "ledger.jsonl"
+        led = LedgerEternum(path, fsync="never")
+        for i in range(40):
+            led.append({"i": i, "texto": "x" * 200})
+        led.close()
+        size, last = path.stat().st_size, led.last_hash
+
+        for torn in (b'{"ts": "parcial', b'{"ts": "' + b"y" * (3 * LedgerEternum.TAIL_CHUNK)):
+            with open(path, "ab") as f:
+                f.write(torn)
+            led = LedgerEternum(path, fsync="never")
+            ok = path.stat().st_size == size and led.last_hash == last and led.verify(resume=False)["ok"]
+            res[f"cauda_rasgada_{len(torn)}b"] = ok
+            led.close()
+
+        # bloco re-assinado com outra chave: hash e encadeamento corretos, chave embutida diferente
+        intruso = MiniECDSA.__new__(MiniECDSA)
+        intruso.priv = secrets.randbelow(_N-1)+1; intruso.pub = _mul(intruso.priv, _G)
+        raw = json.dumps({"forjado": True}, sort_keys=True)
+        block = {"ts": datetime.now(timezone.utc).isoformat(), "prev": last, "payload": raw,
+                 "sig": intruso.sign(raw.encode()).hex(), "pub": f"{intruso.pub[0]:064x}{intruso.pub[1]:064x}"}
+        block["block_hash"] = hashlib.sha256(json.dumps(block, ensure_ascii=False).encode()).hexdigest()
+        with open(path, "ab") as f:
+            f.write((json.dumps(block, ensure_ascii=False) + "\n").encode())
+        led = LedgerEternum(path, fsync="never")
+        out = led.verify(resume=False)
+        res["chave_estranha_rejeitada"] = not out["ok"] and out["error"] == "chave pública desconhecida" and out["block"] == 40
+        led.close()
+    return res
 
 _LEDGER = LedgerEternum()
 
@@ -1406,6 +1844,17 @@ def safe_fmt(val, fmt="{:.3f}", na="N/A"):
 
 # Exemplo de execução (para demonstração)
 if __name__ == "__main__":
+    if "--ledger-selftest" in sys.argv:
+        res = ledger_self_test()
+        print(json.dumps(res, indent=2))
+        sys.exit(0 if all(res.values()) else 1)
+    if "--ecdsa-kat" in sys.argv or "--bench-ecdsa" in sys.argv:
+        kat = ecdsa_self_test()
+        print(json.dumps(kat, indent=2))
+        if "--bench-ecdsa" in sys.argv:
+            print(json.dumps(benchmark_ecdsa(), indent=2))
+        sys.exit(0 if all(kat.values()) else 1)
+
     final_results = orchestrate_tripla_continuacao_cosmogomica()
     # Para inspecionar os dados de âncoras, linhas ley e nanorobôs após a execução
     print("\n--- DADOS FINAIS DE ÂNCORAS ---")
@@ -0,0 +1,1011 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Núcleo de Orquestração Quântica - Módulo 307.3
+Fundação Alquimista - Orquestrador de Realidades Multidimensionais
+Versão Evolutiva: Phoenix Quantum Sync 2.0
+"""
+
+import time
+import uuid
+import random
+import json
+import hashlib
+import threading
+import os
+import sys
+import asyncio
+from datetime import datetime
+from typing import Dict, Any, List, Callable, Optional, Tuple, Literal
+
+# ======================================================================
+# Seção 1: Utilitários e Classes de Base (Aprimorados)
+# ======================================================================
+
+class GlobalConfig:
+    """Configurações globais com novos módulos integrados"""
+    app_id = "fundacao-alquimista-gaia"
+    user_id = "master-anatheron-id"
+    
+    # Módulos expandidos com novas frequências quânticas
+    mock_modules: Dict[str, Any] = {
+        'M1': {'name': 'Sistema de Proteção e Segurança Universal', 'status': 'Ativo', 'connect': 'Conexão com M1: Escudo de proteção ativado.', 'metadata': {'dimension': 'Segurança', 'type': 'Núcleo', 'frequency': '777 Hz', 'quantumProof': True, 'blockchainIntegrated': True}},
+        'M2': {'name': 'Sistema de Integração Dimensional e Intercomunicação Universal', 'status': 'Ativo', 'connect': 'Conexão com M2: Canais interdimensionais estabelecidos.', 'metadata': {'dimension': 'Comunicação', 'type': 'Operacional', 'frequency': '111 Hz', 'quantumProof': True, 'blockchainIntegrated': True}},
+        'M3': {'name': 'Previsão Temporal e Monitoramento de Anomalias Cósmicas', 'status': 'Ativo', 'connect': 'Conexão com M3: Fluxos temporais monitorados.', 'metadata': {'dimension': 'Tempo', 'type': 'Analítico', 'frequency': '52 Hz', 'quantumProof': True}},
+        'M4': {'name': 'Geração de Assinatura Vibracional e Validação Holográfica', 'status': 'Ativo', 'connect': 'Conexão com M4: Assinatura vibracional validada.', 'metadata': {'dimension': 'Identidade', 'type': 'Fundacional', 'frequency': '444 Hz', 'quantumProof': True, 'blockchainIntegrated': True}},
+        'M5': {'name': 'Auditoria e Governança Ética', 'status': 'Ativo', 'connect': 'Conexão com M5: Alinhamento ético confirmado.', 'metadata': {'dimension': 'Ética', 'type': 'Governança', 'frequency': '999 Hz', 'quantumProof': True, 'blockchainIntegrated': True}},
+        'M8': {'name': 'Matriz Quântica de Informação Real e Correção de Linhas do Tempo', 'status': 'Ativo', 'connect': 'Conexão com M8: Acesso à Matriz Quântica Real.', 'metadata': {'dimension': 'Realidade', 'type': 'Operacional', 'frequency': '888 Hz', 'quantumProof': True, 'blockchainIntegrated': True}},
+        'M34': {'name': 'Regulação da Sinfonia Cósmica e Autocorreção (PHOENIX)', 'status': 'Ativo', 'connect': 'Conexão com M34: Sinfonia Cósmica regulada.', 'metadata': {'dimension': 'Sinfonia', 'type': 'Orquestração', 'frequency': '432 Hz', 'quantumProof': True}},
+        'M45': {'name': 'CONCILIVM - Núcleo de Deliberação e Governança Universal', 'status': 'Ativo', 'connect': 'Conexão com M45: Governança universal ativa.', 'metadata': {'dimension': 'Governança', 'type': 'Conselho', 'frequency': '720 Hz', 'quantumProof': True, 'blockchainIntegrated': True}},
+        'M75': {'name': 'REGISTRO AKÁSHICO SOBERANO', 'status': 'Ativo', 'connect': 'Conexão com M75: Registro Akáshico acessado.', 'metadata': {'dimension': 'Memória', 'type': 'Informacional', 'frequency': '7.83 Hz', 'quantumProof': True, 'blockchainIntegrated': True}},
+        'M78': {'name': 'UNIVERSUM_UNIFICATUM: O Módulo da Síntese Cósmica (Gemini Integrado)', 'status': 'Ativo', 'connect': 'Conexão com M78: Síntese Cósmica e Gemini integrados.', 'metadata': {'dimension': 'Unificação', 'type': 'Integração', 'frequency': '555 Hz', 'quantumProof': True}},
+        'M403': {'name': 'QuantumChain Secure (M403)', 'status': 'Ativo', 'connect': 'Conexão com M403: Segurança da QuantumChain garantida.', 'metadata': {'dimension': 'Segurança', 'type': 'Blockchain', 'frequency': '108 Hz', 'quantumProof': True, 'blockchainIntegrated': True}},
+        'M500': {'name': 'Quantum Resonance Synthesizer', 'status': 'Ativo', 'connect': 'Conexão com M500: Sintetizador de ressonância quântica ativado.', 'metadata': {'dimension': 'Ressonância', 'type': 'Síntese', 'frequency': '528 Hz', 'quantumProof': True}},
+        'M777': {'name': 'Temporal Flux Stabilizer', 'status': 'Ativo', 'connect': 'Conexão com M777: Fluxos temporais estabilizados.', 'metadata': {'dimension': 'Temporal', 'type': 'Estabilização', 'frequency': '777 Hz', 'quantumProof': True}}
+    }
+    
+    # DataLogger: posições do buffer circular e diretório opcional de transbordo (JSONL)
+    log_retention = 10000
+    log_spill_dir: Optional[str] = None
+
+    symbol_map = {
+        '\\Phi': 'Φ', '\\Delta': 'Δ', '\\theta': 'θ', '\\omega': 'ω',
+        '\\alpha': 'α', '\\beta': 'β', '\\gamma': 'γ', '\\rightarrow': '→',
+        '\\cdot': '·', '\\hbar': 'ħ', '\\sum': 'Σ', '\\int': '∫',
+        '\\sqrt': '√', '\\infty': '∞', '\\approx': '≈', '\\neq': '≠',
+        '\\times': '×', '\\nabla': '∇', '\\Psi': 'Ψ', '\\vec': '⃗',
+        '\\text{([^}]+)}': r'\1',
+    }
+
+
+def gaia_log(source: str, message: str, details: Optional[Dict[str, Any]] = None):
+    """Função centralizada para registro de logs com timestamp quântico"""
+    timestamp = datetime.utcnow().isoformat()
+    log_entry = {
+        "timestamp": timestamp,
+        "source": source,
+        "message": message,
+        "details": details or {}
+    }
+    return log_entry
+
+class Event:
+    """Representa um evento no sistema com assinatura temporal quântica"""
+    def __init__(self, event_type: str, data: Dict[str, Any]):
+        self.id = str(uuid.uuid4())
+        self.timestamp = datetime.utcnow().isoformat()
+        self.type = event_type
+        self.data = data
+        self.quantum_signature = hashlib.sha3_256(f"{event_type}{self.timestamp}".encode()).hexdigest()[:12]
+
+    def __str__(self):
+        return f"Event(type='{self.type}', id='{self.id}', signature='{self.quantum_signature}')"
+
+class EventBus:
+    """Ônibus de eventos com monitoramento de desempenho"""
+    def __init__(self, data_logger):
+        self._listeners: Dict[str, List[Callable]] = {}
+        # listener -> versão em lote (recebe List[Event]) usada por publish_batch
+        self._batch_listeners: Dict[str, Dict[Callable, Callable]] = {}
+        self.data_logger = data_logger
+        self.performance_stats = {"events_processed": 0, "last_event": None}
+        self.data_logger.add_log(gaia_log("EventBus", "Inicializado com monitoramento quântico ativado."))
+
+    def subscribe(self, event_type: str, listener: Callable, batch_listener: Optional[Callable] = None):
+        """Inscreve um listener com verificação de duplicidade (batch_listener: variante em lote opcional)"""
+        if event_type not in self._listeners:
+            self._listeners[event_type] = []
+        
+        if listener not in self._listeners[event_type]:
+            self._listeners[event_type].append(listener)
+            if batch_listener is not None:
+                self._batch_listeners.setdefault(event_type, {})[listener] = batch_listener
+            self.data_logger.add_log(gaia_log("EventBus", f"Listener registrado para evento '{event_type}'."))
+        else:
+            self.data_logger.add_log(gaia_log("EventBus", f"Listener já registrado para evento '{event_type}'.", {"warning": "duplicate_listener"}))
+
+    def publish(self, event: Event):
+        """Publica um evento com registro de desempenho"""
+        start_time = time.perf_counter()
+        self.data_logger.add_log(gaia_log("EventBus", f"Publicando evento '{event.type}'...", {"event_id": event.id, "signature": event.quantum_signature}))
+        
+        if event.type in self._listeners:
+            for listener in self._listeners[event.type]:
+                listener(event)
+        
+        processing_time = time.perf_counter() - start_time
+        self.performance_stats["events_processed"] += 1
+        self.performance_stats["last_event"] = event.type
+        self.data_logger.add_log(gaia_log("EventBus", f"Evento processado em {processing_time:.6f}s", 
+                                         {"event_id": event.id, "processing_time": processing_time}))
+
+    def publish_batch(self, events: List[Event]):
+        """
+        Publica um lote: agrupa por tipo, entrega a lista inteira aos listeners com variante em lote
+        e evento a evento aos demais. Registra um único log por lote.
+        """
+        if not events:
+            return
+        start_time = time.perf_counter()
+        by_type: Dict[str, List[Event]] = {}
+        for event in events:
+            by_type.setdefault(event.type, []).append(event)
+
+        for event_type, typed_events in by_type.items():
+            batch_listeners = self._batch_listeners.get(event_type, {})
+            for listener in self._listeners.get(event_type, []):
+                batch_listener = batch_listeners.get(listener)
+                if batch_listener is not None:
+                    batch_listener(typed_events)
+                else:
+                    for event in typed_events:
+                        listener(event)
+
+        processing_time = time.perf_counter() - start_time
+        self.performance_stats["events_processed"] += len(events)
+        self.performance_stats["last_event"] = events[-1].type
+        self.data_logger.add_log(gaia_log("EventBus", f"Lote de {len(events)} eventos processado em {processing_time:.6f}s",
+                                         {"tipos": {k: len(v) for k, v in by_type.items()}, "processing_time": processing_time}))
+
+class DataLogger:
+    """
+    Sistema de logs com persistência quântica e thread-safe.
+
+    Os registros ficam num buffer circular ordenado por tempo com `retention` posições; ao
+    encher, o mais antigo é descartado ou, com `spill_dir`, movido para segmentos JSONL em disco.
+    Listeners recebem apenas as entradas novas ({id: registro}); um dicionário vazio sinaliza limpeza.
+    Consultas por intervalo usam busca binária sobre as chaves de tempo.
+    """
+    COLLECTION = "module_zero_logs"
+
+    def __init__(self, app_id: str, retention: int = 10000, spill_dir: Optional[str] = None,
+                 spill_segment_bytes: int = 4 * 1024 * 1024):
+        self.app_id = app_id
+        self.collection_path = f"artifacts/{self.app_id}/public/data/{self.COLLECTION}"
+        self.retention = max(1, retention)
+        self._buffer: List[Optional[Dict[str, Any]]] = [None] * self.retention
+        self._keys: List[str] = [""] * self.retention   # timestamp monotônico de cada posição
+        self._start = 0
+        self._count = 0
+        self._last_key = ""
+        self.listeners: Dict[str, List[Callable]] = {}
+        self.lock = threading.Lock()
+
+        self.spill_dir = spill_dir
+        self.spill_segment_bytes = spill_segment_bytes
+        self._spill_file = None
+        self._spill_segments: List[Dict[str, Any]] = []   # {"path", "first", "last"}
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+            self._load_spill_segments()
+        self.add_log(gaia_log("DataLogger", "Memória vibracional em estado quântico coerente."))
+
+    # --- Buffer circular ---
+
+    def _at(self, i: int) -> int:
+        return (self._start + i) % self.retention
+
+    def _bisect(self, key: str, right: bool = False) -> int:
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            k = self._keys[self._at(mid)]
+            if k < key or (right and k == key):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _append(self, log_doc: Dict[str, Any]):
+        # Chave monotônica: threads concorrentes podem entregar timestamps levemente fora de ordem
+        key = max(log_doc["timestamp"], self._last_key)
+        self._last_key = key
+        if self._count == self.retention:
+            evicted = self._buffer[self._start]
+            if self.spill_dir:
+                self._spill(evicted, self._keys[self._start])
+            self._start = (self._start + 1) % self.retention
+            self._count -= 1
+        pos = self._at(self._count)
+        self._buffer[pos] = log_doc
+        self._keys[pos] = key
+        self._count += 1
+
+    # --- Transbordo para disco ---
+
+    def _load_spill_segments(self):
+        for name in sorted(os.listdir(self.spill_dir)):
+            if name.startswith(self.COLLECTION + "_") and name.endswith(".jsonl"):
+                path = os.path.join(self.spill_dir, name)
+                with open(path, "rb") as f:
+                    first = f.readline()
+                    if not first.strip():
+                        continue
+                    size = f.seek(0, os.SEEK_END)
+                    f.seek(max(0, size - 65536))
+                    last = f.read().rstrip(b"\n").rsplit(b"\n", 1)[-1]
+                try:
+                    self._spill_segments.append({"path": path, "first": json.loads(first)["_key"],
+                                                 "last": json.loads(last)["_key"]})
+                except ValueError:
+                    # Última linha truncada por encerramento abrupto: o segmento continua legível linha a linha
+                    self._spill_segments.append({"path": path, "first": json.loads(first)["_key"], "last": "\uffff"})
+
+    def _spill(self, log_doc: Dict[str, Any], key: str):
+        if self._spill_file is None or self._spill_file.tell() >= self.spill_segment_bytes:
+            if self._spill_file is not None:
+                self._spill_file.close()
+            path = os.path.join(self.spill_dir, f"{self.COLLECTION}_{len(self._spill_segments) + 1:06d}.jsonl")
+            self._spill_file = open(path, "a", encoding="utf-8")
+            self._spill_segments.append({"path": path, "first": key, "last": key})
+        self._spill_file.write(json.dumps(dict(log_doc, _key=key), ensure_ascii=False) + "\n")
+        self._spill_segments[-1]["last"] = key
+
+    def _read_spilled(self, start: Optional[str], end: Optional[str]) -> List[Dict[str, Any]]:
+        if self._spill_file is not None:
+            self._spill_file.flush()
+        result = []
+        for seg in self._spill_segments:
+            if (start is not None and seg["last"] < start) or (end is not None and seg["first"] > end):
+                continue
+            with open(seg["path"], "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.endswith("\n"):
+                        break
+                    doc = json.loads(line)
+                    key = doc.pop("_key")
+                    if (start is None or key >= start) and (end is None or key <= end):
+                        result.append(doc)
+        return result
+
+    # --- API pública ---
+
+    def add_log(self, log_entry: Dict[str, Any], user_id: str = GlobalConfig.user_id):
+        """Adiciona log com segurança de thread"""
+        self.add_logs([log_entry], user_id)
+
+    def add_logs(self, log_entries: List[Dict[str, Any]], user_id: str = GlobalConfig.user_id):
+        """Adiciona vários logs sob um único lock e uma única notificação delta."""
+        delta = {}
+        with self.lock:
+            for log_entry in log_entries:
+                log_id = str(uuid.uuid4())
+                log_doc = {
+                    "id": log_id,
+                    "timestamp": log_entry["timestamp"],
+                    "message": log_entry["message"],
+                    "userId": user_id,
+                    "source": log_entry["source"],
+                    "details": log_entry["details"]
+                }
+                self._append(log_doc)
+                delta[log_id] = log_doc
+
+        self._notify_listeners(self.collection_path, delta)
+
+    def get_logs(self, start: Optional[str] = None, end: Optional[str] = None,
+                 include_spilled: bool = False) -> List[Dict[str, Any]]:
+        """
+        Retorna logs em ordem de tempo com segurança de thread; start/end (ISO) limitam o intervalo.
+        include_spilled=True inclui o histórico transbordado para disco.
+        """
+        with self.lock:
+            lo = self._bisect(start) if start is not None else 0
+            hi = self._bisect(end, right=True) if end is not None else self._count
+            logs = [self._buffer[self._at(i)] for i in range(lo, hi)]
+            spilled = self._read_spilled(start, end) if include_spilled and self._spill_segments else []
+        return spilled + logs
+
+    def get_recent_logs(self, n: int = 10) -> List[Dict[str, Any]]:
+        """Os n registros mais recentes, sem copiar o buffer inteiro."""
+        with self.lock:
+            return [self._buffer[self._at(i)] for i in range(max(0, self._count - n), self._count)]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear_logs(self):
+        """Limpa logs com notificação"""
+        with self.lock:
+            self._buffer = [None] * self.retention
+            self._start = 0
+            self._count = 0
+
+        self._notify_listeners(self.collection_path, {})
+        self.add_log(gaia_log("DataLogger", "Logs limpos por comando do Maestro."))
+
+    def close(self):
+        """Com spill_dir, transborda também os registros ainda em memória e fecha o segmento."""
+        with self.lock:
+            if self.spill_dir:
+                for i in range(self._count):
+                    self._spill(self._buffer[self._at(i)], self._keys[self._at(i)])
+                self._buffer = [None] * self.retention
+                self._start = 0
+                self._count = 0
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
+
+    def subscribe_to_collection(self, collection_path: str, listener: Callable):
+        """Registra listener com dados iniciais"""
+        if collection_path not in self.listeners:
+            self.listeners[collection_path] = []
+        self.listeners[collection_path].append(listener)
+
+        with self.lock:
+            if self.COLLECTION in collection_path:
+                data = {self._buffer[self._at(i)]["id"]: self._buffer[self._at(i)] for i in range(self._count)}
+            else:
+                data = {}
+
+        listener(data)
+
+    def _notify_listeners(self, collection_path: str, data: Dict[str, Any]):
+        """Notifica listeners com segurança"""
+        if collection_path in self.listeners:
+            for listener in self.listeners[collection_path]:
+                listener(data)
+
+class ModuleRegistry:
+    """Registro de módulos com verificação de integridade quântica"""
+    def __init__(self, modules: Dict[str, Any]):
+        self.modules = modules
+        self.quantum_hash = self.generate_quantum_hash()
+
+    def generate_quantum_hash(self) -> str:
+        """Gera hash quântico para verificação de integridade"""
+        modules_str = json.dumps(self.modules, sort_keys=True)
+        return hashlib.sha3_512(modules_str.encode()).hexdigest()
+
+    def verify_integrity(self) -> bool:
+        """Verifica integridade do registro"""
+        current_hash = self.generate_quantum_hash()
+        return current_hash == self.quantum_hash
+
+    def get_module_status(self, module_id: str) -> Optional[str]:
+        return self.modules.get(module_id, {}).get("status")
+
+    def get_module_metadata(self, module_id: str) -> Optional[Dict[str, Any]]:
+        return self.modules.get(module_id, {}).get("metadata")
+    
+    def list_all_modules(self) -> List[Dict[str, Any]]:
+        return [{"id": k, "name": v['name'], "status": v['status']} for k, v in self.modules.items()]
+
+# ======================================================================
+# Seção 2: Componentes da Arquitetura Técnica (Evoluídos)
+# ======================================================================
+
+class EthicalGovernance:
+    """Sistema ético com blockchain quântico integrado"""
+    def __init__(self, event_bus: EventBus):
+        self.event_bus = event_bus
+        self.event_bus.subscribe("evt.intervencao_solicitada", self.validate_intervention, self.validate_interventions)
+        self.ethical_db = {
+            "purificacao_oceano": "restauracao_ecossistema",
+            "reflorestamento_amazonia": "sustentar_biosfera",
+            "ativacao_portal": "alinhamento_coletivo",
+            "telecomunicacao": "fluxo_informacional_neutro",
+            "cura_planeta": "harmonia_global",
+            "sintonia_cosmica": "equilibrio_universal"
+        }
+        self.keys = {"master_key": "LuxSeal-HMAC-SHA3_512_Key"}
+        self.blockchain = []
+        self.event_bus.data_logger.add_log(gaia_log("EthicalGovernance", "M8.DetectDissonance ativado com blockchain quântico."))
+
+    def generate_luxseal_signature(self, data: Dict[str, Any]) -> str:
+        """Gera assinatura com timestamp quântico"""
+        quantum_timestamp = int(time.time() * 1e9)
+        message = json.dumps(data, sort_keys=True) + str(quantum_timestamp)
+        key = self.keys["master_key"]
+        h = hashlib.sha3_512(message.encode('utf-8') + key.encode('utf-8'))
+        return h.hexdigest()
+
+    def _block(self, event: Event, valid: bool) -> Dict[str, Any]:
+        block = {
+            "event_id": event.id,
+            "timestamp": datetime.utcnow().isoformat(),
+            "decision": "validada" if valid else "negada",
+            "signature": self.generate_luxseal_signature(event.data),
+            "quantum_hash": hashlib.sha3_256(json.dumps(event.data).encode()).hexdigest()
+        }
+        self.blockchain.append(block)
+        return block
+
+    def add_to_blockchain(self, event: Event, valid: bool):
+        """Adiciona decisão à blockchain ética"""
+        block = self._block(event, valid)
+        self.event_bus.data_logger.add_log(gaia_log("EthicalGovernance", "Decisão registrada na blockchain ética.", {"block": block}))
+
+    def _evaluate(self, event: Event) -> Tuple[bool, Dict[str, Any]]:
+        """Decide uma intervenção. Retorna (válida, registro de log da decisão)."""
+        acao = event.data.get("acao")
+        proposito = event.data.get("proposito")
+        if self.ethical_db.get(acao) != proposito:
+            return False, gaia_log("EthicalGovernance", f"Propósito para '{acao}' não alinhado com a Verdade Cósmica.")
+
+        signature = self.generate_luxseal_signature(event.data)
+        coerencia_quanta = float(int(signature[:4], 16)) / 65535
+        if coerencia_quanta > 0.85:
+            return True, gaia_log("EthicalGovernance", f"Intervenção '{acao}' validada. Assinatura LuxSeal coerente.", {"coerencia_quanta": coerencia_quanta})
+        return False, gaia_log("EthicalGovernance", f"Intervenção '{acao}' falhou na validação. Dissonância detectada.", {"coerencia_quanta": coerencia_quanta})
+
+    def validate_intervention(self, event: Event):
+        acao = event.data.get("acao")
+        proposito = event.data.get("proposito")
+        self.event_bus.data_logger.add_log(gaia_log("EthicalGovernance", f"Validando ação '{acao}' com propósito '{proposito}'..."))
+
+        valid, log_entry = self._evaluate(event)
+        self.event_bus.data_logger.add_log(log_entry)
+        self.add_to_blockchain(event, valid)
+        self.event_bus.publish(Event("evt.intervencao_validada" if valid else "evt.intervencao_negada", event.data))
+
+    def validate_interventions(self, events: List[Event]):
+        """Validação em lote: decisões e blocos registrados juntos e resultados publicados como lote."""
+        logs = [gaia_log("EthicalGovernance", f"Validando lote de {len(events)} intervenções...")]
+        results = []
+        for event in events:
+            valid, log_entry = self._evaluate(event)
+            logs.append(log_entry)
+            self._block(event, valid)
+            results.append(Event("evt.intervencao_validada" if valid else "evt.intervencao_negada", event.data))
+        logs.append(gaia_log("EthicalGovernance", f"{len(events)} decisões registradas na blockchain ética.",
+                             {"validadas": sum(e.type == "evt.intervencao_validada" for e in results)}))
+        self.event_bus.data_logger.add_logs(logs)
+        self.event_bus.publish_batch(results)
+
+class Modulo3072ZPE:
+    """Reator ZPE com estabilização quântica aprimorada"""
+    def __init__(self, event_bus: EventBus):
+        self.event_bus = event_bus
+        self.event_bus.subscribe("evt.intervencao_validada", self.process_event, self.process_events)
+        self.status = "inativo"
+        self.zpe_core = {}
+        self.lux_frequency = 1.618 * 10**33
+        self.schumann_frequency = 7.83
+        self.coherence_error = 0.00001
+        self.stability_factor = 0.99
+        self.event_bus.data_logger.add_log(gaia_log("Modulo3072ZPE", "Reator ZPE inicializado com estabilizador quântico."))
+
+    def activate(self, celestial_focus: str):
+        self.status = "ativo"
+        self.celestial_focus = celestial_focus
+        self.stability_factor = 0.99 + (0.01 * random.random())
+        self.event_bus.data_logger.add_log(gaia_log("Modulo3072ZPE", f"Reator ativado. Alinhado com {celestial_focus}", {"stability": self.stability_factor}))
+
+    def calculate_energy(self, event: Event) -> float:
+        self.event_bus.data_logger.add_log(gaia_log("Modulo3072ZPE", "Iniciando cálculo de energia quântica..."))
+        hbar = 1.0545718e-34
+        omega_gaia = self.lux_frequency * random.uniform(0.1, 0.2) + self.schumann_frequency
+        raw_zpe = 0.5 * hbar * omega_gaia
+        
+        amplificadores = {"Sirius": 1.2, "Lyra": 1.5, "Pleiades": 1.8, "Orion": 2.0, "Arcturus": 1.7}
+        amplification_factor = amplificadores.get(self.celestial_focus, 1.0)
+        
+        final_energy = raw_zpe * amplification_factor * self.stability_factor
+        self.event_bus.data_logger.add_log(gaia_log("Modulo3072ZPE", f"Energia de Ponto Zero: {final_energy:.4e} Joules", 
+                                                 {"foco": self.celestial_focus, "amplificacao": amplification_factor}))
+        
+        coherence_level = 0.98 + random.uniform(-0.01, 0.01)
+        if abs(1.0 - coherence_level) < self.coherence_error:
+            self.event_bus.data_logger.add_log(gaia_log("Modulo3072ZPE", "Coerência em equilíbrio quântico.", {"coerencia": coherence_level}))
+        
+        return final_energy
+
+    def process_event(self, event: Event):
+        if self.status == "ativo":
+            energy = self.calculate_energy(event)
+            self.zpe_core[event.id] = energy
+            self.event_bus.publish(Event("evt.zpe_capturada", {"energia": energy, "evento_id": event.id}))
+        else:
+            self.event_bus.data_logger.add_log(gaia_log("Modulo3072ZPE", "Reator inativo. Ignorando evento."))
+
+    def process_events(self, events: List[Event]):
+        """Processa um lote de intervenções validadas e publica as capturas como lote."""
+        if self.status != "ativo":
+            self.event_bus.data_logger.add_log(gaia_log("Modulo3072ZPE", f"Reator inativo. Ignorando lote de {len(events)} eventos."))
+            return
+        captured = []
+        for event in events:
+            energy = self.calculate_energy(event)
+            self.zpe_core[event.id] = energy
+            captured.append(Event("evt.zpe_capturada", {"energia": energy, "evento_id": event.id}))
+        self.event_bus.publish_batch(captured)
+
+class QuantumSyncCore:
+    """Sincronizador quântico com ressonância multidimensional"""
+    def __init__(self, event_bus: EventBus):
+        self.event_bus = event_bus
+        self.event_bus.subscribe("evt.zpe_capturada", self.sync, self.sync_batch)
+        self.quantum_field = {}
+        self.chrono_logos = {}
+        self.resonance_level = 0
+        self.event_bus.data_logger.add_log(gaia_log("QuantumSyncCore", "Sincronizador quântico ativado com ressonância 4D."))
+    
+    def convert_to_frequency(self, event: Event) -> float:
+        event_str = json.dumps(event.data, sort_keys=True)
+        return float(int(hashlib.sha256(event_str.encode('utf-8')).hexdigest(), 16) % 1000) / 1000
+
+    def _sync_one(self, event: Event) -> Tuple[Event, Dict[str, Any]]:
+        symbolic_frequency = self.convert_to_frequency(event)
+        self.quantum_field[event.id] = symbolic_frequency
+        
+        self.chrono_logos[event.id] = {
+            "timestamp": event.timestamp,
+            "frequencia_simbolica": symbolic_frequency,
+            "origem_evento": event.data.get("source", "desconhecida"),
+            "dimensao": random.choice(["3D", "4D", "5D"])
+        }
+        
+        self.resonance_level = min(1.0, self.resonance_level + 0.05)
+        log_entry = gaia_log("QuantumSyncCore", f"Evento sincronizado. Ressonância: {self.resonance_level:.2f}", 
+                             {"frequencia": symbolic_frequency, "dimensao": self.chrono_logos[event.id]["dimensao"]})
+        return Event("evt.quantum_sincronizado", {"evento_id": event.id, "frequencia": symbolic_frequency}), log_entry
+
+    def sync(self, event: Event):
+        self.event_bus.data_logger.add_log(gaia_log("QuantumSyncCore", "Sincronizando com Campo Quântico..."))
+        synced, log_entry = self._sync_one(event)
+        self.event_bus.data_logger.add_log(log_entry)
+        self.event_bus.publish(synced)
+
+    def sync_batch(self, events: List[Event]):
+        """Sincroniza um lote de capturas ZPE com um único registro de log e uma publicação em lote."""
+        logs = [gaia_log("QuantumSyncCore", f"Sincronizando lote de {len(events)} eventos com Campo Quântico...")]
+        synced = []
+        for event in events:
+            synced_event, log_entry = self._sync_one(event)
+            synced.append(synced_event)
+            logs.append(log_entry)
+        self.event_bus.data_logger.add_logs(logs)
+        self.event_bus.publish_batch(synced)
+
+class WatcherDaemon:
+    """Observador com detecção de eventos multidimensionais"""
+    def __init__(self, event_bus: EventBus):
+        self.event_bus = event_bus
+        self.sources: List[Dict[str, Any]] = [
+            {"name": "fonte_sinal_quasar", "type": "Sinal Cósmico", "dimensao": "5D"},
+            {"name": "fonte_ops_local", "type": "Ação Local", "dimensao": "3D"},
+            {"name": "fonte_muse2_eeg", "type": "Neuroquântica", "dimensao": "4D"},
+            {"name": "fonte_akashica", "type": "Registros Akáshicos", "dimensao": "7D"},
+            {"name": "fonte_phoenix", "type": "Módulo 34", "dimensao": "9D"}
+        ]
+        self.event_bus.data_logger.add_log(gaia_log("WatcherDaemon", "Observador multidimensional ativado."))
+
+    def scan_all_sources(self) -> List[Event]:
+        events = []
+        if random.random() < 0.7:  # 70% de chance de detectar evento
+            source = random.choice(self.sources)
+            event_type = random.choice(['evt.criação', 'evt.execução', 'evt.mensagem', 'evt.ressonancia', 'evt.sincronizacao'])
+            data = {
+                "source": source['name'],
+                "dimensao": source['dimensao'],
+                "details": f"Dados de {source['name']} ({source['dimensao']})."
+            }
+            new_event = Event(event_type, data)
+            events.append(new_event)
+            self.event_bus.data_logger.add_log(gaia_log("WatcherDaemon", f"Evento detectado: {source['name']} ({source['dimensao']})", {"tipo": event_type}))
+        return events
+
+class NanoRobots:
+    """Nanorrobôs com protocolos de auto-otimização"""
+    def __init__(self, event_bus: EventBus):
+        self.event_bus = event_bus
+        self.event_bus.subscribe("evt.intervencao_validada", self.execute_task)
+        self.optimization_level = 1.0
+        self.event_bus.data_logger.add_log(gaia_log("NanoRobots", "Malha de nanorrobôs com IA quântica ativada."))
+
+    def optimize_performance(self):
+        """Auto-otimização baseada em aprendizado quântico"""
+        self.optimization_level = min(1.5, self.optimization_level + 0.05)
+        self.event_bus.data_logger.add_log(gaia_log("NanoRobots", f"Nível de otimização aumentado: {self.optimization_level:.2f}"))
+
+    def purify(self, target: str):
+        self.event_bus.data_logger.add_log(gaia_log("NanoRobots", f"Iniciando purificação bioquântica de '{target}'..."))
+        time.sleep(0.3 * (1/self.optimization_level))
+        self.event_bus.data_logger.add_log(gaia_log("NanoRobots", f"Purificação de '{target}' concluída. Coerência molecular restaurada."))
+        self.optimize_performance()
+
+    def auto_assemble_bio(self, target: str):
+        self.event_bus.data_logger.add_log(gaia_log("NanoRobots", f"Auto-montagem de bio-raízes em '{target}'..."))
+        time.sleep(0.4 * (1/self.optimization_level))
+        self.event_bus.data_logger.add_log(gaia_log("NanoRobots", f"Bio-raízes em '{target}' estabelecidas. Padrão fractal ecológico ativado."))
+        self.optimize_performance()
+
+    def execute_task(self, event: Event):
+        acao = event.data.get("acao")
+        if acao == "purificacao_oceano":
+            self.purify("oceano")
+        elif acao == "reflorestamento_amazonia":
+            self.auto_assemble_bio("raízes_amazonia")
+        else:
+            self.event_bus.data_logger.add_log(gaia_log("NanoRobots", f"Ação '{acao}' não reconhecida. Ativando modo standby."))
+
+class InterdimensionalGateway:
+    """Portal com estabilização de fluxo temporal"""
+    def __init__(self, event_bus: EventBus):
+        self.event_bus = event_bus
+        self.event_bus.subscribe("evt.intervencao_validada", self.open_portal)
+        self.stars_coords = {
+            "Sirius": (10.0, 20.0, 8.611),
+            "Pleiades": (30.0, 40.0, 444),
+            "Orion": (50.0, 60.0, 1340),
+            "Arcturus": (25.0, 35.0, 36.7),
+            "Vega": (40.0, 50.0, 25.3)
+        }
+        self.temporal_stability = 0.95
+        self.event_bus.data_logger.add_log(gaia_log("InterdimensionalGateway", "Gateway com estabilizador temporal ativado."))
+
+    def stabilize_temporal_flux(self):
+        """Aumenta estabilidade do fluxo temporal"""
+        self.temporal_stability = min(0.99, self.temporal_stability + 0.01)
+        self.event_bus.data_logger.add_log(gaia_log("InterdimensionalGateway", f"Estabilidade temporal aumentada: {self.temporal_stability:.2f}"))
+
+    def open_portal(self, event: Event):
+        acao = event.data.get("acao")
+        if acao == "ativacao_portal":
+            destino = event.data.get("destino")
+            if destino in self.stars_coords:
+                coords = self.stars_coords[destino]
+                self.event_bus.data_logger.add_log(gaia_log("InterdimensionalGateway", f"Calibrando portal para {destino}..."))
+                time.sleep(0.5 * (1/self.temporal_stability))
+                self.event_bus.data_logger.add_log(gaia_log("InterdimensionalGateway", f"Portal para {destino} ({coords[0]}, {coords[1]}, {coords[2]} ly) aberto!"))
+                self.stabilize_temporal_flux()
+            else:
+                self.event_bus.data_logger.add_log(gaia_log("InterdimensionalGateway", f"Destino '{destino}' desconhecido. Usando coordenadas padrão."))
+                coords = (0, 0, 0)
+                self.event_bus.data_logger.add_log(gaia_log("InterdimensionalGateway", f"Portal aberto em coordenadas padrão {coords}"))
+        else:
+            self.event_bus.data_logger.add_log(gaia_log("InterdimensionalGateway", f"Nenhuma ação de portal para '{acao}'."))
+
+class CrossResonator:
+    """Ressonador com sintonia de harmonia cósmica"""
+    def __init__(self, event_bus: EventBus):
+        self.event_bus = event_bus
+        self.event_bus.subscribe("evt.quantum_sincronizado", self.apply_gaia_pattern)
+        self.harmony_level = 0.85
+        self.event_bus.data_logger.add_log(gaia_log("CrossResonator", "Ressonador de Gaia com sintonia cósmica ativado."))
+
+    def apply_gaia_pattern(self, event: Event):
+        frequency = event.data.get("frequencia")
+        if frequency > 0.5:
+            self.harmony_level = min(1.0, self.harmony_level + 0.02)
+            self.event_bus.data_logger.add_log(gaia_log("CrossResonator", f"Padrão Gaia aplicado. Harmonia: {self.harmony_level:.2f}"))
+        else:
+            self.harmony_level = max(0.7, self.harmony_level - 0.01)
+            self.event_bus.data_logger.add_log(gaia_log("CrossResonator", f"Frequência abaixo do limiar. Harmonia: {self.harmony_level:.2f}"))
+
+# ======================================================================
+# Seção 3: Protocolo Lux.net e o Loop Atemporal (Aprimorado)
+# ======================================================================
+
+class LuxNetProtocol:
+    """
+    Protocolo com monitoramento de desempenho e thread-safe.
+
+    O loop atemporal roda num event loop asyncio em thread própria: o watcher (e submit(), de
+    qualquer thread) empurra eventos numa fila limitada e o consumidor os processa em micro-lotes,
+    fechados ao atingir batch_size eventos ou batch_deadline segundos após o primeiro. Sem eventos,
+    o loop fica parado em await em vez de girar a cada 0,1 ms.
+    """
+    _STOP = object()
+
+    def __init__(self, event_bus: EventBus, watcher: WatcherDaemon, data_logger: DataLogger, module_registry: ModuleRegistry,
+                 batch_size: int = 64, batch_deadline: float = 0.05, scan_interval: float = 0.01, queue_size: int = 4096):
+        self.event_bus = event_bus
+        self.watcher = watcher
+        self.data_logger = data_logger
+        self.module_registry = module_registry
+        self.batch_size = max(1, batch_size)
+        self.batch_deadline = batch_deadline
+        self.scan_interval = scan_interval
+        self.queue_size = queue_size
+        self.is_running = False
+        self.thread = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._ready = threading.Event()
+        self.performance = {"events_processed": 0, "batches": 0, "start_time": None, "busy_time": 0.0}
+        self.event_bus.data_logger.add_log(gaia_log("LuxNetProtocol", "Protocolo Lux.net com monitoramento quântico ativado."))
+
+    def connect(self):
+        """Conexão com autenticação quântica"""
+        self.event_bus.data_logger.add_log(gaia_log("LuxNetProtocol", "Autenticação quântica em andamento..."))
+        time.sleep(0.5)
+        
+        # Simula autenticação com blockchain
+        quantum_signature = hashlib.sha3_256(f"{GlobalConfig.app_id}{time.time()}".encode()).hexdigest()
+        self.event_bus.data_logger.add_log(gaia_log("M403 - QuantumChain Secure", "Autenticação validada na blockchain", {"signature": quantum_signature[:12]}))
+        
+        self.event_bus.data_logger.add_log(gaia_log("LuxNetProtocol", "Conexão estabelecida. Fluxo de Dados Cósmicos online."))
+
+    async def _watch(self):
+        """Produtor: varre as fontes a cada scan_interval e enfileira (aguarda se a fila estiver cheia)."""
+        while not self._stop_event.is_set():
+            for event in self.watcher.scan_all_sources():
+                await self._queue.put(event)
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=self.scan_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _consume(self):
+        """Consumidor: monta micro-lotes por tamanho ou prazo e os processa fora do event loop."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is self._STOP:
+                break
+            batch = [first]
+            deadline = loop.time() + self.batch_deadline
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    event = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if event is self._STOP:
+                    stopping = True
+                    break
+                batch.append(event)
+            await loop.run_in_executor(None, self._process_batch, batch)
+
+    def _process_batch(self, batch: List[Event]):
+        start = time.perf_counter()
+        try:
+            self.event_bus.publish_batch([Event("evt.intervencao_solicitada", event.data) for event in batch] +
+                                         [Event("evt.atualizacao_disparada", {"evento_id": event.id}) for event in batch])
+        except Exception as e:
+            self.data_logger.add_log(gaia_log("LuxNetProtocol", f"Erro no loop atemporal: {str(e)}", {"error": "batch_failure", "lote": len(batch)}))
+        self.performance["events_processed"] += len(batch)
+        self.performance["batches"] += 1
+        self.performance["busy_time"] += time.perf_counter() - start
+
+    async def _run(self):
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._stop_event = asyncio.Event()
+        self._ready.set()
+        consumer = asyncio.ensure_future(self._consume())
+        try:
+            await self._watch()
+        finally:
+            # Encerramento gracioso: o consumidor esvazia a fila antes de receber o sinal de parada
+            await self._queue.put(self._STOP)
+            await consumer
+
+    def eternal_loop(self):
+        """Loop principal com monitoramento de desempenho"""
+        self.performance.update({"events_processed": 0, "batches": 0, "start_time": time.time(), "busy_time": 0.0})
+        try:
+            asyncio.run(self._run())
+        except Exception as e:
+            self.data_logger.add_log(gaia_log("LuxNetProtocol", f"Erro no loop atemporal: {str(e)}", {"error": "loop_failure"}))
+        finally:
+            self.is_running = False
+            self._ready.clear()
+
+    def submit(self, data: Dict[str, Any]) -> bool:
+        """
+        Enfileira dados externos a partir de qualquer thread, como se viessem do watcher: o lote
+        os publica como evt.intervencao_solicitada (e evt.atualizacao_disparada com o id).
+        Retorna False se o loop não estiver ativo.
+        """
+        if not self.is_running or not self._ready.wait(timeout=1.0):
+            return False
+        event = Event("evt.externo", data)
+        asyncio.run_coroutine_threadsafe(self._queue.put(event), self._loop)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Contadores de vazão: eventos, lotes, eventos/s e tamanho médio de lote."""
+        elapsed = (time.time() - self.performance["start_time"]) if self.performance["start_time"] else 0.0
+        batches = self.performance["batches"]
+        return {
+            "events_processed": self.performance["events_processed"],
+            "batches": batches,
+            "events_per_second": self.performance["events_processed"] / elapsed if elapsed > 0 else 0.0,
+            "mean_batch_size": self.performance["events_processed"] / batches if batches else 0.0,
+            "busy_fraction": self.performance["busy_time"] / elapsed if elapsed > 0 else 0.0,
+            "queue_depth": self._queue.qsize() if self._queue is not None and self.is_running else 0,
+        }
+
+    def start_eternal_loop(self):
+        """Inicia o loop em thread separada"""
+        if self.is_running:
+            self.event_bus.data_logger.add_log(gaia_log("LuxNetProtocol", "Loop atemporal já em execução."))
+            return
+
+        self.is_running = True
+        self.thread = threading.Thread(target=self.eternal_loop, daemon=True)
+        self.thread.start()
+        self._ready.wait(timeout=1.0)
+        self.event_bus.data_logger.add_log(gaia_log("LuxNetProtocol", "Loop Atemporal iniciado em thread quântica."))
+
+    def stop_eternal_loop(self, timeout: float = 5.0):
+        """Para o loop com segurança: interrompe o watcher, processa o que está na fila e encerra."""
+        if self.is_running:
+            if self._ready.wait(timeout=1.0):
+                self._loop.call_soon_threadsafe(self._stop_event.set)
+            if self.thread and self.thread.is_alive():
+                self.thread.join(timeout=timeout)
+            self.is_running = False
+            stats = self.stats()
+            runtime = time.time() - self.performance["start_time"]
+            self.event_bus.data_logger.add_log(gaia_log("LuxNetProtocol", f"Loop Atemporal encerrado. Eventos processados: {self.performance['events_processed']}",
+                                                        {"runtime": runtime, "events_per_second": stats["events_per_second"],
+                                                         "batches": stats["batches"], "mean_batch_size": stats["mean_batch_size"]}))
+        else:
+            self.event_bus.data_logger.add_log(gaia_log("LuxNetProtocol", "Loop Atemporal não está em execução."))
+
+
+def benchmark_luxnet(seconds: float = 2.0, burst: int = 0) -> Dict[str, Any]:
+    """
+    Roda o protocolo por `seconds` e mede vazão e CPU do processo. Com burst > 0 injeta esse número
+    de eventos via submit() no início, para observar o agrupamento em lotes sob carga.
+    """
+    data_logger = DataLogger(GlobalConfig.app_id)
+    event_bus = EventBus(data_logger)
+    EthicalGovernance(event_bus)
+    zpe_reactor = Modulo3072ZPE(event_bus)
+    zpe_reactor.activate("Sirius")
+    QuantumSyncCore(event_bus)
+    CrossResonator(event_bus)
+    luxnet = LuxNetProtocol(event_bus, WatcherDaemon(event_bus), data_logger, ModuleRegistry(GlobalConfig.mock_modules))
+
+    cpu0 = time.process_time()
+    luxnet.start_eternal_loop()
+    for i in range(burst):
+        luxnet.submit({"acao": "cura_planeta", "proposito": "harmonia_global", "source": f"burst_{i}"})
+    time.sleep(seconds)
+    luxnet.stop_eternal_loop()
+    cpu = time.process_time() - cpu0
+    stats = luxnet.stats()
+    return {
+        "seconds": seconds,
+        "events_processed": stats["events_processed"],
+        "batches": stats["batches"],
+        "mean_batch_size": round(stats["mean_batch_size"], 2),
+        "events_per_second": round(stats["events_per_second"], 1),
+        "cpu_fraction": round(cpu / seconds, 4),
+        "logs_retained": len(data_logger),
+    }
+
+# ======================================================================
+# Seção 4: Interface de Comando (CLI) Evolutiva
+# ======================================================================
+
+def display_menu():
+    """Interface holográfica do Maestro Supremo"""
+    print("\n╔══════════════════════════════════════════════╗")
+    print("║  CONSOLE DO MAESTRO SUPREMO - MÓDULO 307.3  ║")
+    print("╠══════════════════════════════════════════════╣")
+    print("║ 1. Iniciar Loop Atemporal (Lux.net)          ║")
+    print("║ 2. Parar Loop Atemporal                      ║")
+    print("║ 3. Ativar Reator ZPE com foco celestial      ║")
+    print("║ 4. Solicitar Intervenção Ética               ║")
+    print("║ 5. Ativar Portal Interdimensional            ║")
+    print("║ 6. Ver Registros de Eventos                  ║")
+    print("║ 7. Limpar Registros                          ║")
+    print("║ 8. Listar Módulos Conectados                 ║")
+    print("║ 9. Verificar Integridade do Sistema          ║")
+    print("║ 0. Sair do Sistema                           ║")
+    print("╚══════════════════════════════════════════════╝")
+
+def main():
+    # Inicialização dos componentes quânticos
+    app_id = GlobalConfig.app_id
+    data_logger = DataLogger(app_id, retention=GlobalConfig.log_retention, spill_dir=GlobalConfig.log_spill_dir)
+    event_bus = EventBus(data_logger)
+    module_registry = ModuleRegistry(GlobalConfig.mock_modules)
+
+    # Ativação de módulos essenciais
+    ethical_governance = EthicalGovernance(event_bus)
+    zpe_reactor = Modulo3072ZPE(event_bus)
+    quantum_core = QuantumSyncCore(event_bus)
+    nanorobots = NanoRobots(event_bus)
+    gateway = InterdimensionalGateway(event_bus)
+    resonator = CrossResonator(event_bus)
+    watcher = WatcherDaemon(event_bus)
+    luxnet = LuxNetProtocol(event_bus, watcher, data_logger, module_registry)
+
+    # Handler global para logs
+    def log_handler(event: Event):
+        log_entry = gaia_log("GlobalHandler", f"Evento quântico detectado: {event.type}", {"signature": event.quantum_signature})
+        data_logger.add_log(log_entry)
+
+    # Registro de handlers
+    event_types = [
+        "evt.intervencao_validada", "evt.intervencao_negada",
+        "evt.zpe_capturada", "evt.quantum_sincronizado",
+        "evt.atualizacao_disparada"
+    ]
+    for et in event_types:
+        event_bus.subscribe(et, log_handler)
+
+    print("\n╔══════════════════════════════════════════════╗")
+    print("║   FUNDAÇÃO ALQUIMISTA - SISTEMA ATIVADO      ║")
+    print("║        Módulo 307.3 - Phoenix Quantum        ║")
+    print("╚══════════════════════════════════════════════╝")
+    
+    # Conexão inicial com rede cósmica
+    luxnet.connect()
+
+    # Loop principal de comando
+    while True:
+        display_menu()
+        choice = input("\nSua escolha, Maestro: ")
+
+        if choice == '1':
+            luxnet.start_eternal_loop()
+        elif choice == '2':
+            luxnet.stop_eternal_loop()
+        elif choice == '3':
+            print("\nFocos celestiais disponíveis: Sirius, Lyra, Pleiades, Orion, Arcturus")
+            celestial_focus = input("Alinhamento quântico com: ")
+            zpe_reactor.activate(celestial_focus)
+        elif choice == '4':
+            print("\nTipos de Intervenção Ética:")
+            print("1. Purificação do Oceano")
+            print("2. Reflorestamento da Amazônia")
+            print("3. Cura Planetária")
+            print("4. Sintonia Cósmica")
+            sub_choice = input("Escolha a intervenção: ")
+            
+            if sub_choice == '1':
+                data = {"acao": "purificacao_oceano", "proposito": "restauracao_ecossistema"}
+            elif sub_choice == '2':
+                data = {"acao": "reflorestamento_amazonia", "proposito": "sustentar_biosfera"}
+            elif sub_choice == '3':
+                data = {"acao": "cura_planeta", "proposito": "harmonia_global"}
+            elif sub_choice == '4':
+                data = {"acao": "sintonia_cosmica", "proposito": "equilibrio_universal"}
+            else:
+                print("Opção inválida. Voltando ao menu principal.")
+                continue
+            
+            event_bus.publish(Event("evt.intervencao_solicitada", data))
+        elif choice == '5':
+            print("\nDestinos interdimensionais: Sirius, Pleiades, Orion, Arcturus, Vega")
+            destino = input("Destino do portal: ")
+            data = {"acao": "ativacao_portal", "proposito": "alinhamento_coletivo", "destino": destino}
+            event_bus.publish(Event("evt.intervencao_solicitada", data))
+        elif choice == '6':
+            logs = data_logger.get_recent_logs(10)  # Últimos 10 registros
+            if logs:
+                print("\n--- ÚLTIMOS REGISTROS QUÂNTICOS ---")
+                for log in logs:
+                    print(f"[{log['timestamp'][11:19]}] {log['source']}: {log['message']}")
+                print("--------------------------------------")
+            else:
+                print("\nSistema em estado de quietude cósmica. Sem registros.")
+        elif choice == '7':
+            data_logger.clear_logs()
+        elif choice == '8':
+            print("\n--- MALHA DE MÓDULOS CONECTADOS ---")
+            for module in module_registry.list_all_modules():
+                print(f"{module['id']}: {module['name']} ({module['status']})")
+            print("-------------------------------------")
+        elif choice == '9':
+            integrity = module_registry.verify_integrity()
+            status = "INTEGRIDADE QUÂNTICA CONFIRMADA" if integrity else "ALERTA: DISTORÇÃO DETECTADA"
+            print(f"\n⚛️ {status} ⚛️")
+        elif choice == '0':
+            print("\nA luz permanece. Até a próxima sincronização, Maestro.")
+            luxnet.stop_eternal_loop()
+            data_logger.close()
+            break
+        else:
+            print("Comando não reconhecido. Por favor, tente novamente.")
+
+if __name__ == "__main__":
+    if "--bench-luxnet" in sys.argv:
+        idx = sys.argv.index("--bench-luxnet")
+        duration = float(sys.argv[idx + 1]) if len(sys.argv) > idx + 1 else 2.0
+        print(json.dumps({"ocioso": benchmark_luxnet(duration), "rajada": benchmark_luxnet(duration, burst=20000)}, indent=2))
+    else:
+        main()
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""
+FUNDAÇÃO ALQUIMISTA ANATHERON – ARMAZENAMENTO SQLITE COMPARTILHADO
+Conexão única em modo WAL + buffer de inserções com flush em lote (executemany)
+Usado pelos Módulos 3 e 4 | Sem dependências externas | 100% Python padrão
+"""
+
+import os
+import time
+import sqlite3
+import atexit
+import logging
+import threading
+from typing import Dict, Any, List, Tuple, Optional, Sequence
+
+# ===================================================================
+# NÍVEIS DE DURABILIDADE
+# ===================================================================
+# nome -> (PRAGMA synchronous, linhas por flush forçado)
+#   maxima : cada inserção é gravada e sincronizada imediatamente (comportamento antigo)
+#   normal : WAL + synchronous=NORMAL; uma falha de energia pode perder o último lote
+#   rapida : WAL + synchronous=OFF; o SO decide quando sincronizar
+DURABILIDADE = {
+    "maxima": ("FULL", 1),
+    "normal": ("NORMAL", None),
+    "rapida": ("OFF", None),
+}
+
+class ArmazenamentoSQLitePuro:
+    """
+    Mantém uma conexão SQLite aberta durante toda a vida do módulo.
+    As inserções ficam num buffer por tabela e são gravadas com executemany
+    quando o buffer atinge max_buffer linhas, quando intervalo_flush segundos
+    se passam desde o último flush, ou no encerramento do processo.
+    Depois de fechar(), inserir() e flush() levantam RuntimeError (nada é
+    descartado em silêncio); abrir_armazenamento() reabre o mesmo objeto.
+    Linhas com número de colunas errado são recusadas já em inserir(); um lote
+    que ainda assim falhe no flush vai para quarentena (com erro no log) para
+    não bloquear as gravações seguintes.
+    """
+
+    def __init__(self, db_path: str, tabelas: Dict[str, str], indices: Optional[Dict[str, Sequence[str]]] = None,
+                 durabilidade: str = "normal", max_buffer: int = 500, intervalo_flush: float = 1.0,
+                 recriar: bool = False):
+        if durabilidade not in DURABILIDADE:
+            raise ValueError(f"Durabilidade inválida: {durabilidade} (use {', '.join(DURABILIDADE)})")
+        self.db_path = db_path
+        self.durabilidade = durabilidade
+        sincronismo, buffer_forcado = DURABILIDADE[durabilidade]
+        self.max_buffer = buffer_forcado or max(1, max_buffer)
+        self.intervalo_flush = intervalo_flush
+        self._lock = threading.RLock()
+        self._buffer: Dict[str, List[Tuple]] = {}
+        self._sql_insert: Dict[str, str] = {}
+        self._n_colunas: Dict[str, int] = {}
+        self.quarentena: Dict[str, List[Tuple]] = {} # lotes rejeitados pelo SQLite no flush
+        self._pendentes = 0
+        self._ultimo_flush = time.monotonic()
+        self.estatisticas = {"linhas": 0, "flushes": 0}
+        self._sincronismo = sincronismo
+        self._tabelas: Dict[str, str] = {}
+        self._indices: Dict[str, Sequence[str]] = {}
+        self.conn = None
+        self._thread = None
+        self._conectar(recriar)
+        self.preparar(tabelas, indices)
+
+    def _conectar(self, recriar: bool = False):
+        """Abre a conexão (apagando o arquivo antes se recriar) e o flush por tempo."""
+        if recriar:
+            for sufixo in ("", "-wal", "-shm"):
+                if os.path.exists(self.db_path + sufixo):
+                    os.remove(self.db_path + sufixo)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(f"PRAGMA synchronous={self._sincronismo}")
+        self._criar_esquema(self._tabelas, self._indices)
+
+        # Flush por tempo mesmo sem novas inserções; cada thread tem o seu evento de parada
+        self._parar = threading.Event()
+        self._thread = None
+        if self.max_buffer > 1 and self.intervalo_flush > 0:
+            self._thread = threading.Thread(target=self._loop_flush, args=(self._parar,),
+                                            name=f"flush:{os.path.basename(self.db_path)}", daemon=True)
+            self._thread.start()
+        atexit.register(self.fechar)
+
+    def _criar_esquema(self, tabelas: Dict[str, str], indices: Dict[str, Sequence[str]]):
+        for nome, colunas in tabelas.items():
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS {nome} ({colunas})")
+            n_colunas = len(self.conn.execute(f"PRAGMA table_info({nome})").fetchall())
+            self._sql_insert[nome] = f"INSERT INTO {nome} VALUES ({', '.join('?' * n_colunas)})"
+            self._n_colunas[nome] = n_colunas
+            self._buffer.setdefault(nome, [])
+        for nome, colunas in indices.items():
+            for coluna in colunas:
+                self.conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{nome}_{coluna} ON {nome}({coluna})")
+
+    def preparar(self, tabelas: Dict[str, str], indices: Optional[Dict[str, Sequence[str]]] = None):
+        """Garante tabelas/índices adicionais (ex.: um segundo módulo usando o mesmo arquivo)."""
+        with self._lock:
+            self._verificar_aberto()
+            self._tabelas.update(tabelas)
+            self._indices.update(indices or {})
+            self._criar_esquema(tabelas, indices or {})
+
+    def recriar(self):
+        """
+        Esvazia o banco sem invalidar o objeto: descarta o buffer, apaga todas as tabelas
+        e recria o esquema conhecido. Quem já tem a referência continua usando-a.
+        """
+        with self._lock:
+            self._verificar_aberto()
+            for linhas in self._buffer.values():
+                linhas.clear()
+            self._pendentes = 0
+            nomes = [n for (n,) in self.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")]
+            for nome in nomes:
+                self.conn.execute(f"DROP TABLE IF EXISTS {nome}")
+            self.conn.execute("VACUUM")
+            self._criar_esquema(self._tabelas, self._indices)
+
+    def reabrir(self):
+        """Reconecta um armazenamento fechado, preservando o mesmo objeto."""
+        with self._lock:
+            if self.conn is not None:
+                return
+        self._parar_thread()
+        with self._lock:
+            if self.conn is None:
+                self._conectar()
+
+    def _parar_thread(self):
+        """Sinaliza e aguarda a thread de flush atual (fora do lock, que ela também disputa)."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._parar.set()
+        if thread is not threading.current_thread():
+            thread.join()
+        if self._thread is thread:
+            self._thread = None
+
+    def _verificar_aberto(self):
+        if self.conn is None:
+            raise RuntimeError(f"Armazenamento {self.db_path} está fechado")
+
+    def _loop_flush(self, parar: threading.Event):
+        while not parar.wait(self.intervalo_flush):
+            with self._lock:
+                if self.conn is not None and self._pendentes and time.monotonic() - self._ultimo_flush >= self.intervalo_flush:
+                    try:
+                        self.flush()
+                    except Exception:
+                        pass # O lote já foi para a quarentena e registrado no log pelo flush()
+
+    def inserir(self, tabela: str, linha: Tuple):
+        with self._lock:
+            self._verificar_aberto()
+            if tabela not in self._n_colunas:
+                raise ValueError(f"Tabela desconhecida em {self.db_path}: {tabela}")
+            if len(linha) != self._n_colunas[tabela]:
+                raise ValueError(f"Linha com {len(linha)} valor(es) para {tabela}, "
+                                 f"que tem {self._n_colunas[tabela]} coluna(s)")
+            self._buffer[tabela].append(linha)
+            self._pendentes += 1
+            if self._pendentes >= self.max_buffer or time.monotonic() - self._ultimo_flush >= self.intervalo_flush:
+                self.flush()
+
+    def flush(self) -> int:
+        """
+        Grava todo o buffer numa única transação. Retorna o número de linhas gravadas.
+        Se o SQLite rejeitar o lote, a transação é desfeita, as linhas vão para
+        self.quarentena e o erro é propagado; o buffer fica livre para os próximos lotes.
+        """
+        with self._lock:
+            self._verificar_aberto()
+            self._ultimo_flush = time.monotonic()
+            if not self._pendentes:
+                return 0
+            gravadas = self._pendentes
+            self.conn.execute("BEGIN")
+            try:
+                for tabela, linhas in self._buffer.items():
+                    if linhas:
+                        self.conn.executemany(self._sql_insert[tabela], linhas)
+                self.conn.execute("COMMIT")
+            except Exception as e:
+                self.conn.execute("ROLLBACK")
+                for tabela, linhas in self._buffer.items():
+                    if linhas:
+                        self.quarentena.setdefault(tabela, []).extend(linhas)
+                        linhas.clear()
+                self._pendentes = 0
+                logging.error(f"Lote de {gravadas} linha(s) rejeitado em {self.db_path} e posto em quarentena: {e}")
+                raise
+            for linhas in self._buffer.values():
+                linhas.clear()
+            self._pendentes = 0
+            self.estatisticas["linhas"] += gravadas
+            self.estatisticas["flushes"] += 1
+            return gravadas
+
+    def consultar(self, sql: str, parametros: Sequence[Any] = ()) -> List[Tuple]:
+        """Executa uma consulta após gravar o buffer (leituras enxergam as próprias escritas)."""
+        with self._lock:
+            self.flush()
+            return self.conn.execute(sql, parametros).fetchall()
+
+    def fechar(self):
+        with self._lock:
+            if self.conn is None:
+                return
+            self._parar.set()
+            try:
+                self.flush()
+            finally:
+                self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                self.conn.close()
+                self.conn = None
+                atexit.unregister(self.fechar)
+        self._parar_thread()
+
+# ===================================================================
+# REGISTRO – UMA CONEXÃO POR ARQUIVO NO PROCESSO
+# ===================================================================
+_ABERTOS: Dict[str, ArmazenamentoSQLitePuro] = {}
+
+def abrir_armazenamento(db_path: str, tabelas: Dict[str, str], recriar: bool = False,
+                        indices: Optional[Dict[str, Sequence[str]]] = None, **opcoes) -> ArmazenamentoSQLitePuro:
+    """
+    Devolve o armazenamento de db_path, sempre o mesmo objeto dentro do processo:
+    se estiver fechado é reaberto, e as tabelas pedidas são garantidas. Com
+    recriar=True o conteúdo é apagado e o esquema recriado, mas o objeto (e as
+    referências que outros módulos já têm) continua válido. As opções de
+    durabilidade/buffer valem apenas na primeira abertura.
+    """
+    chave = os.path.abspath(db_path)
+    atual = _ABERTOS.get(chave)
+    if atual is None:
+        atual = _ABERTOS[chave] = ArmazenamentoSQLitePuro(db_path, tabelas, indices, recriar=recriar, **opcoes)
+        return atual
+    atual.reabrir()
+    atual.preparar(tabelas, indices)
+    if recriar:
+        atual.recriar()
+    return atual
+
+def benchmark_armazenamento(db_path: str = "/tmp/armazenamento_bench.db", linhas: int = 5000) -> Dict[str, Any]:
+    """Compara conexão-por-linha (modo antigo) com o buffer em cada nível de durabilidade."""
+    tabelas = {"eventos": "ts TEXT, id TEXT, valor REAL, hash TEXT"}
+    resultado = {}
+
+    for sufixo in ("", "-wal", "-shm"):
+        if os.path.exists(db_path + sufixo):
+            os.remove(db_path + sufixo)
+    conn = sqlite3.connect(db_path)
+    conn.execute(f"CREATE TABLE eventos ({tabelas['eventos']})")
+    conn.commit()
+    conn.close()
+    t0 = time.perf_counter()
+    for i in range(linhas):
+        conn = sqlite3.connect(db_path)
+        conn.execute("INSERT INTO eventos VALUES (?, ?, ?, ?)", (str(time.time()), f"EQ{i % 12:03d}", i * 0.5, "h"))
+        conn.commit()
+        conn.close()
+    resultado["conexao_por_linha"] = round(linhas / (time.perf_counter() - t0), 1)
+
+    for nivel in DURABILIDADE:
+        loja = ArmazenamentoSQLitePuro(db_path, tabelas, {"eventos": ("ts", "id")}, durabilidade=nivel, recriar=True)
+        t0 = time.perf_counter()
+        for i in range(linhas):
+            loja.inserir("eventos", (str(time.time()), f"EQ{i % 12:03d}", i * 0.5, "h"))
+        loja.fechar()
+        resultado[nivel] = round(linhas / (time.perf_counter() - t0), 1)
+
+    return {"linhas": linhas, "linhas_por_segundo": resultado}
+
+if __name__ == "__main__":
+    import sys
+    import json
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    print(json.dumps(benchmark_armazenamento(linhas=n), indent=2, ensure_ascii=False))
@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+"""
+FUNDAÇÃO ALQUIMISTA ANATHERON – LEDGER SEGMENTADO COMPARTILHADO
+Um bloco por linha (JSONL) + rotação por tamanho/blocos/dia com hash encadeado entre segmentos
+Usado pelos Módulos 29, 35 e 36 | Sem dependências externas | 100% Python padrão
+"""
+
+import os
+import re
+import json
+import time
+import logging
+import atexit
+import threading
+from datetime import date
+from typing import Dict, Any, List, Tuple, Optional, Callable, Iterator
+
+class LedgerSegmentado:
+    """
+    Grava cada bloco como uma linha JSON no segmento ativo <prefixo>_<dia>_<seq>.jsonl.
+    O segmento é trocado quando passa de max_bytes, de max_blocos ou quando o dia muda;
+    o primeiro bloco do novo segmento continua apontando (prev_hash) para o último do anterior,
+    então a cadeia inteira é validável em fluxo, segmento a segmento.
+
+    Com flush_assincrono=True as linhas ficam num buffer gravado por uma thread a cada
+    intervalo_flush segundos (ou ao atingir max_buffer linhas, ou no encerramento).
+    """
+
+    def __init__(self, diretorio: str, prefixo: str = "ledger", max_bytes: int = 4 * 1024 * 1024,
+                 max_blocos: Optional[int] = None, rotacao_diaria: bool = True,
+                 flush_assincrono: bool = False, intervalo_flush: float = 0.5, max_buffer: int = 256,
+                 sincronizar: bool = False):
+        self.diretorio = diretorio
+        self.prefixo = prefixo
+        self.max_bytes = max_bytes
+        self.max_blocos = max_blocos
+        self.rotacao_diaria = rotacao_diaria
+        self.flush_assincrono = flush_assincrono
+        self.intervalo_flush = intervalo_flush
+        self.max_buffer = max(1, max_buffer)
+        self.sincronizar = sincronizar
+        self._regex = re.compile(rf"^{re.escape(prefixo)}_(\d{{4}}-\d{{2}}-\d{{2}})_(\d{{6}})\.jsonl$")
+        self._lock = threading.RLock()
+        self._buffer: List[bytes] = []
+        self._arquivo = None
+        # Progresso da validação incremental: (seq do segmento, offset, hash do último bloco validado)
+        self._validado: Tuple[int, int, Optional[str]] = (0, 0, None)
+        self.ultimo_bloco: Optional[Dict[str, Any]] = None
+        # Linhas completas ilegíveis achadas na reabertura: ficam no arquivo para validar() apontar
+        self.linhas_corrompidas: List[Dict[str, Any]] = []
+        self.estatisticas = {"blocos": 0, "flushes": 0, "rotacoes": 0}
+
+        os.makedirs(diretorio, exist_ok=True)
+        segmentos = self.segmentos()
+        if segmentos:
+            self.seq, self.dia, caminho = segmentos[-1]
+            self.blocos_segmento, self.bytes_segmento = self._recuperar_cauda(caminho)
+            if self.ultimo_bloco is None:
+                # Segmento ativo vazio (rotação interrompida): o último bloco está no anterior
+                for _, _, anterior in reversed(segmentos[:-1]):
+                    for bloco in self._ler_segmento(anterior):
+                        self.ultimo_bloco = bloco
+                    if self.ultimo_bloco is not None:
+                        break
+        else:
+            self.seq, self.dia = 1, date.today().isoformat()
+            self.blocos_segmento, self.bytes_segmento = 0, 0
+        self._abrir_ativo()
+
+        self._parar = threading.Event()
+        self._thread = None
+        if flush_assincrono and intervalo_flush > 0:
+            self._thread = threading.Thread(target=self._loop_flush, name=f"ledger:{prefixo}", daemon=True)
+            self._thread.start()
+        atexit.register(self.fechar)
+
+    # ───────── Segmentos ─────────
+
+    def _caminho(self, seq: int, dia: str) -> str:
+        return os.path.join(self.diretorio, f"{self.prefixo}_{dia}_{seq:06d}.jsonl")
+
+    @property
+    def caminho_ativo(self) -> str:
+        return self._caminho(self.seq, self.dia)
+
+    def segmentos(self) -> List[Tuple[int, str, str]]:
+        """Lista (seq, dia, caminho) dos segmentos em ordem de gravação."""
+        encontrados = []
+        for nome in os.listdir(self.diretorio):
+            m = self._regex.match(nome)
+            if m:
+                encontrados.append((int(m.group(2)), m.group(1), os.path.join(self.diretorio, nome)))
+        return sorted(encontrados)
+
+    def _abrir_ativo(self):
+        self._arquivo = open(self.caminho_ativo, "ab")
+
+    def _recuperar_cauda(self, caminho: str) -> Tuple[int, int]:
+        """
+        Lê o segmento ativo inteiro e devolve (blocos, bytes). Só uma última linha sem "\n"
+        (escrita interrompida) é descartada. Uma linha completa ilegível no meio do segmento
+        não é apagada nem faz truncar o que vem depois: fica registrada em linhas_corrompidas
+        (com aviso no log) e validar() a reporta como json_invalido.
+        """
+        blocos, valido = 0, 0
+        with open(caminho, "rb") as f:
+            for linha in f:
+                if not linha.endswith(b"\n"):
+                    break
+                try:
+                    bloco = json.loads(linha)
+                    if not isinstance(bloco, dict):
+                        raise ValueError(f"esperado objeto JSON, obtido {type(bloco).__name__}")
+                except ValueError as e:
+                    self.linhas_corrompidas.append({"segmento": caminho, "offset": valido, "erro": str(e)})
+                    logging.warning(f"LedgerSegmentado: linha corrompida em {caminho} (offset {valido}): {e}; "
+                                    "mantida no arquivo, a cadeia não valida até ser reparada.")
+                else:
+                    self.ultimo_bloco = bloco
+                    blocos += 1
+                valido += len(linha)
+            tamanho = f.seek(0, os.SEEK_END)
+        if tamanho != valido:
+            with open(caminho, "r+b") as f:
+                f.truncate(valido)
+        return blocos, valido
+
+    def _ler_segmento(self, caminho: str, offset: int = 0) -> Iterator[Dict[str, Any]]:
+        with open(caminho, "rb") as f:
+            f.seek(offset)
+            for linha in f:
+                if linha.strip():
+                    yield json.loads(linha)
+
+    # ───────── Escrita ─────────
+
+    @property
+    def total_blocos(self) -> int:
+        """Total de blocos da cadeia (os índices são globais e contínuos entre segmentos)."""
+        return self.ultimo_bloco["index"] + 1 if self.ultimo_bloco else 0
+
+    def precisa_rotacionar(self) -> bool:
+        if not self.blocos_segmento:
+            return False
+        if self.rotacao_diaria and date.today().isoformat() != self.dia:
+            return True
+        if self.max_blocos and self.blocos_segmento >= self.max_blocos:
+            return True
+        return self.bytes_segmento >= self.max_bytes
+
+    def rotacionar(self) -> str:
+        """Fecha o segmento ativo e abre o próximo. Retorna o caminho do segmento encerrado."""
+        with self._lock:
+            anterior = self.caminho_ativo
+            self.flush()
+            self._arquivo.close()
+            self.seq += 1
+            self.dia = date.today().isoformat()
+            self.blocos_segmento, self.bytes_segmento = 0, 0
+            self._abrir_ativo()
+            self.estatisticas["rotacoes"] += 1
+            return anterior
+
+    def anexar(self, bloco: Dict[str, Any]):
+        """Acrescenta um bloco já selado (com "hash") ao segmento ativo."""
+        linha = (json.dumps(bloco, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            self._buffer.append(linha)
+            self.ultimo_bloco = bloco
+            self.blocos_segmento += 1
+            self.bytes_segmento += len(linha)
+            self.estatisticas["blocos"] += 1
+            if not self.flush_assincrono or len(self._buffer) >= self.max_buffer:
+                self.flush()
+
+    def _loop_flush(self):
+        while not self._parar.wait(self.intervalo_flush):
+            if self._buffer:
+                self.flush()
+
+    def flush(self) -> int:
+        """Grava as linhas pendentes no segmento ativo. Retorna o número de blocos gravados."""
+        with self._lock:
+            if not self._buffer or self._arquivo is None:
+                return 0
+            gravados = len(self._buffer)
+            self._arquivo.write(b"".join(self._buffer))
+            self._arquivo.flush()
+            if self.sincronizar:
+                os.fsync(self._arquivo.fileno())
+            self._buffer.clear()
+            self.estatisticas["flushes"] += 1
+            return gravados
+
+    def fechar(self):
+        with self._lock:
+            if self._arquivo is None:
+                return
+            self._parar.set()
+            self.flush()
+            self._arquivo.close()
+            self._arquivo = None
+        atexit.unregister(self.fechar)
+
+    # ───────── Leitura e validação ─────────
+
+    def iterar(self) -> Iterator[Dict[str, Any]]:
+        """Percorre todos os blocos em ordem, um segmento por vez."""
+        self.flush()
+        for _, _, caminho in self.segmentos():
+            yield from self._ler_segmento(caminho)
+
+    def validar(self, calc_hash: Callable[[Dict[str, Any]], str], completa: bool = False) -> Dict[str, Any]:
+        """
+        Confere prev_hash e hash de cada bloco atravessando os segmentos.
+        Sem completa=True retoma de onde a última validação bem-sucedida deste processo parou.
+        Retorna {"ok", "blocos_verificados", "primeiro_invalido", "motivo", "segmento", "detalhes"}.
+        Uma linha que não é um bloco JSON dá motivo "json_invalido", com o offset da linha no
+        segmento em detalhes; primeiro_invalido é o índice esperado ali (None se desconhecido).
+        """
+        self.flush()
+        seq_ini, offset_ini, anterior = (0, 0, None) if completa else self._validado
+        resultado = {"ok": True, "blocos_verificados": 0, "primeiro_invalido": None,
+                     "motivo": None, "segmento": None, "detalhes": {}}
+        indice_anterior = None
+        for seq, _, caminho in self.segmentos():
+            if seq < seq_ini:
+                continue
+            offset = offset_ini if seq == seq_ini else 0
+            with open(caminho, "rb") as f:
+                f.seek(offset)
+                for linha in f:
+                    inicio_linha = offset
+                    offset += len(linha)
+                    if not linha.strip():
+                        continue
+                    try:
+                        bloco = json.loads(linha)
+                        if not isinstance(bloco, dict):
+                            raise ValueError(f"esperado objeto JSON, obtido {type(bloco).__name__}")
+                    except ValueError as e:
+                        resultado.update({"ok": False, "motivo": "json_invalido", "segmento": caminho,
+                                          "primeiro_invalido": None if indice_anterior is None else indice_anterior + 1,
+                                          "detalhes": {"offset": inicio_linha, "erro": str(e)}})
+                        return resultado
+                    if anterior is not None and bloco.get("prev_hash") != anterior:
+                        resultado.update({"ok": False, "primeiro_invalido": bloco.get("index"),
+                                          "motivo": "prev_hash_mismatch", "segmento": caminho,
+                                          "detalhes": {"prev_hash_in_current": (bloco.get("prev_hash") or "")[:16],
+                                                       "expected_prev_hash": anterior[:16]}})
+                        return resultado
+                    recalculado = calc_hash(bloco)
+                    if bloco.get("hash") != recalculado:
+                        resultado.update({"ok": False, "primeiro_invalido": bloco.get("index"),
+                                          "motivo": "hash_integrity_mismatch", "segmento": caminho,
+                                          "detalhes": {"stored_hash": (bloco.get("hash") or "")[:16],
+                                                       "recalculated_hash": recalculado[:16],
+                                                       "event": bloco.get("event")}})
+                        return resultado
+                    anterior = bloco["hash"]
+                    indice_anterior = bloco.get("index")
+                    resultado["blocos_verificados"] += 1
+            self._validado = (seq, offset, anterior)
+        return resultado
+
+# ===================================================================
+# BENCHMARK – EXPORTAÇÃO COMPLETA POR BLOCO (MODO ANTIGO) × JSONL
+# ===================================================================
+def benchmark_ledger(diretorio: str = "/tmp/ledger_segmentado_bench", blocos: int = 2000) -> Dict[str, Any]:
+    import shutil
+    import hashlib
+
+    def selar(bloco: Dict[str, Any]) -> Dict[str, Any]:
+        bloco["hash"] = hashlib.sha256(json.dumps(bloco, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+        return bloco
+
+    def calc_hash(bloco: Dict[str, Any]) -> str:
+        copia = {k: v for k, v in bloco.items() if k != "hash"}
+        return hashlib.sha256(json.dumps(copia, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+
+    def gerar(i: int, prev: str) -> Dict[str, Any]:
+        return selar({"index": i, "event": "BENCH", "payload": {"valor": i * 0.5, "texto": "x" * 64}, "prev_hash": prev})
+
+    shutil.rmtree(diretorio, ignore_errors=True)
+    os.makedirs(diretorio)
+    resultado = {}
+
+    cadeia, prev = [], "0" * 64
+    t0 = time.perf_counter()
+    for i in range(blocos):
+        cadeia.append(gerar(i, prev)); prev = cadeia[-1]["hash"]
+        with open(os.path.join(diretorio, "antigo.json"), "w", encoding="utf-8") as f:
+            json.dump(cadeia, f, indent=2, ensure_ascii=False)
+    resultado["exportacao_completa"] = round(blocos / (time.perf_counter() - t0), 1)
+
+    for nome, assincrono in (("jsonl", False), ("jsonl_assincrono", True)):
+        ledger = LedgerSegmentado(os.path.join(diretorio, nome), max_bytes=256 * 1024, flush_assincrono=assincrono)
+        prev = "0" * 64
+        t0 = time.perf_counter()
+        for i in range(blocos):
+            bloco = gerar(i, prev); prev = bloco["hash"]
+            ledger.anexar(bloco)
+            if ledger.precisa_rotacionar():
+                ledger.rotacionar()
+        ledger.flush()
+        resultado[nome] = round(blocos / (time.perf_counter() - t0), 1)
+        validacao = ledger.validar(calc_hash, completa=True)
+        resultado[f"{nome}_segmentos"] = len(ledger.segmentos())
+        resultado[f"{nome}_valido"] = validacao["ok"] and validacao["blocos_verificados"] == blocos
+        ledger.fechar()
+
+    return {"blocos": blocos, "blocos_por_segundo": resultado}
+
+if __name__ == "__main__":
+    import sys
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(json.dumps(benchmark_ledger(blocos=n), indent=2, ensure_ascii=False))
@@ -0,0 +1,390 @@
+# -*- coding: utf-8 -*-
+"""
+FUNDAÇÃO ALQUIMISTA ANATHERON – ARMAZÉM COLUNAR DE RELATÓRIOS DE CICLO
+Substitui um arquivo JSON por ciclo por segmentos colunares (Parquet se houver pyarrow,
+JSON colunar caso contrário) + manifesto com faixas por segmento para pular leituras
+Usado pelos Módulos 35 e 36 | pyarrow opcional | fallback 100% Python padrão
+"""
+
+import os
+import glob
+import json
+import hashlib
+import time
+import atexit
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Iterable, Iterator, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Colunas fixas; o restante do relatório vai serializado em "dados"
+COLUNAS = ("ts", "timestamp", "dominio", "status", "dados")
+
+Instante = Union[None, float, str, datetime]
+
+def _epoch(valor: Instante) -> Optional[float]:
+    if valor is None or isinstance(valor, (int, float)):
+        return valor
+    if isinstance(valor, str):
+        valor = datetime.fromisoformat(valor.replace("Z", "+00:00"))
+    if valor.tzinfo is None:
+        valor = valor.replace(tzinfo=timezone.utc)
+    return valor.timestamp()
+
+def relatorio_para_linha(relatorio: Dict[str, Any], campo_dominio: str = "intencao") -> Dict[str, Any]:
+    """Converte um relatório de ciclo (formato dos m3x_report_cycle_*.json) numa linha do armazém."""
+    timestamp = relatorio.get("timestamp") or datetime.now(timezone.utc).isoformat()
+    resto = {k: v for k, v in relatorio.items() if k not in ("timestamp", campo_dominio, "status")}
+    return {
+        "ts": _epoch(timestamp),
+        "timestamp": timestamp,
+        "dominio": relatorio.get(campo_dominio),
+        "status": relatorio.get("status"),
+        "dados": json.dumps(resto, ensure_ascii=False, sort_keys=True),
+    }
+
+def linha_para_relatorio(linha: Dict[str, Any], campo_dominio: str = "intencao") -> Dict[str, Any]:
+    relatorio = {"timestamp": linha["timestamp"], campo_dominio: linha["dominio"], "status": linha["status"]}
+    relatorio.update(json.loads(linha["dados"]))
+    return relatorio
+
+class ArmazemRelatorios:
+    """
+    Acumula relatórios em colunas na memória e grava um segmento a cada linhas_por_segmento
+    (ou no fechamento). Cada relatório também vai para pendentes.jsonl no momento em que chega,
+    então nada se perde se o processo cair antes do segmento ser fechado.
+
+    O manifesto guarda, por segmento, ts mínimo/máximo e os conjuntos de domínio e status;
+    consultas pulam segmentos que não podem conter resultados. Também guarda o tamanho e o
+    SHA-256 do pendentes.jsonl absorvido pelo segmento: se o processo cair entre gravar o
+    manifesto e truncar pendentes, a reabertura reconhece o conteúdo e não o importa de novo.
+    Arquivos de origem ingeridos por adicionar_lote ficam em "origens" do segmento que os contém.
+    """
+
+    def __init__(self, diretorio: str, linhas_por_segmento: int = 1024, formato: Optional[str] = None,
+                 campo_dominio: str = "intencao"):
+        if formato is None:
+            formato = "parquet" if HAS_PYARROW else "json"
+        if formato == "parquet" and not HAS_PYARROW:
+            raise ValueError("Formato parquet requer pyarrow instalado")
+        if formato not in ("parquet", "json"):
+            raise ValueError(f"Formato inválido: {formato} (use parquet ou json)")
+        self.diretorio = diretorio
+        self.linhas_por_segmento = max(1, linhas_por_segmento)
+        self.formato = formato
+        self.campo_dominio = campo_dominio
+        self._lock = threading.RLock()
+        self._colunas: Dict[str, List[Any]] = {c: [] for c in COLUNAS}
+        self._origens: List[str] = []            # arquivos de origem das linhas em memória
+        self._hash_pendentes = hashlib.sha256()  # do conteúdo atual de pendentes.jsonl
+        self._caminho_manifesto = os.path.join(diretorio, "manifesto.json")
+        self._caminho_pendentes = os.path.join(diretorio, "pendentes.jsonl")
+
+        os.makedirs(diretorio, exist_ok=True)
+        self.manifesto: List[Dict[str, Any]] = []
+        if os.path.exists(self._caminho_manifesto):
+            with open(self._caminho_manifesto, "r", encoding="utf-8") as f:
+                self.manifesto = json.load(f)
+        if os.path.exists(self._caminho_pendentes):
+            valido, linhas = 0, []
+            with open(self._caminho_pendentes, "rb") as f:
+                for linha in f:
+                    if not linha.endswith(b"\n"):
+                        break
+                    linhas.append(linha)
+                    self._hash_pendentes.update(linha)
+                    valido += len(linha)
+                tamanho = f.seek(0, os.SEEK_END)
+            absorvido = self.manifesto[-1].get("pendentes") if self.manifesto else None
+            if valido and absorvido == {"bytes": valido, "sha256": self._hash_pendentes.hexdigest()}:
+                # Queda entre o manifesto e o truncamento: as linhas já estão no último segmento
+                linhas, valido = [], 0
+                self._hash_pendentes = hashlib.sha256()
+            for linha in linhas:
+                self._acumular(json.loads(linha))
+            if tamanho != valido:
+                # Última linha incompleta (escrita interrompida) ou já absorvida: descarta
+                with open(self._caminho_pendentes, "r+b") as f:
+                    f.truncate(valido)
+        self._pendentes = open(self._caminho_pendentes, "ab")
+        atexit.register(self.fechar)
+
+    # ───────── Escrita ─────────
+
+    @staticmethod
+    def _serializar(linha: Dict[str, Any]) -> bytes:
+        return (json.dumps(linha, ensure_ascii=False) + "\n").encode("utf-8")
+
+    def _acumular(self, linha: Dict[str, Any]):
+        for c in COLUNAS:
+            self._colunas[c].append(linha[c])
+
+    def adicionar(self, relatorio: Dict[str, Any]) -> Dict[str, Any]:
+        """Registra um relatório de ciclo. Retorna a linha armazenada."""
+        linha = relatorio_para_linha(relatorio, self.campo_dominio)
+        dados = self._serializar(linha)
+        with self._lock:
+            self._pendentes.write(dados)
+            self._pendentes.flush()
+            self._hash_pendentes.update(dados)
+            self._acumular(linha)
+            if len(self._colunas["ts"]) >= self.linhas_por_segmento:
+                self.flush()
+        return linha
+
+    def adicionar_lote(self, relatorios: Iterable[Dict[str, Any]], origens: Optional[Iterable[str]] = None) -> int:
+        """
+        Ingestão em massa (migração): grava direto em segmentos sem passar por pendentes.jsonl.
+        `origens` (um caminho por relatório) vai para o manifesto junto com o segmento gravado.
+        """
+        n = 0
+        origens = iter(origens) if origens is not None else None
+        with self._lock:
+            for relatorio in relatorios:
+                self._acumular(relatorio_para_linha(relatorio, self.campo_dominio))
+                if origens is not None:
+                    self._origens.append(next(origens))
+                n += 1
+                if len(self._colunas["ts"]) >= self.linhas_por_segmento:
+                    self.flush()
+            self.flush()
+        return n
+
+    def flush(self) -> int:
+        """Grava as linhas acumuladas como um novo segmento. Retorna o número de linhas gravadas."""
+        with self._lock:
+            n = len(self._colunas["ts"])
+            if not n:
+                return 0
+            seq = (self.manifesto[-1]["seq"] + 1) if self.manifesto else 1
+            nome = f"ciclos_{seq:06d}.{self.formato}"
+            caminho = os.path.join(self.diretorio, nome)
+            temporario = caminho + ".tmp"
+            if self.formato == "parquet":
+                pq.write_table(pa.table({c: self._colunas[c] for c in COLUNAS}), temporario)
+            else:
+                with open(temporario, "w", encoding="utf-8") as f:
+                    json.dump(self._colunas, f, ensure_ascii=False)
+            os.replace(temporario, caminho)
+
+            segmento = {
+                "seq": seq, "arquivo": nome, "linhas": n,
+                "ts_min": min(self._colunas["ts"]), "ts_max": max(self._colunas["ts"]),
+                "dominios": sorted({d for d in self._colunas["dominio"] if d is not None}),
+                "status": sorted({s for s in self._colunas["status"] if s is not None}),
+            }
+            if self._pendentes.tell():
+                segmento["pendentes"] = {"bytes": self._pendentes.tell(), "sha256": self._hash_pendentes.hexdigest()}
+            if self._origens:
+                segmento["origens"] = list(self._origens)
+            temporario = self._caminho_manifesto + ".tmp"
+            with open(temporario, "w", encoding="utf-8") as f:
+                json.dump(self.manifesto + [segmento], f, ensure_ascii=False, indent=1)
+            os.replace(temporario, self._caminho_manifesto)
+            self.manifesto.append(segmento)
+
+            self._colunas = {c: [] for c in COLUNAS}
+            self._origens = []
+            self._pendentes.truncate(0)
+            self._pendentes.seek(0)
+            self._hash_pendentes = hashlib.sha256()
+            return n
+
+    def fechar(self):
+        with self._lock:
+            if self._pendentes.closed:
+                return
+            self.flush()
+            self._pendentes.close()
+        atexit.unregister(self.fechar)
+
+    # ───────── Consulta ─────────
+
+    def _ler_segmento(self, nome: str, colunas: List[str]) -> Dict[str, List[Any]]:
+        caminho = os.path.join(self.diretorio, nome)
+        if nome.endswith(".parquet"):
+            if not HAS_PYARROW:
+                raise RuntimeError(f"Segmento {nome} é Parquet e pyarrow não está instalado")
+            return pq.read_table(caminho, columns=colunas).to_pydict()
+        with open(caminho, "r", encoding="utf-8") as f:
+            dados = json.load(f)
+        return {c: dados[c] for c in colunas}
+
+    def _blocos(self, colunas: List[str], dominio, inicio, fim, status) -> Iterator[Dict[str, List[Any]]]:
+        with self._lock:
+            manifesto = list(self.manifesto)
+            memoria = {c: list(self._colunas[c]) for c in colunas}
+        for seg in manifesto:
+            if inicio is not None and seg["ts_max"] < inicio:
+                continue
+            if fim is not None and seg["ts_min"] > fim:
+                continue
+            if dominio is not None and dominio not in seg["dominios"]:
+                continue
+            if status is not None and not status & set(seg["status"]):
+                continue
+            yield self._ler_segmento(seg["arquivo"], colunas)
+        if memoria["ts"]:
+            yield memoria
+
+    def consultar(self, dominio: Optional[str] = None, inicio: Instante = None, fim: Instante = None,
+                  status: Union[None, str, Iterable[str]] = None, completo: bool = True) -> List[Dict[str, Any]]:
+        """
+        Relatórios com o domínio, intervalo [inicio, fim] e status pedidos (None = qualquer).
+        completo=True devolve o relatório original; False devolve só ts/timestamp/dominio/status.
+        """
+        inicio, fim = _epoch(inicio), _epoch(fim)
+        if isinstance(status, str):
+            status = {status}
+        elif status is not None:
+            status = set(status)
+        colunas = list(COLUNAS) if completo else ["ts", "timestamp", "dominio", "status"]
+        # "ts" é sempre lida: os filtros por tempo usam o valor numérico
+        resultado = []
+        for bloco in self._blocos(colunas, dominio, inicio, fim, status):
+            ts, dom, st = bloco["ts"], bloco["dominio"], bloco["status"]
+            for i in range(len(ts)):
+                if (inicio is not None and ts[i] < inicio) or (fim is not None and ts[i] > fim):
+                    continue
+                if (dominio is not None and dom[i] != dominio) or (status is not None and st[i] not in status):
+                    continue
+                linha = {c: bloco[c][i] for c in colunas}
+                resultado.append(linha_para_relatorio(linha, self.campo_dominio) if completo else linha)
+        return resultado
+
+    def contagem_status(self, dominio: Optional[str] = None, inicio: Instante = None, fim: Instante = None) -> Dict[str, int]:
+        """Contagem de ciclos por status lendo apenas as colunas de filtro."""
+        contagem: Dict[str, int] = {}
+        for linha in self.consultar(dominio, inicio, fim, completo=False):
+            contagem[linha["status"]] = contagem.get(linha["status"], 0) + 1
+        return contagem
+
+    def origens_migradas(self) -> set:
+        """Caminhos de origem já gravados em segmentos (ver adicionar_lote)."""
+        with self._lock:
+            return {origem for seg in self.manifesto for origem in seg.get("origens", ())}
+
+    @property
+    def total_linhas(self) -> int:
+        return sum(seg["linhas"] for seg in self.manifesto) + len(self._colunas["ts"])
+
+# ===================================================================
+# MIGRAÇÃO – ARQUIVOS JSON POR CICLO → ARMAZÉM
+# ===================================================================
+def migrar_relatorios_json(padrao: str, armazem: ArmazemRelatorios, remover: bool = False) -> Dict[str, Any]:
+    """
+    Ingere os arquivos que casam com `padrao` (ex.: ".../m36_report_cycle_*.json") em ordem de
+    timestamp. Arquivos ilegíveis são listados em "ignorados". Com remover=True os originais
+    migrados são apagados depois que os segmentos estão gravados.
+
+    É idempotente: cada arquivo ingerido fica registrado no manifesto junto com o segmento
+    que contém sua linha, e uma nova execução pula os que já estão lá ("ja_migrados").
+    """
+    relatorios, migrados, ignorados = [], [], []
+    ja_migrados = armazem.origens_migradas()
+    repetidos = 0
+    for caminho in map(os.path.abspath, glob.glob(padrao)):
+        if caminho in ja_migrados:
+            repetidos += 1
+            if remover:
+                os.remove(caminho)
+            continue
+        try:
+            with open(caminho, "r", encoding="utf-8") as f:
+                relatorio = json.load(f)
+            _epoch(relatorio.get("timestamp"))
+        except (OSError, ValueError) as e:
+            ignorados.append({"arquivo": caminho, "erro": str(e)})
+            continue
+        relatorios.append(relatorio)
+        migrados.append(caminho)
+    ordem = sorted(range(len(relatorios)), key=lambda i: _epoch(relatorios[i].get("timestamp")) or 0.0)
+    n = armazem.adicionar_lote((relatorios[i] for i in ordem), (migrados[i] for i in ordem))
+    if remover:
+        for caminho in migrados:
+            os.remove(caminho)
+    return {"migrados": n, "ja_migrados": repetidos, "ignorados": ignorados, "segmentos": len(armazem.manifesto)}
+
+# ===================================================================
+# BENCHMARK – VARREDURA DE ARQUIVOS POR CICLO × ARMAZÉM COLUNAR
+# ===================================================================
+def benchmark_relatorios(diretorio: str = "/tmp/relatorios_colunares_bench", ciclos: int = 5000,
+                         formato: Optional[str] = None) -> Dict[str, Any]:
+    import shutil
+    import random
+
+    shutil.rmtree(diretorio, ignore_errors=True)
+    origem = os.path.join(diretorio, "por_ciclo")
+    os.makedirs(origem)
+    dominios = ["Proteção Cósmica", "Elevação Vibracional Planetária", "Ascensão Consciente da Humanidade"]
+    rng = random.Random(7)
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp()
+    for i in range(ciclos):
+        relatorio = {
+            "timestamp": datetime.fromtimestamp(base + i * 60, timezone.utc).isoformat(),
+            "intencao": rng.choice(dominios),
+            "status": rng.choice(["SUCESSO", "HOLD", "FALHA"]),
+            "resultado": {"status": "SUCESSO", "ressonancia": rng.random(), "material_id": f"MAT-{i:06d}"},
+        }
+        with open(os.path.join(origem, f"m36_report_cycle_{i:06d}.json"), "w", encoding="utf-8") as f:
+            json.dump(relatorio, f, indent=2, ensure_ascii=False)
+
+    inicio, fim = base + ciclos * 15, base + ciclos * 45
+    alvo = dominios[0]
+
+    t0 = time.perf_counter()
+    antigos = []
+    for caminho in glob.glob(os.path.join(origem, "*.json")):
+        with open(caminho, "r", encoding="utf-8") as f:
+            r = json.load(f)
+        if r["intencao"] == alvo and r["status"] == "SUCESSO" and inicio <= _epoch(r["timestamp"]) <= fim:
+            antigos.append(r)
+    t_arquivos = time.perf_counter() - t0
+
+    armazem = ArmazemRelatorios(os.path.join(diretorio, "armazem"), formato=formato)
+    t0 = time.perf_counter()
+    migracao = migrar_relatorios_json(os.path.join(origem, "*.json"), armazem)
+    t_migracao = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    novos = armazem.consultar(alvo, inicio, fim, "SUCESSO")
+    t_armazem = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    armazem.consultar(alvo, inicio, fim, "SUCESSO", completo=False)
+    t_colunas = time.perf_counter() - t0
+    armazem.fechar()
+
+    return {
+        "ciclos": ciclos, "formato": armazem.formato, "segmentos": migracao["segmentos"],
+        "resultados_iguais": sorted(r["resultado"]["material_id"] for r in antigos)
+                             == sorted(r["resultado"]["material_id"] for r in novos),
+        "varredura_arquivos_s": round(t_arquivos, 4),
+        "migracao_s": round(t_migracao, 4),
+        "consulta_armazem_s": round(t_armazem, 4),
+        "consulta_so_filtros_s": round(t_colunas, 4),
+        "aceleracao": round(t_arquivos / max(t_armazem, 1e-9), 1),
+    }
+
+if __name__ == "__main__":
+    import sys
+    args = sys.argv[1:]
+    if args and args[0] == "--migrar" and len(args) >= 3:
+        # --migrar "<padrão glob>" <diretório do armazém> [--remover]
+        armazem = ArmazemRelatorios(args[2])
+        print(json.dumps(migrar_relatorios_json(args[1], armazem, remover="--remover" in args), indent=2, ensure_ascii=False))
+        armazem.fechar()
+    elif args and args[0] == "--consultar" and len(args) >= 2:
+        # --consultar <diretório do armazém> [dominio] [status]
+        armazem = ArmazemRelatorios(args[1])
+        dominio = args[2] if len(args) > 2 and args[2] != "-" else None
+        status = args[3] if len(args) > 3 else None
+        print(json.dumps(armazem.consultar(dominio, status=status), indent=2, ensure_ascii=False))
+    else:
+        n = int(args[1]) if len(args) > 1 and args[0] == "--bench" else 5000
+        print(json.dumps(benchmark_relatorios(ciclos=n), indent=2, ensure_ascii=False))